@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+#
+# Copyright (C) 2024 Advanced Micro Devices. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+
+
+import json
+import logging
+import os
+import stat
+import tempfile
+
+
+BOOT_ID_PATH = "/proc/sys/kernel/random/boot_id"
+CACHE_DIR_NAME = "amdsmi"
+
+
+def get_boot_id():
+    """Return the kernel boot id or None if it is unavailable"""
+    try:
+        with open(BOOT_ID_PATH, 'r', encoding="utf-8") as boot_id_file:
+            return boot_id_file.read().strip()
+    except OSError:
+        return None
+
+
+def get_cache_dir():
+    """Return the default cache directory, $XDG_RUNTIME_DIR/amdsmi
+
+    The runtime directory is private to the user and cleared on logout, so
+    the cache files are only persisted by default when it is set.
+    return:
+        str : cache directory or None if XDG_RUNTIME_DIR is not set
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if not runtime_dir:
+        return None
+    return os.path.join(runtime_dir, CACHE_DIR_NAME)
+
+
+def _is_owned(file_stat, directory=False):
+    """Return True if the file is owned by the user and nobody else can write it"""
+    if file_stat.st_uid != os.getuid() or file_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        return False
+    if directory:
+        return stat.S_ISDIR(file_stat.st_mode) and not file_stat.st_mode & stat.S_IRWXO
+    return stat.S_ISREG(file_stat.st_mode)
+
+
+class AMDSMIBootCache():
+    """JSON file tagged with the kernel boot id, owned by the user
+
+    The file is never followed through a symlink and is ignored unless it is a
+    regular file owned by the user that nobody else can write. It is written to
+    a temporary file from tempfile.mkstemp in the same directory and renamed
+    over the previous one, so concurrent runs never read a partial file.
+    """
+
+    def __init__(self, name, env, cache_path=None) -> None:
+        """
+        params:
+            name (str) - file name in the default cache directory, see get_cache_dir
+            env (str) - environment variable overriding the path, an empty value disables the file
+            cache_path (str) - path of the file, overrides env. An empty path disables the file.
+        """
+        self.name = name
+        self.env = env
+        self.cache_path = cache_path
+
+
+    def get_path(self):
+        """Return the path of the cache file or None if the file is disabled"""
+        if self.cache_path is not None:
+            return self.cache_path or None
+        if self.env in os.environ:
+            return os.environ[self.env] or None
+        cache_dir = get_cache_dir()
+        if cache_dir is None:
+            return None
+        return os.path.join(cache_dir, self.name)
+
+
+    def _is_default_path(self, cache_path):
+        cache_dir = get_cache_dir()
+        return cache_dir is not None and os.path.dirname(cache_path) == cache_dir
+
+
+    def load(self):
+        """Return the data saved in this boot or None if there is none"""
+        cache_path = self.get_path()
+        boot_id = get_boot_id()
+        if cache_path is None or boot_id is None:
+            return None
+
+        try:
+            cache_fd = os.open(cache_path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logging.debug("AMDSMIBootCache: ignoring cache %s | %s", cache_path, e)
+            return None
+
+        try:
+            with os.fdopen(cache_fd, 'r', encoding="utf-8") as cache_file:
+                if not _is_owned(os.fstat(cache_file.fileno())):
+                    logging.debug("AMDSMIBootCache: ignoring cache %s not owned by the user", cache_path)
+                    return None
+                cache = json.load(cache_file)
+            if cache.get("boot_id") != boot_id:
+                return None
+            return cache["data"]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logging.debug("AMDSMIBootCache: ignoring cache %s | %s", cache_path, e)
+            return None
+
+
+    def save(self, data):
+        """Save data for the later runs of this boot, failures are only logged"""
+        cache_path = self.get_path()
+        boot_id = get_boot_id()
+        if cache_path is None or boot_id is None:
+            return
+
+        cache_dir = os.path.dirname(cache_path) or os.curdir
+        temporary_path = None
+        try:
+            if self._is_default_path(cache_path):
+                os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+                if not _is_owned(os.lstat(cache_dir), directory=True):
+                    logging.debug("AMDSMIBootCache: not writing cache, %s is not private to the user", cache_dir)
+                    return
+            cache_fd, temporary_path = tempfile.mkstemp(prefix=f".{os.path.basename(cache_path)}.", dir=cache_dir)
+            with os.fdopen(cache_fd, 'w', encoding="utf-8") as cache_file:
+                json.dump({"boot_id": boot_id, "data": data}, cache_file)
+            os.replace(temporary_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            logging.debug("AMDSMIBootCache: unable to write cache %s | %s", cache_path, e)
+            if temporary_path is not None:
+                try:
+                    os.unlink(temporary_path)
+                except OSError:
+                    pass
+
+
+    def remove(self):
+        """Remove the cache file"""
+        cache_path = self.get_path()
+        if cache_path is None:
+            return
+        try:
+            os.unlink(cache_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logging.debug("AMDSMIBootCache: unable to remove cache %s | %s", cache_path, e)
@@ -95,7 +95,9 @@ if __name__ == "__main__":
                                     amd_smi_commands.monitor,
                                     amd_smi_commands.rocm_smi,
                                     amd_smi_commands.xgmi,
-                                    amd_smi_commands.partition)
+                                    amd_smi_commands.partition,
+                                    amd_smi_commands.daemon,
+                                    amd_smi_commands.exporter)
     try:
         try:
             argcomplete.autocomplete(amd_smi_parser)
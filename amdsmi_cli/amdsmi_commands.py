@@ -21,19 +21,27 @@
 #
 
 import logging
+import math
 import sys
-import threading
 import time
 import json
 
 from _version import __version__
-from amdsmi_helpers import AMDSMIHelpers
+from amdsmi_daemon import AMDSMIDaemon
+from amdsmi_exporter import AMDSMIExporter
+from amdsmi_fields import AMDSMIFieldPlan, nest_fields
+from amdsmi_helpers import AMDSMIHelpers, AMDSMISnapshot
 from amdsmi_logger import AMDSMILogger
+from amdsmi_sampler import AMDSMISampler, SAMPLER_AGGREGATES
+from amdsmi_topology import AMDSMITopology
 from amdsmi_cli_exceptions import AmdSmiRequiredCommandException
 from rocm_version import get_rocm_version
 from amdsmi import amdsmi_interface
 from amdsmi import amdsmi_exception
 
+# Seconds between the first two counter samples of a device, same as the library violation status
+COUNTER_RATE_INTERVAL = 0.1
+
 
 class AMDSMICommands():
     """This class contains all the commands corresponding to AMDSMIParser
@@ -43,10 +51,13 @@ class AMDSMICommands():
     def __init__(self, format='human_readable', destination='stdout') -> None:
         self.helpers = AMDSMIHelpers()
         self.logger = AMDSMILogger(format=format, destination=destination)
+        self.snapshot = AMDSMISnapshot()
+        self.topology_cache = AMDSMITopology(self.helpers)
+        self.counter_rates = amdsmi_interface.CounterRateTracker()
+        self.sampler = None
         self.device_handles = []
         self.cpu_handles = []
         self.core_handles = []
-        self.stop = ''
 
         amdsmi_init_flag = self.helpers.get_amdsmi_init_flag()
         logging.debug(f"AMDSMI Init Flag: {amdsmi_init_flag}")
@@ -269,7 +280,7 @@ class AMDSMICommands():
     def static_gpu(self, args, multiple_devices=False, gpu=None, asic=None, bus=None, vbios=None,
                         limit=None, driver=None, ras=None, board=None, numa=None, vram=None,
                         cache=None, partition=None, dfc_ucode=None, fb_info=None, num_vf=None,
-                        soc_pstate=None, xgmi_plpd=None, process_isolation=None):
+                        soc_pstate=None, xgmi_plpd=None, process_isolation=None, capabilities=None):
         """Get Static information for target gpu
 
         Args:
@@ -295,6 +306,7 @@ class AMDSMICommands():
             soc_pstate (bool, optional): Value override for args.soc_pstate. Defaults to None.
             xgmi_plpd (bool, optional): Value override for args.xgmi_plpd. Defaults to None.
             process_isolation (bool, optional): Value override for args.process_isolation. Defaults to None.
+            capabilities (bool, optional): Value override for args.capabilities. Defaults to None.
         Returns:
             None: Print output via AMDSMILogger to destination
         """
@@ -355,7 +367,11 @@ class AMDSMICommands():
             current_platform_args += ["dfc_ucode", "fb_info", "num_vf"]
             current_platform_values += [args.dfc_ucode, args.fb_info, args.num_vf]
 
-        if not any(current_platform_values):
+        # Capabilities are only shown when requested
+        if capabilities:
+            args.capabilities = capabilities
+
+        if not any(current_platform_values) and not args.capabilities:
             for arg in current_platform_args:
                 setattr(args, arg, True)
 
@@ -828,6 +844,46 @@ class AMDSMICommands():
                 logging.debug("Failed to get cache info for gpu %s | %s", gpu_id, e.get_error_info())
 
             static_dict['cache_info'] = cache_info_list
+        if args.capabilities:
+            # Probe the getters that commonly report not supported, the interface records
+            # the failures and skips those getters on later calls
+            capability_probes = [
+                (amdsmi_interface.amdsmi_get_gpu_metrics_info, ()),
+                (amdsmi_interface.amdsmi_get_power_info, ()),
+                (amdsmi_interface.amdsmi_get_power_cap_info, ()),
+                (amdsmi_interface.amdsmi_get_energy_count, ()),
+                (amdsmi_interface.amdsmi_get_temp_metric, (amdsmi_interface.AmdSmiTemperatureType.EDGE,
+                                                           amdsmi_interface.AmdSmiTemperatureMetric.CURRENT)),
+                (amdsmi_interface.amdsmi_get_temp_metric, (amdsmi_interface.AmdSmiTemperatureType.HOTSPOT,
+                                                           amdsmi_interface.AmdSmiTemperatureMetric.CURRENT)),
+                (amdsmi_interface.amdsmi_get_temp_metric, (amdsmi_interface.AmdSmiTemperatureType.VRAM,
+                                                           amdsmi_interface.AmdSmiTemperatureMetric.CURRENT)),
+                (amdsmi_interface.amdsmi_get_gpu_fan_speed, (0,)),
+                (amdsmi_interface.amdsmi_get_gpu_fan_rpms, (0,)),
+                (amdsmi_interface.amdsmi_get_gpu_fan_speed_max, (0,)),
+                (amdsmi_interface.amdsmi_get_gpu_od_volt_info, ()),
+                (amdsmi_interface.amdsmi_get_gpu_overdrive_level, ()),
+                (amdsmi_interface.amdsmi_get_gpu_mem_overdrive_level, ()),
+                (amdsmi_interface.amdsmi_get_gpu_perf_level, ()),
+                (amdsmi_interface.amdsmi_get_gpu_total_ecc_count, ()),
+                (amdsmi_interface.amdsmi_get_gpu_ecc_enabled, ()),
+                (amdsmi_interface.amdsmi_get_pcie_info, ()),
+                (amdsmi_interface.amdsmi_get_violation_status, ()),
+                (amdsmi_interface.amdsmi_get_soc_pstate, ()),
+                (amdsmi_interface.amdsmi_get_xgmi_plpd, ()),
+                (amdsmi_interface.amdsmi_get_gpu_process_isolation, ()),
+            ]
+            for api, api_args in capability_probes:
+                try:
+                    api(args.gpu, *api_args)
+                except amdsmi_exception.AmdSmiLibraryException as e:
+                    logging.debug("Failed to probe %s for gpu %s | %s", api.__name__, gpu_id, e.get_error_info())
+
+            unsupported_apis = amdsmi_interface.amdsmi_get_unsupported_apis(args.gpu)
+            if self.logger.is_human_readable_format() or self.logger.is_csv_format():
+                # Convert list to a string for human readable and csv format
+                unsupported_apis = '[' + ", ".join(unsupported_apis) + ']'
+            static_dict['capabilities'] = {'unsupported_apis': unsupported_apis}
 
         # Convert and store output by pid for csv format
         multiple_devices_csv_override = False
@@ -863,7 +919,8 @@ class AMDSMICommands():
                 bus=None, vbios=None, limit=None, driver=None, ras=None,
                 board=None, numa=None, vram=None, cache=None, partition=None,
                 dfc_ucode=None, fb_info=None, num_vf=None, cpu=None,
-                interface_ver=None, soc_pstate=None, xgmi_plpd = None, process_isolation=None):
+                interface_ver=None, soc_pstate=None, xgmi_plpd = None, process_isolation=None,
+                capabilities=None):
         """Get Static information for target gpu and cpu
 
         Args:
@@ -889,6 +946,7 @@ class AMDSMICommands():
             soc_pstate (bool, optional): Value override for args.soc_pstate. Defaults to None.
             xgmi_plpd (bool, optional): Value override for args.xgmi_plpd. Defaults to None.
             process_isolation (bool, optional): Value override for args.process_isolation. Defaults to None.
+            capabilities (bool, optional): Value override for args.capabilities. Defaults to None.
         Raises:
             IndexError: Index error if gpu list is empty
 
@@ -915,7 +973,7 @@ class AMDSMICommands():
         gpu_attributes = ["asic", "bus", "vbios", "limit", "driver", "ras",
                           "board", "numa", "vram", "cache", "partition",
                           "dfc_ucode", "fb_info", "num_vf", "soc_pstate", "xgmi_plpd",
-                          "process_isolation"]
+                          "process_isolation", "capabilities"]
         for attr in gpu_attributes:
             if hasattr(args, attr):
                 if getattr(args, attr):
@@ -946,7 +1004,7 @@ class AMDSMICommands():
                                     bus, vbios, limit, driver, ras,
                                     board, numa, vram, cache, partition,
                                     dfc_ucode, fb_info, num_vf, soc_pstate,
-                                    process_isolation)
+                                    process_isolation, capabilities=capabilities)
         elif self.helpers.is_amd_hsmp_initialized(): # Only CPU is initialized
             if args.cpu == None:
                 args.cpu = self.cpu_handles
@@ -961,7 +1019,7 @@ class AMDSMICommands():
                                 bus, vbios, limit, driver, ras,
                                 board, numa, vram, cache, partition,
                                 dfc_ucode, fb_info, num_vf, soc_pstate, xgmi_plpd,
-                                process_isolation)
+                                process_isolation, capabilities=capabilities)
 
 
     def firmware(self, args, multiple_devices=False, gpu=None, fw_list=True):
@@ -1176,12 +1234,56 @@ class AMDSMICommands():
         self.logger.print_output()
 
 
+    def _prime_counter_rates(self, device_handles):
+        """Take the first counter sample of every device without one, then wait once
+
+        Devices collected afterwards all have a previous sample, so the
+        COUNTER_RATE_INTERVAL wait isn't repeated for each of them.
+
+        params:
+            device_handles (list) - devices to sample
+        """
+        primed = False
+        for device_handle in device_handles:
+            if self.counter_rates.has_sample(device_handle):
+                continue
+            try:
+                self.counter_rates.update(device_handle)
+                primed = True
+            except amdsmi_exception.AmdSmiLibraryException as e:
+                logging.debug("Failed to sample counters for rates | %s", e.get_error_info())
+        if primed:
+            time.sleep(COUNTER_RATE_INTERVAL)
+
+
+    def _get_counter_rates(self, device_handle, gpu_metrics=None):
+        """Get the rates of the accumulating counters since the previous call for the device
+
+        The first call for a device not sampled by _prime_counter_rates has no
+        previous sample, a second sample is taken after COUNTER_RATE_INTERVAL
+        seconds so the rates are always available.
+
+        params:
+            device_handle (device_handle) - device to sample
+            gpu_metrics (dict) - gpu metrics already read for the device in this tick
+        return:
+            dict : CounterRateTracker rates
+        """
+        if not self.counter_rates.has_sample(device_handle):
+            self.counter_rates.update(device_handle)
+            time.sleep(COUNTER_RATE_INTERVAL)
+            # gpu_metrics was read before the first sample
+            gpu_metrics = None
+        return self.counter_rates.update(device_handle, gpu_metrics)
+
+
     def metric_gpu(self, args, multiple_devices=False, watching_output=False, gpu=None,
                 usage=None, watch=None, watch_time=None, iterations=None, power=None,
                 clock=None, temperature=None, ecc=None, ecc_blocks=None, pcie=None,
                 fan=None, voltage_curve=None, overdrive=None, perf_level=None,
                 xgmi_err=None, energy=None, mem_usage=None, schedule=None,
-                guard=None, guest_data=None, fb_usage=None, xgmi=None, throttle=None):
+                guard=None, guest_data=None, fb_usage=None, xgmi=None, throttle=None,
+                rates=None, fields=None):
         """Get Metric information for target gpu
 
         Args:
@@ -1212,6 +1314,8 @@ class AMDSMICommands():
             fb_usage (bool, optional): Value override for args.fb_usage. Defaults to None.
             xgmi (bool, optional): Value override for args.xgmi. Defaults to None.
             throttle (bool, optional): Value override for args.throttle. Defaults to None.
+            rates (bool, optional): Value override for args.rates. Defaults to None.
+            fields (list, optional): Value override for args.fields. Defaults to None.
 
         Raises:
             IndexError: Index error if gpu list is empty
@@ -1283,6 +1387,20 @@ class AMDSMICommands():
             current_platform_values += [args.fan, args.voltage_curve, args.overdrive,
                                         args.perf_level, args.xgmi_err, args.energy, args.throttle]
 
+        # Rates need a second sample, they are only shown when requested
+        rates_enabled = False
+        if self.helpers.is_baremetal() and self.helpers.is_linux():
+            if rates:
+                args.rates = rates
+            rates_enabled = args.rates
+
+        # Selected fields replace the metric arguments, only their sources are read
+        selected_fields = None
+        if self.helpers.is_hypervisor() or self.helpers.is_baremetal() or self.helpers.is_linux():
+            if fields:
+                args.fields = fields
+            selected_fields = args.fields
+
         if self.helpers.is_hypervisor():
             if schedule:
                 args.schedule = schedule
@@ -1315,9 +1433,11 @@ class AMDSMICommands():
                 for gpu in args.gpu:
                     stored_gpus.append(gpu)
 
+                if rates_enabled:
+                    self._prime_counter_rates(args.gpu)
+
                 # Store output from multiple devices
-                for device_handle in args.gpu:
-                    self.metric_gpu(args, multiple_devices=True, watching_output=watching_output, gpu=device_handle)
+                self.helpers.collect_device_outputs(args, self.logger, self.metric_gpu, watching_output=watching_output)
 
                 # Reload original gpus
                 args.gpu = stored_gpus
@@ -1362,8 +1482,17 @@ class AMDSMICommands():
         logging.debug(f"Args:   {current_platform_args}")
         logging.debug(f"Values: {current_platform_values}")
 
+        if selected_fields:
+            field_values = AMDSMIFieldPlan(selected_fields).read(args.gpu)
+            values_dict = self._format_field_values(field_values)
+            # CSV columns keep the full field names
+            if not self.logger.is_csv_format():
+                values_dict = nest_fields(values_dict)
+            self._print_metric_gpu_output(args, values_dict, multiple_devices, watching_output)
+            return
+
         # Set the platform applicable args to True if no args are set
-        if not any(current_platform_values):
+        if not any(current_platform_values) and not rates_enabled:
             for arg in current_platform_args:
                 setattr(args, arg, True)
 
@@ -2175,7 +2304,39 @@ class AMDSMICommands():
                             throttle_status[key] = {"value" : value,
                                                     "unit" : activity_unit}
                 values_dict['throttle'] = throttle_status
+        if rates_enabled:
+            try:
+                rates_dict = self._get_counter_rates(args.gpu)
+                rates_units = amdsmi_interface.CounterRateTracker.get_units()
+                for key, value in rates_dict.items():
+                    rates_unit = rates_units[key]
+                    if isinstance(value, list):
+                        value = [self.helpers.unit_format(self.logger, rate, rates_unit) if rate != "N/A" else rate
+                                 for rate in value]
+                        if self.logger.is_human_readable_format():
+                            # Convert list to a string for human readable format
+                            value = '[' + ", ".join(value) + ']'
+                        rates_dict[key] = value
+                    elif value != "N/A":
+                        rates_dict[key] = self.helpers.unit_format(self.logger, value, rates_unit)
+                values_dict['rates'] = rates_dict
+            except amdsmi_exception.AmdSmiLibraryException as e:
+                values_dict['rates'] = "N/A"
+                logging.debug("Failed to get counter rates for gpu %s | %s", gpu_id, e.get_error_info())
+
+        self._print_metric_gpu_output(args, values_dict, multiple_devices, watching_output)
+
+
+    def _print_metric_gpu_output(self, args, values_dict, multiple_devices, watching_output):
+        """Store the metric values of a single gpu and print them unless
+            multiple devices are being collected
 
+        Args:
+            args (Namespace): Namespace containing the parsed CLI args
+            values_dict (dict): metric values of args.gpu
+            multiple_devices (bool): True if checking for multiple devices
+            watching_output (bool): True if watch argument has been set
+        """
         # Store timestamp first if watching_output is enabled
         if watching_output:
             self.logger.store_output(args.gpu, 'timestamp', int(time.time()))
@@ -2577,7 +2738,7 @@ class AMDSMICommands():
                 cpu_temp=None, cpu_dimm_temp_range_rate=None, cpu_dimm_pow_consumption=None,
                 cpu_dimm_thermal_sensor=None,
                 core=None, core_boost_limit=None, core_curr_active_freq_core_limit=None,
-                core_energy=None, throttle=None):
+                core_energy=None, throttle=None, rates=None, fields=None):
         """Get Metric information for target gpu
 
         Args:
@@ -2652,7 +2813,7 @@ class AMDSMICommands():
         gpu_attributes = ["usage", "watch", "watch_time", "iterations", "power", "clock",
                           "temperature", "ecc", "ecc_blocks", "pcie", "fan", "voltage_curve",
                           "overdrive", "perf_level", "xgmi_err", "energy", "mem_usage", "schedule",
-                          "guard", "guest_data", "fb_usage", "xgmi", "throttle"]
+                          "guard", "guest_data", "fb_usage", "xgmi", "throttle", "rates", "fields"]
         for attr in gpu_attributes:
             if hasattr(args, attr):
                 if getattr(args, attr):
@@ -2725,7 +2886,7 @@ class AMDSMICommands():
                                 clock, temperature, ecc, ecc_blocks, pcie,
                                 fan, voltage_curve, overdrive, perf_level,
                                 xgmi_err, energy, mem_usage, schedule,
-                                guard, guest_data, fb_usage, xgmi, throttle)
+                                guard, guest_data, fb_usage, xgmi, throttle, rates=rates, fields=fields)
         elif self.helpers.is_amd_hsmp_initialized(): # Only CPU is initialized
             if args.cpu == None and args.core == None:
                 # If no args are set, print out all CPU and Core metrics info
@@ -2759,7 +2920,7 @@ class AMDSMICommands():
                                 usage, watch, watch_time, iterations, power,
                                 clock, temperature, ecc, ecc_blocks, pcie,
                                 fan, voltage_curve, overdrive, perf_level,
-                                xgmi_err, energy, mem_usage, schedule, throttle)
+                                xgmi_err, energy, mem_usage, schedule, throttle, rates=rates, fields=fields)
 
 
     def process(self, args, multiple_devices=False, watching_output=False,
@@ -2822,8 +2983,7 @@ class AMDSMICommands():
                     stored_gpus.append(gpu)
 
                 # Store output from multiple devices
-                for device_handle in args.gpu:
-                    self.process(args, multiple_devices=True, watching_output=watching_output, gpu=device_handle)
+                self.helpers.collect_device_outputs(args, self.logger, self.process, watching_output=watching_output)
 
                 # Reload original gpus
                 args.gpu = stored_gpus
@@ -2992,24 +3152,33 @@ class AMDSMICommands():
         if not isinstance(args.gpu, list):
             args.gpu = [args.gpu]
 
-        print('EVENT LISTENING:\n')
-        print('Press q and hit ENTER when you want to stop.')
-        self.stop = False
-        threads = []
-        for device_handle in range(len(args.gpu)):
-            x = threading.Thread(target=self._event_thread, args=(self, device_handle))
-            threads.append(x)
-            x.start()
+        if len(args.gpu) == 0:
+            print("No GPUs on machine")
+            return
+
+        device_handles = {device_handle.value: device_handle for device_handle in args.gpu}
 
-        while True:
-            user_input = input()
-            if user_input == 'q':
-                print("Escape Sequence Detected; Exiting")
-                self.stop = True
-                break
+        def print_event(event):
+            # Only called from the dispatcher thread, so event output never interleaves
+            device_handle = device_handles.get(event["processor_handle"])
+            if device_handle is None:
+                return
+            values_dict = {"event": event["event"],
+                           "message": event["message"]}
+            self.logger.store_output(device_handle, 'values', values_dict)
+            self.logger.print_output()
 
-        for thread in threads:
-            thread.join()
+        print('EVENT LISTENING:\n')
+        print('Press q and hit ENTER when you want to stop.')
+        with amdsmi_interface.AmdSmiEventDispatcher(args.gpu, amdsmi_interface.AmdSmiEvtNotificationType) as dispatcher:
+            dispatcher.subscribe(print_event)
+            dispatcher.start(2000, on_error=print)
+
+            while True:
+                user_input = input()
+                if user_input == 'q':
+                    print("Escape Sequence Detected; Exiting")
+                    break
 
 
     def topology(self, args, multiple_devices=False, gpu=None, access=None,
@@ -3070,22 +3239,18 @@ class AMDSMICommands():
         # Clear the table header
         self.logger.table_header = ''.rjust(12)
 
+        # Every matrix is rendered from the same links, read once per pair and cached per boot
+        gpu_bdfs = [self.helpers.handle_registry.get_gpu_bdf(device_handle) for device_handle in args.gpu]
+        gpu_ids = [self.helpers.get_gpu_id_from_device_handle(device_handle) for device_handle in args.gpu]
+        topology_links = self.topology_cache.get_links(args.gpu)
+
         # Populate the possible gpus
         topo_values = []
-        for src_gpu_index, src_gpu in enumerate(args.gpu):
-            src_gpu_id = self.helpers.get_gpu_id_from_device_handle(src_gpu)
-            topo_values.append({"gpu" : src_gpu_id})
-            src_gpu_bdf = amdsmi_interface.amdsmi_get_gpu_device_bdf(src_gpu)
-            topo_values[src_gpu_index]['bdf'] = src_gpu_bdf
+        for src_gpu_index, src_gpu_bdf in enumerate(gpu_bdfs):
+            topo_values.append({"gpu" : gpu_ids[src_gpu_index], "bdf": src_gpu_bdf})
             self.logger.table_header += src_gpu_bdf.rjust(13)
 
-            if not self.logger.is_json_format():
-                continue  # below is for JSON format only
-
-            ##########################
-            # JSON formatting start  #
-            ##########################
-            links = []
+        if self.logger.is_json_format():
             # create json obj for data alignment
             #  dest_gpu_links = {
             #         "gpu": GPU #
@@ -3101,475 +3266,64 @@ class AMDSMICommands():
             #         "dma": dma - P2P direct memory access (DMA) link capability between nodes
             #         "bi_dir": bi_dir - P2P bi-directional link capability between nodes
             #     }
+            json_keys = [("weight", "weight", args.weight),
+                         ("link_status", "access", args.access),
+                         ("link_type", "link_type", args.link_type),
+                         ("num_hops", "hops", args.hops),
+                         ("bandwidth", "numa_bw", args.numa_bw),
+                         ("coherent", "coherent", args.coherent),
+                         ("atomics", "atomics", args.atomics),
+                         ("dma", "dma", args.dma),
+                         ("bi_dir", "bi_dir", args.bi_dir)]
+            for src_gpu_index, src_gpu_bdf in enumerate(gpu_bdfs):
+                links = []
+                for dest_gpu_index, dest_gpu_bdf in enumerate(gpu_bdfs):
+                    link = topology_links[src_gpu_bdf][dest_gpu_bdf]
+                    is_self = src_gpu_index == dest_gpu_index
+                    dest_gpu_links = {"gpu": gpu_ids[dest_gpu_index], "bdf": dest_gpu_bdf}
+                    for json_key, link_key, enabled in json_keys:
+                        if enabled:
+                            dest_gpu_links[json_key] = AMDSMITopology.format_link(link_key, link, is_self)
+                    links.append(dest_gpu_links)
+                topo_values[src_gpu_index]['links'] = links
+
+            self.logger.multiple_device_output = topo_values
+            self.logger.print_output(multiple_device_enabled=True, tabular=True)
+            return
 
-            for dest_gpu_index, dest_gpu in enumerate(args.gpu):
-                link_type = "SELF"
-                if src_gpu != dest_gpu:
-                    link_type = amdsmi_interface.amdsmi_topo_get_link_type(src_gpu, dest_gpu)['type']
-                if isinstance(link_type, int):
-                    if link_type == amdsmi_interface.amdsmi_wrapper.AMDSMI_IOLINK_TYPE_UNDEFINED:
-                        link_type = "UNKNOWN"
-                    elif link_type == amdsmi_interface.amdsmi_wrapper.AMDSMI_IOLINK_TYPE_PCIEXPRESS:
-                        link_type = "PCIE"
-                    elif link_type == amdsmi_interface.amdsmi_wrapper.AMDSMI_IOLINK_TYPE_XGMI:
-                        link_type = "XGMI"
-                    else:
-                        link_type = "N/A"
-
-                numa_bw = "N/A"
-                if src_gpu != dest_gpu:
-                    try:
-                        bw_dict = amdsmi_interface.amdsmi_get_minmax_bandwidth_between_processors(src_gpu, dest_gpu)
-                        numa_bw = f"{bw_dict['min_bandwidth']}-{bw_dict['max_bandwidth']}"
-                    except amdsmi_exception.AmdSmiLibraryException as e:
-                        logging.debug("Failed to get min max bandwidth for %s to %s | %s",
-                                    self.helpers.get_gpu_id_from_device_handle(src_gpu),
-                                    self.helpers.get_gpu_id_from_device_handle(dest_gpu),
-                                    e.get_error_info())
-
-                weight = 0
-                num_hops = 0
-                if src_gpu != dest_gpu:
-                    weight = amdsmi_interface.amdsmi_topo_get_link_weight(src_gpu, dest_gpu)
-                    num_hops = amdsmi_interface.amdsmi_topo_get_link_type(src_gpu, dest_gpu)['hops']
-                link_status = amdsmi_interface.amdsmi_is_P2P_accessible(src_gpu, dest_gpu)
-                if link_status:
-                    link_status = "ENABLED"
-                else:
-                    link_status = "DISABLED"
-
-                link_coherent = "SELF"
-                link_atomics = "SELF"
-                link_dma = "SELF"
-                link_bi_dir = "SELF"
-
-                if src_gpu != dest_gpu:
-                    try:
-                        cap = amdsmi_interface.amdsmi_topo_get_p2p_status(src_gpu, dest_gpu)['cap']
-                        link_coherent = (
-                            "C" if cap['is_iolink_coherent'] == 1 else
-                            "NC" if cap['is_iolink_coherent'] == 0 else
-                            "N/A"
-                        )
-                        link_atomics = (
-                            "64,32" if cap['is_iolink_atomics_32bit'] == 1 and cap['is_iolink_atomics_64bit'] == 1 else
-                            "32" if cap['is_iolink_atomics_32bit'] == 1 else
-                            "64" if cap['is_iolink_atomics_64bit'] == 1 else
-                            "N/A"
-                        )
-                        link_dma = (
-                            "T" if cap['is_iolink_dma'] == 1 else
-                            "F" if cap['is_iolink_dma'] == 0 else
-                            "N/A"
-                        )
-                        link_bi_dir = (
-                            "T" if cap['is_iolink_bi_directional'] == 1 else
-                            "F" if cap['is_iolink_bi_directional'] == 0 else
-                            "N/A"
-                        )
-                    except amdsmi_exception.AmdSmiLibraryException as e:
-                        logging.debug("Failed to get link status for %s to %s | %s",
-                                    self.helpers.get_gpu_id_from_device_handle(src_gpu),
-                                    self.helpers.get_gpu_id_from_device_handle(dest_gpu),
-                                    e.get_error_info())
-
-
-                # link_status = amdsmi_is_P2P_accessible(src,dest)
-                dest_gpu_links = {
-                    "gpu": self.helpers.get_gpu_id_from_device_handle(dest_gpu),
-                    "bdf": amdsmi_interface.amdsmi_get_gpu_device_bdf(dest_gpu),
-                    "weight": weight,
-                    "link_status": link_status,
-                    "link_type": link_type,
-                    "num_hops": num_hops,
-                    "bandwidth": numa_bw,
-                    "coherent": link_coherent,
-                    "atomics": link_atomics,
-                    "dma": link_dma,
-                    "bi_dir": link_bi_dir
-                }
-                if not args.access:
-                    del dest_gpu_links['link_status']
-                if not args.weight:
-                    del dest_gpu_links['weight']
-                if not args.link_type:
-                    del dest_gpu_links['link_type']
-                if not args.hops:
-                    del dest_gpu_links['num_hops']
-                if not args.numa_bw:
-                    del dest_gpu_links['bandwidth']
-                if not args.coherent:
-                    del dest_gpu_links['coherent']
-                if not args.atomics:
-                    del dest_gpu_links['atomics']
-                if not args.dma:
-                    del dest_gpu_links['dma']
-                if not args.bi_dir:
-                    del dest_gpu_links['bi_dir']
-                links.append(dest_gpu_links)
-                dest_end = dest_gpu_index+1 == len(args.gpu)
-                isEndOfSrc = src_gpu_index+1 == len(args.gpu)
-                if dest_end:
-                    topo_values[src_gpu_index]['links'] = links
-                    continue
-            if isEndOfSrc:
-                self.logger.multiple_device_output = topo_values
-                self.logger.print_output(multiple_device_enabled=True, tabular=True)
-                return
-            ##########################
-            # JSON formatting end    #
-            ##########################
-
-        if args.access:
-            tabular_output = []
-            for src_gpu_index, src_gpu in enumerate(args.gpu):
-                src_gpu_bdf = amdsmi_interface.amdsmi_get_gpu_device_bdf(src_gpu)
-                if self.logger.is_human_readable_format():
-                    tabular_output_dict = {'gpu' : f"{src_gpu_bdf} "}
-                else:
-                    tabular_output_dict = {'gpu' : src_gpu_bdf}
-                src_gpu_links = {}
-                for dest_gpu in args.gpu:
-                    dest_gpu_id = self.helpers.get_gpu_id_from_device_handle(dest_gpu)
-                    dest_gpu_key = f'gpu_{dest_gpu_id}'
-
-                    try:
-                        dest_gpu_link_status = amdsmi_interface.amdsmi_is_P2P_accessible(src_gpu, dest_gpu)
-                        if dest_gpu_link_status:
-                            src_gpu_links[dest_gpu_key] = "ENABLED"
-                        else:
-                            src_gpu_links[dest_gpu_key] = "DISABLED"
-                    except amdsmi_exception.AmdSmiLibraryException as e:
-                        src_gpu_links[dest_gpu_key] = "N/A"
-                        logging.debug("Failed to get link status for %s to %s | %s",
-                                        self.helpers.get_gpu_id_from_device_handle(src_gpu),
-                                        self.helpers.get_gpu_id_from_device_handle(dest_gpu),
-                                        e.get_error_info())
-
-                topo_values[src_gpu_index]['link_accessibility'] = src_gpu_links
-
-                tabular_output_dict.update(src_gpu_links)
-                tabular_output.append(tabular_output_dict)
-
-            if self.logger.is_human_readable_format():
-                self.logger.multiple_device_output = tabular_output
-                self.logger.table_title = "ACCESS TABLE"
-                self.logger.print_output(multiple_device_enabled=True, tabular=True)
-
-        if args.weight:
-            tabular_output = []
-            for src_gpu_index, src_gpu in enumerate(args.gpu):
-                src_gpu_bdf = amdsmi_interface.amdsmi_get_gpu_device_bdf(src_gpu)
-                if self.logger.is_human_readable_format():
-                    tabular_output_dict = {'gpu' : f"{src_gpu_bdf} "}
-                else:
-                    tabular_output_dict = {'gpu' : src_gpu_bdf}
-                src_gpu_weight = {}
-                for dest_gpu in args.gpu:
-                    dest_gpu_id = self.helpers.get_gpu_id_from_device_handle(dest_gpu)
-                    dest_gpu_key = f'gpu_{dest_gpu_id}'
-
-                    if src_gpu == dest_gpu:
-                        src_gpu_weight[dest_gpu_key] = 0
-                        continue
-
-                    try:
-                        dest_gpu_link_weight = amdsmi_interface.amdsmi_topo_get_link_weight(src_gpu, dest_gpu)
-                        src_gpu_weight[dest_gpu_key] = dest_gpu_link_weight
-                    except amdsmi_exception.AmdSmiLibraryException as e:
-                        src_gpu_weight[dest_gpu_key] = "N/A"
-                        logging.debug("Failed to get link weight for %s to %s | %s",
-                                        self.helpers.get_gpu_id_from_device_handle(src_gpu),
-                                        self.helpers.get_gpu_id_from_device_handle(dest_gpu),
-                                        e.get_error_info())
-
-                topo_values[src_gpu_index]['weight'] = src_gpu_weight
-
-                tabular_output_dict.update(src_gpu_weight)
-                tabular_output.append(tabular_output_dict)
-
-            if self.logger.is_human_readable_format():
-                self.logger.multiple_device_output = tabular_output
-                self.logger.table_title = "WEIGHT TABLE"
-                self.logger.print_output(multiple_device_enabled=True, tabular=True)
-
-        if args.hops:
-            tabular_output = []
-            for src_gpu_index, src_gpu in enumerate(args.gpu):
-                src_gpu_bdf = amdsmi_interface.amdsmi_get_gpu_device_bdf(src_gpu)
-                if self.logger.is_human_readable_format():
-                    tabular_output_dict = {'gpu' : f"{src_gpu_bdf} "}
-                else:
-                    tabular_output_dict = {'gpu' : src_gpu_bdf}
-                src_gpu_hops = {}
-                for dest_gpu in args.gpu:
-                    dest_gpu_id = self.helpers.get_gpu_id_from_device_handle(dest_gpu)
-                    dest_gpu_key = f'gpu_{dest_gpu_id}'
-
-                    if src_gpu == dest_gpu:
-                        src_gpu_hops[dest_gpu_key] = 0
-                        continue
-
-                    try:
-                        dest_gpu_hops = amdsmi_interface.amdsmi_topo_get_link_type(src_gpu, dest_gpu)['hops']
-                        src_gpu_hops[dest_gpu_key] = dest_gpu_hops
-                    except amdsmi_exception.AmdSmiLibraryException as e:
-                        src_gpu_hops[dest_gpu_key] = "N/A"
-                        logging.debug("Failed to get link hops for %s to %s | %s",
-                                        self.helpers.get_gpu_id_from_device_handle(src_gpu),
-                                        self.helpers.get_gpu_id_from_device_handle(dest_gpu),
-                                        e.get_error_info())
-
-                topo_values[src_gpu_index]['hops'] = src_gpu_hops
-
-                tabular_output_dict.update(src_gpu_hops)
-                tabular_output.append(tabular_output_dict)
-
-            if self.logger.is_human_readable_format():
-                self.logger.multiple_device_output = tabular_output
-                self.logger.table_title = "HOPS TABLE"
-                self.logger.print_output(multiple_device_enabled=True, tabular=True)
-
-        if args.link_type:
-            tabular_output = []
-            for src_gpu_index, src_gpu in enumerate(args.gpu):
-                src_gpu_bdf = amdsmi_interface.amdsmi_get_gpu_device_bdf(src_gpu)
-                if self.logger.is_human_readable_format():
-                    tabular_output_dict = {'gpu' : f"{src_gpu_bdf} "}
-                else:
-                    tabular_output_dict = {'gpu' : src_gpu_bdf}
-                src_gpu_link_type = {}
-                for dest_gpu in args.gpu:
-                    dest_gpu_id = self.helpers.get_gpu_id_from_device_handle(dest_gpu)
-                    dest_gpu_key = f'gpu_{dest_gpu_id}'
-
-                    if src_gpu == dest_gpu:
-                        src_gpu_link_type[dest_gpu_key] = "SELF"
-                        continue
-                    try:
-                        link_type = amdsmi_interface.amdsmi_topo_get_link_type(src_gpu, dest_gpu)['type']
-                        if isinstance(link_type, int):
-                            if link_type == amdsmi_interface.amdsmi_wrapper.AMDSMI_IOLINK_TYPE_UNDEFINED:
-                                src_gpu_link_type[dest_gpu_key] = "UNKNOWN"
-                            elif link_type == amdsmi_interface.amdsmi_wrapper.AMDSMI_IOLINK_TYPE_PCIEXPRESS:
-                                src_gpu_link_type[dest_gpu_key] = "PCIE"
-                            elif link_type == amdsmi_interface.amdsmi_wrapper.AMDSMI_IOLINK_TYPE_XGMI:
-                                src_gpu_link_type[dest_gpu_key] = "XGMI"
-                    except amdsmi_exception.AmdSmiLibraryException as e:
-                        src_gpu_link_type[dest_gpu_key] = "N/A"
-                        logging.debug("Failed to get link type for %s to %s | %s",
-                                        self.helpers.get_gpu_id_from_device_handle(src_gpu),
-                                        self.helpers.get_gpu_id_from_device_handle(dest_gpu),
-                                        e.get_error_info())
-
-                topo_values[src_gpu_index]['link_type'] = src_gpu_link_type
-
-                tabular_output_dict.update(src_gpu_link_type)
-                tabular_output.append(tabular_output_dict)
-
-            if self.logger.is_human_readable_format():
-                self.logger.multiple_device_output = tabular_output
-                self.logger.table_title = "LINK TYPE TABLE"
-                self.logger.print_output(multiple_device_enabled=True, tabular=True)
-
-        if args.numa_bw:
-            tabular_output = []
-            for src_gpu_index, src_gpu in enumerate(args.gpu):
-                src_gpu_bdf = amdsmi_interface.amdsmi_get_gpu_device_bdf(src_gpu)
-                if self.logger.is_human_readable_format():
-                    tabular_output_dict = {'gpu' : f"{src_gpu_bdf} "}
-                else:
-                    tabular_output_dict = {'gpu' : src_gpu_bdf}
-                src_gpu_link_type = {}
-                for dest_gpu in args.gpu:
-                    dest_gpu_id = self.helpers.get_gpu_id_from_device_handle(dest_gpu)
-                    dest_gpu_key = f'gpu_{dest_gpu_id}'
-
-                    if src_gpu == dest_gpu:
-                        src_gpu_link_type[dest_gpu_key] = "N/A"
-                        continue
-
-                    try:
-                        link_type = amdsmi_interface.amdsmi_topo_get_link_type(src_gpu, dest_gpu)['type']
-                        if isinstance(link_type, int):
-                            if link_type != 2:
-                                # non_xgmi = True
-                                src_gpu_link_type[dest_gpu_key] = "N/A"
-                                continue
-                    except amdsmi_exception.AmdSmiLibraryException as e:
-                        src_gpu_link_type[dest_gpu_key] = "N/A"
-                        logging.debug("Failed to get link type for %s to %s | %s",
-                                        self.helpers.get_gpu_id_from_device_handle(src_gpu),
-                                        self.helpers.get_gpu_id_from_device_handle(dest_gpu),
-                                        e.get_error_info())
-
-                    try:
-                        bw_dict = amdsmi_interface.amdsmi_get_minmax_bandwidth_between_processors(src_gpu, dest_gpu)
-                        src_gpu_link_type[dest_gpu_key] = f"{bw_dict['min_bandwidth']}-{bw_dict['max_bandwidth']}"
-                    except amdsmi_exception.AmdSmiLibraryException as e:
-                        src_gpu_link_type[dest_gpu_key] =  e.get_error_info()
-                        logging.debug("Failed to get min max bandwidth for %s to %s | %s",
-                                        self.helpers.get_gpu_id_from_device_handle(src_gpu),
-                                        self.helpers.get_gpu_id_from_device_handle(dest_gpu),
-                                        e.get_error_info())
-
-                topo_values[src_gpu_index]['numa_bandwidth'] = src_gpu_link_type
-
-                tabular_output_dict.update(src_gpu_link_type)
-                tabular_output.append(tabular_output_dict)
-
-            if self.logger.is_human_readable_format():
-                self.logger.multiple_device_output = tabular_output
-                self.logger.table_title = "NUMA BW TABLE"
-                self.logger.print_output(multiple_device_enabled=True, tabular=True)
-
-        if args.coherent:
-            tabular_output = []
-            for src_gpu_index, src_gpu in enumerate(args.gpu):
-                src_gpu_bdf = amdsmi_interface.amdsmi_get_gpu_device_bdf(src_gpu)
-                if self.logger.is_human_readable_format():
-                    tabular_output_dict = {'gpu' : f"{src_gpu_bdf} "}
-                else:
-                    tabular_output_dict = {'gpu' : src_gpu_bdf}
-                src_gpu_coherent = {}
-                for dest_gpu in args.gpu:
-                    dest_gpu_id = self.helpers.get_gpu_id_from_device_handle(dest_gpu)
-                    dest_gpu_key = f'gpu_{dest_gpu_id}'
-
-                    if src_gpu == dest_gpu:
-                        src_gpu_coherent[dest_gpu_key] = "SELF"
-                        continue
-                    try:
-                        iolink_coherent = amdsmi_interface.amdsmi_topo_get_p2p_status(src_gpu, dest_gpu)['cap']['is_iolink_coherent']
-                        src_gpu_coherent[dest_gpu_key] = "C" if iolink_coherent == 1 else "NC" if iolink_coherent == 0 else "N/A"
-                    except amdsmi_exception.AmdSmiLibraryException as e:
-                        src_gpu_coherent[dest_gpu_key] = "N/A"
-                        logging.debug("Failed to get link coherent for %s to %s | %s",
-                                        self.helpers.get_gpu_id_from_device_handle(src_gpu),
-                                        self.helpers.get_gpu_id_from_device_handle(dest_gpu),
-                                        e.get_error_info())
-
-                topo_values[src_gpu_index]['coherent'] = src_gpu_coherent
-
-                tabular_output_dict.update(src_gpu_coherent)
-                tabular_output.append(tabular_output_dict)
-
-            if self.logger.is_human_readable_format():
-                self.logger.multiple_device_output = tabular_output
-                self.logger.table_title = "CACHE COHERANCY TABLE"
-                self.logger.print_output(multiple_device_enabled=True, tabular=True)
-
-        if args.atomics:
-            tabular_output = []
-            for src_gpu_index, src_gpu in enumerate(args.gpu):
-                src_gpu_bdf = amdsmi_interface.amdsmi_get_gpu_device_bdf(src_gpu)
-                if self.logger.is_human_readable_format():
-                    tabular_output_dict = {'gpu' : f"{src_gpu_bdf} "}
-                else:
-                    tabular_output_dict = {'gpu' : src_gpu_bdf}
-                src_gpu_atomics = {}
-                for dest_gpu in args.gpu:
-                    dest_gpu_id = self.helpers.get_gpu_id_from_device_handle(dest_gpu)
-                    dest_gpu_key = f'gpu_{dest_gpu_id}'
-
-                    if src_gpu == dest_gpu:
-                        src_gpu_atomics[dest_gpu_key] = "SELF"
-                        continue
-                    try:
-                        cap = amdsmi_interface.amdsmi_topo_get_p2p_status(src_gpu, dest_gpu)['cap']
-                        src_gpu_atomics[dest_gpu_key] = (
-                            "64,32" if cap['is_iolink_atomics_32bit'] == 1 and cap['is_iolink_atomics_64bit'] == 1 else
-                            "32" if cap['is_iolink_atomics_32bit'] == 1 else
-                            "64" if cap['is_iolink_atomics_64bit'] == 1 else
-                            "N/A"
-                        )
-                    except amdsmi_exception.AmdSmiLibraryException as e:
-                        src_gpu_atomics[dest_gpu_key] = "N/A"
-                        logging.debug("Failed to get link atomics for %s to %s | %s",
-                                        self.helpers.get_gpu_id_from_device_handle(src_gpu),
-                                        self.helpers.get_gpu_id_from_device_handle(dest_gpu),
-                                        e.get_error_info())
-
-                topo_values[src_gpu_index]['atomics'] = src_gpu_atomics
-
-                tabular_output_dict.update(src_gpu_atomics)
-                tabular_output.append(tabular_output_dict)
-
-            if self.logger.is_human_readable_format():
-                self.logger.multiple_device_output = tabular_output
-                self.logger.table_title = "ATOMICS TABLE"
-                self.logger.print_output(multiple_device_enabled=True, tabular=True)
-
-        if args.dma:
-            tabular_output = []
-            for src_gpu_index, src_gpu in enumerate(args.gpu):
-                src_gpu_bdf = amdsmi_interface.amdsmi_get_gpu_device_bdf(src_gpu)
-                if self.logger.is_human_readable_format():
-                    tabular_output_dict = {'gpu' : f"{src_gpu_bdf} "}
-                else:
-                    tabular_output_dict = {'gpu' : src_gpu_bdf}
-                src_gpu_dma = {}
-                for dest_gpu in args.gpu:
-                    dest_gpu_id = self.helpers.get_gpu_id_from_device_handle(dest_gpu)
-                    dest_gpu_key = f'gpu_{dest_gpu_id}'
-
-                    if src_gpu == dest_gpu:
-                        src_gpu_dma[dest_gpu_key] = "SELF"
-                        continue
-                    try:
-                        iolink_dma = amdsmi_interface.amdsmi_topo_get_p2p_status(src_gpu, dest_gpu)['cap']['is_iolink_dma']
-                        src_gpu_dma[dest_gpu_key] = "T" if iolink_dma == 1 else "F" if iolink_dma == 0 else "N/A"
-                    except amdsmi_exception.AmdSmiLibraryException as e:
-                        src_gpu_dma[dest_gpu_key] = "N/A"
-                        logging.debug("Failed to get link dma for %s to %s | %s",
-                                        self.helpers.get_gpu_id_from_device_handle(src_gpu),
-                                        self.helpers.get_gpu_id_from_device_handle(dest_gpu),
-                                        e.get_error_info())
-
-                topo_values[src_gpu_index]['dma'] = src_gpu_dma
-
-                tabular_output_dict.update(src_gpu_dma)
-                tabular_output.append(tabular_output_dict)
-
-            if self.logger.is_human_readable_format():
-                self.logger.multiple_device_output = tabular_output
-                self.logger.table_title = "DMA TABLE"
-                self.logger.print_output(multiple_device_enabled=True, tabular=True)
-
-        if args.bi_dir:
+        # (args value, topo_values key, table title, link key)
+        topology_tables = [(args.access, 'link_accessibility', "ACCESS TABLE", 'access'),
+                           (args.weight, 'weight', "WEIGHT TABLE", 'weight'),
+                           (args.hops, 'hops', "HOPS TABLE", 'hops'),
+                           (args.link_type, 'link_type', "LINK TYPE TABLE", 'link_type'),
+                           (args.numa_bw, 'numa_bandwidth', "NUMA BW TABLE", 'numa_bw'),
+                           (args.coherent, 'coherent', "CACHE COHERANCY TABLE", 'coherent'),
+                           (args.atomics, 'atomics', "ATOMICS TABLE", 'atomics'),
+                           (args.dma, 'dma', "DMA TABLE", 'dma'),
+                           (args.bi_dir, 'bi_dir', "BI-DIRECTIONAL TABLE", 'bi_dir')]
+        for enabled, topo_key, table_title, link_key in topology_tables:
+            if not enabled:
+                continue
             tabular_output = []
-            for src_gpu_index, src_gpu in enumerate(args.gpu):
-                src_gpu_bdf = amdsmi_interface.amdsmi_get_gpu_device_bdf(src_gpu)
+            for src_gpu_index, src_gpu_bdf in enumerate(gpu_bdfs):
                 if self.logger.is_human_readable_format():
                     tabular_output_dict = {'gpu' : f"{src_gpu_bdf} "}
                 else:
                     tabular_output_dict = {'gpu' : src_gpu_bdf}
-                src_gpu_bi_dir = {}
-                for dest_gpu in args.gpu:
-                    dest_gpu_id = self.helpers.get_gpu_id_from_device_handle(dest_gpu)
-                    dest_gpu_key = f'gpu_{dest_gpu_id}'
-
-                    if src_gpu == dest_gpu:
-                        src_gpu_bi_dir[dest_gpu_key] = "SELF"
-                        continue
-                    try:
-                        iolink_bi_dir = amdsmi_interface.amdsmi_topo_get_p2p_status(src_gpu, dest_gpu)['cap']['is_iolink_bi_directional']
-                        src_gpu_bi_dir[dest_gpu_key] = "T" if iolink_bi_dir == 1 else "F" if iolink_bi_dir == 0 else "N/A"
-                    except amdsmi_exception.AmdSmiLibraryException as e:
-                        src_gpu_bi_dir[dest_gpu_key] = "N/A"
-                        logging.debug("Failed to get link bi-directional for %s to %s | %s",
-                                        self.helpers.get_gpu_id_from_device_handle(src_gpu),
-                                        self.helpers.get_gpu_id_from_device_handle(dest_gpu),
-                                        e.get_error_info())
+                src_gpu_values = {}
+                for dest_gpu_index, dest_gpu_bdf in enumerate(gpu_bdfs):
+                    src_gpu_values[f'gpu_{gpu_ids[dest_gpu_index]}'] = AMDSMITopology.format_link(
+                        link_key, topology_links[src_gpu_bdf][dest_gpu_bdf],
+                        src_gpu_index == dest_gpu_index, xgmi_bandwidth_only=True)
 
-                topo_values[src_gpu_index]['bi_dir'] = src_gpu_bi_dir
+                topo_values[src_gpu_index][topo_key] = src_gpu_values
 
-                tabular_output_dict.update(src_gpu_bi_dir)
+                tabular_output_dict.update(src_gpu_values)
                 tabular_output.append(tabular_output_dict)
 
             if self.logger.is_human_readable_format():
                 self.logger.multiple_device_output = tabular_output
-                self.logger.table_title = "BI-DIRECTIONAL TABLE"
+                self.logger.table_title = table_title
                 self.logger.print_output(multiple_device_enabled=True, tabular=True)
 
         if self.logger.is_human_readable_format():
@@ -3974,6 +3728,9 @@ class AMDSMICommands():
                 compute_partition = amdsmi_interface.AmdSmiComputePartitionType[args.compute_partition]
                 try:
                     amdsmi_interface.amdsmi_set_gpu_compute_partition(args.gpu, compute_partition)
+                    # Repartitioning changes the processor handles
+                    self.helpers.handle_registry.invalidate()
+                    self.topology_cache.invalidate()
                 except amdsmi_exception.AmdSmiLibraryException as e:
                     if e.get_error_code() == amdsmi_interface.amdsmi_wrapper.AMDSMI_STATUS_NO_PERM:
                         raise PermissionError('Command requires elevation') from e
@@ -3983,6 +3740,9 @@ class AMDSMICommands():
                 memory_partition = amdsmi_interface.AmdSmiMemoryPartitionType[args.memory_partition]
                 try:
                     amdsmi_interface.amdsmi_set_gpu_memory_partition(args.gpu, memory_partition)
+                    # Repartitioning changes the processor handles
+                    self.helpers.handle_registry.invalidate()
+                    self.topology_cache.invalidate()
                 except amdsmi_exception.AmdSmiLibraryException as e:
                     if e.get_error_code() == amdsmi_interface.amdsmi_wrapper.AMDSMI_STATUS_NO_PERM:
                         raise PermissionError('Command requires elevation') from e
@@ -4284,6 +4044,8 @@ class AMDSMICommands():
                 if self.helpers.is_amd_device(args.gpu):
                     try:
                         amdsmi_interface.amdsmi_reset_gpu(args.gpu)
+                        self.helpers.handle_registry.invalidate()
+                        self.topology_cache.invalidate()
                         result = 'Successfully reset GPU'
                     except amdsmi_exception.AmdSmiLibraryException as e:
                         if e.get_error_code() == amdsmi_interface.amdsmi_wrapper.AMDSMI_STATUS_NO_PERM:
@@ -4426,7 +4188,8 @@ class AMDSMICommands():
     def monitor(self, args, multiple_devices=False, watching_output=False, gpu=None,
                   watch=None, watch_time=None, iterations=None, power_usage=None,
                   temperature=None, gfx_util=None, mem_util=None, encoder=None, decoder=None,
-                  ecc=None, vram_usage=None, pcie=None, process=None, violation=None):
+                  ecc=None, vram_usage=None, pcie=None, process=None, violation=None, rates=None,
+                  sample_interval=None, fields=None):
         """ Populate a table with each GPU as an index to rows of targeted data
 
         Args:
@@ -4447,6 +4210,9 @@ class AMDSMICommands():
             pcie (bool, optional): Value override for args.pcie. Defaults to None.
             process (bool, optional): Value override for args.process. Defaults to None.
             violation (bool, optional): Value override for args.violation. Defaults to None.
+            rates (bool, optional): Value override for args.rates. Defaults to None.
+            sample_interval (float, optional): Value override for args.sample_interval. Defaults to None.
+            fields (list, optional): Value override for args.fields. Defaults to None.
 
         Raises:
             ValueError: Value error if no gpu value is provided
@@ -4464,6 +4230,8 @@ class AMDSMICommands():
             args.watch_time = watch_time
         if iterations:
             args.iterations = iterations
+        if sample_interval:
+            args.sample_interval = sample_interval
 
         # monitor args
         if power_usage:
@@ -4488,6 +4256,10 @@ class AMDSMICommands():
             args.process = process
         if violation:
             args.violation = violation
+        if rates:
+            args.rates = rates
+        if fields:
+            args.fields = fields
 
         # Handle No GPU passed
         if args.gpu == None:
@@ -4497,14 +4269,15 @@ class AMDSMICommands():
         if self.helpers.is_virtual_os():
             args.ecc = False
             if not any([args.power_usage, args.temperature, args.gfx, args.mem,
-                    args.encoder, args.decoder, args.vram_usage, args.pcie, args.violation]):
+                    args.encoder, args.decoder, args.vram_usage, args.pcie, args.violation,
+                    args.rates, args.fields]):
                 args.power_usage = args.temperature = args.gfx = args.mem = \
                 args.encoder = args.decoder = \
                 args.vram_usage = args.pcie = args.violation = True
         else:
             if not any([args.power_usage, args.temperature, args.gfx, args.mem,
                     args.encoder, args.decoder, args.ecc,
-                    args.vram_usage, args.pcie, args.violation]):
+                    args.vram_usage, args.pcie, args.violation, args.rates, args.fields]):
                 args.power_usage = args.temperature = args.gfx = args.mem = \
                 args.encoder = args.decoder = args.ecc = \
                 args.vram_usage = args.pcie = args.violation = True
@@ -4513,16 +4286,37 @@ class AMDSMICommands():
         # Don't include process in this logic as it's an optional edge case
         if not any([args.power_usage, args.temperature, args.gfx, args.mem,
                     args.encoder, args.decoder, args.ecc,
-                    args.vram_usage, args.pcie, args.violation]):
+                    args.vram_usage, args.pcie, args.violation, args.rates, args.fields]):
             args.power_usage = args.temperature = args.gfx = args.mem = \
                 args.encoder = args.decoder = args.ecc = \
                 args.vram_usage = args.pcie = args.violation = True
 
         # Handle watch logic, will only enter this block once
         if args.watch:
-            self.helpers.handle_watch(args=args, subcommand=self.monitor, logger=self.logger)
+            sampler_fields = {}
+            if args.power_usage:
+                # Fallback to average_socket_power for older gpu_metrics versions
+                sampler_fields['power'] = ['current_socket_power', 'average_socket_power']
+            if args.temperature:
+                sampler_fields['hotspot_temperature'] = ['temperature_hotspot']
+            if args.sample_interval and sampler_fields:
+                sampled_gpus = args.gpu if isinstance(args.gpu, list) else [args.gpu]
+                # Room for every sample of one watch interval
+                ring_size = math.ceil(args.watch / args.sample_interval) + 1
+                self.sampler = AMDSMISampler(sampled_gpus, sampler_fields, args.sample_interval, ring_size)
+                self.sampler.start()
+            try:
+                self.helpers.handle_watch(args=args, subcommand=self.monitor, logger=self.logger)
+            finally:
+                if self.sampler is not None:
+                    self.sampler.stop()
+                    self.sampler = None
             return
 
+        # Each top level call is one tick; every column reads from the same per device snapshot
+        if not multiple_devices:
+            self.snapshot.start_tick()
+
         # Handle multiple GPUs
         if isinstance(args.gpu, list):
             if len(args.gpu) > 1:
@@ -4531,9 +4325,12 @@ class AMDSMICommands():
                 for gpu in args.gpu:
                     stored_gpus.append(gpu)
 
+                if args.rates:
+                    self._prime_counter_rates(args.gpu)
+
                 # Store output from multiple devices without printing to console
-                for device_handle in args.gpu:
-                    self.monitor(args, multiple_devices=True, watching_output=watching_output, gpu=device_handle)
+                self.helpers.collect_device_outputs(args, self.logger, self.monitor, watching_output=watching_output)
+                self.snapshot.end_tick()
 
                 # Reload original gpus
                 args.gpu = stored_gpus
@@ -4551,7 +4348,7 @@ class AMDSMICommands():
 
                 # Add output to total watch output and clear multiple device output
                 if watching_output:
-                    self.logger.store_watch_output(multiple_device_enabled=True)
+                    self.logger.store_watch_output(multiple_device_enabled=True, tabular=True)
 
                 return
             elif len(args.gpu) == 1:
@@ -4570,18 +4367,23 @@ class AMDSMICommands():
             self.logger.store_output(args.gpu, 'timestamp', int(time.time()))
             self.logger.table_header = 'TIMESTAMP'.rjust(10) + '  ' + self.logger.table_header
 
-        # Store the pcie_bw values due to possible increase in bandwidth due to repeated gpu_metrics calls
+        # Store the pcie_bw values first; the pcie_info snapshot is shared with the ecc pcie_replay column
         if args.pcie:
             try:
-                pcie_info = amdsmi_interface.amdsmi_get_pcie_info(args.gpu)['pcie_metric']
+                pcie_info = self.snapshot.get(amdsmi_interface.amdsmi_get_pcie_info, args.gpu)['pcie_metric']
             except amdsmi_exception.AmdSmiLibraryException as e:
                 pcie_info = "N/A"
                 logging.debug("Failed to get pci bandwidth on gpu %s | %s", gpu_id, e.get_error_info())
 
+        # Aggregates of the samples taken since the previous watch iteration
+        sampled_values = {}
+        if self.sampler is not None:
+            sampled_values = self.sampler.collect(args.gpu)
+
         # Resume regular ordering of values
         if args.power_usage:
             try:
-                gpu_metrics_info = amdsmi_interface.amdsmi_get_gpu_metrics_info(args.gpu)
+                gpu_metrics_info = self.snapshot.get(amdsmi_interface.amdsmi_get_gpu_metrics_info, args.gpu)
 
                 if gpu_metrics_info['current_socket_power'] != "N/A":
                     monitor_values['power_usage'] = gpu_metrics_info['current_socket_power']
@@ -4600,16 +4402,20 @@ class AMDSMICommands():
                 logging.debug("Failed to get power usage on gpu %s | %s", gpu_id, e.get_error_info())
 
             self.logger.table_header += 'POWER'.rjust(7)
+
+            if 'power' in sampled_values:
+                self._store_sampled_values(monitor_values, sampled_values['power'],
+                                           'power', 'POWER', 'W', 11)
         if args.temperature:
             try:
-                temperature = amdsmi_interface.amdsmi_get_gpu_metrics_info(args.gpu)['temperature_hotspot']
+                temperature = self.snapshot.get(amdsmi_interface.amdsmi_get_gpu_metrics_info, args.gpu)['temperature_hotspot']
                 monitor_values['hotspot_temperature'] = temperature
             except amdsmi_exception.AmdSmiLibraryException as e:
                 monitor_values['hotspot_temperature'] = "N/A"
                 logging.debug("Failed to get hotspot temperature on gpu %s | %s", gpu_id, e.get_error_info())
 
             try:
-                temperature = amdsmi_interface.amdsmi_get_gpu_metrics_info(args.gpu)['temperature_mem']
+                temperature = self.snapshot.get(amdsmi_interface.amdsmi_get_gpu_metrics_info, args.gpu)['temperature_mem']
                 monitor_values['memory_temperature'] = temperature
             except amdsmi_exception.AmdSmiLibraryException as e:
                 monitor_values['memory_temperature'] = "N/A"
@@ -4632,9 +4438,17 @@ class AMDSMICommands():
 
             self.logger.table_header += 'GPU_TEMP'.rjust(10)
             self.logger.table_header += 'MEM_TEMP'.rjust(10)
+
+            if 'hotspot_temperature' in sampled_values:
+                if self.logger.is_human_readable_format():
+                    sampled_temp_unit = temp_unit_human_readable
+                else:
+                    sampled_temp_unit = temp_unit_json
+                self._store_sampled_values(monitor_values, sampled_values['hotspot_temperature'],
+                                           'hotspot_temperature', 'GPU_TEMP', sampled_temp_unit, 14)
         if args.gfx:
             try:
-                gfx_util = amdsmi_interface.amdsmi_get_gpu_metrics_info(args.gpu)['average_gfx_activity']
+                gfx_util = self.snapshot.get(amdsmi_interface.amdsmi_get_gpu_metrics_info, args.gpu)['average_gfx_activity']
                 monitor_values['gfx'] = gfx_util
                 activity_unit = '%'
                 if gfx_util != "N/A":
@@ -4650,7 +4464,7 @@ class AMDSMICommands():
             self.logger.table_header += 'GFX_UTIL'.rjust(10)
 
             try:
-                gfx_clock = amdsmi_interface.amdsmi_get_gpu_metrics_info(args.gpu)['current_gfxclk']
+                gfx_clock = self.snapshot.get(amdsmi_interface.amdsmi_get_gpu_metrics_info, args.gpu)['current_gfxclk']
                 monitor_values['gfx_clock'] = gfx_clock
                 freq_unit = 'MHz'
                 if gfx_clock != "N/A":
@@ -4667,7 +4481,7 @@ class AMDSMICommands():
             self.logger.table_header += 'GFX_CLOCK'.rjust(11)
         if args.mem:
             try:
-                mem_util = amdsmi_interface.amdsmi_get_gpu_metrics_info(args.gpu)['average_umc_activity']
+                mem_util = self.snapshot.get(amdsmi_interface.amdsmi_get_gpu_metrics_info, args.gpu)['average_umc_activity']
                 monitor_values['mem'] = mem_util
                 activity_unit = '%'
                 if mem_util != "N/A":
@@ -4683,7 +4497,7 @@ class AMDSMICommands():
             self.logger.table_header += 'MEM_UTIL'.rjust(10)
 
             try:
-                mem_clock = amdsmi_interface.amdsmi_get_gpu_metrics_info(args.gpu)['current_uclk']
+                mem_clock = self.snapshot.get(amdsmi_interface.amdsmi_get_gpu_metrics_info, args.gpu)['current_uclk']
                 monitor_values['mem_clock'] = mem_clock
                 freq_unit = 'MHz'
                 if mem_clock != "N/A":
@@ -4700,7 +4514,7 @@ class AMDSMICommands():
         if args.encoder:
             try:
                 # Get List of vcn activity values
-                encoder_util = amdsmi_interface.amdsmi_get_gpu_metrics_info(args.gpu)['vcn_activity']
+                encoder_util = self.snapshot.get(amdsmi_interface.amdsmi_get_gpu_metrics_info, args.gpu)['vcn_activity']
                 encoding_activity_avg = []
                 for value in encoder_util:
                     if isinstance(value, int):
@@ -4728,7 +4542,7 @@ class AMDSMICommands():
             self.logger.table_header += 'ENC_UTIL'.rjust(10)
 
             try:
-                encoder_clock = amdsmi_interface.amdsmi_get_gpu_metrics_info(args.gpu)['current_vclk0']
+                encoder_clock = self.snapshot.get(amdsmi_interface.amdsmi_get_gpu_metrics_info, args.gpu)['current_vclk0']
                 monitor_values['encoder_clock'] = encoder_clock
                 freq_unit = 'MHz'
                 if encoder_clock != "N/A":
@@ -4755,7 +4569,7 @@ class AMDSMICommands():
             self.logger.table_header += 'DEC_UTIL'.rjust(10)
 
             try:
-                decoder_clock = amdsmi_interface.amdsmi_get_gpu_metrics_info(args.gpu)['current_dclk0']
+                decoder_clock = self.snapshot.get(amdsmi_interface.amdsmi_get_gpu_metrics_info, args.gpu)['current_dclk0']
                 monitor_values['decoder_clock'] = decoder_clock
 
                 freq_unit = 'MHz'
@@ -4783,7 +4597,7 @@ class AMDSMICommands():
             self.logger.table_header += 'DOUBLE_ECC'.rjust(12)
 
             try:
-                pcie_metric = amdsmi_interface.amdsmi_get_pcie_info(args.gpu)['pcie_metric']
+                pcie_metric = self.snapshot.get(amdsmi_interface.amdsmi_get_pcie_info, args.gpu)['pcie_metric']
                 logging.debug("PCIE Metric for %s | %s", gpu_id, pcie_metric)
                 monitor_values['pcie_replay'] = pcie_metric['pcie_replay_count']
             except amdsmi_exception.AmdSmiLibraryException as e:
@@ -4872,6 +4686,55 @@ class AMDSMICommands():
             self.logger.table_header += 'VR_TVIOL'.rjust(kVR_MAX_WIDTH, ' ')
             self.logger.table_header += 'HBM_TVIOL'.rjust(kHBM_MAX_WIDTH, ' ')
 
+        if args.rates:
+            rates_values = {
+                "avg_power": "N/A",
+                "pcie_avg_bw": "N/A",
+                "xgmi_read_bw": "N/A",
+                "xgmi_write_bw": "N/A",
+                "ppt_residency": "N/A",
+                "thm_residency": "N/A",
+            }
+            try:
+                gpu_metrics_info = self.snapshot.get(amdsmi_interface.amdsmi_get_gpu_metrics_info, args.gpu)
+                rates = self._get_counter_rates(args.gpu, gpu_metrics_info)
+                rates_values['avg_power'] = rates['power']
+                rates_values['pcie_avg_bw'] = rates['pcie_bandwidth']
+                # Total over all xgmi links
+                for key, rate_key in (('xgmi_read_bw', 'xgmi_read_bandwidth'), ('xgmi_write_bw', 'xgmi_write_bandwidth')):
+                    link_rates = [rate for rate in rates[rate_key] if rate != "N/A"]
+                    if link_rates:
+                        rates_values[key] = round(sum(link_rates), 3)
+                rates_values['ppt_residency'] = rates['ppt_residency']
+                rates_values['thm_residency'] = rates['socket_thm_residency']
+            except amdsmi_exception.AmdSmiLibraryException as e:
+                logging.debug("Failed to get counter rates on gpu %s | %s", gpu_id, e.get_error_info())
+
+            rates_units = {"avg_power": "W", "pcie_avg_bw": "GB/s", "xgmi_read_bw": "GB/s",
+                           "xgmi_write_bw": "GB/s", "ppt_residency": "%", "thm_residency": "%"}
+            rates_headers = {"avg_power": ('AVG_POWER', 11), "pcie_avg_bw": ('PCIE_AVG', 13),
+                             "xgmi_read_bw": ('XGMI_READ', 13), "xgmi_write_bw": ('XGMI_WRITE', 13),
+                             "ppt_residency": ('PPT_RES', 10), "thm_residency": ('THM_RES', 10)}
+            for key, value in rates_values.items():
+                if value != "N/A":
+                    value = self.helpers.unit_format(self.logger, value, rates_units[key])
+                header, width = rates_headers[key]
+                if self.logger.is_human_readable_format():
+                    value = value.rjust(width, ' ')
+                monitor_values[key] = value
+                self.logger.table_header += header.rjust(width, ' ')
+
+        # Selected fields are read through the snapshot, sharing sources with the columns above
+        if args.fields:
+            field_values = AMDSMIFieldPlan(args.fields).read(args.gpu, snapshot=self.snapshot)
+            for field, value in self._format_field_values(field_values).items():
+                header = field.upper()
+                width = max(len(header) + 2, 10)
+                if self.logger.is_human_readable_format():
+                    value = str(value).rjust(width, ' ')
+                monitor_values[field] = value
+                self.logger.table_header += header.rjust(width, ' ')
+
         self.logger.store_output(args.gpu, 'values', monitor_values)
 
         # intialize dual_csv_format; applicable to process only
@@ -4959,13 +4822,87 @@ class AMDSMICommands():
             self.logger.store_multiple_device_output()
             return
 
+        self.snapshot.end_tick()
+
         if watching_output and not self.logger.destination == "stdout": # End of single gpu add to watch_output
-            self.logger.store_watch_output(multiple_device_enabled=False)
+            self.logger.store_watch_output(multiple_device_enabled=False, tabular=True)
 
 
         self.logger.print_output(multiple_device_enabled=False, watching_output=watching_output, tabular=True, dual_csv_output=dual_csv_output)
 
 
+    def _store_sampled_values(self, monitor_values, aggregates, key, header, unit, width):
+        """Store the min, avg, max, and p99 of a sampled monitor value as columns
+
+        Args:
+            monitor_values (dict): monitor output of the device
+            aggregates (dict): AMDSMISampler.collect output of the value
+            key (str): monitor key of the value, ex. power -> power_min
+            header (str): table header of the value, ex. POWER -> POWER_MIN
+            unit (str): unit of the value
+            width (int): column width
+        """
+        for aggregate in SAMPLER_AGGREGATES:
+            value = aggregates[aggregate]
+            if value != "N/A":
+                value = self.helpers.unit_format(self.logger, value, unit)
+            if self.logger.is_human_readable_format():
+                value = value.rjust(width, ' ')
+            monitor_values[f"{key}_{aggregate}"] = value
+            self.logger.table_header += f"{header}_{aggregate.upper()}".rjust(width, ' ')
+
+
+    def _format_field_values(self, field_values):
+        """Format the values read for --fields with their units
+
+        Args:
+            field_values (dict): AMDSMIFieldPlan.read output
+
+        Returns:
+            dict: field_values formatted for the current output format
+        """
+        for field, value in field_values.items():
+            unit = AMDSMIFieldPlan.get_unit(field)
+            if value == "N/A" or not unit:
+                continue
+            if self.logger.is_json_format() and unit == '\N{DEGREE SIGN}C':
+                unit = 'C'
+            field_values[field] = self.helpers.unit_format(self.logger, value, unit)
+        return field_values
+
+
+    def daemon(self, args):
+        """Keep the library initialized and serve metric, monitor, and static
+            queries over a Unix socket until interrupted
+
+        Args:
+            args (Namespace): Namespace containing the parsed CLI args
+        """
+        amdsmi_daemon = AMDSMIDaemon(self, args.query_parser, args.socket)
+        amdsmi_daemon.serve_forever()
+
+
+    def exporter(self, args, gpu=None):
+        """Sample the monitor metrics in the background and serve them for
+            Prometheus over HTTP until interrupted
+
+        Args:
+            args (Namespace): Namespace containing the parsed CLI args
+            gpu (device_handle, optional): device_handle for target device. Defaults to None.
+        """
+        if gpu:
+            args.gpu = gpu
+
+        # Handle No GPU passed
+        if args.gpu == None:
+            args.gpu = self.device_handles
+        if not isinstance(args.gpu, list):
+            args.gpu = [args.gpu]
+
+        amdsmi_exporter = AMDSMIExporter(self.helpers, args.gpu, interval=args.interval)
+        amdsmi_exporter.serve_forever(args.address, args.port)
+
+
     def rocm_smi(self, args):
         print("Placeholder for rocm-smi legacy commands")
 
@@ -5378,31 +5315,3 @@ class AMDSMICommands():
             self.logger.table_title = "ACCELERATOR_PARTITION_PROFILES"
             self.logger.print_output(multiple_device_enabled=True, tabular=True)
             self.logger.clear_multiple_devices_ouput()
-
-
-    def _event_thread(self, commands, i):
-        devices = commands.device_handles
-        if len(devices) == 0:
-            print("No GPUs on machine")
-            return
-
-        device = devices[i]
-        listener = amdsmi_interface.AmdSmiEventReader(device,
-                                        amdsmi_interface.AmdSmiEvtNotificationType)
-        values_dict = {}
-
-        while not self.stop:
-            try:
-                events = listener.read(2000)
-                for event in events:
-                    values_dict["event"] = event["event"]
-                    values_dict["message"] = event["message"]
-                    commands.logger.store_output(device, 'values', values_dict)
-                    commands.logger.print_output()
-            except amdsmi_exception.AmdSmiLibraryException as e:
-                if e.err_code != amdsmi_interface.amdsmi_wrapper.AMDSMI_STATUS_NO_DATA:
-                    print(e)
-            except Exception as e:
-                print(e)
-
-        listener.stop()
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+#
+# Copyright (C) 2024 Advanced Micro Devices. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+
+""" amd-smi daemon and its thin client
+
+The daemon keeps the library initialized and answers metric, monitor and static
+queries over a Unix socket. Each request is a single line of JSON holding the
+amd-smi arguments, each reply is a single line of JSON holding the output the
+same command would print:
+
+    request: {"command": ["metric", "--gpu", "0", "--json"]}
+    reply:   {"status": 0, "output": "..."}
+             {"status": 1, "error": "..."}
+
+Running this file directly acts as the client, so existing callers only need to
+replace `amd-smi` with `amdsmi_daemon.py`:
+
+    amdsmi_daemon.py [--socket PATH] metric --gpu 0 --json
+
+The client only imports the standard library, it doesn't load the amdsmi library.
+"""
+
+import contextlib
+import io
+import json
+import logging
+import os
+import socket
+import stat
+import sys
+
+
+SOCKET_NAME = "daemon.sock"
+SOCKET_PATH_ENV = "AMDSMI_DAEMON_SOCKET"
+MAX_REQUEST_SIZE = 64 * 1024
+CLIENT_TIMEOUT = 30
+
+
+def get_socket_dir():
+    """Return the directory of the default socket, only accessible by the user
+
+    $XDG_RUNTIME_DIR/amdsmi, or /tmp/amdsmi-<uid> when XDG_RUNTIME_DIR is not set.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "amdsmi")
+    return os.path.join("/tmp", f"amdsmi-{os.getuid()}")
+
+
+def get_socket_path(socket_path=None):
+    """Return socket_path, the AMDSMI_DAEMON_SOCKET environment variable or the default path"""
+    if socket_path:
+        return socket_path
+    return os.environ.get(SOCKET_PATH_ENV) or os.path.join(get_socket_dir(), SOCKET_NAME)
+
+
+def _make_private_dir(directory):
+    """Create directory with mode 0700, fail if it exists and others can access it"""
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    dir_stat = os.lstat(directory)
+    if not stat.S_ISDIR(dir_stat.st_mode) or dir_stat.st_uid != os.getuid() or dir_stat.st_mode & 0o077:
+        raise RuntimeError(f"{directory} must be a directory owned by the user with mode 0700")
+
+
+class AMDSMIDaemon():
+    """Serve amd-smi queries over a Unix socket from an initialized AMDSMICommands
+
+    Requests are handled one at a time by the existing AMDSMICommands handlers,
+    their printed output is captured and returned to the client.
+    """
+
+    def __init__(self, commands, parser, socket_path=None) -> None:
+        """
+        params:
+            commands (AMDSMICommands) - initialized commands used as request handlers
+            parser (AMDSMIParser) - parser used to convert requests into handler arguments
+            socket_path (str) - path of the Unix socket to listen on
+        """
+        self.commands = commands
+        self.parser = parser
+        self.socket_path = get_socket_path(socket_path)
+        self.socket_stat = None
+        # Only read only queries are served, anything that changes device state needs amd-smi
+        self.handlers = (commands.metric, commands.monitor, commands.static)
+        self.requests_served = 0
+
+
+    def _is_own_socket(self, socket_stat):
+        return stat.S_ISSOCK(socket_stat.st_mode) and socket_stat.st_uid == os.getuid()
+
+
+    def _bind(self):
+        """Bind the listening socket, only accessible by the user
+
+        A stale socket file left by a previous daemon of the user is replaced,
+        anything else at the socket path is left alone.
+        """
+        if os.path.dirname(self.socket_path) == get_socket_dir():
+            _make_private_dir(get_socket_dir())
+
+        try:
+            socket_stat = os.lstat(self.socket_path)
+        except FileNotFoundError:
+            pass
+        else:
+            if not self._is_own_socket(socket_stat):
+                raise RuntimeError(f"{self.socket_path} exists and is not a socket owned by the user")
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.unlink(self.socket_path)
+            else:
+                raise RuntimeError(f"amd-smi daemon already listening on {self.socket_path}")
+            finally:
+                probe.close()
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # The socket file is created 0600 so other users can't connect
+        umask = os.umask(0o177)
+        try:
+            server.bind(self.socket_path)
+        except OSError:
+            server.close()
+            raise
+        finally:
+            os.umask(umask)
+        self.socket_stat = os.lstat(self.socket_path)
+        server.listen()
+        return server
+
+
+    def serve_forever(self):
+        """Accept and answer requests until interrupted"""
+        server = self._bind()
+        print(f"amd-smi daemon listening on {self.socket_path}")
+        sys.stdout.flush()
+        try:
+            while True:
+                connection, _ = server.accept()
+                with connection:
+                    connection.settimeout(CLIENT_TIMEOUT)
+                    try:
+                        request = _recv_line(connection)
+                        reply = self.handle_request(request)
+                        connection.sendall(json.dumps(reply).encode("utf-8") + b"\n")
+                    except (OSError, ValueError) as e:
+                        logging.debug("amd-smi daemon: dropped client request | %s", e)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
+            self._unlink_socket()
+            logging.debug("amd-smi daemon: served %s requests", self.requests_served)
+
+
+    def _unlink_socket(self):
+        """Remove the socket file if it is still the one this daemon bound"""
+        try:
+            socket_stat = os.lstat(self.socket_path)
+        except FileNotFoundError:
+            return
+        if (socket_stat.st_dev, socket_stat.st_ino) == (self.socket_stat.st_dev, self.socket_stat.st_ino):
+            os.unlink(self.socket_path)
+
+
+    def handle_request(self, request):
+        """Run one request and return the reply dictionary
+        params:
+            request (bytes) - JSON encoded request line
+        return:
+            dict : {"status": 0, "output": str} or {"status": 1, "error": str}
+        """
+        try:
+            command = json.loads(request)["command"]
+            if not isinstance(command, list) or not all(isinstance(arg, str) for arg in command):
+                raise TypeError
+        except (ValueError, KeyError, TypeError):
+            return {"status": 1, "error": 'Invalid request, expected {"command": ["<subcommand>", "<args>", ...]}'}
+
+        self.requests_served += 1
+        output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+                self._run_command(command)
+        except Exception as e:
+            return {"status": 1, "error": self._format_error(e)}
+        except SystemExit:
+            # argparse exits on --help and on some usage errors, return what it printed
+            return {"status": 1, "error": output.getvalue()}
+        return {"status": 0, "output": output.getvalue()}
+
+
+    def _run_command(self, command):
+        args = self.parser.parse_args(args=command)
+        if getattr(args, "func", None) not in self.handlers:
+            raise ValueError(f"amd-smi daemon only serves metric, monitor and static queries: {' '.join(command)}")
+        if getattr(args, "watch", None):
+            raise ValueError("Watch arguments are not supported through the daemon, query it at the desired interval")
+
+        # Reset the logger left over from the previous request
+        logger = self.commands.logger
+        logger.output = {}
+        logger.multiple_device_output = []
+        logger.destination = 'stdout'
+        if args.json:
+            logger.format = logger.LoggerFormat.json.value
+        elif args.csv:
+            logger.format = logger.LoggerFormat.csv.value
+        else:
+            logger.format = logger.LoggerFormat.human_readable.value
+        if args.file:
+            raise ValueError("--file is not supported through the daemon, redirect the client output instead")
+
+        args.func(args)
+
+
+    def _format_error(self, error):
+        # Match the error output of amd-smi
+        import amdsmi_cli_exceptions
+        from amdsmi import amdsmi_exception
+
+        if isinstance(error, amdsmi_exception.AmdSmiLibraryException):
+            error = amdsmi_cli_exceptions.AmdSmiAMDSMIErrorException(self.commands.logger.format,
+                                                                    error.get_error_code())
+        return str(error)
+
+
+def _recv_line(connection):
+    """Read a single newline terminated message from connection"""
+    data = b""
+    while not data.endswith(b"\n"):
+        chunk = connection.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+        if len(data) > MAX_REQUEST_SIZE:
+            raise ValueError("Request too large")
+    return data
+
+
+def query(command, socket_path=None, timeout=CLIENT_TIMEOUT):
+    """Send an amd-smi command to the daemon and return its reply
+    params:
+        command (list[str]) - amd-smi arguments ex: ["metric", "--gpu", "0", "--json"]
+        socket_path (str) - daemon socket path, see get_socket_path
+        timeout (int) - seconds to wait for the reply
+    return:
+        dict : {"status": 0, "output": str} or {"status": 1, "error": str}
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.settimeout(timeout)
+        connection.connect(get_socket_path(socket_path))
+        connection.sendall(json.dumps({"command": list(command)}).encode("utf-8") + b"\n")
+        return json.loads(_recv_line(connection))
+
+
+def main(argv):
+    socket_path = None
+    if len(argv) >= 2 and argv[0] == "--socket":
+        socket_path = argv[1]
+        argv = argv[2:]
+    if not argv:
+        print("usage: amdsmi_daemon.py [--socket PATH] <amd-smi metric|monitor|static arguments>")
+        return 1
+
+    try:
+        reply = query(argv, socket_path)
+    except OSError as e:
+        print(f"Unable to reach amd-smi daemon on {get_socket_path(socket_path)}: {e}", file=sys.stderr)
+        return 1
+
+    if reply["status"] == 0:
+        print(reply["output"], end='')
+        return 0
+    print(reply["error"])
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+#
+# Copyright (C) 2024 Advanced Micro Devices. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+
+import http.server
+import logging
+import socketserver
+import threading
+import time
+
+from amdsmi import amdsmi_interface
+from amdsmi import amdsmi_exception
+from amdsmi_sampler import run_sampler_loop
+
+
+# gpu_metrics keys read for the amd-smi monitor columns
+MONITOR_GPU_METRICS_FIELDS = ['current_socket_power', 'average_socket_power',
+                              'temperature_hotspot', 'temperature_mem',
+                              'average_gfx_activity', 'average_umc_activity', 'vcn_activity',
+                              'current_gfxclk', 'current_uclk', 'current_vclk0', 'current_dclk0']
+
+# Metric name: (type, help), rendered in this order
+EXPORTER_METRICS = {
+    'amdsmi_power_watts': ('gauge', "Socket power in W"),
+    'amdsmi_temperature_celsius': ('gauge', "Temperature in C"),
+    'amdsmi_utilization_percent': ('gauge', "Engine utilization in %"),
+    'amdsmi_clock_mhz': ('gauge', "Current clock frequency in MHz"),
+    'amdsmi_ecc_errors_total': ('counter', "ECC error count"),
+    'amdsmi_pcie_replay_total': ('counter', "PCIe replay count"),
+    'amdsmi_pcie_bandwidth_mbps': ('gauge', "PCIe bandwidth in Mb/s"),
+    'amdsmi_vram_used_megabytes': ('gauge', "VRAM used in MB"),
+    'amdsmi_vram_total_megabytes': ('gauge', "VRAM total in MB"),
+    'amdsmi_violation_percent': ('gauge', "Power and thermal violation status in %"),
+}
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class AMDSMIExporter():
+    """Serve amd-smi monitor metrics in the Prometheus text format
+
+    A background thread samples every device at a fixed interval and renders
+    the exposition text once per sample. Scrapes only return the latest
+    rendered text with its age, they never call the library, so the scrape
+    latency doesn't depend on the number of GPUs.
+    """
+
+    def __init__(self, helpers, device_handles, interval=1) -> None:
+        """
+        params:
+            helpers (AMDSMIHelpers) - used to resolve gpu ids and BDFs
+            device_handles (list) - gpu device handles to sample
+            interval (int) - seconds between samples
+        """
+        self.device_handles = device_handles
+        self.interval = interval
+        self.samples_total = 0
+        self.sample_errors_total = 0
+        # Rendered text and time of the latest sample
+        self.latest = (b"", time.time())
+        self._stop = threading.Event()
+
+        # gpu and bdf labels don't change while sampling
+        self.device_labels = []
+        for device_handle in device_handles:
+            gpu_id = helpers.get_gpu_id_from_device_handle(device_handle)
+            bdf = helpers.handle_registry.get_gpu_bdf(device_handle)
+            self.device_labels.append(f'gpu="{gpu_id}",bdf="{bdf}"')
+
+
+    def sample(self):
+        """Read every device once
+        return:
+            dict : {"timestamp": float, "duration": float,
+                    "values": {metric_name: [(labels, value), ...]}}
+        """
+        start_time = time.time()
+        values = {metric_name: [] for metric_name in EXPORTER_METRICS}
+
+        def add_value(metric_name, labels, value):
+            # Skip N/A and any other non numeric value
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                values[metric_name].append((labels, value))
+
+        gpu_metrics = amdsmi_interface.amdsmi_get_gpu_metrics_info_batch(self.device_handles,
+                                                                         fields=MONITOR_GPU_METRICS_FIELDS)
+        for index, device_handle in enumerate(self.device_handles):
+            labels = self.device_labels[index]
+
+            power = gpu_metrics['current_socket_power'][index]
+            if power == "N/A":
+                power = gpu_metrics['average_socket_power'][index]
+            add_value('amdsmi_power_watts', labels, power)
+            add_value('amdsmi_temperature_celsius', f'{labels},sensor="hotspot"', gpu_metrics['temperature_hotspot'][index])
+            add_value('amdsmi_temperature_celsius', f'{labels},sensor="memory"', gpu_metrics['temperature_mem'][index])
+            add_value('amdsmi_utilization_percent', f'{labels},engine="gfx"', gpu_metrics['average_gfx_activity'][index])
+            add_value('amdsmi_utilization_percent', f'{labels},engine="mem"', gpu_metrics['average_umc_activity'][index])
+            vcn_activity = gpu_metrics['vcn_activity'][index]
+            if isinstance(vcn_activity, list):
+                # Averaging the possible encoding activity values, same as monitor
+                vcn_activity = [value for value in vcn_activity if isinstance(value, int)]
+                if vcn_activity:
+                    add_value('amdsmi_utilization_percent', f'{labels},engine="encoder"',
+                              sum(vcn_activity) / len(vcn_activity))
+            add_value('amdsmi_clock_mhz', f'{labels},clock="gfx"', gpu_metrics['current_gfxclk'][index])
+            add_value('amdsmi_clock_mhz', f'{labels},clock="mem"', gpu_metrics['current_uclk'][index])
+            add_value('amdsmi_clock_mhz', f'{labels},clock="encoder"', gpu_metrics['current_vclk0'][index])
+            add_value('amdsmi_clock_mhz', f'{labels},clock="decoder"', gpu_metrics['current_dclk0'][index])
+
+            try:
+                ecc = amdsmi_interface.amdsmi_get_gpu_total_ecc_count(device_handle)
+                add_value('amdsmi_ecc_errors_total', f'{labels},type="correctable"', ecc['correctable_count'])
+                add_value('amdsmi_ecc_errors_total', f'{labels},type="uncorrectable"', ecc['uncorrectable_count'])
+            except amdsmi_exception.AmdSmiLibraryException as e:
+                logging.debug("Failed to get ecc on %s | %s", labels, e.get_error_info())
+
+            try:
+                pcie_metric = amdsmi_interface.amdsmi_get_pcie_info(device_handle)['pcie_metric']
+                add_value('amdsmi_pcie_replay_total', labels, pcie_metric['pcie_replay_count'])
+                add_value('amdsmi_pcie_bandwidth_mbps', labels, pcie_metric['pcie_bandwidth'])
+            except amdsmi_exception.AmdSmiLibraryException as e:
+                logging.debug("Failed to get pcie info on %s | %s", labels, e.get_error_info())
+
+            try:
+                vram_usage = amdsmi_interface.amdsmi_get_gpu_vram_usage(device_handle)
+                add_value('amdsmi_vram_used_megabytes', labels, vram_usage['vram_used'])
+                add_value('amdsmi_vram_total_megabytes', labels, vram_usage['vram_total'])
+            except amdsmi_exception.AmdSmiLibraryException as e:
+                logging.debug("Failed to get vram memory usage on %s | %s", labels, e.get_error_info())
+
+            try:
+                violations = amdsmi_interface.amdsmi_get_violation_status(device_handle)
+                for violation_type, key in (('pviol', 'per_ppt_pwr'), ('tviol', 'per_socket_thrm'),
+                                            ('phot_tviol', 'per_prochot_thrm'), ('vr_tviol', 'per_vr_thrm'),
+                                            ('hbm_tviol', 'per_hbm_thrm')):
+                    add_value('amdsmi_violation_percent', f'{labels},type="{violation_type}"', violations[key])
+            except amdsmi_exception.AmdSmiLibraryException as e:
+                logging.debug("Failed to get violation status on %s | %s", labels, e.get_error_info())
+
+        return {"timestamp": start_time,
+                "duration": time.time() - start_time,
+                "values": values}
+
+
+    def render(self, sample):
+        """Render one sample in the Prometheus text exposition format
+        return:
+            bytes : exposition text
+        """
+        lines = []
+        for metric_name, (metric_type, metric_help) in EXPORTER_METRICS.items():
+            metric_values = sample["values"][metric_name]
+            if not metric_values:
+                continue
+            lines.append(f"# HELP {metric_name} {metric_help}")
+            lines.append(f"# TYPE {metric_name} {metric_type}")
+            for labels, value in metric_values:
+                lines.append(f"{metric_name}{{{labels}}} {value}")
+
+        lines.append("# HELP amdsmi_exporter_sample_timestamp_seconds Time of the last sample")
+        lines.append("# TYPE amdsmi_exporter_sample_timestamp_seconds gauge")
+        lines.append(f"amdsmi_exporter_sample_timestamp_seconds {sample['timestamp']:.3f}")
+        lines.append("# HELP amdsmi_exporter_sample_duration_seconds Time spent reading the last sample")
+        lines.append("# TYPE amdsmi_exporter_sample_duration_seconds gauge")
+        lines.append(f"amdsmi_exporter_sample_duration_seconds {sample['duration']:.6f}")
+        lines.append("# HELP amdsmi_exporter_samples_total Samples taken since the exporter started")
+        lines.append("# TYPE amdsmi_exporter_samples_total counter")
+        lines.append(f"amdsmi_exporter_samples_total {self.samples_total}")
+        return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+    def scrape(self, now=None):
+        """Return the latest rendered sample followed by its age and the sampling errors
+        params:
+            now (float) - current time, time.time() by default
+        return:
+            bytes : exposition text
+        """
+        metrics, timestamp = self.latest
+        if now is None:
+            now = time.time()
+        lines = ["# HELP amdsmi_exporter_sample_age_seconds Time since the last successful sample",
+                 "# TYPE amdsmi_exporter_sample_age_seconds gauge",
+                 f"amdsmi_exporter_sample_age_seconds {max(0, now - timestamp):.3f}",
+                 "# HELP amdsmi_exporter_sample_errors_total Samples that failed since the exporter started",
+                 "# TYPE amdsmi_exporter_sample_errors_total counter",
+                 f"amdsmi_exporter_sample_errors_total {self.sample_errors_total}"]
+        return metrics + ("\n".join(lines) + "\n").encode("utf-8")
+
+
+    def _take_sample(self):
+        try:
+            sample = self.sample()
+        except Exception:
+            self.sample_errors_total += 1
+            raise
+        self.samples_total += 1
+        # Swapping the reference is atomic, scrapes always see a complete sample
+        self.latest = (self.render(sample), sample["timestamp"])
+
+
+    def serve_forever(self, address, port):
+        """Start the sampler and serve /metrics until interrupted
+        params:
+            address (str) - address to listen on
+            port (int) - port to listen on
+        """
+        self._take_sample()
+        # A failed sample keeps the previous text, its age shows it is stale
+        sampler = threading.Thread(target=run_sampler_loop, args=(self._take_sample, self.interval, self._stop),
+                                   name="amdsmi-exporter-sampler", daemon=True)
+        sampler.start()
+
+        server = _AMDSMIExporterHTTPServer((address, port), _AMDSMIExporterRequestHandler)
+        server.exporter = self
+        print(f"amd-smi exporter serving http://{address}:{port}/metrics")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._stop.set()
+            server.server_close()
+            sampler.join()
+
+
+class _AMDSMIExporterHTTPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+    exporter = None
+
+
+class _AMDSMIExporterRequestHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+        body = self.server.exporter.scrape()
+        self.send_response(200)
+        self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+    def log_message(self, format, *args):
+        logging.debug("amd-smi exporter: %s - %s", self.address_string(), format % args)
@@ -0,0 +1,248 @@
+#
+# Copyright (C) 2024 Advanced Micro Devices. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+
+
+import logging
+
+from amdsmi import amdsmi_interface
+from amdsmi import amdsmi_exception
+
+
+def _gpu_metric(*keys):
+    """Extract the first of keys that isn't N/A from the gpu_metrics table"""
+    def extract(gpu_metrics):
+        for key in keys:
+            value = gpu_metrics[key]
+            if isinstance(value, list): # Per XCC values, ex. current_gfxclks
+                value = value[0] if value else "N/A"
+            if value != "N/A":
+                return value
+        return "N/A"
+    # Output keys to decode, passed as fields to amdsmi_get_gpu_metrics_info
+    extract.gpu_metrics_keys = keys
+    return extract
+
+
+def _value(*path):
+    """Extract a nested value from a dictionary returned by the library"""
+    def extract(info):
+        for key in path:
+            info = info[key]
+        return info
+    return extract
+
+
+def _voltage(key):
+    """Extract a voltage from the power info; 0xFFFF means it is not supported"""
+    def extract(power_info):
+        if power_info[key] == 0xFFFF:
+            return "N/A"
+        return power_info[key]
+    return extract
+
+
+def _pcie_speed(pcie_info):
+    # pcie_speed is reported in MT/s
+    pcie_speed = pcie_info['pcie_metric']['pcie_speed']
+    if pcie_speed == "N/A":
+        return pcie_speed
+    if pcie_speed % 1000 != 0:
+        return round(pcie_speed / 1000, 1)
+    return round(pcie_speed / 1000)
+
+
+def _memory_mb(memory):
+    return memory // (1024 * 1024)
+
+
+def _energy_j(energy_info):
+    energy = round(energy_info["energy_accumulator"] * energy_info["counter_resolution"], 3)
+    return round(energy / 1000000, 3)
+
+
+# Library reads backing the fields: source name -> (amdsmi_interface api, extra api args)
+# Each source is read at most once per device, however many fields it feeds
+FIELD_SOURCES = {
+    'gpu_metrics': (amdsmi_interface.amdsmi_get_gpu_metrics_info, ()),
+    'power_info': (amdsmi_interface.amdsmi_get_power_info, ()),
+    'gfx_clock_info': (amdsmi_interface.amdsmi_get_clock_info, (amdsmi_interface.AmdSmiClkType.GFX,)),
+    'mem_clock_info': (amdsmi_interface.amdsmi_get_clock_info, (amdsmi_interface.AmdSmiClkType.MEM,)),
+    'pcie_info': (amdsmi_interface.amdsmi_get_pcie_info, ()),
+    'vram_total': (amdsmi_interface.amdsmi_get_gpu_memory_total, (amdsmi_interface.AmdSmiMemoryType.VRAM,)),
+    'vram_usage': (amdsmi_interface.amdsmi_get_gpu_memory_usage, (amdsmi_interface.AmdSmiMemoryType.VRAM,)),
+    'energy': (amdsmi_interface.amdsmi_get_energy_count, ()),
+    'ecc': (amdsmi_interface.amdsmi_get_gpu_total_ecc_count, ()),
+    'fan_speed': (amdsmi_interface.amdsmi_get_gpu_fan_speed, (0,)),
+    'fan_rpm': (amdsmi_interface.amdsmi_get_gpu_fan_rpms, (0,)),
+    'perf_level': (amdsmi_interface.amdsmi_get_gpu_perf_level, ()),
+}
+
+# Fields selectable with --fields: field name -> (source name, extractor, unit)
+FIELDS = {
+    'power.socket': ('gpu_metrics', _gpu_metric('current_socket_power', 'average_socket_power'), 'W'),
+    'power.gfx_voltage': ('power_info', _voltage('gfx_voltage'), 'mV'),
+    'power.soc_voltage': ('power_info', _voltage('soc_voltage'), 'mV'),
+    'power.mem_voltage': ('power_info', _voltage('mem_voltage'), 'mV'),
+    'temp.edge': ('gpu_metrics', _gpu_metric('temperature_edge'), '\N{DEGREE SIGN}C'),
+    'temp.hotspot': ('gpu_metrics', _gpu_metric('temperature_hotspot'), '\N{DEGREE SIGN}C'),
+    'temp.mem': ('gpu_metrics', _gpu_metric('temperature_mem'), '\N{DEGREE SIGN}C'),
+    'usage.gfx': ('gpu_metrics', _gpu_metric('average_gfx_activity'), '%'),
+    'usage.umc': ('gpu_metrics', _gpu_metric('average_umc_activity'), '%'),
+    'usage.mm': ('gpu_metrics', _gpu_metric('average_mm_activity'), '%'),
+    'clock.gfx.cur': ('gpu_metrics', _gpu_metric('current_gfxclk', 'current_gfxclks'), 'MHz'),
+    'clock.gfx.min': ('gfx_clock_info', _value('min_clk'), 'MHz'),
+    'clock.gfx.max': ('gfx_clock_info', _value('max_clk'), 'MHz'),
+    'clock.mem.cur': ('gpu_metrics', _gpu_metric('current_uclk'), 'MHz'),
+    'clock.mem.min': ('mem_clock_info', _value('min_clk'), 'MHz'),
+    'clock.mem.max': ('mem_clock_info', _value('max_clk'), 'MHz'),
+    'clock.soc.cur': ('gpu_metrics', _gpu_metric('current_socclk', 'current_socclks'), 'MHz'),
+    'clock.vclk0.cur': ('gpu_metrics', _gpu_metric('current_vclk0', 'current_vclk0s'), 'MHz'),
+    'clock.dclk0.cur': ('gpu_metrics', _gpu_metric('current_dclk0', 'current_dclk0s'), 'MHz'),
+    'pcie.width': ('pcie_info', _value('pcie_metric', 'pcie_width'), ''),
+    'pcie.speed': ('pcie_info', _pcie_speed, 'GT/s'),
+    'pcie.bandwidth': ('pcie_info', _value('pcie_metric', 'pcie_bandwidth'), 'Mb/s'),
+    'pcie.replay_count': ('pcie_info', _value('pcie_metric', 'pcie_replay_count'), ''),
+    'mem_usage.total_vram': ('vram_total', _memory_mb, 'MB'),
+    'mem_usage.used_vram': ('vram_usage', _memory_mb, 'MB'),
+    'energy.total': ('energy', _energy_j, 'J'),
+    'ecc.correctable': ('ecc', _value('correctable_count'), ''),
+    'ecc.uncorrectable': ('ecc', _value('uncorrectable_count'), ''),
+    'ecc.deferred': ('ecc', _value('deferred_count'), ''),
+    'fan.speed': ('fan_speed', _value(), ''),
+    'fan.rpm': ('fan_rpm', _value(), 'RPM'),
+    'perf_level': ('perf_level', _value(), ''),
+}
+
+# Top level groups, ex. clock selects every clock.* field
+FIELD_GROUPS = tuple(dict.fromkeys(field.split('.')[0] for field in FIELDS))
+
+
+def parse_fields(fields_str):
+    """Expand a comma separated field selection into the list of fields
+
+    A selector is either a field name or a group prefix, ex. clock.gfx selects
+    clock.gfx.cur, clock.gfx.min, and clock.gfx.max. Fields keep the order they
+    were selected in and are only listed once.
+
+    params:
+        fields_str (str) - comma separated selectors, ex. power.socket,temp.hotspot
+    return:
+        list : selected field names
+    raises:
+        ValueError - if a selector doesn't match any field
+    """
+    fields = []
+    for selector in fields_str.split(','):
+        selector = selector.strip().lower()
+        matches = [field for field in FIELDS if field == selector or field.startswith(selector + '.')]
+        if not selector or not matches:
+            raise ValueError(selector)
+        for field in matches:
+            if field not in fields:
+                fields.append(field)
+    return fields
+
+
+def nest_fields(field_values):
+    """Convert {'clock.gfx.cur': value} into {'clock': {'gfx': {'cur': value}}}"""
+    nested_values = {}
+    for field, value in field_values.items():
+        *groups, name = field.split('.')
+        level = nested_values
+        for group in groups:
+            level = level.setdefault(group, {})
+        level[name] = value
+    return nested_values
+
+
+class AMDSMIFieldPlan():
+    """Minimal set of library reads for a --fields selection
+
+    Fields sharing a source are fed from a single read of it, ex. power.socket,
+    temp.hotspot and clock.gfx.cur all come from one gpu_metrics table. Sources
+    that no selected field needs are never read, and only the gpu_metrics keys
+    the selected fields need are decoded.
+    """
+
+    def __init__(self, fields) -> None:
+        self.fields = list(fields)
+        self.sources = []
+        gpu_metrics_keys = []
+        for field in self.fields:
+            source, extract, _ = FIELDS[field]
+            if source not in self.sources:
+                self.sources.append(source)
+            if source == 'gpu_metrics':
+                gpu_metrics_keys.extend(key for key in extract.gpu_metrics_keys
+                                        if key not in gpu_metrics_keys)
+        self.gpu_metrics_keys = tuple(gpu_metrics_keys)
+
+
+    @staticmethod
+    def get_unit(field):
+        return FIELDS[field][2]
+
+
+    def read(self, device_handle, snapshot=None):
+        """Read the sources of the plan once and extract every field
+
+        gpu_metrics is read with only the keys the selected fields need, unless
+        the snapshot already holds the full table from another column.
+
+        params:
+            device_handle - amdsmi processor handle
+            snapshot (AMDSMISnapshot, optional) - per tick cache every source is
+                read through. Defaults to calling the api.
+        return:
+            dict : {field: value}, value is "N/A" when its source failed
+        """
+        source_values = {}
+        for source in self.sources:
+            api, api_args = FIELD_SOURCES[source]
+            try:
+                if source == 'gpu_metrics':
+                    source_values[source] = self._read_gpu_metrics(api, device_handle, snapshot)
+                elif snapshot is None:
+                    source_values[source] = api(device_handle, *api_args)
+                else:
+                    source_values[source] = snapshot.get(api, device_handle, *api_args)
+            except amdsmi_exception.AmdSmiLibraryException as e:
+                source_values[source] = "N/A"
+                logging.debug("Failed to read %s for fields | %s", api.__name__, e.get_error_info())
+
+        field_values = {}
+        for field in self.fields:
+            source, extract, _ = FIELDS[field]
+            if source_values[source] == "N/A":
+                field_values[field] = "N/A"
+            else:
+                field_values[field] = extract(source_values[source])
+        return field_values
+
+
+    def _read_gpu_metrics(self, api, device_handle, snapshot):
+        if snapshot is None:
+            return api(device_handle, fields=self.gpu_metrics_keys)
+        try:
+            return snapshot.lookup(api, device_handle)
+        except KeyError:
+            # The keys are a tuple so the snapshot can key on them
+            return snapshot.get(api, device_handle, self.gpu_metrics_keys)
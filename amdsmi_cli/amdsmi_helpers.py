@@ -20,11 +20,15 @@
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 #
 
+import copy
+import functools
 import logging
 import math
 import os
 import platform
+import queue
 import sys
+import threading
 import time
 import re
 
@@ -33,49 +37,339 @@ from enum import Enum
 from typing import Set
 
 from amdsmi_init import *
+from amdsmi_boot_cache import AMDSMIBootCache
 from BDF import BDF
 
 
-class AMDSMIHelpers():
-    """Helper functions that aren't apart of the AMDSMI API
-    Useful for determining platform and device identifiers
+PLATFORM_CACHE_NAME = "platform.json"
+PLATFORM_CACHE_ENV = "AMDSMI_PLATFORM_CACHE"
 
-    Functions:
-        os_info: tuple ()
+
+class AMDSMIHandleRegistry():
+    """Processor handles enumerated once and indexed by handle.value
+
+    The CLI resolves device handles back to their GPU/CPU/core index on every
+    stored output. The registry enumerates each handle type on first use and
+    keeps dictionaries for O(1) index, BDF and UUID lookups. Handles are only
+    re-enumerated after invalidate(), which must be called after anything that
+    can change the handle list (ex. gpu reset or a partition change).
+    Enumeration is locked, so devices collected concurrently share the registry.
     """
 
     def __init__(self) -> None:
-        self.operating_system = platform.system()
+        self._lock = threading.RLock()
+        self.invalidate()
+
+
+    def invalidate(self):
+        """Drop all cached handles, the next lookup re-enumerates them"""
+        with self._lock:
+            self._gpu_handles = None
+            self._gpu_indices = None
+            self._gpu_bdfs = None
+            self._gpu_uuids = None
+            self._gpu_handles_by_bdf = None
+            self._gpu_handles_by_uuid = None
+            self._cpu_handles = None
+            self._cpu_indices = None
+            self._core_handles = None
+            self._core_indices = None
+
+
+    # Each loader assigns the attribute it checks last, so other threads never see partial lookups
+
+    def _load_gpus(self):
+        if self._gpu_handles is None:
+            with self._lock:
+                if self._gpu_handles is None:
+                    gpu_handles = amdsmi_interface.amdsmi_get_processor_handles()
+                    self._gpu_indices = {handle.value: index for index, handle in enumerate(gpu_handles)}
+                    self._gpu_handles = gpu_handles
 
-        self._is_hypervisor = False
-        self._is_virtual_os = False
-        self._is_baremetal = False
-        self._is_passthrough = False
 
-        self._is_linux = False
-        self._is_windows = False
+    def _load_gpu_identifiers(self):
+        # BDF and UUID need two library calls per GPU, so only read them when asked for
+        self._load_gpus()
+        if self._gpu_bdfs is None:
+            with self._lock:
+                if self._gpu_bdfs is None:
+                    gpu_bdfs = {}
+                    gpu_uuids = {}
+                    gpu_handles_by_bdf = {}
+                    gpu_handles_by_uuid = {}
+                    for handle in self._gpu_handles:
+                        bdf = amdsmi_interface.amdsmi_get_gpu_device_bdf(handle)
+                        uuid = amdsmi_interface.amdsmi_get_gpu_device_uuid(handle)
+                        gpu_bdfs[handle.value] = bdf
+                        gpu_uuids[handle.value] = uuid
+                        gpu_handles_by_bdf[BDF(bdf)] = handle
+                        gpu_handles_by_uuid[uuid.lower()] = handle
+                    self._gpu_uuids = gpu_uuids
+                    self._gpu_handles_by_bdf = gpu_handles_by_bdf
+                    self._gpu_handles_by_uuid = gpu_handles_by_uuid
+                    self._gpu_bdfs = gpu_bdfs
 
-        if self.operating_system.startswith("Linux"):
-            self._is_linux = True
-            logging.debug(f"AMDSMIHelpers: Platform is linux:{self._is_linux}")
+
+    def _load_cpus(self):
+        if self._cpu_handles is None:
+            with self._lock:
+                if self._cpu_handles is None:
+                    cpu_handles = amdsmi_interface.amdsmi_get_cpusocket_handles()
+                    self._cpu_indices = {handle.value: index for index, handle in enumerate(cpu_handles)}
+                    self._cpu_handles = cpu_handles
+
+
+    def _load_cores(self):
+        if self._core_handles is None:
+            with self._lock:
+                if self._core_handles is None:
+                    core_handles = amdsmi_interface.amdsmi_get_cpucore_handles()
+                    self._core_indices = {handle.value: index for index, handle in enumerate(core_handles)}
+                    self._core_handles = core_handles
+
+
+    def get_gpu_handles(self):
+        """Return the gpu device handles in order of gpu index"""
+        self._load_gpus()
+        return list(self._gpu_handles)
+
+
+    def get_cpu_handles(self):
+        """Return the cpu socket handles in order of cpu index"""
+        self._load_cpus()
+        return list(self._cpu_handles)
+
+
+    def get_core_handles(self):
+        """Return the cpu core handles in order of core index"""
+        self._load_cores()
+        return list(self._core_handles)
+
+
+    def get_gpu_index(self, device_handle):
+        """Return the gpu index of device_handle or None if it is unknown"""
+        self._load_gpus()
+        return self._gpu_indices.get(device_handle.value)
+
+
+    def get_cpu_index(self, device_handle):
+        """Return the cpu index of device_handle or None if it is unknown"""
+        self._load_cpus()
+        return self._cpu_indices.get(device_handle.value)
+
+
+    def get_core_index(self, device_handle):
+        """Return the core index of device_handle or None if it is unknown"""
+        self._load_cores()
+        return self._core_indices.get(device_handle.value)
+
+
+    def get_gpu_bdf(self, device_handle):
+        """Return the BDF string of device_handle or None if it is unknown"""
+        self._load_gpu_identifiers()
+        return self._gpu_bdfs.get(device_handle.value)
+
+
+    def get_gpu_uuid(self, device_handle):
+        """Return the UUID string of device_handle or None if it is unknown"""
+        self._load_gpu_identifiers()
+        return self._gpu_uuids.get(device_handle.value)
+
+
+    def get_gpu_handle_from_bdf(self, bdf):
+        """Return the device handle matching bdf (str or BDF) or None"""
+        self._load_gpu_identifiers()
+        return self._gpu_handles_by_bdf.get(BDF(bdf))
+
+
+    def get_gpu_handle_from_uuid(self, uuid):
+        """Return the device handle matching uuid (case insensitive) or None"""
+        self._load_gpu_identifiers()
+        return self._gpu_handles_by_uuid.get(uuid.lower())
+
+
+class AMDSMIPlatformProfile():
+    """Operating system and virtualization type of the host, detected once per process
+
+    Detecting a guest reads /proc/cpuinfo and detecting passthrough reads the
+    device id of every PCI function, so the profile is detected on first use and
+    shared by every AMDSMIHelpers instance. On Linux it is also saved to a file
+    tagged with the kernel boot id, later runs in the same boot skip the scan.
+    """
+
+    # Device ids of the GPUs that are passed through to guests
+    PASSTHROUGH_DEVICE_IDS = ["7460", "73c8", "74a0", "74a1", "74a2"]
+
+    def __init__(self, cache_path=None) -> None:
+        """
+        params:
+            cache_path (str) - path of the per boot cache file, the AMDSMI_PLATFORM_CACHE
+                environment variable or PLATFORM_CACHE_NAME in the directory from
+                amdsmi_boot_cache.get_cache_dir by default. An empty path disables the file.
+        """
+        self.cache = AMDSMIBootCache(PLATFORM_CACHE_NAME, PLATFORM_CACHE_ENV, cache_path)
+        self._profile = None
+        self._lock = threading.Lock()
+
+
+    def get(self):
+        """Return the profile, detecting it on first use
+        return:
+            dict : {"operating_system", "is_linux", "is_windows", "is_virtual_os",
+                    "is_baremetal", "is_passthrough", "is_hypervisor"}
+        """
+        with self._lock:
+            if self._profile is None:
+                self._profile = self._load()
+        return self._profile
+
+
+    def invalidate(self):
+        """Drop the profile and remove the cache file, the next get() detects it again"""
+        with self._lock:
+            self._profile = None
+            self.cache.remove()
+
+
+    def _load(self):
+        operating_system = platform.system()
+        if not operating_system.startswith("Linux"):
+            return self.detect(operating_system)
+
+        profile = self.cache.load()
+        if isinstance(profile, dict) and profile.get("operating_system") == operating_system:
+            return profile
+
+        profile = self.detect(operating_system)
+        self.cache.save(profile)
+        return profile
+
+
+    @classmethod
+    def detect(cls, operating_system):
+        """Detect the profile of operating_system without any cache"""
+        profile = {"operating_system": operating_system,
+                   "is_linux": False,
+                   "is_windows": False,
+                   "is_virtual_os": False,
+                   "is_baremetal": False,
+                   "is_passthrough": False,
+                   "is_hypervisor": False}
+
+        if operating_system.startswith("Linux"):
+            profile["is_linux"] = True
 
             try:
                 with open('/proc/cpuinfo', 'r') as f:
                     if 'hypervisor' in f.read():
-                        self._is_virtual_os = True
+                        profile["is_virtual_os"] = True
             except IOError:
                 pass
 
-            self._is_baremetal = not self._is_virtual_os
+            profile["is_baremetal"] = not profile["is_virtual_os"]
+
+            # Check for passthrough system filtering by device id, only guests can be passthrough
+            if profile["is_virtual_os"]:
+                output = cls.get_pci_device_ids()
+                if any(('0x' + device_id) in output for device_id in cls.PASSTHROUGH_DEVICE_IDS):
+                    profile["is_baremetal"] = True
+                    profile["is_virtual_os"] = False
+                    profile["is_passthrough"] = True
+
+        return profile
+
+
+    @staticmethod
+    def get_pci_device_ids() -> Set[str]:
+        pci_devices_path = "/sys/bus/pci/devices"
+        pci_devices: set[str] = set()
+        for device in os.listdir(pci_devices_path):
+            device_path = os.path.join(pci_devices_path, device, "device")
+            try:
+                with open(device_path, 'r') as f:
+                    device = f.read().strip()
+                    pci_devices.add(device)
+            except Exception as _:
+                continue
+        return pci_devices
+
+
+class AMDSMIDevicePool():
+    """Bounded pool of threads collecting devices, shared across collect_device_outputs calls
+
+    The threads are daemon threads so a hung device can't keep the process
+    alive, and they are only started when needed, up to the largest
+    max_workers requested. A device stays busy from its submission until its
+    collection returns; a busy device is never queued again, so a hung device
+    holds a single thread however many watch iterations ask for it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tasks = queue.Queue()
+        self._workers = 0
+        self._busy = set()
+
+
+    def submit(self, device_key, task, max_workers):
+        """Queue task() for a device
+        params:
+            device_key - hashable device identifier, ex. the handle value
+            task (callable) - collection of the device, exceptions must be handled by the task
+            max_workers (int) - threads to start at most
+        return:
+            bool : False if the device is still busy and task wasn't queued
+        """
+        with self._lock:
+            if device_key in self._busy:
+                return False
+            self._busy.add(device_key)
+            if self._workers < max_workers:
+                self._workers += 1
+                threading.Thread(target=self._work, name="amdsmi-collect", daemon=True).start()
+        self._tasks.put((device_key, task))
+        return True
+
 
-            # Check for passthrough system filtering by device id
-            output = self.get_pci_device_ids()
-            passthrough_device_ids = ["7460", "73c8", "74a0", "74a1", "74a2"]
-            if any(('0x' + device_id) in output for device_id in passthrough_device_ids):
-                if self._is_virtual_os:
-                    self._is_baremetal = True
-                    self._is_virtual_os = False
-                    self._is_passthrough = True
+    def _work(self):
+        while True:
+            device_key, task = self._tasks.get()
+            try:
+                task()
+            finally:
+                with self._lock:
+                    self._busy.discard(device_key)
+
+
+class AMDSMIHelpers():
+    """Helper functions that aren't apart of the AMDSMI API
+    Useful for determining platform and device identifiers
+
+    Functions:
+        os_info: tuple ()
+    """
+
+    # Shared by every AMDSMIHelpers instance so handles are only enumerated once
+    handle_registry = AMDSMIHandleRegistry()
+    # Shared by every AMDSMIHelpers instance so the platform is only detected once
+    platform_profile = AMDSMIPlatformProfile()
+    # Shared by every AMDSMIHelpers instance so watch iterations reuse the same threads
+    device_pool = AMDSMIDevicePool()
+
+    def __init__(self) -> None:
+        profile = self.platform_profile.get()
+        self.operating_system = profile["operating_system"]
+
+        self._is_hypervisor = profile["is_hypervisor"]
+        self._is_virtual_os = profile["is_virtual_os"]
+        self._is_baremetal = profile["is_baremetal"]
+        self._is_passthrough = profile["is_passthrough"]
+
+        self._is_linux = profile["is_linux"]
+        self._is_windows = profile["is_windows"]
+
+        if self._is_linux:
+            logging.debug(f"AMDSMIHelpers: Platform is linux:{self._is_linux}")
 
 
     def os_info(self, string_format=True):
@@ -163,7 +457,7 @@ class AMDSMIHelpers():
         try:
             cpu_handles = []
             # amdsmi_get_cpusocket_handles() returns the cpu socket handles stored for cpu_id
-            cpu_handles = amdsmi_interface.amdsmi_get_cpusocket_handles()
+            cpu_handles = self.handle_registry.get_cpu_handles()
         except amdsmi_interface.AmdSmiLibraryException as e:
             if e.err_code in (amdsmi_interface.amdsmi_wrapper.AMDSMI_STATUS_NOT_INIT,
                               amdsmi_interface.amdsmi_wrapper.AMDSMI_STATUS_DRIVER_NOT_LOADED):
@@ -208,7 +502,7 @@ class AMDSMIHelpers():
         try:
             core_handles = []
             # amdsmi_get_cpucore_handles() returns the core handles stored for core_id
-            core_handles = amdsmi_interface.amdsmi_get_cpucore_handles()
+            core_handles = self.handle_registry.get_core_handles()
         except amdsmi_interface.AmdSmiLibraryException as e:
             if e.err_code in (amdsmi_interface.amdsmi_wrapper.AMDSMI_STATUS_NOT_INIT,
                               amdsmi_interface.amdsmi_wrapper.AMDSMI_STATUS_DRIVER_NOT_LOADED):
@@ -268,7 +562,7 @@ class AMDSMIHelpers():
 
         try:
             # amdsmi_get_processor_handles returns the device_handles storted for gpu_id
-            device_handles = amdsmi_interface.amdsmi_get_processor_handles()
+            device_handles = self.handle_registry.get_gpu_handles()
         except amdsmi_interface.AmdSmiLibraryException as e:
             if e.err_code in (amdsmi_interface.amdsmi_wrapper.AMDSMI_STATUS_NOT_INIT,
                               amdsmi_interface.amdsmi_wrapper.AMDSMI_STATUS_DRIVER_NOT_LOADED):
@@ -283,8 +577,8 @@ class AMDSMIHelpers():
             max_padding = int(math.log10(len(device_handles))) + 1
 
             for gpu_id, device_handle in enumerate(device_handles):
-                bdf = amdsmi_interface.amdsmi_get_gpu_device_bdf(device_handle)
-                uuid = amdsmi_interface.amdsmi_get_gpu_device_uuid(device_handle)
+                bdf = self.handle_registry.get_gpu_bdf(device_handle)
+                uuid = self.handle_registry.get_gpu_uuid(device_handle)
                 gpu_choices[str(gpu_id)] = {
                     "BDF": bdf,
                     "UUID": uuid,
@@ -331,39 +625,35 @@ class AMDSMIHelpers():
             (False, valid_gpu_format, str): Return False, whether the format of the GPU input is valid, and the first input that failed to be converted
         """
         if 'all' in gpu_selections:
-            return True, True, amdsmi_interface.amdsmi_get_processor_handles()
+            return True, True, self.handle_registry.get_gpu_handles()
 
         if isinstance(gpu_selections, str):
             gpu_selections = [gpu_selections]
 
         if gpu_choices is None:
-            # obtains dictionary of possible gpu choices
-            gpu_choices = self.get_gpu_choices()[0]
+            # Only the gpu IDs are looked up here, UUIDs and BDFs are resolved by the
+            # handle registry, so skip reading the BDF and UUID of every device
+            gpu_choices = {str(gpu_id): {"Device Handle": device_handle}
+                           for gpu_id, device_handle in enumerate(self.handle_registry.get_gpu_handles())}
 
         selected_device_handles = []
         for gpu_selection in gpu_selections:
             valid_gpu_choice = False
+            is_bdf = True
 
-            for gpu_id, gpu_info in gpu_choices.items():
-                bdf = gpu_info['BDF']
-                is_bdf = True
-                uuid = gpu_info['UUID']
-                device_handle = gpu_info['Device Handle']
-
-                # Check if passed gpu is a gpu ID or UUID
-                if gpu_selection == gpu_id or gpu_selection.lower() == uuid:
-                    selected_device_handles.append(device_handle)
-                    valid_gpu_choice = True
-                    break
-                else:  # Check if gpu passed is a BDF object
-                    try:
-                        if BDF(gpu_selection) == BDF(bdf):
-                            selected_device_handles.append(device_handle)
-                            valid_gpu_choice = True
-                            break
-                    except Exception:
-                        is_bdf = False
-                        pass
+            # Check if passed gpu is a gpu ID or UUID
+            if gpu_selection in gpu_choices:
+                device_handle = gpu_choices[gpu_selection]['Device Handle']
+            else:
+                device_handle = self.handle_registry.get_gpu_handle_from_uuid(gpu_selection)
+            if device_handle is None:  # Check if gpu passed is a BDF object
+                try:
+                    device_handle = self.handle_registry.get_gpu_handle_from_bdf(gpu_selection)
+                except Exception:
+                    is_bdf = False
+            if device_handle is not None:
+                selected_device_handles.append(device_handle)
+                valid_gpu_choice = True
 
             if not valid_gpu_choice:
                 logging.debug(f"AMDSMIHelpers.get_device_handles_from_gpu_selections - Unable to convert {gpu_selection}")
@@ -387,13 +677,14 @@ class AMDSMIHelpers():
             (False, str): Return False, and the first input that failed to be converted
         """
         if 'all' in cpu_selections:
-            return True, True, amdsmi_interface.amdsmi_get_cpusocket_handles()
+            return True, True, self.handle_registry.get_cpu_handles()
 
         if isinstance(cpu_selections, str):
             cpu_selections = [cpu_selections]
 
         if cpu_choices is None:
             cpu_choices = self.get_cpu_choices()[0]
+            cpu_choices.pop("all", None)
 
         selected_device_handles = []
         for cpu_selection in cpu_selections:
@@ -428,13 +719,14 @@ class AMDSMIHelpers():
             (False, str): Return False, and the first input that failed to be converted
         """
         if 'all' in core_selections:
-            return True, True, amdsmi_interface.amdsmi_get_cpucore_handles()
+            return True, True, self.handle_registry.get_core_handles()
 
         if isinstance(core_selections, str):
             core_selections = [core_selections]
 
         if core_choices is None:
             core_choices = self.get_core_choices()[0]
+            core_choices.pop("all", None)
 
         selected_device_handles = []
         for core_selection in core_selections:
@@ -475,9 +767,8 @@ class AMDSMIHelpers():
         """
         if isinstance(args.gpu, list):
             if len(args.gpu) > 1:
-                for device_handle in args.gpu:
-                    # Handle multiple_devices to print all output at once
-                    subcommand(args, multiple_devices=True, gpu=device_handle)
+                # Handle multiple_devices to print all output at once
+                self.collect_device_outputs(args, logger, subcommand)
                 logger.print_output(multiple_device_enabled=True)
                 return True, args.gpu
             elif len(args.gpu) == 1:
@@ -489,6 +780,110 @@ class AMDSMIHelpers():
             return False, args.gpu
 
 
+    def collect_device_outputs(self, args, logger, subcommand, **kwargs):
+        """Run subcommand with multiple_devices=True for every device handle in args.gpu
+            and store their output in logger.multiple_device_output in the order of args.gpu.
+            With args.parallel above 1 the devices are collected concurrently by the threads
+            of device_pool, up to args.parallel of them; a device that doesn't finish within
+            args.device_timeout seconds of starting is reported as N/A instead of stalling
+            the other devices. A device whose previous collection is still running is
+            reported as N/A without being queued again.
+        params:
+            args - argparser args to pass to subcommand
+            logger (AMDSMILogger) - Logger storing the output of each device
+            subcommand (AMDSMICommands) - Function that can handle a single gpu
+            kwargs - Additional keyword arguments to pass to subcommand
+        return:
+            Nothing
+        """
+        device_handles = list(args.gpu)
+        parallel = min(getattr(args, 'parallel', None) or 1, len(device_handles))
+        if parallel <= 1:
+            for device_handle in device_handles:
+                subcommand(args, multiple_devices=True, gpu=device_handle, **kwargs)
+            return
+
+        timeout = getattr(args, 'device_timeout', None)
+        start_times = [None] * len(device_handles)
+        finished = [threading.Event() for _ in device_handles]
+        results = [None] * len(device_handles)
+        timed_out = set()
+
+        def collect_device(index):
+            if index in timed_out:
+                return
+            start_times[index] = time.monotonic()
+            # Every device gets its own args, subcommand overwrites args.gpu and the value overrides
+            device_args = copy.copy(args)
+            try:
+                with logger.capture_device_output() as capture:
+                    subcommand(device_args, multiple_devices=True, gpu=device_handles[index], **kwargs)
+                results[index] = capture
+            except BaseException as e:
+                results[index] = e
+            finished[index].set()
+
+        for index, device_handle in enumerate(device_handles):
+            if not self.device_pool.submit(device_handle.value, functools.partial(collect_device, index), parallel):
+                # Still collecting it from a previous call, ex. a device hung since an earlier watch iteration
+                timed_out.add(index)
+                logging.debug("Previous collection of gpu %s is still running",
+                              self.get_gpu_id_from_device_handle(device_handle))
+
+        for index, device_handle in enumerate(device_handles):
+            if index in timed_out:
+                continue
+            wait_start = time.monotonic()
+            while not finished[index].is_set():
+                if timeout is None:
+                    finished[index].wait()
+                    continue
+                # Devices still queued behind hung devices time out from when they were awaited
+                remaining = (start_times[index] or wait_start) + timeout - time.monotonic()
+                if remaining <= 0:
+                    break
+                finished[index].wait(remaining)
+
+            if not finished[index].is_set():
+                # The thread may still finish later, its result is ignored
+                timed_out.add(index)
+                logging.debug("Timed out after %s seconds collecting gpu %s",
+                              timeout, self.get_gpu_id_from_device_handle(device_handle))
+            elif isinstance(results[index], BaseException):
+                raise results[index]
+
+        # Timed out devices get the columns of a collected device, with N/A values
+        template = None
+        for index in range(len(device_handles)):
+            if index not in timed_out:
+                device_outputs = results[index]['multiple_device_output'] + [results[index]['output']]
+                template = next((output for output in device_outputs if output), None)
+                if template is not None:
+                    break
+
+        for index, device_handle in enumerate(device_handles):
+            if index not in timed_out:
+                logger.merge_device_output(results[index])
+                continue
+            if template is None:
+                logger.store_output(device_handle, 'values', "N/A")
+            else:
+                if 'timestamp' in template:
+                    logger.store_output(device_handle, 'timestamp', int(time.time()))
+                logger.store_output(device_handle, 'values',
+                                    {key: self._timed_out_value(value) for key, value in template.items()
+                                     if key not in ('gpu', 'timestamp')})
+            logger.store_multiple_device_output()
+
+
+    @classmethod
+    def _timed_out_value(cls, value):
+        """Return value with every leaf replaced by N/A, a value with its unit becomes N/A"""
+        if isinstance(value, dict) and set(value) != {'value', 'unit'}:
+            return {key: cls._timed_out_value(sub_value) for key, sub_value in value.items()}
+        return "N/A"
+
+
     def handle_cpus(self, args, logger, subcommand):
         """This function will run execute the subcommands based on the number
             of cpus passed in via args.
@@ -574,27 +969,26 @@ class AMDSMIHelpers():
 
         # Set the signal handler to flush a delmiter to file if the format is json
         print("'CTRL' + 'C' to stop watching output:")
-        if watch_time:  # Run for set amount of time
-            iterations_ran = 0
-            end_time = time.time() + watch_time
-            while time.time() <= end_time:
-                subcommand(args, watching_output=True)
-                # Handle iterations limit
-                iterations_ran += 1
-                if iterations is not None:
-                    if iterations <= iterations_ran:
-                        break
-                time.sleep(watch)
-        elif iterations is not None:  # Run for a set amount of iterations
-            for iteration in range(iterations):
-                subcommand(args, watching_output=True)
-                if iteration == iterations - 1:  # Break on iteration completion
-                    break
-                time.sleep(watch)
-        else:  # Run indefinitely as watch_time and iterations are not set
-            while True:
-                subcommand(args, watching_output=True)
-                time.sleep(watch)
+
+        # Iterations start on a fixed grid of watch seconds from the first one, so
+        #  the time spent collecting doesn't add up over the watch
+        start_time = time.monotonic()
+        next_iteration_time = start_time
+        iterations_ran = 0
+        while True:
+            subcommand(args, watching_output=True)
+            iterations_ran += 1
+            if iterations is not None and iterations <= iterations_ran:
+                break
+
+            next_iteration_time += watch
+            current_time = time.monotonic()
+            # Skip the iterations missed by a slow collection instead of running them back to back
+            if next_iteration_time < current_time:
+                next_iteration_time += math.ceil((current_time - next_iteration_time) / watch) * watch
+            if watch_time and next_iteration_time > start_time + watch_time:
+                break
+            time.sleep(next_iteration_time - current_time)
 
         return 1
 
@@ -603,10 +997,9 @@ class AMDSMIHelpers():
         """Get the gpu index from the device_handle.
         amdsmi_get_processor_handles() returns the list of device_handles in order of gpu_index
         """
-        device_handles = amdsmi_interface.amdsmi_get_processor_handles()
-        for gpu_index, device_handle in enumerate(device_handles):
-            if input_device_handle.value == device_handle.value:
-                return gpu_index
+        gpu_index = self.handle_registry.get_gpu_index(input_device_handle)
+        if gpu_index is not None:
+            return gpu_index
         raise amdsmi_exception.AmdSmiParameterException(input_device_handle,
                                                         amdsmi_interface.amdsmi_wrapper.amdsmi_processor_handle,
                                                         "Unable to find gpu ID from device_handle")
@@ -616,10 +1009,9 @@ class AMDSMIHelpers():
         """Get the cpu index from the device_handle.
         amdsmi_interface.amdsmi_get_cpusocket_handles() returns the list of device_handles in order of cpu_index
         """
-        device_handles = amdsmi_interface.amdsmi_get_cpusocket_handles()
-        for cpu_index, device_handle in enumerate(device_handles):
-            if input_device_handle.value == device_handle.value:
-                return cpu_index
+        cpu_index = self.handle_registry.get_cpu_index(input_device_handle)
+        if cpu_index is not None:
+            return cpu_index
         raise amdsmi_exception.AmdSmiParameterException(input_device_handle,
                                                         amdsmi_interface.amdsmi_wrapper.amdsmi_processor_handle,
                                                         "Unable to find cpu ID from device_handle")
@@ -629,10 +1021,9 @@ class AMDSMIHelpers():
         """Get the core index from the device_handle.
         amdsmi_interface.amdsmi_get_cpusocket_handles() returns the list of device_handles in order of cpu_index
         """
-        device_handles = amdsmi_interface.amdsmi_get_cpucore_handles()
-        for core_index, device_handle in enumerate(device_handles):
-            if input_device_handle.value == device_handle.value:
-                return core_index
+        core_index = self.handle_registry.get_core_index(input_device_handle)
+        if core_index is not None:
+            return core_index
         raise amdsmi_exception.AmdSmiParameterException(input_device_handle,
                                                         amdsmi_interface.amdsmi_wrapper.amdsmi_processor_handle,
                                                         "Unable to find core ID from device_handle")
@@ -645,11 +1036,8 @@ class AMDSMIHelpers():
             list[BDF]: List of GPU BDFs
         """
         gpu_bdfs = []
-        device_handles = amdsmi_interface.amdsmi_get_processor_handles()
-
-        for device_handle in device_handles:
-            bdf = amdsmi_interface.amdsmi_get_gpu_device_bdf(device_handle)
-            gpu_bdfs.append(bdf)
+        for device_handle in self.handle_registry.get_gpu_handles():
+            gpu_bdfs.append(self.handle_registry.get_gpu_bdf(device_handle))
 
         return gpu_bdfs
 
@@ -804,14 +1192,116 @@ class AMDSMIHelpers():
             raise TypeError("val must be an int or float")
 
     def get_pci_device_ids(self) -> Set[str]:
-        pci_devices_path = "/sys/bus/pci/devices"
-        pci_devices: set[str] = set()
-        for device in os.listdir(pci_devices_path):
-            device_path = os.path.join(pci_devices_path, device, "device")
+        return AMDSMIPlatformProfile.get_pci_device_ids()
+
+
+class AMDSMISnapshot():
+    """Per-tick cache of device reads shared by every column of a report
+
+    A single watch tick may need several values from the same library call
+    (ex. power, temperatures, clocks and activity all live in gpu_metrics).
+    Reads are keyed on (api, device_handle, args) and reused until the next
+    start_tick(), so every column of a tick is fed from one consistent sample.
+    Library failures are cached as well, every lookup raises a new exception
+    of the cached class with the cached error code.
+    Devices collected concurrently share the snapshot, a read that only returns
+    after its tick ended (ex. a timed out device) is dropped.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cache = {}
+        self._tick = 0
+        self.calls = 0
+        self.hits = 0
+        self.total_saved = 0
+
+
+    def start_tick(self):
+        """Drop all cached reads and reset the per-tick counters"""
+        with self._lock:
+            self._cache = {}
+            self._tick += 1
+            self.calls = 0
+            self.hits = 0
+
+
+    def end_tick(self):
+        """Release the cached reads and return the library calls saved this tick
+        return:
+            int : number of lookups served from the snapshot
+        """
+        with self._lock:
+            saved_calls = self.hits
+            self.total_saved += saved_calls
+            self._cache = {}
+            self._tick += 1
+        logging.debug(f"AMDSMISnapshot: {self.calls} library calls, {saved_calls} saved this tick "
+                      f"({self.total_saved} saved total)")
+        return saved_calls
+
+
+    def get(self, api, device_handle, *args):
+        """Return api(device_handle, *args), reading the library at most once per tick
+        params:
+            api - amdsmi_interface function taking a device handle
+            device_handle - amdsmi processor handle
+            args - additional hashable api arguments, ex. AmdSmiClkType.GFX
+        return:
+            Cached return value of api(device_handle, *args)
+        raises:
+            AmdSmiLibraryException - cached failure from the first read
+        """
+        key = (api.__name__, device_handle.value) + args
+        with self._lock:
+            cached = key in self._cache
+            if cached:
+                self.hits += 1
+                entry = self._cache[key]
+            else:
+                self.calls += 1
+                tick = self._tick
+
+        if not cached:
+            # Read without the lock so other devices aren't blocked
             try:
-                with open(device_path, 'r') as f:
-                    device = f.read().strip()
-                    pci_devices.add(device)
-            except Exception as _:
-                continue
-        return pci_devices
+                entry = (True, api(device_handle, *args))
+            except amdsmi_exception.AmdSmiLibraryException as e:
+                entry = (False, (type(e), e.get_error_code()))
+            with self._lock:
+                if tick == self._tick:
+                    self._cache[key] = entry
+
+        return self._unpack(entry)
+
+
+    def lookup(self, api, device_handle, *args):
+        """Return a value already read with get() this tick, without reading the library
+        params:
+            api - amdsmi_interface function taking a device handle
+            device_handle - amdsmi processor handle
+            args - additional hashable api arguments
+        return:
+            Cached return value of api(device_handle, *args)
+        raises:
+            KeyError - if api(device_handle, *args) wasn't read this tick
+            AmdSmiLibraryException - cached failure from the first read
+        """
+        key = (api.__name__, device_handle.value) + args
+        with self._lock:
+            entry = self._cache[key]
+            self.hits += 1
+
+        return self._unpack(entry)
+
+
+    @staticmethod
+    def _unpack(entry):
+        # Failures keep their exception class and error code, each lookup raises a new exception
+        succeeded, value = entry
+        if not succeeded:
+            exception_class, error_code = value
+            if exception_class in (amdsmi_exception.AmdSmiRetryException, amdsmi_exception.AmdSmiTimeoutException):
+                raise exception_class()
+            raise exception_class(error_code)
+        return value
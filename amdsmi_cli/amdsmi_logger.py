@@ -20,31 +20,324 @@
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 #
 
+import contextlib
 import csv
 import json
 import re
+import threading
 import time
 from typing import Dict
 from enum import Enum
-import yaml
 import inspect
 
 from amdsmi_helpers import AMDSMIHelpers
 import amdsmi_cli_exceptions
 
-### Custom YAML Functions
-# Dumper class to preserve order of yaml.dump
-class CustomDumper(yaml.Dumper):
-    def represent_dict_preserve_order(self, data):
-        return self.represent_dict(data.items())
-def has_sort_keys_option(): # to check if sort_keys is available
-    return 'sort_keys' in inspect.signature(yaml.dump).parameters
+### Human readable output
+# Human readable output used to be rendered by dumping the json output with yaml.dump
+# and cleaning it up. The renderer below writes the same text directly, it follows the
+# PyYAML block emitter for the values the CLI outputs, including its quoting rules and
+# its line wrapping. Values it doesn't cover fall back to PyYAML, imported on use.
+
+# Plain strings yaml would read back as another type, yaml.dump quotes them
+_YAML_IMPLICIT_TYPES = re.compile(r'''^(?:yes|Yes|YES|no|No|NO|true|True|TRUE|false|False|FALSE|on|On|ON|off|Off|OFF
+                                  |[-+]?(?:[0-9][0-9_]*)\.[0-9_]*(?:[eE][-+][0-9]+)?
+                                  |\.[0-9][0-9_]*(?:[eE][-+][0-9]+)?
+                                  |[-+]?[0-9][0-9_]*(?::[0-5]?[0-9])+\.[0-9_]*
+                                  |[-+]?\.(?:inf|Inf|INF)
+                                  |\.(?:nan|NaN|NAN)
+                                  |[-+]?0b[0-1_]+
+                                  |[-+]?0[0-7_]+
+                                  |[-+]?(?:0|[1-9][0-9_]*)
+                                  |[-+]?0x[0-9a-fA-F_]+
+                                  |[-+]?[1-9][0-9_]*(?::[0-5]?[0-9])+
+                                  |<<
+                                  |~|null|Null|NULL|
+                                  |[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]
+                                  |[0-9][0-9][0-9][0-9]-[0-9][0-9]?-[0-9][0-9]?
+                                   (?:[Tt]|[ \t]+)[0-9][0-9]?:[0-9][0-9]:[0-9][0-9](?:\.[0-9]*)?
+                                   (?:[ \t]*(?:Z|[-+][0-9][0-9]?(?::[0-9][0-9])?))?
+                                  |=)$''', re.X)
+_YAML_WHITESPACE = '\0 \t\r\n\x85\u2028\u2029'
+_YAML_BEST_WIDTH = 80
+_YAML_BEST_INDENT = 2
+_PROCESS_INFO_KEY = re.compile(r'PROCESS_INFO_[0-9]+:')
+
+
+class _UnsupportedValue(Exception):
+    """Raised by _HumanReadableRenderer for values only PyYAML renders, ex. multi-line strings"""
+
+
+class _HumanReadableRenderer():
+    """Render a device output dictionary as amd-smi human readable text in one pass
+
+    The emitter state (column, indent, whitespace, indention) and the scalar quoting
+    follow yaml.dump(default_flow_style=False, allow_unicode=True), so long values wrap
+    at the same places. Each finished line is then cleaned up like the yaml output was:
+    quotes removed, PROCESS_INFO indices removed, and the indentation doubled.
+    """
+
+    def __init__(self) -> None:
+        self.lines = []
+        self.line = []
+        self.column = 0
+        self.indent = None
+        self.whitespace = True
+        self.indention = True
+
+
+    def render(self, json_object):
+        self._write_node(json_object)
+        self._write_indent()
+        return ''.join(line + '\n' for line in self.lines)
+
+
+    def _write(self, data):
+        # The column counts the quotes, they're only dropped from the output
+        self.column += len(data)
+        if "'" in data:
+            data = data.replace("'", "")
+        self.line.append(data)
+
+
+    def _write_line_break(self):
+        line = ''.join(self.line)
+        if line != "AMDSMI_SPACING_REMOVAL:":
+            if "PROCESS_INFO_" in line:
+                line = _PROCESS_INFO_KEY.sub('PROCESS_INFO:', line)
+            # Remove dashes and increase tabbing of the key
+            key, separator, value = line.partition(':')
+            self.lines.append(key.replace("-", " ", 1).replace("  ", "    ") + separator + value)
+        self.line = []
+        self.whitespace = True
+        self.indention = True
+        self.column = 0
+
+
+    def _write_indent(self):
+        indent = self.indent or 0
+        if not self.indention or self.column > indent or (self.column == indent and not self.whitespace):
+            self._write_line_break()
+        if self.column < indent:
+            self.whitespace = True
+            self._write(' ' * (indent - self.column))
+
+
+    def _write_indicator(self, indicator, need_whitespace, whitespace=False, indention=False):
+        if not self.whitespace and need_whitespace:
+            indicator = ' ' + indicator
+        self.whitespace = whitespace
+        self.indention = self.indention and indention
+        self._write(indicator)
+
+
+    def _write_node(self, value, mapping_context=False, simple_key=False):
+        if isinstance(value, dict):
+            if not value:
+                self._write_indicator('{', True, whitespace=True)
+                self._write_indicator('}', False)
+            else:
+                self._write_mapping(value)
+        elif isinstance(value, (list, tuple)):
+            if not value:
+                self._write_indicator('[', True, whitespace=True)
+                self._write_indicator(']', False)
+            else:
+                self._write_sequence(value, indentless=mapping_context and not self.indention)
+        else:
+            parent_indent = self.indent
+            self.indent = _YAML_BEST_INDENT if parent_indent is None else parent_indent + _YAML_BEST_INDENT
+            self._write_scalar(value, simple_key)
+            self.indent = parent_indent
+
+
+    def _write_mapping(self, mapping):
+        parent_indent = self.indent
+        self.indent = 0 if parent_indent is None else parent_indent + _YAML_BEST_INDENT
+        for key, value in mapping.items():
+            self._write_indent()
+            # json.dumps converts every key to a string
+            key = self._scalar_text(key)
+            # yaml.dump writes empty keys and keys of 128 characters or more, counting
+            # the 5 of the "!!str" tag, as complex keys
+            if not key or len(key) + 5 >= 128:
+                raise _UnsupportedValue(key)
+            self._write_node(key, mapping_context=True, simple_key=True)
+            self._write_indicator(':', False)
+            self._write_node(value, mapping_context=True)
+        self.indent = parent_indent
+
+
+    def _write_sequence(self, sequence, indentless):
+        parent_indent = self.indent
+        if parent_indent is None:
+            self.indent = 0
+        elif not indentless:
+            self.indent = parent_indent + _YAML_BEST_INDENT
+        for item in sequence:
+            self._write_indent()
+            self._write_indicator('-', True, indention=True)
+            self._write_node(item)
+        self.indent = parent_indent
+
+
+    @staticmethod
+    def _scalar_text(value):
+        """Return the text json.dumps writes for a value, or the string itself"""
+        if isinstance(value, str):
+            return value
+        if value is True:
+            return 'true'
+        if value is False:
+            return 'false'
+        if value is None:
+            return 'null'
+        if isinstance(value, int):
+            return int.__repr__(value)
+        if isinstance(value, float):
+            if value != value:
+                return 'NaN'
+            if value in (float('inf'), float('-inf')):
+                return 'Infinity' if value > 0 else '-Infinity'
+            return float.__repr__(value)
+        # Let json.dumps raise for the types it doesn't convert
+        raise _UnsupportedValue(value)
+
+
+    def _write_scalar(self, value, simple_key):
+        if not isinstance(value, str):
+            # Numbers, booleans, and null are written as json wrote them, never quoted
+            text = self._scalar_text(value)
+            if not self.whitespace:
+                self._write(' ')
+            self.whitespace = False
+            self.indention = False
+            self._write(text)
+            return
+
+        if self._is_plain(value):
+            self._write_plain(value, split=not simple_key)
+        else:
+            self._write_single_quoted(value, split=not simple_key)
+
+
+    @staticmethod
+    def _is_plain(text):
+        """Return whether yaml.dump writes text unquoted, raise _UnsupportedValue if it
+        needs double quotes or spans several lines"""
+        if not text:
+            return False
+        # Non printable characters, line breaks, and characters outside of the BMP (json
+        # escapes them as surrogate pairs) need double quotes or several lines
+        if not (text.isascii() and text.isprintable()):
+            for ch in text:
+                if not ('\x20' <= ch <= '\x7E' or '\xA0' <= ch <= '\uD7FF'
+                        or ('\uE000' <= ch <= '\uFFFD' and ch != '\uFEFF')):
+                    raise _UnsupportedValue(text)
+
+        if text[0] == ' ' or text[-1] == ' ' or text.startswith(('---', '...')):
+            return False
+        followed_by_whitespace = len(text) == 1 or text[1] in _YAML_WHITESPACE
+        if text[0] in '#,[]{}&*!|>\'"%@`' or (text[0] in '?:-' and followed_by_whitespace):
+            return False
+        if ': ' in text or ' #' in text or text[-1] == ':':
+            return False
+        return _YAML_IMPLICIT_TYPES.match(text) is None
+
+
+    def _write_plain(self, text, split):
+        if not self.whitespace:
+            self._write(' ')
+        self.whitespace = False
+        self.indention = False
+        if not split or ' ' not in text or self.column + len(text) <= _YAML_BEST_WIDTH:
+            self._write(text)
+            return
+
+        # Break single spaces once the line is past the best width
+        spaces = False
+        start = end = 0
+        while end <= len(text):
+            ch = text[end] if end < len(text) else None
+            if spaces:
+                if ch != ' ':
+                    if start + 1 == end and self.column > _YAML_BEST_WIDTH:
+                        self._write_indent()
+                        self.whitespace = False
+                        self.indention = False
+                    else:
+                        self._write(text[start:end])
+                    start = end
+            elif ch is None or ch == ' ':
+                self._write(text[start:end])
+                start = end
+            spaces = ch == ' '
+            end += 1
+
+
+    def _write_single_quoted(self, text, split):
+        self._write_indicator("'", True)
+        spaces = False
+        start = end = 0
+        while end <= len(text):
+            ch = text[end] if end < len(text) else None
+            if spaces:
+                if ch != ' ':
+                    if (start + 1 == end and self.column > _YAML_BEST_WIDTH and split
+                            and start != 0 and end != len(text)):
+                        self._write_indent()
+                    else:
+                        self._write(text[start:end])
+                    start = end
+            elif ch is None or ch in " '":
+                if start < end:
+                    self._write(text[start:end])
+                    start = end
+            if ch == "'":
+                self._write("''")
+                start = end + 1
+            spaces = ch == ' '
+            end += 1
+        self._write_indicator("'", False)
+
+class _DeviceOutputAttribute():
+    """Logger attribute kept per thread while that thread captures device output
+
+    Outside of AMDSMILogger.capture_device_output() every thread shares the logger value.
+    """
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, logger, owner=None):
+        if logger is None:
+            return self
+        capture = getattr(logger._device_capture, 'state', None)
+        if capture is not None:
+            return capture[self.name]
+        return logger.__dict__[self.name]
+
+    def __set__(self, logger, value):
+        capture = getattr(logger._device_capture, 'state', None)
+        if capture is not None:
+            capture[self.name] = value
+        else:
+            logger.__dict__[self.name] = value
+
 
 class AMDSMILogger():
+    # Written while storing a single device's output, see capture_device_output
+    output = _DeviceOutputAttribute()
+    multiple_device_output = _DeviceOutputAttribute()
+    table_title = _DeviceOutputAttribute()
+    table_header = _DeviceOutputAttribute()
+    secondary_table_title = _DeviceOutputAttribute()
+    secondary_table_header = _DeviceOutputAttribute()
+
     def __init__(self, format='human_readable', destination='stdout') -> None:
+        self._device_capture = threading.local()
         self.output = {}
         self.multiple_device_output = []
-        self.watch_output = []
+        self.watch_streams = {} # watch output files streamed to -> csv header written
         self.format = format # csv, json, or human_readable
         self.destination = destination # stdout, path to a file (append)
         self.table_title = ""
@@ -126,6 +419,9 @@ class AMDSMILogger():
             elif key == 'timestamp':
                 stored_timestamp = string_value
                 table_values += string_value.rjust(10) + '  '
+            # Selected fields are padded to their column when stored
+            elif '.' in key:
+                table_values += string_value
             elif key == 'power_usage':
                 table_values += string_value.rjust(7)
             elif key in ('gfx_clock', 'mem_clock', 'encoder_clock', 'decoder_clock', 'vram_used'):
@@ -234,12 +530,26 @@ class AMDSMILogger():
 
         capitalized_json["AMDSMI_SPACING_REMOVAL"] = tabbed_dictionary
 
+        try:
+            return _HumanReadableRenderer().render(capitalized_json)
+        except _UnsupportedValue:
+            return self._convert_json_to_human_readable_yaml(capitalized_json)
+
+
+    def _convert_json_to_human_readable_yaml(self, capitalized_json: Dict[str, any]):
+        # Round trip through PyYAML for the values _HumanReadableRenderer doesn't render
+        import yaml
+
         json_string = json.dumps(capitalized_json, indent=4)
 
-        if has_sort_keys_option():
+        if 'sort_keys' in inspect.signature(yaml.dump).parameters:
             yaml_data = yaml.safe_load(json_string)
             yaml_output = yaml.dump(yaml_data, sort_keys=False, allow_unicode=True)
         else:
+            # Dumper class to preserve order of yaml.dump
+            class CustomDumper(yaml.Dumper):
+                def represent_dict_preserve_order(self, data):
+                    return self.represent_dict(data.items())
             CustomDumper.add_representer(dict, CustomDumper.represent_dict_preserve_order)
             yaml_data = yaml.safe_load(json_string)
             yaml_output = yaml.dump(yaml_data, Dumper=CustomDumper, allow_unicode=True, default_flow_style=False)
@@ -249,7 +559,7 @@ class AMDSMILogger():
         yaml_output = yaml_output.replace("'", "") # Remove ''
 
         # Remove process_info indicies for Host parity:
-        yaml_output = re.sub(r'PROCESS_INFO_[0-9]+:', 'PROCESS_INFO:', yaml_output)
+        yaml_output = _PROCESS_INFO_KEY.sub('PROCESS_INFO:', yaml_output)
 
         clean_yaml_output = ''
         for line in yaml_output.splitlines():
@@ -457,26 +767,198 @@ class AMDSMILogger():
         self.output = {}
 
 
-    def store_watch_output(self, multiple_device_enabled=False):
-        """ Add the current output or multiple_devices_output
+    @contextlib.contextmanager
+    def capture_device_output(self):
+        """ Keep the output stored by the current thread apart from the other threads
+                Used to collect several devices concurrently, the caller merges
+                the captured device output back with merge_device_output
+            params:
+                None
+            return:
+                dict : captured output, table titles and headers of the current thread
+        """
+        capture = {'output': {},
+                   'multiple_device_output': [],
+                   'table_title': self.table_title,
+                   'table_header': self.table_header,
+                   'secondary_table_title': self.secondary_table_title,
+                   'secondary_table_header': self.secondary_table_header}
+        self._device_capture.state = capture
+        try:
+            yield capture
+        finally:
+            self._device_capture.state = None
+
+
+    def merge_device_output(self, capture):
+        """ Append output captured by capture_device_output to multiple_device_output
+            params:
+                capture (dict) - captured output of one device
+            return:
+                Nothing
+        """
+        self.multiple_device_output.extend(capture['multiple_device_output'])
+        if capture['output']:
+            self.multiple_device_output.append(capture['output'])
+        self.table_title = capture['table_title']
+        self.table_header = capture['table_header']
+        self.secondary_table_title = capture['secondary_table_title']
+        self.secondary_table_header = capture['secondary_table_header']
+
+
+    def store_watch_output(self, multiple_device_enabled=False, tabular=False):
+        """ Stream the current output or multiple_devices_output to the destination file
+                then clear the current output. Each watch iteration is appended and flushed
+                to the file as it arrives so memory use stays flat over long watches.
             params:
                 multiple_device_enabled (bool) - True if watching multiple devices
+                tabular (bool) - True if the watch output is printed as a table
             return:
                 Nothing
         """
         if multiple_device_enabled:
-            for output in self.multiple_device_output:
-                self.watch_output.append(output)
-
+            watch_output = self.multiple_device_output
             self.multiple_device_output = []
         else:
-            output = {}
+            watch_output = [self.output] if self.output else []
+            self.output = {}
 
-            for key, value in self.output.items():
-                output[key] = value
-            self.watch_output.append(output)
+        if self.destination == 'stdout' or not watch_output:
+            return
 
-            self.output = {}
+        if self.is_json_format():
+            self._stream_json_watch_output(watch_output)
+        elif self.is_csv_format():
+            self._stream_csv_watch_output(watch_output)
+        elif self.is_human_readable_format():
+            if tabular:
+                self._stream_tabular_watch_output(watch_output)
+            else:
+                self._stream_human_readable_watch_output(watch_output)
+
+
+    def _open_watch_stream(self, path):
+        """ Open a watch output file for appending, the first open in a watch truncates it
+            params:
+                path (Path) - file to open
+            return:
+                file object opened for writing
+        """
+        if path in self.watch_streams:
+            mode = 'a'
+        else:
+            mode = 'w'
+            self.watch_streams[path] = []
+        return path.open(mode, newline = '', encoding="utf-8")
+
+
+    def _get_process_watch_destination(self):
+        """ Return the companion file that watched process_list rows are streamed to
+                ex: output.csv -> output_process.csv
+        """
+        return self.destination.with_name(f"{self.destination.stem}_process{self.destination.suffix}")
+
+
+    def _split_process_list(self, watch_output):
+        """ Split watch output into primary outputs and process_list outputs
+            params:
+                watch_output (list) - device outputs from one watch iteration
+            return:
+                (list, list) - primary outputs without process_list, process outputs
+        """
+        primary_outputs = []
+        process_outputs = []
+        for output_dict in watch_output:
+            if 'process_list' in output_dict:
+                process_outputs.append({'timestamp': output_dict['timestamp'],
+                                        'gpu': output_dict['gpu'],
+                                        'process_list': output_dict['process_list']})
+            primary_outputs.append({key: value for key, value in output_dict.items() if key != 'process_list'})
+        return primary_outputs, process_outputs
+
+
+    def _stream_json_watch_output(self, watch_output):
+        # One JSON object per line (NDJSON) so the file is valid after every iteration
+        with self._open_watch_stream(self.destination) as output_file:
+            for output in watch_output:
+                output_file.write(json.dumps(output) + '\n')
+            output_file.flush()
+
+
+    def _write_watch_csv_rows(self, path, rows):
+        """ Append rows to a streamed csv file, writing the header only once
+                A new header block is written if a row introduces keys not seen before
+            params:
+                path (Path) - csv file to append to
+                rows (list) - list of dicts to write
+            return:
+                Nothing
+        """
+        with self._open_watch_stream(path) as output_file:
+            csv_header = self.watch_streams[path]
+            for row in rows:
+                new_keys = [key for key in row if key not in csv_header]
+                if new_keys:
+                    if csv_header:
+                        output_file.write("\n")
+                    csv_header.extend(new_keys)
+                    csv.DictWriter(output_file, csv_header).writeheader()
+                writer = csv.DictWriter(output_file, csv_header, restval="N/A")
+                writer.writerow(row)
+            output_file.flush()
+
+
+    def _stream_csv_watch_output(self, watch_output):
+        primary_outputs, process_outputs = self._split_process_list(watch_output)
+        self._write_watch_csv_rows(self.destination, primary_outputs)
+
+        process_rows = []
+        for process_output in process_outputs:
+            # Add a new entry for each process_info
+            for process_info_dict in process_output['process_list']:
+                process_row = {'timestamp': process_output['timestamp'],
+                               'gpu': process_output['gpu']}
+                if isinstance(process_info_dict["process_info"], dict):
+                    for process_field, process_value in process_info_dict["process_info"].items():
+                        if isinstance(process_value, dict):
+                            process_row.update(process_value)
+                        else:
+                            process_row[process_field] = process_value
+                else:
+                    # Handle no process found case
+                    process_row["process_info"] = process_info_dict["process_info"]
+                process_rows.append(process_row)
+        if process_rows:
+            self._write_watch_csv_rows(self._get_process_watch_destination(), process_rows)
+
+
+    def _stream_human_readable_watch_output(self, watch_output):
+        with self._open_watch_stream(self.destination) as output_file:
+            for output in watch_output:
+                output_file.write(self._convert_json_to_human_readable(output))
+            output_file.write('\n')
+            output_file.flush()
+
+
+    def _stream_tabular_watch_output(self, watch_output):
+        primary_outputs, process_outputs = self._split_process_list(watch_output)
+        table_streams = [(self.destination, primary_outputs,
+                          self.table_title, self.table_header)]
+        if process_outputs:
+            table_streams.append((self._get_process_watch_destination(), process_outputs,
+                                  self.secondary_table_title, self.secondary_table_header))
+
+        for path, outputs, table_title, table_header in table_streams:
+            first_write = path not in self.watch_streams
+            with self._open_watch_stream(path) as output_file:
+                # Table title and header are only written once at the top of the file
+                if first_write:
+                    if table_title:
+                        output_file.write(table_title + ':\n')
+                    output_file.write(table_header + '\n')
+                for output in outputs:
+                    output_file.write(self._convert_json_to_tabular(output) + '\n')
+                output_file.flush()
 
 
     def print_output(self, multiple_device_enabled=False, watching_output=False, tabular=False, dual_csv_output=False):
@@ -518,12 +1000,10 @@ class AMDSMILogger():
                 json_std_output = json.dumps(json_output, indent=4)
                 print(json_std_output)
         else: # Write output to file
-            if watching_output: # Flush the full JSON output to the file on watch command completion
-                with self.destination.open('w', encoding="utf-8") as output_file:
-                    json.dump(self.watch_output, output_file, indent=4)
-            else:
-                with self.destination.open('a', encoding="utf-8") as output_file:
-                    json.dump(json_output, output_file, indent=4)
+            if watching_output: # Watch output is streamed to the file by store_watch_output
+                return
+            with self.destination.open('a', encoding="utf-8") as output_file:
+                json.dump(json_output, output_file, indent=4)
 
 
     def _print_csv_output(self, multiple_device_enabled=False, watching_output=False):
@@ -554,31 +1034,14 @@ class AMDSMILogger():
                 writer.writerows(stored_csv_output)
                 print(str(csv_stdout_output))
         else:
-            if watching_output:
-                with self.destination.open('w', newline = '', encoding="utf-8") as output_file:
-                    if self.watch_output:
-                        csv_keys = set()
-                        for output in self.watch_output:
-                            for key in output:
-                                csv_keys.add(key)
-
-                        for index, output_dict in enumerate(self.watch_output):
-                            remaining_keys = csv_keys - set(output_dict.keys())
-                            for key in remaining_keys:
-                                self.watch_output[index][key] = "N/A"
-
-                        # Get the header as a list of the first element to maintain order
-                        csv_header = self.watch_output[0].keys()
-                        writer = csv.DictWriter(output_file, csv_header)
-                        writer.writeheader()
-                        writer.writerows(self.watch_output)
-            else:
-                with self.destination.open('a', newline = '', encoding="utf-8") as output_file:
-                    # Get the header as a list of the first element to maintain order
-                    csv_header = stored_csv_output[0].keys()
-                    writer = csv.DictWriter(output_file, csv_header)
-                    writer.writeheader()
-                    writer.writerows(stored_csv_output)
+            if watching_output: # Watch output is streamed to the file by store_watch_output
+                return
+            with self.destination.open('a', newline = '', encoding="utf-8") as output_file:
+                # Get the header as a list of the first element to maintain order
+                csv_header = stored_csv_output[0].keys()
+                writer = csv.DictWriter(output_file, csv_header)
+                writer.writeheader()
+                writer.writerows(stored_csv_output)
 
 
     def _print_dual_csv_output(self, multiple_device_enabled=False, watching_output=False):
@@ -660,85 +1123,21 @@ class AMDSMILogger():
                 if watching_output:
                     print()
         else:
-            if watching_output:
-                with self.destination.open('w', newline = '', encoding="utf-8") as output_file:
-                    primary_csv_output = []
-                    secondary_csv_output = []
-                    if self.watch_output:
-                        # Split watch_output into primary_csv and secondary_csv
-                        for output_dict in self.watch_output:
-                            if 'process_list' in output_dict:
-                                # Add a new entry for each process_info
-                                for process_info_dict in output_dict['process_list']:
-                                    secondary_output_dict = {}
-                                    if watching_output:
-                                        secondary_output_dict['timestamp'] = output_dict['timestamp']
-                                    secondary_output_dict['gpu'] = output_dict['gpu']
-                                    if isinstance(process_info_dict["process_info"], dict):
-                                        for process_field, process_value in process_info_dict["process_info"].items():
-                                            if isinstance(process_value, dict):
-                                                for key, value in process_value.items():
-                                                    secondary_output_dict[key] = value
-                                            else:
-                                                secondary_output_dict[process_field] = process_value
-                                    else:
-                                        # Handle no process found case
-                                        secondary_output_dict["process_info"] = process_info_dict["process_info"]
-                                    secondary_csv_output.append(secondary_output_dict)
-                            primary_output_dict = {}
-                            for key, value in output_dict.items():
-                                if key != 'process_list':
-                                    primary_output_dict[key] = value
-                            primary_csv_output.append(primary_output_dict)
-
-                        # Ensure uniform data within primary and secondary csv outputs
-                        if primary_csv_output:
-                            primary_keys = set()
-                            for output in primary_csv_output:
-                                for key in output:
-                                    primary_keys.add(key)
-                            # insert empty data to align with keys that may not exist
-                            for index, output_dict in enumerate(primary_csv_output):
-                                remaining_keys = primary_keys - set(output_dict.keys())
-                                for key in remaining_keys:
-                                    primary_csv_output[index][key] = "N/A"
-                        if secondary_csv_output:
-                            secondary_keys = set()
-                            for output in secondary_csv_output:
-                                for key in output:
-                                    secondary_keys.add(key)
-                            # insert empty data to align with keys that may not exist
-                            for index, output_dict in enumerate(secondary_csv_output):
-                                remaining_keys = secondary_keys - set(output_dict.keys())
-                                for key in remaining_keys:
-                                    secondary_csv_output[index][key] = "N/A"
-
-                        if primary_csv_output:
-                            # Get the header as a list of the first element to maintain order
-                            csv_header = primary_csv_output[0].keys()
-                            writer = csv.DictWriter(output_file, csv_header)
-                            writer.writeheader()
-                            writer.writerows(primary_csv_output)
-                        if secondary_csv_output:
-                            output_file.write("\n")
-                            csv_header = secondary_csv_output[0].keys()
-                            writer = csv.DictWriter(output_file, csv_header)
-                            writer.writeheader()
-                            writer.writerows(secondary_csv_output)
-            else:
-                with self.destination.open('a', newline = '', encoding="utf-8") as output_file:
-                    if primary_csv_output:
-                        # Get the header as a list of the first element to maintain order
-                        csv_header = primary_csv_output[0].keys()
-                        writer = csv.DictWriter(output_file, csv_header)
-                        writer.writeheader()
-                        writer.writerows(primary_csv_output)
-                    if secondary_csv_output:
-                        output_file.write("\n")
-                        csv_header = secondary_csv_output[0].keys()
-                        writer = csv.DictWriter(output_file, csv_header)
-                        writer.writeheader()
-                        writer.writerows(secondary_csv_output)
+            if watching_output: # Watch output is streamed to the file by store_watch_output
+                return
+            with self.destination.open('a', newline = '', encoding="utf-8") as output_file:
+                if primary_csv_output:
+                    # Get the header as a list of the first element to maintain order
+                    csv_header = primary_csv_output[0].keys()
+                    writer = csv.DictWriter(output_file, csv_header)
+                    writer.writeheader()
+                    writer.writerows(primary_csv_output)
+                if secondary_csv_output:
+                    output_file.write("\n")
+                    csv_header = secondary_csv_output[0].keys()
+                    writer = csv.DictWriter(output_file, csv_header)
+                    writer.writeheader()
+                    writer.writerows(secondary_csv_output)
 
     def _print_human_readable_output(self, multiple_device_enabled=False, watching_output=False, tabular=False):
         # If tabular output is enabled, redirect to _print_tabular_output
@@ -762,15 +1161,10 @@ class AMDSMILogger():
                 # print as ascii, ignore incompatible characters
                 print(human_readable_output.encode('ascii', 'ignore').decode('ascii'))
         else:
-            if watching_output:
-                with self.destination.open('w', encoding="utf-8") as output_file:
-                    human_readable_output = ''
-                    for output in self.watch_output:
-                        human_readable_output += self._convert_json_to_human_readable(output)
-                    output_file.write(human_readable_output + '\n')
-            else:
-                with self.destination.open('a', encoding="utf-8") as output_file:
-                    output_file.write(human_readable_output + '\n')
+            if watching_output: # Watch output is streamed to the file by store_watch_output
+                return
+            with self.destination.open('a', encoding="utf-8") as output_file:
+                output_file.write(human_readable_output + '\n')
 
 
     def _print_tabular_output(self, multiple_device_enabled=False, watching_output=False):
@@ -844,52 +1238,8 @@ class AMDSMILogger():
                 if watching_output:
                     print("\n")
         else:
-            if watching_output: # Write all stored watched output to a file
-                with self.destination.open('w', encoding="utf-8") as output_file:
-                    primary_table = ''
-                    secondary_table = ''
-                    # Add process_list to the secondary_table
-                    # Add remaining watch_output to the primary_table
-                    for device_output in self.watch_output:
-                        # if process_list is detected in device_output store in secondary_table
-                        if 'process_list' in device_output:
-                            process_table_dict = {
-                                'timestamp': device_output['timestamp'],
-                                'gpu': device_output['gpu'],
-                                'process_list': device_output['process_list']
-                            }
-                            secondary_table += self._convert_json_to_tabular(process_table_dict) + '\n'
-                        # Add primary table keys without process_list
-                        primary_table_output = {}
-                        for key, value in device_output.items():
-                            if key != 'process_list':
-                                primary_table_output[key] = value
-                        primary_table += self._convert_json_to_tabular(primary_table_output) + '\n'
-                    primary_table = primary_table.rstrip() # Remove trailing new line
-                    secondary_table = secondary_table.rstrip()
-
-                    # Add primary table title and header to primary_table
-                    if primary_table:
-                        primary_table_heading = ''
-                        if self.table_title:
-                            primary_table_heading = self.table_title + ':\n'
-                        primary_table_heading += self.table_header + '\n'
-                        primary_table = primary_table_heading + primary_table
-
-                    # Add secondary table title and header to secondary_table
-                    # Currently just process_info uses this logic
-                    if secondary_table:
-                        secondary_table_heading = ''
-                        if self.secondary_table_title:
-                            secondary_table_heading = '\n' + self.secondary_table_title + ':\n'
-                        secondary_table_heading += self.secondary_table_header + '\n'
-                        secondary_table = secondary_table_heading + secondary_table
-
-                    # Write both full tables to the file
-                    output_file.write(primary_table)
-                    if secondary_table:
-                        output_file.write("\n" + secondary_table)
-            else: # Write all singular output to a file
-                with self.destination.open('a', encoding="utf-8") as output_file:
-                    output_file.write(primary_table + '\n')
-                    output_file.write(secondary_table)
+            if watching_output: # Watch output is streamed to the file by store_watch_output
+                return
+            with self.destination.open('a', encoding="utf-8") as output_file:
+                output_file.write(primary_table + '\n')
+                output_file.write(secondary_table)
@@ -33,6 +33,7 @@ from typing import Union
 from pathlib import Path
 
 from _version import __version__
+from amdsmi_fields import FIELD_GROUPS, parse_fields
 from amdsmi_helpers import AMDSMIHelpers
 from rocm_version import get_rocm_version
 import amdsmi_cli_exceptions
@@ -71,39 +72,22 @@ class AMDSMIParser(argparse.ArgumentParser):
     """
     def __init__(self, version, list, static, firmware, bad_pages, metric,
                  process, profile, event, topology, set_value, reset, monitor,
-                 rocmsmi, xgmi, partition):
+                 rocmsmi, xgmi, partition, daemon, exporter):
 
         # Helper variables
         self.helpers = AMDSMIHelpers()
 
-        # Get choices based on driver initialized
-        if self.helpers.is_amdgpu_initialized():
-            self.gpu_choices, self.gpu_choices_str = self.helpers.get_gpu_choices()
-        else:
-            self.gpu_choices = {}
-            self.gpu_choices_str = ""
-
-        if self.helpers.is_amd_hsmp_initialized():
-            self.cpu_choices, self.cpu_choices_str = self.helpers.get_cpu_choices()
-            self.core_choices, self.core_choices_str = self.helpers.get_core_choices()
-        else:
-            self.cpu_choices = {}
-            self.cpu_choices_str = ""
-            self.core_choices = {}
-            self.core_choices_str = ""
+        # Device choices are enumerated on first use, see _get_device_choices()
+        self._device_choices = {}
 
         self.vf_choices = ['3', '2', '1']
 
-        version_string = f"Version: {__version__}"
-        platform_string = f"Platform: {self.helpers.os_info()}"
-        rocm_version = get_rocm_version()
-        rocm_version_string = f"ROCm version: {rocm_version}"
         program_name = 'amd-smi'
 
-        # Adjust argument parser options
+        # Adjust argument parser options, the description is built in format_help()
         super().__init__(
             formatter_class= lambda prog: AMDSMIParserHelpFormatter(prog),
-            description=f"AMD System Management Interface | {version_string} | {rocm_version_string} | {platform_string}",
+            description=None,
             add_help=True,
             prog=program_name)
 
@@ -117,7 +101,8 @@ class AMDSMIParser(argparse.ArgumentParser):
         # Store possible subcommands & aliases for later errors
         self.possible_commands = ['version', 'list', 'static', 'firmware', 'ucode', 'bad-pages',
                                   'metric', 'process', 'profile', 'event', 'topology', 'set',
-                                  'reset', 'monitor', 'dmon', 'xgmi', 'partition']
+                                  'reset', 'monitor', 'dmon', 'xgmi', 'partition', 'daemon',
+                                  'exporter']
 
         # Add all subparsers
         self._add_version_parser(self.subparsers, version)
@@ -136,6 +121,67 @@ class AMDSMIParser(argparse.ArgumentParser):
         self._add_rocm_smi_parser(self.subparsers, rocmsmi)
         self._add_xgmi_parser(self.subparsers, xgmi)
         self._add_partition_parser(self.subparsers, partition)
+        self._add_daemon_parser(self.subparsers, daemon)
+        self._add_exporter_parser(self.subparsers, exporter)
+
+
+    def format_help(self):
+        # Reading the ROCm version loads librocm-core, only do it when the help is printed
+        if self.description is None:
+            version_string = f"Version: {__version__}"
+            platform_string = f"Platform: {self.helpers.os_info()}"
+            rocm_version_string = f"ROCm version: {get_rocm_version()}"
+            self.description = f"AMD System Management Interface | {version_string} | {rocm_version_string} | {platform_string}"
+        return super().format_help()
+
+
+    def _get_device_choices(self, device_type):
+        """Return the (choices, choices_str) of a device type, enumerating them on first use
+        params:
+            device_type (str) - 'gpu', 'cpu', or 'core'
+        return:
+            (dict, str) : (choices, choices_str), empty if the driver isn't initialized
+        """
+        if device_type not in self._device_choices:
+            if device_type == 'gpu' and self.helpers.is_amdgpu_initialized():
+                self._device_choices[device_type] = self.helpers.get_gpu_choices()
+            elif device_type == 'cpu' and self.helpers.is_amd_hsmp_initialized():
+                self._device_choices[device_type] = self.helpers.get_cpu_choices()
+            elif device_type == 'core' and self.helpers.is_amd_hsmp_initialized():
+                self._device_choices[device_type] = self.helpers.get_core_choices()
+            else:
+                self._device_choices[device_type] = ({}, "")
+        return self._device_choices[device_type]
+
+
+    @property
+    def gpu_choices(self):
+        return self._get_device_choices('gpu')[0]
+
+
+    @property
+    def gpu_choices_str(self):
+        return self._get_device_choices('gpu')[1]
+
+
+    @property
+    def cpu_choices(self):
+        return self._get_device_choices('cpu')[0]
+
+
+    @property
+    def cpu_choices_str(self):
+        return self._get_device_choices('cpu')[1]
+
+
+    @property
+    def core_choices(self):
+        return self._get_device_choices('core')[0]
+
+
+    @property
+    def core_choices_str(self):
+        return self._get_device_choices('core')[1]
 
 
     def _not_negative_int(self, int_value):
@@ -150,6 +196,17 @@ class AMDSMIParser(argparse.ArgumentParser):
             raise amdsmi_cli_exceptions.AmdSmiInvalidParameterValueException(int_value, outputformat)
 
 
+    def _field_list(self, fields_value):
+        # Argument type validator
+        try:
+            return parse_fields(fields_value)
+        except ValueError as e:
+            outputformat = self.helpers.get_output_format()
+            if fields_value == "":
+                raise amdsmi_cli_exceptions.AmdSmiMissingParameterValueException(fields_value, outputformat)
+            raise amdsmi_cli_exceptions.AmdSmiInvalidParameterValueException(e.args[0], outputformat)
+
+
     def _positive_int(self, int_value):
         # Argument type validator
         if int_value.isdigit():  # Is digit doesn't work on negative numbers
@@ -163,6 +220,21 @@ class AMDSMIParser(argparse.ArgumentParser):
             raise amdsmi_cli_exceptions.AmdSmiInvalidParameterValueException(int_value, outputformat)
 
 
+    def _positive_float(self, float_value):
+        # Argument type validator
+        try:
+            if 0 < float(float_value) < float('inf'):
+                return float(float_value)
+        except ValueError:
+            pass
+
+        outputformat = self.helpers.get_output_format()
+        if float_value == "":
+            raise amdsmi_cli_exceptions.AmdSmiMissingParameterValueException(float_value, outputformat)
+        else:
+            raise amdsmi_cli_exceptions.AmdSmiInvalidParameterValueException(float_value, outputformat)
+
+
     def _is_valid_string(self, string_value):
         # Argument type validator
         # This is for triggering a cli exception if an empty string is detected
@@ -275,21 +347,29 @@ class AMDSMIParser(argparse.ArgumentParser):
         return WatchSelectedAction
 
 
-    def _gpu_select(self, gpu_choices):
+    def _gpu_select(self):
         """ Custom argparse action to return the device handle(s) for the gpu(s) selected
             This will set the destination (args.gpu) to a list of 1 or more device handles
             If 1 or more device handles are not found then raise an ArgumentError for the first invalid gpu seen
         """
 
+        amdsmi_parser = self
         amdsmi_helpers = self.helpers
         class _GPUSelectAction(argparse.Action):
             ouputformat=self.helpers.get_output_format()
+
+            # The help holds a {choices} field, only enumerate the choices when it's printed
+            @property
+            def help(self):
+                return self._help.format(choices=amdsmi_parser.gpu_choices_str)
+
+            @help.setter
+            def help(self, value):
+                self._help = value
+
             # Checks the values
             def __call__(self, parser, args, values, option_string=None):
-                if "all" in gpu_choices:
-                    del gpu_choices["all"]
-                status, gpu_format, selected_device_handles = amdsmi_helpers.get_device_handles_from_gpu_selections(gpu_selections=values,
-                                                                                                         gpu_choices=gpu_choices)
+                status, gpu_format, selected_device_handles = amdsmi_helpers.get_device_handles_from_gpu_selections(gpu_selections=values)
                 if status:
                     setattr(args, self.dest, selected_device_handles)
                 else:
@@ -306,20 +386,28 @@ class AMDSMIParser(argparse.ArgumentParser):
         return _GPUSelectAction
 
 
-    def _cpu_select(self, cpu_choices):
+    def _cpu_select(self):
         """ Custom argparse action to return the device handle(s) for the cpu(s) selected
         This will set the destination (args.cpu) to a list of 1 or more device handles
         If 1 or more device handles are not found then raise an ArgumentError for the first invalid cpu seen
         """
+        amdsmi_parser = self
         amdsmi_helpers = self.helpers
         class _CPUSelectAction(argparse.Action):
             ouputformat=self.helpers.get_output_format()
+
+            # The help holds a {choices} field, only enumerate the choices when it's printed
+            @property
+            def help(self):
+                return self._help.format(choices=amdsmi_parser.cpu_choices_str)
+
+            @help.setter
+            def help(self, value):
+                self._help = value
+
             # Checks the values
             def __call__(self, parser, args, values, option_string=None):
-                if "all" in cpu_choices:
-                    del cpu_choices["all"]
-                status, cpu_format, selected_device_handles = amdsmi_helpers.get_device_handles_from_cpu_selections(cpu_selections=values,
-                                                                                                        cpu_choices=cpu_choices)
+                status, cpu_format, selected_device_handles = amdsmi_helpers.get_device_handles_from_cpu_selections(cpu_selections=values)
                 if status:
                     setattr(args, self.dest, selected_device_handles)
                 else:
@@ -335,20 +423,28 @@ class AMDSMIParser(argparse.ArgumentParser):
         return _CPUSelectAction
 
 
-    def _core_select(self, core_choices):
+    def _core_select(self):
         """ Custom argparse action to return the device handle(s) for the core(s) selected
         This will set the destination (args.core) to a list of 1 or more device handles
         If 1 or more device handles are not found then raise an ArgumentError for the first invalid core seen
         """
+        amdsmi_parser = self
         amdsmi_helpers = self.helpers
         class _CoreSelectAction(argparse.Action):
             ouputformat=self.helpers.get_output_format()
+
+            # The help holds a {choices} field, only enumerate the choices when it's printed
+            @property
+            def help(self):
+                return self._help.format(choices=amdsmi_parser.core_choices_str)
+
+            @help.setter
+            def help(self, value):
+                self._help = value
+
             # Checks the values
             def __call__(self, parser, args, values, option_string=None):
-                if "all" in core_choices:
-                    del core_choices["all"]
-                status, core_format, selected_device_handles = amdsmi_helpers.get_device_handles_from_core_selections(core_selections=values,
-                                                                                                        core_choices=core_choices)
+                status, core_format, selected_device_handles = amdsmi_helpers.get_device_handles_from_core_selections(core_selections=values)
                 if status:
                     setattr(args, self.dest, selected_device_handles)
                 else:
@@ -387,19 +483,30 @@ class AMDSMIParser(argparse.ArgumentParser):
 
     def _add_watch_arguments(self, subcommand_parser):
         # Device arguments help text
-        watch_help = "Reprint the command in a loop of INTERVAL seconds"
+        watch_help = "Reprint the command in a loop of INTERVAL seconds, fractions of a second are allowed"
         watch_time_help = "The total TIME to watch the given command"
         iterations_help = "Total number of ITERATIONS to loop on the given command"
 
         # Mutually Exclusive Args within the subparser
         subcommand_parser.add_argument('-w', '--watch', action='store', metavar='INTERVAL',
-             type=self._positive_int, required=False, help=watch_help)
+             type=self._positive_float, required=False, help=watch_help)
         subcommand_parser.add_argument('-W', '--watch_time', action=self._check_watch_selected(), metavar='TIME',
             type=self._positive_int, required=False, help=watch_time_help)
         subcommand_parser.add_argument('-i', '--iterations', action=self._check_watch_selected(), metavar='ITERATIONS',
             type=self._positive_int, required=False, help=iterations_help)
 
 
+    def _add_parallel_arguments(self, subcommand_parser):
+        # Parallel arguments help text
+        parallel_help = "Collect up to N GPUs concurrently (1 by default)"
+        device_timeout_help = "Seconds to wait for each GPU with --parallel before reporting it as N/A (30 by default)"
+
+        subcommand_parser.add_argument('--parallel', action='store', metavar='N',
+            type=self._positive_int, required=False, default=1, help=parallel_help)
+        subcommand_parser.add_argument('--device-timeout', action='store', metavar='SECONDS',
+            type=self._positive_int, required=False, default=30, help=device_timeout_help)
+
+
     def _validate_cpu_core(self, value):
         if value == '':
             outputformat = self.helpers.get_output_format()
@@ -425,27 +532,27 @@ class AMDSMIParser(argparse.ArgumentParser):
 
     def _add_device_arguments(self, subcommand_parser, required=False):
         # Device arguments help text
-        gpu_help = f"Select a GPU ID, BDF, or UUID from the possible choices:\n{self.gpu_choices_str}"
+        gpu_help = "Select a GPU ID, BDF, or UUID from the possible choices:\n{choices}"
         vf_help = "Gets general information about the specified VF (timeslice, fb info, …).\
                     \nAvailable only on virtualization OSs"
-        cpu_help = f"Select a CPU ID from the possible choices:\n{self.cpu_choices_str}"
-        core_help = f"Select a Core ID from the possible choices:\n{self.core_choices_str}"
+        cpu_help = "Select a CPU ID from the possible choices:\n{choices}"
+        core_help = "Select a Core ID from the possible choices:\n{choices}"
 
 
         # Mutually Exclusive Args within the subparser
         device_args = subcommand_parser.add_mutually_exclusive_group(required=required)
 
         if self.helpers.is_amdgpu_initialized():
-            device_args.add_argument('-g', '--gpu', action=self._gpu_select(self.gpu_choices),
+            device_args.add_argument('-g', '--gpu', action=self._gpu_select(),
                                         nargs='+', help=gpu_help)
 
         if self.helpers.is_amd_hsmp_initialized():
             device_args.add_argument('-U', '--cpu', type=self._validate_cpu_core,
-                                        action=self._cpu_select(self.cpu_choices),
+                                        action=self._cpu_select(),
                                         nargs='+', help=cpu_help)
             if subcommand_parser._optionals.title != "Static Arguments":
                 device_args.add_argument('-O', '--core', type=self._validate_cpu_core,
-                                            action=self._core_select(self.core_choices),
+                                            action=self._core_select(),
                                             nargs='+', help=core_help)
 
         if self.helpers.is_hypervisor():
@@ -601,6 +708,7 @@ class AMDSMIParser(argparse.ArgumentParser):
         soc_pstate_help = "The available soc pstate policy"
         xgmi_plpd_help = "The available XGMI per-link power down policy"
         process_isolation_help = "The process isolation status"
+        capabilities_help = "Library getters that report not supported for the GPU;\n they are skipped for the rest of the session"
 
         # Options arguments help text for Hypervisors and Baremetal
         ras_help = "Displays RAS features information"
@@ -624,6 +732,7 @@ class AMDSMIParser(argparse.ArgumentParser):
 
         # Add Universal Arguments
         self._add_device_arguments(static_parser, required=False)
+        self._add_parallel_arguments(static_parser)
 
         # Handle GPU Options
         if self.helpers.is_amdgpu_initialized():
@@ -635,6 +744,7 @@ class AMDSMIParser(argparse.ArgumentParser):
             static_parser.add_argument('-c', '--cache', action='store_true', required=False, help=cache_help)
             static_parser.add_argument('-B', '--board', action='store_true', required=False, help=board_help)
             static_parser.add_argument('-R', '--process-isolation', action='store_true', required=False, help=process_isolation_help)
+            static_parser.add_argument('--capabilities', action='store_true', required=False, help=capabilities_help)
 
             # Options to display on Hypervisors and Baremetal
             if self.helpers.is_hypervisor() or self.helpers.is_baremetal():
@@ -686,6 +796,7 @@ class AMDSMIParser(argparse.ArgumentParser):
         # Add Universal Arguments
         self._add_command_modifiers(firmware_parser)
         self._add_device_arguments(firmware_parser, required=False)
+        self._add_parallel_arguments(firmware_parser)
 
         # Optional Args
         firmware_parser.add_argument('-f', '--ucode-list', '--fw-list', dest='fw_list', action='store_true', required=False, help=fw_list_help, default=True)
@@ -760,6 +871,8 @@ class AMDSMIParser(argparse.ArgumentParser):
         xgmi_err_help = "XGMI error information since last read"
         energy_help = "Amount of energy consumed"
         throttle_help = "Displays throttle accumulators; Only available for MI300 or newer ASICs"
+        rates_help = "Displays power, bandwidth, activity, and throttle residency rates computed from the\n accumulating counters since the previous watch iteration; Only available for MI300 or newer ASICs"
+        fields_help = "Comma separated fields to display, ex. power.socket,temp.hotspot,clock.gfx.cur\n Only the library calls backing the selected fields are made; a group selects all\n of its fields: " + ", ".join(FIELD_GROUPS)
 
         # Help text for Arguments only on Hypervisors
         schedule_help = "All scheduling information"
@@ -804,6 +917,7 @@ class AMDSMIParser(argparse.ArgumentParser):
 
         # Add Universal Arguments
         self._add_device_arguments(metric_parser, required=False)
+        self._add_parallel_arguments(metric_parser)
 
         # Add Watch args
         self._add_watch_arguments(metric_parser)
@@ -820,6 +934,8 @@ class AMDSMIParser(argparse.ArgumentParser):
                 metric_parser.add_argument('-c', '--clock', action='store_true', required=False, help=clock_help)
                 metric_parser.add_argument('-t', '--temperature', action='store_true', required=False, help=temperature_help)
                 metric_parser.add_argument('-P', '--pcie', action='store_true', required=False, help=pcie_help)
+                metric_parser.add_argument('--fields', action='store', required=False, type=self._field_list,
+                                           metavar='FIELDS', help=fields_help)
 
             # Options that only apply to Hypervisors and Baremetal Linux
             if self.helpers.is_hypervisor() or (self.helpers.is_baremetal() and self.helpers.is_linux()):
@@ -835,6 +951,7 @@ class AMDSMIParser(argparse.ArgumentParser):
                 metric_parser.add_argument('-x', '--xgmi-err', action='store_true', required=False, help=xgmi_err_help)
                 metric_parser.add_argument('-E', '--energy', action='store_true', required=False, help=energy_help)
                 metric_parser.add_argument('-T', '--throttle', action='store_true', required=False, help=throttle_help)
+                metric_parser.add_argument('-R', '--rates', action='store_true', required=False, help=rates_help)
 
             # Options to only display to Hypervisors
             if self.helpers.is_hypervisor():
@@ -915,6 +1032,7 @@ class AMDSMIParser(argparse.ArgumentParser):
         # Add Universal Arguments
         self._add_command_modifiers(process_parser)
         self._add_device_arguments(process_parser, required=False)
+        self._add_parallel_arguments(process_parser)
 
         # Add Watch args
         self._add_watch_arguments(process_parser)
@@ -1184,6 +1302,9 @@ class AMDSMIParser(argparse.ArgumentParser):
         pcie_bandwidth_help = "Monitor PCIe bandwidth in Mb/s"
         process_help = "Enable Process information table below monitor output"
         violation_help = "Monitor power and thermal violation status (%%); Only available for MI300 or newer ASICs"
+        rates_help = "Monitor average power (W), PCIe and XGMI bandwidth (GB/s), and throttle residency (%%)\n computed from the accumulating counters; Only available for MI300 or newer ASICs"
+        fields_help = "Comma separated fields to monitor, ex. power.socket,temp.hotspot,clock.gfx.cur\n Only the library calls backing the selected fields are made; a group selects all\n of its fields: " + ", ".join(FIELD_GROUPS)
+        sample_interval_help = "Sample power and temperature every SECONDS between watch iterations and\n display their min, avg, max, and p99; Requires -w/--watch"
 
         # Create monitor subparser
         monitor_parser = subparsers.add_parser('monitor', help=monitor_help, description=monitor_subcommand_help, aliases=["dmon"])
@@ -1194,6 +1315,7 @@ class AMDSMIParser(argparse.ArgumentParser):
         # Add Universal Arguments
         self._add_command_modifiers(monitor_parser)
         self._add_device_arguments(monitor_parser, required=False)
+        self._add_parallel_arguments(monitor_parser)
         self._add_watch_arguments(monitor_parser)
 
         # Add monitor arguments
@@ -1211,6 +1333,11 @@ class AMDSMIParser(argparse.ArgumentParser):
         monitor_parser.add_argument('-r', '--pcie', action='store_true', required=False, help=pcie_bandwidth_help)
         monitor_parser.add_argument('-q', '--process', action='store_true', required=False, help=process_help)
         monitor_parser.add_argument('-V', '--violation', action='store_true', required=False, help=violation_help)
+        monitor_parser.add_argument('-R', '--rates', action='store_true', required=False, help=rates_help)
+        monitor_parser.add_argument('-s', '--sample-interval', action=self._check_watch_selected(), metavar='SECONDS',
+                                    type=self._positive_float, required=False, help=sample_interval_help)
+        monitor_parser.add_argument('--fields', action='store', required=False, type=self._field_list,
+                                    metavar='FIELDS', help=fields_help)
 
 
     def _add_rocm_smi_parser(self, subparsers, func):
@@ -1320,6 +1447,78 @@ class AMDSMIParser(argparse.ArgumentParser):
         self._add_command_modifiers(partition_parser)
 
 
+    def _add_daemon_parser(self, subparsers, func):
+        if not self.helpers.is_linux():
+            # This subparser is only applicable to Linux
+            return
+
+        # Subparser help text
+        daemon_help = "Serve metric, monitor, and static queries over a local socket"
+        daemon_subcommand_help = "Keep the library initialized and answer metric, monitor, and static queries\
+                                 \nas JSON over a Unix socket. Use amdsmi_daemon.py as a client:\
+                                 \n    amdsmi_daemon.py metric --gpu 0 --json"
+        daemon_optionals_title = "Daemon Arguments"
+
+        # Options help text
+        socket_help = "Path of the Unix socket to listen on\
+                       \n(AMDSMI_DAEMON_SOCKET or $XDG_RUNTIME_DIR/amdsmi/daemon.sock by default)"
+
+        # Create daemon subparser
+        daemon_parser = subparsers.add_parser('daemon', help=daemon_help, description=daemon_subcommand_help)
+        daemon_parser._optionals.title = daemon_optionals_title
+        daemon_parser.formatter_class=lambda prog: AMDSMISubparserHelpFormatter(prog)
+        # Queries are parsed with this parser, so pass it along to the handler
+        daemon_parser.set_defaults(func=func, query_parser=self)
+
+        daemon_parser.add_argument('-s', '--socket', action='store', type=self._is_valid_string, required=False,
+                                   metavar='PATH', help=socket_help)
+
+        # Add command modifiers to the bottom
+        self._add_command_modifiers(daemon_parser)
+
+
+    def _add_exporter_parser(self, subparsers, func):
+        if not self.helpers.is_linux():
+            # This subparser is only applicable to Linux
+            return
+
+        if not self.helpers.is_amdgpu_initialized():
+            # The exporter subcommand is only applicable to systems with amdgpu initialized
+            return
+
+        # Subparser help text
+        exporter_help = "Serve monitor metrics for Prometheus over HTTP"
+        exporter_subcommand_help = "Sample the target devices in the background and serve the amd-smi monitor\
+                                   \nmetrics in the Prometheus text format on http://ADDRESS:PORT/metrics.\
+                                   \nIf no GPU is specified, all GPUs on the system are exported."
+        exporter_optionals_title = "Exporter Arguments"
+
+        # Options help text
+        gpu_help = "Select a GPU ID, BDF, or UUID from the possible choices:\n{choices}"
+        address_help = "Address to listen on (127.0.0.1 by default)"
+        port_help = "Port to listen on (9410 by default)"
+        interval_help = "Seconds between device samples (1 by default)"
+
+        # Create exporter subparser
+        exporter_parser = subparsers.add_parser('exporter', help=exporter_help, description=exporter_subcommand_help)
+        exporter_parser._optionals.title = exporter_optionals_title
+        exporter_parser.formatter_class=lambda prog: AMDSMISubparserHelpFormatter(prog)
+        exporter_parser.set_defaults(func=func)
+
+        # Handle GPU Options
+        exporter_parser.add_argument('-g', '--gpu', action=self._gpu_select(),
+                                     nargs='+', help=gpu_help)
+        exporter_parser.add_argument('-a', '--address', action='store', type=self._is_valid_string, required=False,
+                                     default='127.0.0.1', help=address_help)
+        exporter_parser.add_argument('-p', '--port', action='store', type=self._positive_int, required=False,
+                                     default=9410, help=port_help)
+        exporter_parser.add_argument('-i', '--interval', action='store', type=self._positive_int, required=False,
+                                     default=1, metavar='SECONDS', help=interval_help)
+
+        # Add command modifiers to the bottom
+        self._add_command_modifiers(exporter_parser)
+
+
     def error(self, message):
         outputformat = self.helpers.get_output_format()
 
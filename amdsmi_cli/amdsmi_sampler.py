@@ -0,0 +1,214 @@
+#
+# Copyright (C) 2024 Advanced Micro Devices. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+
+import array
+import logging
+import math
+import threading
+import time
+
+from amdsmi import amdsmi_interface
+from amdsmi import amdsmi_exception
+
+
+# Samples kept per device and field, whatever the display and sample intervals are
+SAMPLER_MAX_RING_SIZE = 10000
+
+# Aggregates published for every sampled field, in display order
+SAMPLER_AGGREGATES = ('min', 'avg', 'max', 'p99')
+
+
+def take_sample(sample):
+    """Call sample(), logging any exception instead of raising it
+    return:
+        bool : True if sample() returned
+    """
+    try:
+        sample()
+        return True
+    except amdsmi_exception.AmdSmiLibraryException as e:
+        logging.debug("Failed to sample devices | %s", e.get_error_info())
+    except Exception:
+        logging.exception("Failed to sample devices")
+    return False
+
+
+def run_sampler_loop(sample, interval, stop):
+    """Call sample() every interval seconds until stop is set
+
+    The deadlines are kept on a fixed grid, so the time spent in sample()
+    doesn't push the next call back, and missed intervals are skipped instead
+    of sampled back to back. A failing sample() is logged and the loop keeps
+    going.
+    params:
+        sample (callable) - reads the devices
+        interval (float) - seconds between calls
+        stop (threading.Event) - ends the loop once set
+    """
+    next_sample_time = time.monotonic() + interval
+    while not stop.wait(max(0, next_sample_time - time.monotonic())):
+        take_sample(sample)
+        next_sample_time += interval
+        if next_sample_time < time.monotonic():
+            next_sample_time = time.monotonic() + interval
+
+
+class SampleRing():
+    """Fixed size ring of float samples backed by an array
+
+    Once full, every new sample overwrites the oldest one, so the memory used
+    doesn't depend on how long the sampler runs.
+    """
+
+    def __init__(self, size) -> None:
+        self.size = size
+        self.samples = array.array('d', bytes(8 * size))
+        self.count = 0
+        self.index = 0
+
+
+    def append(self, value):
+        self.samples[self.index] = value
+        self.index = (self.index + 1) % self.size
+        if self.count < self.size:
+            self.count += 1
+
+
+    def clear(self):
+        self.count = 0
+        self.index = 0
+
+
+    def values(self):
+        """Return the samples from oldest to newest"""
+        if self.count < self.size:
+            return self.samples[:self.count]
+        return self.samples[self.index:] + self.samples[:self.index]
+
+
+    def aggregate(self):
+        """Return the min, avg, max, and 99th percentile of the samples
+        return:
+            dict : {"min", "avg", "max", "p99", "samples"}, "N/A" values if the ring is empty
+        """
+        if not self.count:
+            aggregates = dict.fromkeys(SAMPLER_AGGREGATES, "N/A")
+            aggregates['samples'] = 0
+            return aggregates
+
+        values = sorted(self.values())
+        # Nearest rank percentile
+        p99_index = max(0, math.ceil(0.99 * self.count) - 1)
+        aggregates = {'min': values[0],
+                      'avg': round(sum(values) / self.count, 3),
+                      'max': values[-1],
+                      'p99': values[p99_index]}
+        # The rings store floats, give integer samples back as they were read
+        for aggregate, value in aggregates.items():
+            if value.is_integer():
+                aggregates[aggregate] = int(value)
+        aggregates['samples'] = self.count
+        return aggregates
+
+
+class AMDSMISampler():
+    """Sample gpu_metrics fields faster than the display interval
+
+    A background thread reads the selected fields of every device each
+    interval into one SampleRing per device and field. The deadlines are kept
+    on a fixed grid, so the time spent reading doesn't push the next sample
+    back. collect() returns the aggregates of the samples taken since the
+    previous collect() of that device.
+    """
+
+    def __init__(self, device_handles, fields, interval, ring_size) -> None:
+        """
+        params:
+            device_handles (list) - gpu device handles to sample
+            fields (dict) - {name: [gpu_metrics keys]}, the first key with a
+                numeric value is sampled, ex. current then average socket power
+            interval (float) - seconds between samples
+            ring_size (int) - samples kept per device and field
+        """
+        self.device_handles = device_handles
+        self.fields = fields
+        self.interval = interval
+        self.ring_size = min(max(1, ring_size), SAMPLER_MAX_RING_SIZE)
+        self.samples_total = 0
+        self.metrics_fields = []
+        for metrics_keys in fields.values():
+            for metrics_key in metrics_keys:
+                if metrics_key not in self.metrics_fields:
+                    self.metrics_fields.append(metrics_key)
+
+        self.rings = {device_handle.value: {name: SampleRing(self.ring_size) for name in fields}
+                      for device_handle in device_handles}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+
+    def sample(self):
+        """Read every device once into the rings"""
+        gpu_metrics = amdsmi_interface.amdsmi_get_gpu_metrics_info_batch(self.device_handles,
+                                                                         fields=self.metrics_fields)
+        with self._lock:
+            for index, device_handle in enumerate(self.device_handles):
+                rings = self.rings[device_handle.value]
+                for name, metrics_keys in self.fields.items():
+                    for metrics_key in metrics_keys:
+                        value = gpu_metrics[metrics_key][index]
+                        if isinstance(value, (int, float)) and not isinstance(value, bool):
+                            rings[name].append(value)
+                            break
+            self.samples_total += 1
+
+
+    def collect(self, device_handle):
+        """Return the aggregates of a device and start a new window
+        params:
+            device_handle - gpu device handle
+        return:
+            dict : {name: {"min", "avg", "max", "p99", "samples"}}
+        """
+        with self._lock:
+            rings = self.rings[device_handle.value]
+            aggregates = {name: ring.aggregate() for name, ring in rings.items()}
+            for ring in rings.values():
+                ring.clear()
+        return aggregates
+
+
+    def start(self):
+        """Take the first sample and start the sampler thread"""
+        self._stop.clear()
+        take_sample(self.sample)
+        self._thread = threading.Thread(target=run_sampler_loop, args=(self.sample, self.interval, self._stop),
+                                        name="amdsmi-sampler", daemon=True)
+        self._thread.start()
+
+
+    def stop(self):
+        """Stop the sampler thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+#
+# Copyright (C) 2024 Advanced Micro Devices. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+
+
+import logging
+
+from amdsmi import amdsmi_interface
+from amdsmi import amdsmi_exception
+from amdsmi_boot_cache import AMDSMIBootCache
+
+
+TOPOLOGY_CACHE_NAME = "topology.json"
+TOPOLOGY_CACHE_ENV = "AMDSMI_TOPOLOGY_CACHE"
+
+
+class AMDSMITopology():
+    """Link information of every GPU pair, collected in one pass and cached per boot
+
+    Each link holds the raw values of amdsmi_topo_get_link_type, amdsmi_topo_get_link_weight,
+    amdsmi_get_minmax_bandwidth_between_processors, amdsmi_is_P2P_accessible and
+    amdsmi_topo_get_p2p_status. A failed read is stored as None, with the error
+    info under '<key>_error'. When the link from a to b is bi-directional the
+    reads are reused for b to a, so a pair is only read once.
+
+    Links are keyed by BDF and saved to a file tagged with the kernel boot id,
+    later runs in the same boot only read the pairs missing from that file.
+    Links with a failed read other than AMDSMI_STATUS_NOT_SUPPORTED are marked
+    'transient' and left out of the file so later runs read them again.
+    The cache must be invalidated when the topology can change (ex. partition change or gpu reset).
+    """
+
+    def __init__(self, helpers, cache_path=None) -> None:
+        """
+        params:
+            helpers (AMDSMIHelpers) - used to resolve gpu BDFs
+            cache_path (str) - path of the per boot cache file, the AMDSMI_TOPOLOGY_CACHE
+                environment variable or TOPOLOGY_CACHE_NAME in the directory from
+                amdsmi_boot_cache.get_cache_dir by default. An empty path disables the file.
+        """
+        self.helpers = helpers
+        self.cache = AMDSMIBootCache(TOPOLOGY_CACHE_NAME, TOPOLOGY_CACHE_ENV, cache_path)
+        self.links = None # loaded on first use
+        self.reads = 0
+
+
+    def _load_cache(self):
+        links = self.cache.load()
+        if not isinstance(links, dict):
+            return {}
+        return links
+
+
+    def _save_cache(self):
+        self.cache.save({src_bdf: {dest_bdf: link for dest_bdf, link in src_links.items() if not link.get('transient')}
+                         for src_bdf, src_links in self.links.items()})
+
+
+    def invalidate(self):
+        """Drop the collected links and remove the cache file"""
+        self.links = {}
+        self.cache.remove()
+
+
+    def _read(self, link, key, api, *args):
+        self.reads += 1
+        try:
+            link[key] = api(*args)
+        except amdsmi_exception.AmdSmiLibraryException as e:
+            link[key] = None
+            link[f"{key}_error"] = e.get_error_info()
+            if e.get_error_code() != amdsmi_interface.amdsmi_wrapper.AMDSMI_STATUS_NOT_SUPPORTED:
+                link['transient'] = True
+
+
+    def _read_link(self, src_gpu, dest_gpu):
+        link = {}
+        self._read(link, 'accessible', amdsmi_interface.amdsmi_is_P2P_accessible, src_gpu, dest_gpu)
+        if src_gpu.value == dest_gpu.value:
+            return link
+        self._read(link, 'link_type', amdsmi_interface.amdsmi_topo_get_link_type, src_gpu, dest_gpu)
+        self._read(link, 'weight', amdsmi_interface.amdsmi_topo_get_link_weight, src_gpu, dest_gpu)
+        self._read(link, 'bandwidth', amdsmi_interface.amdsmi_get_minmax_bandwidth_between_processors,
+                   src_gpu, dest_gpu)
+        self._read(link, 'p2p_status', amdsmi_interface.amdsmi_topo_get_p2p_status, src_gpu, dest_gpu)
+        return link
+
+
+    @staticmethod
+    def _is_bi_directional(link):
+        p2p_status = link.get('p2p_status')
+        return p2p_status is not None and p2p_status['cap']['is_iolink_bi_directional'] == 1
+
+
+    def get_links(self, device_handles):
+        """Return the links between every pair of device_handles
+        params:
+            device_handles (list) - gpu device handles
+        return:
+            dict : {src_bdf: {dest_bdf: link}} for every src and dest in device_handles
+        """
+        if self.links is None:
+            self.links = self._load_cache()
+        bdfs = [self.helpers.handle_registry.get_gpu_bdf(device_handle) for device_handle in device_handles]
+        reads = self.reads
+
+        for src_index, src_gpu in enumerate(device_handles):
+            src_links = self.links.setdefault(bdfs[src_index], {})
+            if bdfs[src_index] not in src_links:
+                src_links[bdfs[src_index]] = self._read_link(src_gpu, src_gpu)
+
+            # Upper triangle only, the lower triangle is mirrored when the link is bi-directional
+            for dest_index in range(src_index + 1, len(device_handles)):
+                dest_gpu = device_handles[dest_index]
+                dest_links = self.links.setdefault(bdfs[dest_index], {})
+                if bdfs[dest_index] not in src_links:
+                    src_links[bdfs[dest_index]] = self._read_link(src_gpu, dest_gpu)
+                if bdfs[src_index] not in dest_links:
+                    if self._is_bi_directional(src_links[bdfs[dest_index]]):
+                        dest_links[bdfs[src_index]] = src_links[bdfs[dest_index]]
+                    else:
+                        dest_links[bdfs[src_index]] = self._read_link(dest_gpu, src_gpu)
+
+        logging.debug("AMDSMITopology: %s library calls for %s gpus", self.reads - reads, len(device_handles))
+        if self.reads != reads:
+            self._save_cache()
+
+        return {src_bdf: {dest_bdf: self.links[src_bdf][dest_bdf] for dest_bdf in bdfs} for src_bdf in bdfs}
+
+
+    @staticmethod
+    def _format_link_type(link_type):
+        if link_type == amdsmi_interface.amdsmi_wrapper.AMDSMI_IOLINK_TYPE_UNDEFINED:
+            return "UNKNOWN"
+        if link_type == amdsmi_interface.amdsmi_wrapper.AMDSMI_IOLINK_TYPE_PCIEXPRESS:
+            return "PCIE"
+        if link_type == amdsmi_interface.amdsmi_wrapper.AMDSMI_IOLINK_TYPE_XGMI:
+            return "XGMI"
+        return "N/A"
+
+
+    @staticmethod
+    def _format_p2p_cap(link, key):
+        if link['p2p_status'] is None:
+            return "N/A"
+        cap = link['p2p_status']['cap']
+        if key == 'coherent':
+            return "C" if cap['is_iolink_coherent'] == 1 else "NC" if cap['is_iolink_coherent'] == 0 else "N/A"
+        if key == 'atomics':
+            return ("64,32" if cap['is_iolink_atomics_32bit'] == 1 and cap['is_iolink_atomics_64bit'] == 1 else
+                    "32" if cap['is_iolink_atomics_32bit'] == 1 else
+                    "64" if cap['is_iolink_atomics_64bit'] == 1 else
+                    "N/A")
+        if key == 'dma':
+            return "T" if cap['is_iolink_dma'] == 1 else "F" if cap['is_iolink_dma'] == 0 else "N/A"
+        return "T" if cap['is_iolink_bi_directional'] == 1 else "F" if cap['is_iolink_bi_directional'] == 0 else "N/A"
+
+
+    @staticmethod
+    def format_link(key, link, is_self, xgmi_bandwidth_only=False):
+        """Return the amd-smi topology display value of a link
+        params:
+            key (str) - access, weight, hops, link_type, numa_bw, coherent, atomics, dma or bi_dir
+            link (dict) - link returned by AMDSMITopology.get_links
+            is_self (bool) - True if the link is from a gpu to itself
+            xgmi_bandwidth_only (bool) - Only report numa_bw for XGMI links
+        return:
+            str or int : display value
+        """
+        if key == 'access':
+            if link['accessible'] is None:
+                return "N/A"
+            return "ENABLED" if link['accessible'] else "DISABLED"
+        if key in ('weight', 'hops'):
+            if is_self:
+                return 0
+            if key == 'weight':
+                return "N/A" if link['weight'] is None else link['weight']
+            return "N/A" if link['link_type'] is None else link['link_type']['hops']
+        if key == 'link_type':
+            if is_self:
+                return "SELF"
+            return "N/A" if link['link_type'] is None else AMDSMITopology._format_link_type(link['link_type']['type'])
+        if key == 'numa_bw':
+            if is_self:
+                return "N/A"
+            if xgmi_bandwidth_only and link['link_type'] is not None and \
+                    link['link_type']['type'] != amdsmi_interface.amdsmi_wrapper.AMDSMI_IOLINK_TYPE_XGMI:
+                return "N/A"
+            if link['bandwidth'] is None:
+                return link['bandwidth_error'] if xgmi_bandwidth_only else "N/A"
+            return f"{link['bandwidth']['min_bandwidth']}-{link['bandwidth']['max_bandwidth']}"
+        if is_self:
+            return "SELF"
+        return AMDSMITopology._format_p2p_cap(link, key)
@@ -30,6 +30,10 @@ from .amdsmi_interface import amdsmi_shut_down
 from .amdsmi_interface import amdsmi_get_processor_type
 from .amdsmi_interface import amdsmi_get_processor_handles
 from .amdsmi_interface import amdsmi_get_socket_handles
+from .amdsmi_interface import amdsmi_refresh_handle_topology
+from .amdsmi_interface import amdsmi_get_handle_topology_generation
+from .amdsmi_interface import amdsmi_get_unsupported_apis
+from .amdsmi_interface import amdsmi_clear_unsupported_apis
 from .amdsmi_interface import amdsmi_get_socket_info
 
 # ESMI Dependent Functions
@@ -74,6 +78,7 @@ try:
     from .amdsmi_interface import amdsmi_get_cpu_current_xgmi_bw
     from .amdsmi_interface import amdsmi_get_hsmp_metrics_table_version
     from .amdsmi_interface import amdsmi_get_hsmp_metrics_table
+    from .amdsmi_interface import amdsmi_get_hsmp_metrics_table_units
     from .amdsmi_interface import amdsmi_first_online_core_on_cpu_socket
     from .amdsmi_interface import amdsmi_get_cpu_family
     from .amdsmi_interface import amdsmi_get_cpu_model
@@ -110,6 +115,7 @@ from .amdsmi_interface import amdsmi_get_violation_status
 
 # # Process Information
 from .amdsmi_interface import amdsmi_get_gpu_process_list
+from .amdsmi_interface import amdsmi_get_gpu_process_table
 
 # # ECC Error Information
 from .amdsmi_interface import amdsmi_get_gpu_total_ecc_count
@@ -157,6 +163,14 @@ from .amdsmi_interface import amdsmi_get_gpu_mem_overdrive_level
 from .amdsmi_interface import amdsmi_get_clk_freq
 from .amdsmi_interface import amdsmi_get_gpu_od_volt_info
 from .amdsmi_interface import amdsmi_get_gpu_metrics_info
+from .amdsmi_interface import amdsmi_get_gpu_metrics_dtype
+from .amdsmi_interface import amdsmi_get_gpu_metrics_array
+from .amdsmi_interface import amdsmi_get_gpu_metrics_info_batch
+from .amdsmi_interface import amdsmi_get_power_info_batch
+from .amdsmi_interface import amdsmi_get_temp_metric_batch
+from .amdsmi_interface import amdsmi_get_clock_info_batch
+from .amdsmi_interface import amdsmi_get_gpu_activity_batch
+from .amdsmi_interface import CounterRateTracker
 from .amdsmi_interface import amdsmi_get_gpu_od_volt_curve_regions
 from .amdsmi_interface import amdsmi_is_gpu_power_management_enabled
 
@@ -198,6 +212,8 @@ from .amdsmi_interface import amdsmi_get_gpu_memory_reserved_pages
 
 # # Events
 from .amdsmi_interface import AmdSmiEventReader
+from .amdsmi_interface import AmdSmiEvent
+from .amdsmi_interface import AmdSmiEventDispatcher
 
 # # Device Identification information
 from .amdsmi_interface import amdsmi_get_gpu_vendor_name
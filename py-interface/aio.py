@@ -0,0 +1,202 @@
+#
+# Copyright (C) 2024 Advanced Micro Devices. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Asyncio versions of the amdsmi getters.
+
+Every amdsmi_get_*, amdsmi_topo_get_* and amdsmi_is_* function of
+amdsmi_interface has a coroutine of the same name here. The blocking library
+call runs on a bounded thread pool so the event loop keeps running, and calls
+on the same processor or socket handle are serialized so a slow device doesn't
+get several requests queued in the library at once:
+
+    import asyncio
+    import amdsmi
+    from amdsmi import aio
+
+    async def poll(handles):
+        return await asyncio.gather(*[aio.amdsmi_get_gpu_activity(handle) for handle in handles])
+
+    amdsmi.amdsmi_init()
+    activity = asyncio.run(poll(amdsmi.amdsmi_get_processor_handles()))
+
+amdsmi_init and amdsmi_shut_down are not wrapped, call them from the main thread.
+"""
+
+import asyncio
+import functools
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List
+
+from . import amdsmi_interface
+from . import amdsmi_wrapper
+from .amdsmi_exception import *
+
+DEFAULT_MAX_WORKERS = 8
+
+_executor = None
+_executor_lock = threading.Lock()
+_max_workers = DEFAULT_MAX_WORKERS
+
+# Event loop -> {handle value: asyncio.Lock}, locks are only valid on the loop they were created on
+_device_locks = weakref.WeakKeyDictionary()
+
+__all__ = ["DEFAULT_MAX_WORKERS", "amdsmi_aio_set_max_workers", "amdsmi_aio_shut_down", "amdsmi_aio_run"]
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_max_workers,
+                                           thread_name_prefix="amdsmi-aio")
+        return _executor
+
+
+def amdsmi_aio_set_max_workers(max_workers: int) -> None:
+    """
+    Set the number of threads used to run library calls.
+
+    The running pool finishes its pending calls, the next call starts a pool
+    of the new size.
+
+    Parameters:
+        max_workers(`int`): Maximum number of concurrent library calls
+
+    Returns:
+        `None`: This function does not return anything
+    """
+    global _executor, _max_workers
+    if not isinstance(max_workers, int) or isinstance(max_workers, bool) or max_workers < 1:
+        raise AmdSmiParameterException(max_workers, int, "max_workers must be a positive integer")
+
+    with _executor_lock:
+        _max_workers = max_workers
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+def amdsmi_aio_shut_down(wait: bool = True) -> None:
+    """
+    Stop the thread pool, call it before amdsmi_shut_down.
+
+    Parameters:
+        wait(`bool`): Wait for the pending calls to finish
+
+    Returns:
+        `None`: This function does not return anything
+    """
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+def _get_device_keys(args) -> List[int]:
+    """Return the sorted handle values a call touches from its first argument"""
+    if not args:
+        return []
+    handles = args[0]
+    if isinstance(handles, amdsmi_wrapper.amdsmi_processor_handle):
+        handles = [handles]
+    elif not isinstance(handles, list):
+        return []
+    keys = {handle.value for handle in handles
+            if isinstance(handle, amdsmi_wrapper.amdsmi_processor_handle)}
+    # A fixed acquire order keeps calls on overlapping handle lists from deadlocking
+    return sorted(key for key in keys if key is not None)
+
+
+def _get_device_lock(loop, key) -> asyncio.Lock:
+    locks = _device_locks.get(loop)
+    if locks is None:
+        locks = _device_locks[loop] = {}
+    lock = locks.get(key)
+    if lock is None:
+        lock = locks[key] = asyncio.Lock()
+    return lock
+
+
+async def amdsmi_aio_run(api: Callable, *args, **kwargs) -> Any:
+    """
+    Run any amdsmi_interface function on the thread pool.
+
+    Calls whose first argument is a processor or socket handle, or a list of
+    them, wait for the calls already running on those handles. A cancelled
+    call keeps its handles until the library call returns.
+
+    Parameters:
+        api(`Callable`): amdsmi_interface function to call
+        *args: Positional arguments of api
+        **kwargs: Keyword arguments of api
+
+    Returns:
+        `Any`: The value returned by api
+
+    Raises:
+        Any exception raised by api
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(api, *args, **kwargs)
+    locks = [_get_device_lock(loop, key) for key in _get_device_keys(args)]
+    acquired = []
+    future = None
+    try:
+        for lock in locks:
+            await lock.acquire()
+            acquired.append(lock)
+        future = loop.run_in_executor(_get_executor(), call)
+        # Cancelling the caller doesn't stop the library call, keep the
+        # handles locked until the call really returns
+        future.add_done_callback(lambda _: _release_locks(acquired))
+        return await asyncio.shield(future)
+    finally:
+        if future is None:
+            _release_locks(acquired)
+
+
+def _release_locks(locks: List[asyncio.Lock]) -> None:
+    for lock in reversed(locks):
+        lock.release()
+
+
+def _make_coroutine(api: Callable) -> Callable:
+    @functools.wraps(api)
+    async def coroutine(*args, **kwargs):
+        return await amdsmi_aio_run(api, *args, **kwargs)
+    return coroutine
+
+
+def _is_getter(name: str) -> bool:
+    return name.startswith(("amdsmi_get_", "amdsmi_topo_get_", "amdsmi_is_"))
+
+
+for _name in dir(amdsmi_interface):
+    _api = getattr(amdsmi_interface, _name)
+    if _is_getter(_name) and callable(_api) and getattr(_api, "__module__", None) == amdsmi_interface.__name__:
+        globals()[_name] = _make_coroutine(_api)
+        __all__.append(_name)
+
+del _name, _api
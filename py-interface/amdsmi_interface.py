@@ -20,16 +20,21 @@
 #
 
 import ctypes
+import functools
+import inspect
 import re
+import struct
 from typing import Union, Any, Dict, List
 from enum import IntEnum
-from collections.abc import Iterable
+from collections import namedtuple
+from collections.abc import Callable, Iterable
 
 from . import amdsmi_wrapper
 from .amdsmi_exception import *
 import sys
 import math
-from time import localtime, asctime, time
+import threading
+from time import localtime, asctime, time, monotonic
 
 MAX_NUM_PROCESSES = 1024
 
@@ -257,6 +262,10 @@ class AmdSmiEvtNotificationType(IntEnum):
     GPU_POST_RESET = amdsmi_wrapper.AMDSMI_EVT_NOTIF_GPU_POST_RESET
     RING_HANG = amdsmi_wrapper.AMDSMI_EVT_NOTIF_RING_HANG
 
+# Event value -> name of the events returned by the event readers
+_EVT_NOTIFICATION_NAMES = {event.value: event.name for event in AmdSmiEvtNotificationType
+                           if event != AmdSmiEvtNotificationType.NONE}
+
 class AmdSmiTemperatureMetric(IntEnum):
     CURRENT = amdsmi_wrapper.AMDSMI_TEMP_CURRENT
     MAX = amdsmi_wrapper.AMDSMI_TEMP_MAX
@@ -412,6 +421,22 @@ class AmdSmiProcessorType(IntEnum):
     AMDSMI_PROCESSOR_TYPE_NON_AMD_CPU = amdsmi_wrapper.AMDSMI_PROCESSOR_TYPE_NON_AMD_CPU
 
 
+# Layout of amdsmi_evt_notification_data_t: processor_handle, event, message, padding
+_EVT_NOTIFICATION_DATA = struct.Struct("@PI64s4x")
+
+
+class AmdSmiEvent(namedtuple("AmdSmiEvent", ["processor_handle", "event", "raw_message"])):
+    """
+    Event returned by AmdSmiEventReader.read_batch. raw_message is the NUL
+    padded message field, it is only decoded when message is accessed.
+    """
+    __slots__ = ()
+
+    @property
+    def message(self) -> str:
+        return self.raw_message.split(b"\0", 1)[0].decode("utf-8")
+
+
 class AmdSmiEventReader:
     def __init__(
         self, processor_handle: amdsmi_wrapper.amdsmi_processor_handle,
@@ -438,35 +463,65 @@ class AmdSmiEventReader:
             if event_type != AmdSmiEvtNotificationType.NONE:
                 mask |= (1 << (int(event_type) - 1))
 
+        # Reused by every read, grown to the largest num_elem requested
+        self.event_info = None
+        self._num_read = ctypes.c_uint32()
+
         _check_res(amdsmi_wrapper.amdsmi_init_gpu_event_notification(processor_handle))
         _check_res(amdsmi_wrapper.amdsmi_set_gpu_event_notification_mask(
             processor_handle, ctypes.c_uint64(mask)))
 
-    def read(self, timestamp, num_elem=10):
-        self.event_info = (amdsmi_wrapper.amdsmi_evt_notification_data_t * num_elem)()
+    def _read_events(self, timestamp, num_elem):
+        """Fill the event buffer and return the number of events read"""
+        if not isinstance(num_elem, int) or num_elem < 1:
+            raise AmdSmiParameterException(num_elem, int, "num_elem must be a positive integer")
+        if self.event_info is None or len(self.event_info) < num_elem:
+            self.event_info = (amdsmi_wrapper.amdsmi_evt_notification_data_t * num_elem)()
+
+        self._num_read.value = num_elem
         _check_res(
             amdsmi_wrapper.amdsmi_get_gpu_event_notification(
                 ctypes.c_int(timestamp),
-                ctypes.byref(ctypes.c_uint32(num_elem)),
+                ctypes.byref(self._num_read),
                 self.event_info,
             )
         )
+        # The buffer holds older events past the ones read this time
+        return min(self._num_read.value, num_elem)
+
+    def read(self, timestamp, num_elem=10):
+        num_read = self._read_events(timestamp, num_elem)
 
         ret = []
-        for i in range(0, num_elem):
-            unique_event_values = set(event.value for event in AmdSmiEvtNotificationType)
-            if self.event_info[i].event in unique_event_values:
-                if AmdSmiEvtNotificationType(self.event_info[i].event).name != "NONE":
-                    ret.append(
-                        {
-                            "processor_handle": self.event_info[i].processor_handle,
-                            "event": AmdSmiEvtNotificationType(self.event_info[i].event).name,
-                            "message": self.event_info[i].message.decode("utf-8"),
-                        }
-                    )
+        for i in range(0, num_read):
+            event_info = self.event_info[i]
+            event_name = _EVT_NOTIFICATION_NAMES.get(event_info.event)
+            if event_name is not None:
+                ret.append(
+                    {
+                        "processor_handle": event_info.processor_handle,
+                        "event": event_name,
+                        "message": event_info.message.decode("utf-8"),
+                    }
+                )
 
         return ret
 
+    def read_batch(self, timestamp, num_elem=10) -> List[AmdSmiEvent]:
+        """
+        Same as read, with the events returned as AmdSmiEvent tuples.
+
+        Returns:
+            `list`: AmdSmiEvent(processor_handle, event, raw_message) of every event read
+        """
+        num_read = self._read_events(timestamp, num_elem)
+
+        # Unpack the raw buffer in one pass instead of reading the ctypes fields one by one
+        event_data = memoryview(self.event_info).cast("B")[:num_read * _EVT_NOTIFICATION_DATA.size]
+        return [tuple.__new__(AmdSmiEvent, (processor_handle or None, _EVT_NOTIFICATION_NAMES[event], message))
+                for processor_handle, event, message in _EVT_NOTIFICATION_DATA.iter_unpack(event_data)
+                if event in _EVT_NOTIFICATION_NAMES]
+
     def stop(self):
         _check_res(amdsmi_wrapper.amdsmi_stop_gpu_event_notification(
             self.processor_handle))
@@ -478,6 +533,212 @@ class AmdSmiEventReader:
         self.stop()
 
 
+class AmdSmiEventDispatcher:
+    """
+    Read the event notifications of several devices from one thread.
+
+    amdsmi_get_gpu_event_notification returns the pending events of every
+    device with notifications enabled, so a single read serves all of them.
+    Every event is passed to the callbacks subscribed to its device on the
+    dispatching thread, one event at a time, so callbacks don't need locking
+    and the thread count doesn't grow with the number of devices.
+    """
+    def __init__(
+        self, processor_handles: List[amdsmi_wrapper.amdsmi_processor_handle],
+        event_types: List[AmdSmiEvtNotificationType], num_elem: int = 10
+    ):
+        processor_handles = _validate_processor_handles(processor_handles)
+        if not isinstance(event_types, Iterable):
+            raise AmdSmiParameterException(
+                event_types, Iterable
+            )
+        for event_type in event_types:
+            if not isinstance(event_type, AmdSmiEvtNotificationType):
+                raise AmdSmiParameterException(
+                    event_type, AmdSmiEvtNotificationType
+                )
+        if not isinstance(num_elem, int) or num_elem < 1:
+            raise AmdSmiParameterException(num_elem, int, "num_elem must be a positive integer")
+
+        mask = 0
+        for event_type in event_types:
+            if event_type != AmdSmiEvtNotificationType.NONE:
+                mask |= (1 << (int(event_type) - 1))
+
+        self.processor_handles = processor_handles
+        self.num_elem = num_elem
+        # Only the dispatching thread reads, one buffer serves every poll
+        self._event_info = (amdsmi_wrapper.amdsmi_evt_notification_data_t * num_elem)()
+        self._num_read = ctypes.c_uint32()
+        self._subscribers = {}
+        self._next_token = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+        self._enabled_handles = []
+        try:
+            for processor_handle in processor_handles:
+                _check_res(amdsmi_wrapper.amdsmi_init_gpu_event_notification(processor_handle))
+                self._enabled_handles.append(processor_handle)
+                _check_res(amdsmi_wrapper.amdsmi_set_gpu_event_notification_mask(
+                    processor_handle, ctypes.c_uint64(mask)))
+        except AmdSmiException:
+            try:
+                self._stop_notifications()
+            except AmdSmiException:
+                pass # Raise the error that failed the setup, not the cleanup one
+            raise
+
+    def subscribe(self, callback, processor_handle: Union[amdsmi_wrapper.amdsmi_processor_handle, None] = None) -> int:
+        """
+        Call callback(event) for every event of processor_handle, or of every
+        device if processor_handle is None.
+
+        Returns:
+            `int`: Token for unsubscribe
+        """
+        if not callable(callback):
+            raise AmdSmiParameterException(callback, Callable)
+        if processor_handle is not None and not isinstance(processor_handle, amdsmi_wrapper.amdsmi_processor_handle):
+            raise AmdSmiParameterException(
+                processor_handle, amdsmi_wrapper.amdsmi_processor_handle
+            )
+
+        handle_value = None if processor_handle is None else processor_handle.value
+        with self._lock:
+            token = self._next_token
+            self._next_token += 1
+            self._subscribers[token] = (handle_value, callback)
+        return token
+
+    def unsubscribe(self, token: int) -> None:
+        with self._lock:
+            self._subscribers.pop(token, None)
+
+    def poll(self, timeout: int) -> List[Dict[str, Any]]:
+        """
+        Wait up to timeout milliseconds for events and dispatch them.
+
+        Returns:
+            `list`: The dispatched events, empty if no event arrived in time
+        """
+        self._num_read.value = self.num_elem
+        try:
+            _check_res(
+                amdsmi_wrapper.amdsmi_get_gpu_event_notification(
+                    ctypes.c_int(timeout), ctypes.byref(self._num_read), self._event_info
+                )
+            )
+        except AmdSmiLibraryException as e:
+            if e.get_error_code() == amdsmi_wrapper.AMDSMI_STATUS_NO_DATA:
+                return []
+            raise
+
+        events = []
+        for i in range(0, min(self._num_read.value, self.num_elem)):
+            event_info = self._event_info[i]
+            event_name = _EVT_NOTIFICATION_NAMES.get(event_info.event)
+            if event_name is not None:
+                events.append(
+                    {
+                        "processor_handle": event_info.processor_handle,
+                        "event": event_name,
+                        "message": event_info.message.decode("utf-8"),
+                    }
+                )
+
+        with self._lock:
+            subscribers = list(self._subscribers.values())
+        for event in events:
+            for handle_value, callback in subscribers:
+                if handle_value is None or handle_value == event["processor_handle"]:
+                    callback(event)
+        return events
+
+    # Seconds waited after a failed poll, doubled on every consecutive failure
+    _ERROR_BACKOFF = 0.1
+    _MAX_ERROR_BACKOFF = 5.0
+
+    def _dispatch_loop(self, timeout, on_error):
+        backoff = 0
+        while not self._stop_event.is_set():
+            try:
+                self.poll(timeout)
+                backoff = 0
+            except Exception as e:
+                if on_error is not None:
+                    on_error(e)
+                # A persistent error would otherwise fail every poll right away
+                backoff = min(backoff * 2 or self._ERROR_BACKOFF, self._MAX_ERROR_BACKOFF)
+                self._stop_event.wait(backoff)
+
+    def start(self, timeout: int = 1000, on_error=None) -> None:
+        """
+        Poll on a background thread until stop.
+
+        Parameters:
+            timeout(`int`): Milliseconds each read waits for events, stop
+            returns within this time
+            on_error(`callable`, optional): Called with the exceptions raised
+            by the library or the callbacks, they are dropped if None. After
+            an exception the next read waits from 0.1 up to 5 seconds
+        """
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._dispatch_loop, args=(timeout, on_error),
+                                        name="amdsmi-event-dispatcher", daemon=True)
+        self._thread.start()
+
+    async def events(self, processor_handle: Union[amdsmi_wrapper.amdsmi_processor_handle, None] = None):
+        """
+        Asynchronously iterate over the events of processor_handle, or of every
+        device if None. The dispatcher must be started.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        token = self.subscribe(lambda event: loop.call_soon_threadsafe(queue.put_nowait, event),
+                               processor_handle)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self.unsubscribe(token)
+
+    def __aiter__(self):
+        return self.events()
+
+    def _stop_notifications(self):
+        """Stop the notifications of every device, then raise the first error"""
+        enabled_handles, self._enabled_handles = self._enabled_handles, []
+        error = None
+        for processor_handle in enabled_handles:
+            try:
+                _check_res(amdsmi_wrapper.amdsmi_stop_gpu_event_notification(processor_handle))
+            except AmdSmiException as e:
+                if error is None:
+                    error = e
+        if error is not None:
+            raise error
+
+    def stop(self) -> None:
+        """Stop the dispatching thread and the notifications of every device"""
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        self._stop_notifications()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
 _AMDSMI_MAX_DRIVER_VERSION_LENGTH = 80
 _AMDSMI_GPU_UUID_SIZE = 38
 _AMDSMI_STRING_LENGTH = 80
@@ -629,9 +890,91 @@ def _validate_if_max_uint(value, uint_type: MaxUIntegerTypes, isActivity=False,
         return return_val
 
 
+class _AmdSmiHandleTopology:
+    """
+    Cache of the socket, processor, cpu socket and cpu core handle enumerations.
+
+    Enumerating processor handles costs two library calls per socket, so each
+    handle list is enumerated once and served from the cache afterwards.
+    `invalidate` marks the lists stale (the next lookup re-enumerates) and
+    `refresh` re-enumerates them immediately. `generation` is incremented
+    every time a re-enumeration returns a different set of handles, so
+    long running callers can poll it to detect hot-plug or partition changes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._enumerators = {}
+        self._handles = {}
+        self._stale = set()
+        self.generation = 0
+
+    def _update(self, key, handles):
+        previous_handles = self._handles.get(key)
+        if previous_handles is not None and \
+                [handle.value for handle in previous_handles] != [handle.value for handle in handles]:
+            self.generation += 1
+        self._handles[key] = handles
+        self._stale.discard(key)
+
+    def get(self, enumerate_handles):
+        key = enumerate_handles.__name__
+        with self._lock:
+            if key not in self._handles or key in self._stale:
+                self._enumerators[key] = enumerate_handles
+                self._update(key, enumerate_handles())
+            return list(self._handles[key])
+
+    def invalidate(self):
+        with self._lock:
+            self._stale = set(self._handles)
+
+    def refresh(self):
+        with self._lock:
+            generation = self.generation
+            for key, enumerate_handles in self._enumerators.items():
+                self._update(key, enumerate_handles())
+            return self.generation != generation
+
+
+_handle_topology = _AmdSmiHandleTopology()
+
+
+def amdsmi_refresh_handle_topology() -> bool:
+    """
+    Re-enumerate all cached socket, processor, cpu socket and cpu core handles.
+    Handle getters return a cached enumeration, call this after a hot-plug or
+    partition change made outside of this process.
+
+    Parameters:
+        `None`.
+
+    Returns:
+        `bool`: True if any handle list changed, the topology generation is
+        incremented in that case.
+    """
+    return _handle_topology.refresh()
+
+
+def amdsmi_get_handle_topology_generation() -> int:
+    """
+    Get the handle topology generation counter. The counter is incremented
+    every time a re-enumeration returns different handles, so it can be
+    polled cheaply to detect topology changes.
+
+    Parameters:
+        `None`.
+
+    Returns:
+        `int`: Current topology generation.
+    """
+    return _handle_topology.generation
+
+
 def amdsmi_get_socket_handles() -> List[amdsmi_wrapper.amdsmi_socket_handle]:
     """
     Function that gets socket handles. Wraps the same named function call.
+    The enumeration is cached, see `amdsmi_refresh_handle_topology`.
 
     Parameters:
         `None`.
@@ -639,6 +982,10 @@ def amdsmi_get_socket_handles() -> List[amdsmi_wrapper.amdsmi_socket_handle]:
     Returns:
         `List`: List containing all of the found socket handles.
     """
+    return _handle_topology.get(_enumerate_socket_handles)
+
+
+def _enumerate_socket_handles():
     socket_count = ctypes.c_uint32(0)
     null_ptr = ctypes.POINTER(amdsmi_wrapper.amdsmi_socket_handle)()
     _check_res(
@@ -661,6 +1008,7 @@ def amdsmi_get_socket_handles() -> List[amdsmi_wrapper.amdsmi_socket_handle]:
 def amdsmi_get_cpusocket_handles() -> List[amdsmi_wrapper.amdsmi_socket_handle]:
     """
     Function that gets cpu socket handles. Wraps the same named function call.
+    The enumeration is cached, see `amdsmi_refresh_handle_topology`.
 
     Parameters:
         `None`.
@@ -668,6 +1016,10 @@ def amdsmi_get_cpusocket_handles() -> List[amdsmi_wrapper.amdsmi_socket_handle]:
     Returns:
         `List`: List containing all of the found cpu socket handles.
     """
+    return _handle_topology.get(_enumerate_cpusocket_handles)
+
+
+def _enumerate_cpusocket_handles():
     cpu_count = ctypes.c_uint32(0)
     null_ptr = ctypes.POINTER(amdsmi_wrapper.amdsmi_processor_handle)()
     _check_res(
@@ -716,7 +1068,11 @@ def amdsmi_get_processor_info(processor_handle):
 
 
 def amdsmi_get_processor_handles() -> List[amdsmi_wrapper.amdsmi_processor_handle]:
-    socket_handles = amdsmi_get_socket_handles()
+    return _handle_topology.get(_enumerate_processor_handles)
+
+
+def _enumerate_processor_handles():
+    socket_handles = _enumerate_socket_handles()
     devices = []
     for socket in socket_handles:
         device_count = ctypes.c_uint32()
@@ -747,6 +1103,10 @@ def amdsmi_get_processor_handles() -> List[amdsmi_wrapper.amdsmi_processor_handl
     return devices
 
 def amdsmi_get_cpucore_handles() -> List[amdsmi_wrapper.amdsmi_processor_handle]:
+    return _handle_topology.get(_enumerate_cpucore_handles)
+
+
+def _enumerate_cpucore_handles():
     cores_count = ctypes.c_uint32(0)
     null_ptr = ctypes.POINTER(amdsmi_wrapper.amdsmi_processor_handle)()
     _check_res(
@@ -1470,9 +1830,137 @@ def check_msb_64(num):
     else:
         return num
 
+# Encodings for the metric table defined for hsmp
+_HSMP_FRACTION_Q10 = 1 / math.pow(2, 10)
+_HSMP_FRACTION_UQ10 = _HSMP_FRACTION_Q10
+_HSMP_FRACTION_UQ16 = 1 / math.pow(2, 16)
+
+
+def _decode_hsmp_q10_32(value):
+    return round(check_msb_32(value) * _HSMP_FRACTION_Q10, 3)
+
+
+def _decode_hsmp_q10_64(value):
+    return round(check_msb_64(value) * _HSMP_FRACTION_Q10, 3)
+
+
+def _decode_hsmp_uq10(value):
+    return round(value * _HSMP_FRACTION_UQ10, 3)
+
+
+def _decode_hsmp_uq16_kilo(value):
+    return round((value * _HSMP_FRACTION_UQ16) / KILO, 3)
+
+
+# hsmp metrics table output key: (amdsmi_hsmp_metrics_table_t field, decode, unit)
+# decode is applied to every entry of the array fields, None keeps the raw value
+_HSMP_METRICS_TABLE_FIELDS = {
+    "mtbl_accumulation_counter": ("accumulation_counter", None, None),
+    "mtbl_max_socket_temperature": ("max_socket_temperature", _decode_hsmp_q10_32, "°C"),
+    "mtbl_max_vr_temperature": ("max_vr_temperature", _decode_hsmp_q10_32, "°C"),
+    "mtbl_max_hbm_temperature": ("max_hbm_temperature", _decode_hsmp_q10_32, "°C"),
+    "mtbl_max_socket_temperature_acc": ("max_socket_temperature_acc", _decode_hsmp_q10_64, "°C"),
+    "mtbl_max_vr_temperature_acc": ("max_vr_temperature_acc", _decode_hsmp_q10_64, "°C"),
+    "mtbl_max_hbm_temperature_acc": ("max_hbm_temperature_acc", _decode_hsmp_q10_64, "°C"),
+    "mtbl_socket_power_limit": ("socket_power_limit", _decode_hsmp_uq10, "W"),
+    "mtbl_max_socket_power_limit": ("max_socket_power_limit", _decode_hsmp_uq10, "W"),
+    "mtbl_socket_power": ("socket_power", _decode_hsmp_uq10, "W"),
+    "mtbl_timestamp_raw": ("timestamp", None, None),
+    "mtbl_socket_energy_acc": ("socket_energy_acc", _decode_hsmp_uq16_kilo, "kJ"),
+    "mtbl_ccd_energy_acc": ("ccd_energy_acc", _decode_hsmp_uq16_kilo, "kJ"),
+    "mtbl_xcd_energy_acc": ("xcd_energy_acc", _decode_hsmp_uq16_kilo, "kJ"),
+    "mtbl_aid_energy_acc": ("aid_energy_acc", _decode_hsmp_uq16_kilo, "kJ"),
+    "mtbl_hbm_energy_acc": ("hbm_energy_acc", _decode_hsmp_uq16_kilo, "kJ"),
+    "mtbl_cclk_frequency_limit": ("cclk_frequency_limit", _decode_hsmp_uq10, "GHz"),
+    "mtbl_gfxclk_frequency_limit": ("gfxclk_frequency_limit", _decode_hsmp_uq10, "MHz"),
+    "mtbl_fclk_frequency": ("fclk_frequency", _decode_hsmp_uq10, "MHz"),
+    "mtbl_uclk_frequency": ("uclk_frequency", _decode_hsmp_uq10, "MHz"),
+    "mtbl_socclk_frequency": ("socclk_frequency", _decode_hsmp_uq10, "MHz"),
+    "mtbl_vclk_frequency": ("vclk_frequency", _decode_hsmp_uq10, "MHz"),
+    "mtbl_dclk_frequency": ("dclk_frequency", _decode_hsmp_uq10, "MHz"),
+    "mtbl_lclk_frequency": ("lclk_frequency", _decode_hsmp_uq10, "MHz"),
+    "mtbl_fclk_frequency_table": ("fclk_frequency_table", _decode_hsmp_uq10, "MHz"),
+    "mtbl_uclk_frequency_table": ("uclk_frequency_table", _decode_hsmp_uq10, "MHz"),
+    "mtbl_socclk_frequency_table": ("socclk_frequency_table", _decode_hsmp_uq10, "MHz"),
+    "mtbl_vclk_frequency_table": ("vclk_frequency_table", _decode_hsmp_uq10, "MHz"),
+    "mtbl_dclk_frequency_table": ("dclk_frequency_table", _decode_hsmp_uq10, "MHz"),
+    "mtbl_lclk_frequency_table": ("lclk_frequency_table", _decode_hsmp_uq10, "MHz"),
+    "mtbl_cclk_frequency_acc": ("cclk_frequency_acc", _decode_hsmp_uq10, "GHz"),
+    "mtbl_gfxclk_frequency_acc": ("gfxclk_frequency_acc", _decode_hsmp_uq10, "MHz"),
+    "mtbl_gfxclk_frequency": ("gfxclk_frequency", _decode_hsmp_uq10, "MHz"),
+    "mtbl_max_cclk_frequency": ("max_cclk_frequency", _decode_hsmp_uq10, "GHz"),
+    "mtbl_min_cclk_frequency": ("min_cclk_frequency", _decode_hsmp_uq10, "GHz"),
+    "mtbl_max_gfxclk_frequency": ("max_gfxclk_frequency", _decode_hsmp_uq10, "MHz"),
+    "mtbl_min_gfxclk_frequency": ("min_gfxclk_frequency", _decode_hsmp_uq10, "MHz"),
+    "mtbl_max_lclk_dpm_range": ("max_lclk_dpm_range", None, None),
+    "mtbl_min_lclk_dpm_range": ("min_lclk_dpm_range", None, None),
+    "mtbl_xgmi_width": ("xgmi_width", _decode_hsmp_uq10, None),
+    "mtbl_xgmi_bitrate": ("xgmi_bitrate", _decode_hsmp_uq10, "Gbps"),
+    "mtbl_xgmi_read_bandwidth_acc": ("xgmi_read_bandwidth_acc", _decode_hsmp_uq10, "Gbps"),
+    "mtbl_xgmi_write_bandwidth_acc": ("xgmi_write_bandwidth_acc", _decode_hsmp_uq10, "Gbps"),
+    "mtbl_socket_c0_residency": ("socket_c0_residency", _decode_hsmp_uq10, "%"),
+    "mtbl_socket_gfx_busy": ("socket_gfx_busy", _decode_hsmp_uq10, "%"),
+    "mtbl_hbm_bandwidth_utilization": ("dram_bandwidth_utilization", _decode_hsmp_uq10, "%"),
+    "mtbl_socket_c0_residency_acc": ("socket_c0_residency_acc", _decode_hsmp_uq10, None),
+    "mtbl_socket_gfx_busy_acc": ("socket_gfx_busy_acc", _decode_hsmp_uq10, None),
+    "mtbl_hbm_bandwidth_acc": ("dram_bandwidth_acc", _decode_hsmp_uq10, "Gbps"),
+    "mtbl_max_hbm_bandwidth": ("max_dram_bandwidth", _decode_hsmp_uq10, "Gbps"),
+    "mtbl_dram_bandwidth_utilization_acc": ("dram_bandwidth_utilization_acc", _decode_hsmp_uq10, None),
+    "mtbl_pcie_bandwidth_acc": ("pcie_bandwidth_acc", _decode_hsmp_uq10, "Gbps"),
+    "mtbl_prochot_residency_acc": ("prochot_residency_acc", None, None),
+    "mtbl_ppt_residency_acc": ("ppt_residency_acc", None, None),
+    "mtbl_socket_thm_residency_acc": ("socket_thm_residency_acc", None, None),
+    "mtbl_vr_thm_residency_acc": ("vr_thm_residency_acc", None, None),
+    "mtbl_hbm_thm_residency_acc": ("hbm_thm_residency_acc", None, None),
+}
+
+
+def amdsmi_get_hsmp_metrics_table_units() -> Dict[str, Union[str, None]]:
+    """
+    Get the unit of each numeric amdsmi_get_hsmp_metrics_table value.
+
+    Returns:
+        `dict`: Output key to its unit, ex. {"mtbl_socket_power": "W"}.
+        Counters and other unitless values map to None.
+    """
+    return {key: unit for key, (_, _, unit) in _HSMP_METRICS_TABLE_FIELDS.items()}
+
+
+def _decode_hsmp_metrics_table(mtbl: amdsmi_wrapper.amdsmi_hsmp_metrics_table_t, numeric: bool, read_time: float):
+    metrics_table = {}
+    for key, (field, decode, unit) in _HSMP_METRICS_TABLE_FIELDS.items():
+        value = getattr(mtbl, field)
+        if isinstance(value, ctypes.Array):
+            value = [decode(x) for x in value] if decode else list(value)
+        elif decode:
+            value = decode(value)
+        if not numeric and unit:
+            # The string output is the numeric value followed by its unit
+            value = f"{value} {unit}"
+        metrics_table[key] = value
+        if key == "mtbl_timestamp_raw" and not numeric:
+            metrics_table["mtbl_timestamp_readable"] = f"{asctime(localtime(read_time))}"
+    return metrics_table
+
+
 def amdsmi_get_hsmp_metrics_table(
-    processor_handle: amdsmi_wrapper.amdsmi_processor_handle
-):
+    processor_handle: amdsmi_wrapper.amdsmi_processor_handle,
+    numeric: bool = False,
+) -> Dict[str, Any]:
+    """
+    Get the HSMP metrics table of a cpu socket.
+
+    Parameters:
+        processor_handle(`amdsmi_processor_handle`): Handle for the given cpu socket.
+        numeric(`bool`, optional): Return the decoded values as numbers and lists
+        of numbers, see amdsmi_get_hsmp_metrics_table_units for their units.
+        Defaults to False, which formats each value with its unit, ex. "250.0 W",
+        and adds "mtbl_timestamp_readable" with the time of the read.
+
+    Returns:
+        `dict`: Dictionary of the metrics table values. "mtbl_timestamp_raw" holds
+        the timestamp reported by the hardware.
+    """
     if not isinstance(processor_handle, amdsmi_wrapper.amdsmi_processor_handle):
         raise AmdSmiParameterException(
             processor_handle, amdsmi_wrapper.amdsmi_processor_handle
@@ -1480,81 +1968,13 @@ def amdsmi_get_hsmp_metrics_table(
 
     mtbl = amdsmi_wrapper.amdsmi_hsmp_metrics_table_t()
 
-    '''Encodings for the metric table defined for hsmp'''
-    fraction_q10 = 1 / math.pow(2, 10)
-    fraction_uq10 = fraction_q10
-    fraction_uq16 = 1 / math.pow(2, 16)
-
     _check_res(
             amdsmi_wrapper.amdsmi_get_hsmp_metrics_table(
                    processor_handle, mtbl
             )
     )
 
-    rawtime = int(mtbl.timestamp)
-    rawtime = time()
-    timeinfo = localtime(rawtime)
-
-    return {
-        "mtbl_accumulation_counter": mtbl.accumulation_counter,
-        "mtbl_max_socket_temperature": f"{round(check_msb_32(mtbl.max_socket_temperature) * fraction_q10 ,3)} °C",
-        "mtbl_max_vr_temperature": f"{round(check_msb_32(mtbl.max_vr_temperature) * fraction_q10 ,3)} °C",
-        "mtbl_max_hbm_temperature": f"{round(check_msb_32(mtbl.max_hbm_temperature) * fraction_q10 ,3)} °C",
-        "mtbl_max_socket_temperature_acc": f"{round(check_msb_64(mtbl.max_socket_temperature_acc) * fraction_q10 ,3)} °C",
-        "mtbl_max_vr_temperature_acc": f"{round(check_msb_64(mtbl.max_vr_temperature_acc) * fraction_q10 ,3)} °C",
-        "mtbl_max_hbm_temperature_acc": f"{round(check_msb_64(mtbl.max_hbm_temperature_acc) * fraction_q10 ,3)} °C",
-        "mtbl_socket_power_limit": f"{round(mtbl.socket_power_limit * fraction_uq10 ,3)} W",
-        "mtbl_max_socket_power_limit": f"{round(mtbl.max_socket_power_limit * fraction_uq10 ,3)} W",
-        "mtbl_socket_power": f"{round(mtbl.socket_power * fraction_uq10 ,3)} W",
-        "mtbl_timestamp_raw": mtbl.timestamp,
-        "mtbl_timestamp_readable": f"{asctime(timeinfo)}",
-        "mtbl_socket_energy_acc": f"{round((mtbl.socket_energy_acc * fraction_uq16)/KILO ,3)} kJ",
-        "mtbl_ccd_energy_acc": f"{round((mtbl.ccd_energy_acc * fraction_uq16)/KILO ,3)} kJ",
-        "mtbl_xcd_energy_acc": f"{round((mtbl.xcd_energy_acc * fraction_uq16)/KILO ,3)} kJ",
-        "mtbl_aid_energy_acc": f"{round((mtbl.aid_energy_acc * fraction_uq16)/KILO ,3)} kJ",
-        "mtbl_hbm_energy_acc": f"{round((mtbl.hbm_energy_acc * fraction_uq16)/KILO ,3)} kJ",
-        "mtbl_cclk_frequency_limit": f"{round(mtbl.cclk_frequency_limit * fraction_uq10 ,3)} GHz",
-        "mtbl_gfxclk_frequency_limit": f"{round(mtbl.gfxclk_frequency_limit * fraction_uq10 ,3)} MHz",
-        "mtbl_fclk_frequency": f"{round(mtbl.fclk_frequency * fraction_uq10 ,3)} MHz",
-        "mtbl_uclk_frequency": f"{round(mtbl.uclk_frequency * fraction_uq10 ,3)} MHz",
-        "mtbl_socclk_frequency": f"{[round(x*fraction_uq10 ,3) for x in list(mtbl.socclk_frequency)]} MHz",
-        "mtbl_vclk_frequency": f"{[round(x*fraction_uq10 ,3) for x in list(mtbl.vclk_frequency)]} MHz",
-        "mtbl_dclk_frequency": f"{[round(x*fraction_uq10 ,3) for x in list(mtbl.dclk_frequency)]} MHz",
-        "mtbl_lclk_frequency": f"{[round(x*fraction_uq10 ,3) for x in list(mtbl.lclk_frequency)]} MHz",
-        "mtbl_fclk_frequency_table": f"{[round(x*fraction_uq10 ,3) for x in list(mtbl.fclk_frequency_table)]} MHz",
-        "mtbl_uclk_frequency_table": f"{[round(x*fraction_uq10 ,3) for x in list(mtbl.uclk_frequency_table)]} MHz",
-        "mtbl_socclk_frequency_table": f"{[round(x*fraction_uq10 ,3) for x in list(mtbl.socclk_frequency_table)]} MHz",
-        "mtbl_vclk_frequency_table": f"{[round(x*fraction_uq10 ,3) for x in list(mtbl.vclk_frequency_table)]} MHz",
-        "mtbl_dclk_frequency_table": f"{[round(x*fraction_uq10 ,3) for x in list(mtbl.dclk_frequency_table)]} MHz",
-        "mtbl_lclk_frequency_table": f"{[round(x*fraction_uq10 ,3) for x in list(mtbl.lclk_frequency_table)]} MHz",
-        "mtbl_cclk_frequency_acc": f"{[round(x*fraction_uq10 ,3) for x in list(mtbl.cclk_frequency_acc)]} GHz",
-        "mtbl_gfxclk_frequency_acc": f"{[round(x*fraction_uq10 ,3) for x in list(mtbl.gfxclk_frequency_acc)]} MHz",
-        "mtbl_gfxclk_frequency": f"{[round(x*fraction_uq10 ,3) for x in list(mtbl.gfxclk_frequency)]} MHz",
-        "mtbl_max_cclk_frequency": f"{round(mtbl.max_cclk_frequency * fraction_uq10 ,3)} GHz",
-        "mtbl_min_cclk_frequency": f"{round(mtbl.min_cclk_frequency * fraction_uq10 ,3)} GHz",
-        "mtbl_max_gfxclk_frequency": f"{round(mtbl.max_gfxclk_frequency * fraction_uq10 ,3)} MHz",
-        "mtbl_min_gfxclk_frequency": f"{round(mtbl.min_gfxclk_frequency * fraction_uq10 ,3)} MHz",
-        "mtbl_max_lclk_dpm_range": mtbl.max_lclk_dpm_range,
-        "mtbl_min_lclk_dpm_range": mtbl.min_lclk_dpm_range,
-        "mtbl_xgmi_width": round(mtbl.xgmi_width * fraction_uq10 ,3),
-        "mtbl_xgmi_bitrate": f"{round(mtbl.xgmi_bitrate * fraction_uq10 ,3)} Gbps",
-        "mtbl_xgmi_read_bandwidth_acc": f"{[round(x*fraction_uq10 ,3) for x in list(mtbl.xgmi_read_bandwidth_acc)]} Gbps",
-        "mtbl_xgmi_write_bandwidth_acc": f"{[round(x*fraction_uq10 ,3) for x in list(mtbl.xgmi_write_bandwidth_acc)]} Gbps",
-        "mtbl_socket_c0_residency": f"{round(mtbl.socket_c0_residency * fraction_uq10 ,3)} %",
-        "mtbl_socket_gfx_busy": f"{round(mtbl.socket_gfx_busy * fraction_uq10 ,3)} %",
-        "mtbl_hbm_bandwidth_utilization": f"{round(mtbl.dram_bandwidth_utilization * fraction_uq10 ,3)} %",
-        "mtbl_socket_c0_residency_acc": round(mtbl.socket_c0_residency_acc * fraction_uq10 ,3),
-        "mtbl_socket_gfx_busy_acc": round(mtbl.socket_gfx_busy_acc * fraction_uq10 ,3),
-        "mtbl_hbm_bandwidth_acc": f"{round(mtbl.dram_bandwidth_acc * fraction_uq10 ,3)} Gbps",
-        "mtbl_max_hbm_bandwidth": f"{round(mtbl.max_dram_bandwidth * fraction_uq10 ,3)} Gbps",
-        "mtbl_dram_bandwidth_utilization_acc": round(mtbl.dram_bandwidth_utilization_acc * fraction_uq10 ,3),
-        "mtbl_pcie_bandwidth_acc": f"{[round(x*fraction_uq10 ,3) for x in list(mtbl.pcie_bandwidth_acc)]} Gbps",
-        "mtbl_prochot_residency_acc": mtbl.prochot_residency_acc,
-        "mtbl_ppt_residency_acc": mtbl.ppt_residency_acc,
-        "mtbl_socket_thm_residency_acc": mtbl.socket_thm_residency_acc,
-        "mtbl_vr_thm_residency_acc": mtbl.vr_thm_residency_acc,
-        "mtbl_hbm_thm_residency_acc": mtbl.hbm_thm_residency_acc
-    }
+    return _decode_hsmp_metrics_table(mtbl, numeric, time())
 
 def amdsmi_first_online_core_on_cpu_socket(
     processor_handle: amdsmi_wrapper.amdsmi_processor_handle
@@ -1591,10 +2011,13 @@ def amdsmi_init(flag=AmdSmiInitFlags.INIT_AMD_GPUS):
     if not isinstance(flag, AmdSmiInitFlags):
         raise AmdSmiParameterException(flag, AmdSmiInitFlags)
     _check_res(amdsmi_wrapper.amdsmi_init(flag))
+    _handle_topology.invalidate()
 
 
 def amdsmi_shut_down():
     _check_res(amdsmi_wrapper.amdsmi_shut_down())
+    _handle_topology.invalidate()
+    _capability_cache.clear()
 
 
 def amdsmi_get_processor_type(
@@ -2117,6 +2540,86 @@ def amdsmi_get_gpu_ras_block_features_enabled(
     return ras_states
 
 
+# Attempts to fill the process list when processes keep starting between the count and the fill
+_PROCESS_LIST_ATTEMPTS = 3
+
+# Column, amdsmi_proc_info_t field path, struct format of the process table columns
+_PROCESS_TABLE_FIELDS = (
+    ("name", ("name",), "32s"),
+    ("pid", ("pid",), "I"),
+    ("mem", ("mem",), "Q"),
+    ("gfx", ("engine_usage", "gfx"), "Q"),
+    ("enc", ("engine_usage", "enc"), "Q"),
+    ("gtt_mem", ("memory_usage", "gtt_mem"), "Q"),
+    ("cpu_mem", ("memory_usage", "cpu_mem"), "Q"),
+    ("vram_mem", ("memory_usage", "vram_mem"), "Q"),
+)
+
+_process_table_record = None
+
+
+def _get_process_table_record() -> struct.Struct:
+    """Struct unpacking the _PROCESS_TABLE_FIELDS of one amdsmi_proc_info_t, built on first use"""
+    global _process_table_record
+    if _process_table_record is None:
+        fields = []
+        for _, path, field_format in _PROCESS_TABLE_FIELDS:
+            ctype = amdsmi_wrapper.amdsmi_proc_info_t
+            offset = 0
+            for name in path:
+                offset += getattr(ctype, name).offset
+                ctype = dict(ctype._fields_)[name]
+            fields.append((offset, field_format))
+
+        record_format = "="
+        position = 0
+        # _PROCESS_TABLE_FIELDS is in layout order, so the unpacked values are in column order
+        for offset, field_format in fields:
+            if offset > position:
+                record_format += f"{offset - position}x"
+            record_format += field_format
+            position = offset + struct.calcsize("=" + field_format)
+        record_format += f"{ctypes.sizeof(amdsmi_wrapper.amdsmi_proc_info_t) - position}x"
+        _process_table_record = struct.Struct(record_format)
+    return _process_table_record
+
+
+def _read_gpu_process_list(processor_handle: amdsmi_wrapper.amdsmi_processor_handle):
+    """
+    Count the running processes, then fill a list of exactly that size.
+    If processes keep starting, the list filled by the last attempt is
+    returned even though it misses the newest ones.
+
+    Returns:
+        `tuple`: (amdsmi_proc_info_t array or None, number of processes filled)
+    """
+    num_processes = ctypes.c_uint32(0)
+    _check_res(
+        amdsmi_wrapper.amdsmi_get_gpu_process_list(
+            processor_handle, ctypes.byref(num_processes), None
+        )
+    )
+
+    for attempt in range(_PROCESS_LIST_ATTEMPTS):
+        list_size = num_processes.value
+        if list_size == 0:
+            break
+        process_list = (amdsmi_wrapper.amdsmi_proc_info_t * list_size)()
+        ret = amdsmi_wrapper.amdsmi_get_gpu_process_list(
+            processor_handle, ctypes.byref(num_processes), process_list
+        )
+        # Processes started since the count, num_processes holds the new count
+        if ret == amdsmi_wrapper.AMDSMI_STATUS_OUT_OF_RESOURCES:
+            if attempt < _PROCESS_LIST_ATTEMPTS - 1:
+                continue
+            # Still growing after the last attempt, keep the processes that were filled
+        else:
+            _check_res(ret)
+        return process_list, min(num_processes.value, list_size)
+
+    return None, 0
+
+
 def amdsmi_get_gpu_process_list(
     processor_handle: amdsmi_wrapper.amdsmi_processor_handle,
 ) -> List[amdsmi_wrapper.amdsmi_proc_info_t]:
@@ -2125,18 +2628,10 @@ def amdsmi_get_gpu_process_list(
             processor_handle, amdsmi_wrapper.amdsmi_processor_handle
         )
 
-    # This will get populated with the number of processes found
-    max_processes = ctypes.c_uint32(MAX_NUM_PROCESSES)
-
-    process_list = (amdsmi_wrapper.amdsmi_proc_info_t * max_processes.value)()
-    _check_res(
-        amdsmi_wrapper.amdsmi_get_gpu_process_list(
-            processor_handle, ctypes.byref(max_processes), process_list
-        )
-    )
+    process_list, num_processes = _read_gpu_process_list(processor_handle)
 
     result = []
-    for index in range(max_processes.value):
+    for index in range(num_processes):
         process_name = process_list[index].name.decode("utf-8").strip()
         if process_name == "":
             process_name = "N/A"
@@ -2158,6 +2653,52 @@ def amdsmi_get_gpu_process_list(
     return result
 
 
+def amdsmi_get_gpu_process_table(
+    processor_handle: amdsmi_wrapper.amdsmi_processor_handle,
+    pids: Union[Iterable, None] = None,
+) -> Dict[str, List]:
+    """
+    Get the processes running on a device as columns.
+
+    The list is sized to the running processes instead of MAX_NUM_PROCESSES and
+    is unpacked in one pass, no dict is built per process.
+
+    Parameters:
+        processor_handle(`amdsmi_processor_handle`): Handle for the given device.
+        pids(`list`, optional): Only return these process ids. Defaults to None, all processes.
+
+    Returns:
+        `dict`: "name", "pid", "mem", "gfx", "enc", "gtt_mem", "cpu_mem" and "vram_mem"
+        columns, holding one value per process in the same order.
+    """
+    if not isinstance(processor_handle, amdsmi_wrapper.amdsmi_processor_handle):
+        raise AmdSmiParameterException(
+            processor_handle, amdsmi_wrapper.amdsmi_processor_handle
+        )
+    if pids is not None:
+        if not isinstance(pids, Iterable):
+            raise AmdSmiParameterException(pids, Iterable)
+        pids = set(pids)
+
+    process_list, num_processes = _read_gpu_process_list(processor_handle)
+
+    record = _get_process_table_record()
+    rows = []
+    if num_processes:
+        process_data = memoryview(process_list).cast("B")[:num_processes * record.size]
+        rows = record.iter_unpack(process_data)
+    if pids is not None:
+        pid_index = [key for key, _, _ in _PROCESS_TABLE_FIELDS].index("pid")
+        rows = [row for row in rows if row[pid_index] in pids]
+    columns = list(zip(*rows)) or [()] * len(_PROCESS_TABLE_FIELDS)
+
+    table = {}
+    for (key, _, _), column in zip(_PROCESS_TABLE_FIELDS, columns):
+        table[key] = list(column)
+    table["name"] = [name.split(b"\0", 1)[0].decode("utf-8").strip() or "N/A" for name in table["name"]]
+    return table
+
+
 def amdsmi_get_gpu_device_uuid(processor_handle: amdsmi_wrapper.amdsmi_processor_handle) -> str:
     if not isinstance(processor_handle, amdsmi_wrapper.amdsmi_processor_handle):
         raise AmdSmiParameterException(
@@ -2689,6 +3230,8 @@ def amdsmi_set_gpu_compute_partition(processor_handle: amdsmi_wrapper.amdsmi_pro
             processor_handle, compute_partition
         )
     )
+    _handle_topology.invalidate()
+    _capability_cache.clear()
 
 
 def amdsmi_get_gpu_memory_partition(processor_handle: amdsmi_wrapper.amdsmi_processor_handle):
@@ -2726,6 +3269,8 @@ def amdsmi_set_gpu_memory_partition(processor_handle: amdsmi_wrapper.amdsmi_proc
             processor_handle, memory_partition
         )
     )
+    _handle_topology.invalidate()
+    _capability_cache.clear()
 
 
 def amdsmi_get_gpu_accelerator_partition_profile(
@@ -2907,6 +3452,8 @@ def amdsmi_reset_gpu(processor_handle: amdsmi_wrapper.amdsmi_processor_handle):
         )
 
     _check_res(amdsmi_wrapper.amdsmi_reset_gpu(processor_handle))
+    _handle_topology.invalidate()
+    _capability_cache.clear(processor_handle)
 
 
 def amdsmi_set_gpu_fan_speed(
@@ -3758,14 +4305,129 @@ def amdsmi_get_gpu_od_volt_info(
     }
 
 
+# gpu_metrics output key: (max uint type, isActivity, isBool)
+# Keys are in amdsmi_gpu_metrics_t order; xcp_stats.* keys decode one field of every xcp_stats entry
+_GPU_METRICS_FIELDS = {
+    "temperature_edge": (MaxUIntegerTypes.UINT16_T, False, False),
+    "temperature_hotspot": (MaxUIntegerTypes.UINT16_T, False, False),
+    "temperature_mem": (MaxUIntegerTypes.UINT16_T, False, False),
+    "temperature_vrgfx": (MaxUIntegerTypes.UINT16_T, False, False),
+    "temperature_vrsoc": (MaxUIntegerTypes.UINT16_T, False, False),
+    "temperature_vrmem": (MaxUIntegerTypes.UINT16_T, False, False),
+    "average_gfx_activity": (MaxUIntegerTypes.UINT16_T, True, False),
+    "average_umc_activity": (MaxUIntegerTypes.UINT16_T, True, False),
+    "average_mm_activity": (MaxUIntegerTypes.UINT16_T, True, False),
+    "average_socket_power": (MaxUIntegerTypes.UINT16_T, False, False),
+    "energy_accumulator": (MaxUIntegerTypes.UINT64_T, False, False),
+    "system_clock_counter": (MaxUIntegerTypes.UINT64_T, False, False),
+    "average_gfxclk_frequency": (MaxUIntegerTypes.UINT16_T, False, False),
+    "average_socclk_frequency": (MaxUIntegerTypes.UINT16_T, False, False),
+    "average_uclk_frequency": (MaxUIntegerTypes.UINT16_T, False, False),
+    "average_vclk0_frequency": (MaxUIntegerTypes.UINT16_T, False, False),
+    "average_dclk0_frequency": (MaxUIntegerTypes.UINT16_T, False, False),
+    "average_vclk1_frequency": (MaxUIntegerTypes.UINT16_T, False, False),
+    "average_dclk1_frequency": (MaxUIntegerTypes.UINT16_T, False, False),
+    "current_gfxclk": (MaxUIntegerTypes.UINT16_T, False, False),
+    "current_socclk": (MaxUIntegerTypes.UINT16_T, False, False),
+    "current_uclk": (MaxUIntegerTypes.UINT16_T, False, False),
+    "current_vclk0": (MaxUIntegerTypes.UINT16_T, False, False),
+    "current_dclk0": (MaxUIntegerTypes.UINT16_T, False, False),
+    "current_vclk1": (MaxUIntegerTypes.UINT16_T, False, False),
+    "current_dclk1": (MaxUIntegerTypes.UINT16_T, False, False),
+    "throttle_status": (MaxUIntegerTypes.UINT32_T, False, True),
+    "current_fan_speed": (MaxUIntegerTypes.UINT16_T, False, False),
+    "pcie_link_width": (MaxUIntegerTypes.UINT16_T, False, False),
+    "pcie_link_speed": (MaxUIntegerTypes.UINT16_T, False, False),
+    "gfx_activity_acc": (MaxUIntegerTypes.UINT32_T, False, False),
+    "mem_activity_acc": (MaxUIntegerTypes.UINT32_T, False, False),
+    "temperature_hbm": (MaxUIntegerTypes.UINT16_T, False, False),
+    "firmware_timestamp": (MaxUIntegerTypes.UINT64_T, False, False),
+    "voltage_soc": (MaxUIntegerTypes.UINT16_T, False, False),
+    "voltage_gfx": (MaxUIntegerTypes.UINT16_T, False, False),
+    "voltage_mem": (MaxUIntegerTypes.UINT16_T, False, False),
+    "indep_throttle_status": (MaxUIntegerTypes.UINT64_T, False, True),
+    "current_socket_power": (MaxUIntegerTypes.UINT16_T, False, False),
+    "vcn_activity": (MaxUIntegerTypes.UINT16_T, True, False),
+    "gfxclk_lock_status": (MaxUIntegerTypes.UINT32_T, False, False),
+    "xgmi_link_width": (MaxUIntegerTypes.UINT16_T, False, False),
+    "xgmi_link_speed": (MaxUIntegerTypes.UINT16_T, False, False),
+    "pcie_bandwidth_acc": (MaxUIntegerTypes.UINT64_T, False, False),
+    "pcie_bandwidth_inst": (MaxUIntegerTypes.UINT64_T, False, False),
+    "pcie_l0_to_recov_count_acc": (MaxUIntegerTypes.UINT64_T, False, False),
+    "pcie_replay_count_acc": (MaxUIntegerTypes.UINT64_T, False, False),
+    "pcie_replay_rover_count_acc": (MaxUIntegerTypes.UINT64_T, False, False),
+    "xgmi_read_data_acc": (MaxUIntegerTypes.UINT64_T, False, False),
+    "xgmi_write_data_acc": (MaxUIntegerTypes.UINT64_T, False, False),
+    "current_gfxclks": (MaxUIntegerTypes.UINT16_T, False, False),
+    "current_socclks": (MaxUIntegerTypes.UINT16_T, False, False),
+    "current_vclk0s": (MaxUIntegerTypes.UINT16_T, False, False),
+    "current_dclk0s": (MaxUIntegerTypes.UINT16_T, False, False),
+    "jpeg_activity": (MaxUIntegerTypes.UINT16_T, True, False),
+    "pcie_nak_sent_count_acc": (MaxUIntegerTypes.UINT32_T, False, False),
+    "pcie_nak_rcvd_count_acc": (MaxUIntegerTypes.UINT32_T, False, False),
+    "accumulation_counter": (MaxUIntegerTypes.UINT64_T, False, False),
+    "prochot_residency_acc": (MaxUIntegerTypes.UINT64_T, False, False),
+    "ppt_residency_acc": (MaxUIntegerTypes.UINT64_T, False, False),
+    "socket_thm_residency_acc": (MaxUIntegerTypes.UINT64_T, False, False),
+    "vr_thm_residency_acc": (MaxUIntegerTypes.UINT64_T, False, False),
+    "hbm_thm_residency_acc": (MaxUIntegerTypes.UINT64_T, False, False),
+    "num_partition": (MaxUIntegerTypes.UINT16_T, False, False),
+    "xcp_stats.gfx_busy_inst": (MaxUIntegerTypes.UINT32_T, True, False),
+    "xcp_stats.jpeg_busy": (MaxUIntegerTypes.UINT16_T, True, False),
+    "xcp_stats.vcn_busy": (MaxUIntegerTypes.UINT16_T, True, False),
+    "xcp_stats.gfx_busy_acc": (MaxUIntegerTypes.UINT64_T, True, False),
+    "pcie_lc_perf_other_end_recovery": (MaxUIntegerTypes.UINT32_T, False, False),
+}
+
+
+def _decode_gpu_metrics_field(gpu_metrics: amdsmi_wrapper.amdsmi_gpu_metrics_t, key: str):
+    uint_type, is_activity, is_bool = _GPU_METRICS_FIELDS[key]
+    if key.startswith("xcp_stats."):
+        # Create 2d array with each XCP's stats
+        xcp_field = key[len("xcp_stats."):]
+        return [
+            [_validate_if_max_uint(val, uint_type, isActivity=is_activity) for val in getattr(xcp, xcp_field)]
+            for xcp in gpu_metrics.xcp_stats
+        ]
+
+    value = getattr(gpu_metrics, key)
+    if isinstance(value, ctypes.Array):
+        value = list(value)
+    return _validate_if_max_uint(value, uint_type, isActivity=is_activity, isBool=is_bool)
+
+
 def amdsmi_get_gpu_metrics_info(
     processor_handle: amdsmi_wrapper.amdsmi_processor_handle,
+    fields: Union[List[str], None] = None,
 ) -> Dict[str, Any]:
+    """
+    Get the gpu metrics table of a device.
+
+    Parameters:
+        processor_handle(`amdsmi_processor_handle`): Handle for the given device.
+        fields(`list`, optional): Output keys to decode, ex. ["current_socket_power"].
+        Only the requested keys are validated and returned. Defaults to None,
+        which decodes the full table.
+
+    Returns:
+        `dict`: Dictionary of the requested gpu metrics fields.
+    """
     if not isinstance(processor_handle, amdsmi_wrapper.amdsmi_processor_handle):
         raise AmdSmiParameterException(
             processor_handle, amdsmi_wrapper.amdsmi_processor_handle
         )
 
+    if fields is None:
+        fields = _GPU_METRICS_FIELDS
+    else:
+        if isinstance(fields, str):
+            fields = [fields]
+        if not isinstance(fields, Iterable):
+            raise AmdSmiParameterException(fields, List[str])
+        for field in fields:
+            if not isinstance(field, str) or field not in _GPU_METRICS_FIELDS:
+                raise AmdSmiKeyException(str(field))
+
     gpu_metrics = amdsmi_wrapper.amdsmi_gpu_metrics_t()
     _check_res(
         amdsmi_wrapper.amdsmi_get_gpu_metrics_info(
@@ -3773,106 +4435,565 @@ def amdsmi_get_gpu_metrics_info(
         )
     )
 
-    gpu_metrics_output = {
-        "temperature_edge": _validate_if_max_uint(gpu_metrics.temperature_edge, MaxUIntegerTypes.UINT16_T),
-        "temperature_hotspot": _validate_if_max_uint(gpu_metrics.temperature_hotspot, MaxUIntegerTypes.UINT16_T),
-        "temperature_mem": _validate_if_max_uint(gpu_metrics.temperature_mem, MaxUIntegerTypes.UINT16_T),
-        "temperature_vrgfx": _validate_if_max_uint(gpu_metrics.temperature_vrgfx, MaxUIntegerTypes.UINT16_T),
-        "temperature_vrsoc": _validate_if_max_uint(gpu_metrics.temperature_vrsoc, MaxUIntegerTypes.UINT16_T),
-        "temperature_vrmem": _validate_if_max_uint(gpu_metrics.temperature_vrmem, MaxUIntegerTypes.UINT16_T),
-        "average_gfx_activity": _validate_if_max_uint(gpu_metrics.average_gfx_activity, MaxUIntegerTypes.UINT16_T, isActivity=True),
-        "average_umc_activity": _validate_if_max_uint(gpu_metrics.average_umc_activity, MaxUIntegerTypes.UINT16_T, isActivity=True),
-        "average_mm_activity": _validate_if_max_uint(gpu_metrics.average_mm_activity, MaxUIntegerTypes.UINT16_T, isActivity=True),
-        "average_socket_power": _validate_if_max_uint(gpu_metrics.average_socket_power, MaxUIntegerTypes.UINT16_T),
-        "energy_accumulator": _validate_if_max_uint(gpu_metrics.energy_accumulator, MaxUIntegerTypes.UINT64_T),
-        "system_clock_counter": _validate_if_max_uint(gpu_metrics.system_clock_counter, MaxUIntegerTypes.UINT64_T),
-        "average_gfxclk_frequency": _validate_if_max_uint(gpu_metrics.average_gfxclk_frequency, MaxUIntegerTypes.UINT16_T),
-        "average_socclk_frequency": _validate_if_max_uint(gpu_metrics.average_socclk_frequency, MaxUIntegerTypes.UINT16_T),
-        "average_uclk_frequency": _validate_if_max_uint(gpu_metrics.average_uclk_frequency, MaxUIntegerTypes.UINT16_T),
-        "average_vclk0_frequency": _validate_if_max_uint(gpu_metrics.average_vclk0_frequency, MaxUIntegerTypes.UINT16_T),
-        "average_dclk0_frequency": _validate_if_max_uint(gpu_metrics.average_dclk0_frequency, MaxUIntegerTypes.UINT16_T),
-        "average_vclk1_frequency": _validate_if_max_uint(gpu_metrics.average_vclk1_frequency, MaxUIntegerTypes.UINT16_T),
-        "average_dclk1_frequency": _validate_if_max_uint(gpu_metrics.average_dclk1_frequency, MaxUIntegerTypes.UINT16_T),
-        "current_gfxclk": _validate_if_max_uint(gpu_metrics.current_gfxclk, MaxUIntegerTypes.UINT16_T),
-        "current_socclk": _validate_if_max_uint(gpu_metrics.current_socclk, MaxUIntegerTypes.UINT16_T),
-        "current_uclk": _validate_if_max_uint(gpu_metrics.current_uclk, MaxUIntegerTypes.UINT16_T),
-        "current_vclk0": _validate_if_max_uint(gpu_metrics.current_vclk0, MaxUIntegerTypes.UINT16_T),
-        "current_dclk0": _validate_if_max_uint(gpu_metrics.current_dclk0, MaxUIntegerTypes.UINT16_T),
-        "current_vclk1": _validate_if_max_uint(gpu_metrics.current_vclk1, MaxUIntegerTypes.UINT16_T),
-        "current_dclk1": _validate_if_max_uint(gpu_metrics.current_dclk1, MaxUIntegerTypes.UINT16_T),
-        "throttle_status": _validate_if_max_uint(gpu_metrics.throttle_status, MaxUIntegerTypes.UINT32_T, isBool=True),
-        "current_fan_speed": _validate_if_max_uint(gpu_metrics.current_fan_speed, MaxUIntegerTypes.UINT16_T),
-        "pcie_link_width": _validate_if_max_uint(gpu_metrics.pcie_link_width, MaxUIntegerTypes.UINT16_T),
-        "pcie_link_speed": _validate_if_max_uint(gpu_metrics.pcie_link_speed, MaxUIntegerTypes.UINT16_T),
-        "gfx_activity_acc": _validate_if_max_uint(gpu_metrics.gfx_activity_acc, MaxUIntegerTypes.UINT32_T),
-        "mem_activity_acc": _validate_if_max_uint(gpu_metrics.mem_activity_acc, MaxUIntegerTypes.UINT32_T),
-        "temperature_hbm": _validate_if_max_uint(list(gpu_metrics.temperature_hbm), MaxUIntegerTypes.UINT16_T),
-        "firmware_timestamp": _validate_if_max_uint(gpu_metrics.firmware_timestamp, MaxUIntegerTypes.UINT64_T),
-        "voltage_soc": _validate_if_max_uint(gpu_metrics.voltage_soc, MaxUIntegerTypes.UINT16_T),
-        "voltage_gfx": _validate_if_max_uint(gpu_metrics.voltage_gfx, MaxUIntegerTypes.UINT16_T),
-        "voltage_mem": _validate_if_max_uint(gpu_metrics.voltage_mem, MaxUIntegerTypes.UINT16_T),
-        "indep_throttle_status": _validate_if_max_uint(gpu_metrics.indep_throttle_status, MaxUIntegerTypes.UINT64_T, isBool=True),
-        "current_socket_power": _validate_if_max_uint(gpu_metrics.current_socket_power, MaxUIntegerTypes.UINT16_T),
-        "vcn_activity": _validate_if_max_uint(list(gpu_metrics.vcn_activity), MaxUIntegerTypes.UINT16_T, isActivity=True),
-        "gfxclk_lock_status": _validate_if_max_uint(gpu_metrics.gfxclk_lock_status, MaxUIntegerTypes.UINT32_T),
-        "xgmi_link_width": _validate_if_max_uint(gpu_metrics.xgmi_link_width, MaxUIntegerTypes.UINT16_T),
-        "xgmi_link_speed": _validate_if_max_uint(gpu_metrics.xgmi_link_speed, MaxUIntegerTypes.UINT16_T),
-        "pcie_bandwidth_acc": _validate_if_max_uint(gpu_metrics.pcie_bandwidth_acc, MaxUIntegerTypes.UINT64_T),
-        "pcie_bandwidth_inst": _validate_if_max_uint(gpu_metrics.pcie_bandwidth_inst, MaxUIntegerTypes.UINT64_T),
-        "pcie_l0_to_recov_count_acc": _validate_if_max_uint(gpu_metrics.pcie_l0_to_recov_count_acc, MaxUIntegerTypes.UINT64_T),
-        "pcie_replay_count_acc": _validate_if_max_uint(gpu_metrics.pcie_replay_count_acc, MaxUIntegerTypes.UINT64_T),
-        "pcie_replay_rover_count_acc": _validate_if_max_uint(gpu_metrics.pcie_replay_rover_count_acc, MaxUIntegerTypes.UINT64_T),
-        "xgmi_read_data_acc": _validate_if_max_uint(list(gpu_metrics.xgmi_read_data_acc), MaxUIntegerTypes.UINT64_T),
-        "xgmi_write_data_acc": _validate_if_max_uint(list(gpu_metrics.xgmi_write_data_acc), MaxUIntegerTypes.UINT64_T),
-        "current_gfxclks": _validate_if_max_uint(list(gpu_metrics.current_gfxclks), MaxUIntegerTypes.UINT16_T),
-        "current_socclks": _validate_if_max_uint(list(gpu_metrics.current_socclks), MaxUIntegerTypes.UINT16_T),
-        "current_vclk0s": _validate_if_max_uint(list(gpu_metrics.current_vclk0s), MaxUIntegerTypes.UINT16_T),
-        "current_dclk0s": _validate_if_max_uint(list(gpu_metrics.current_dclk0s), MaxUIntegerTypes.UINT16_T),
-        "jpeg_activity": _validate_if_max_uint(list(gpu_metrics.jpeg_activity), MaxUIntegerTypes.UINT16_T, isActivity=True),
-        "pcie_nak_sent_count_acc": _validate_if_max_uint(gpu_metrics.pcie_nak_sent_count_acc, MaxUIntegerTypes.UINT32_T),
-        "pcie_nak_rcvd_count_acc": _validate_if_max_uint(gpu_metrics.pcie_nak_rcvd_count_acc, MaxUIntegerTypes.UINT32_T),
-        "accumulation_counter": _validate_if_max_uint(gpu_metrics.accumulation_counter, MaxUIntegerTypes.UINT64_T),
-        "prochot_residency_acc": _validate_if_max_uint(gpu_metrics.prochot_residency_acc, MaxUIntegerTypes.UINT64_T),
-        "ppt_residency_acc": _validate_if_max_uint(gpu_metrics.ppt_residency_acc, MaxUIntegerTypes.UINT64_T),
-        "socket_thm_residency_acc": _validate_if_max_uint(gpu_metrics.socket_thm_residency_acc, MaxUIntegerTypes.UINT64_T),
-        "vr_thm_residency_acc": _validate_if_max_uint(gpu_metrics.vr_thm_residency_acc, MaxUIntegerTypes.UINT64_T),
-        "hbm_thm_residency_acc": _validate_if_max_uint(gpu_metrics.hbm_thm_residency_acc, MaxUIntegerTypes.UINT64_T),
-        "num_partition": _validate_if_max_uint(gpu_metrics.num_partition, MaxUIntegerTypes.UINT16_T),
-        "xcp_stats.gfx_busy_inst": list(gpu_metrics.xcp_stats),
-        "xcp_stats.jpeg_busy": list(gpu_metrics.xcp_stats),
-        "xcp_stats.vcn_busy": list(gpu_metrics.xcp_stats),
-        "xcp_stats.gfx_busy_acc": list(gpu_metrics.xcp_stats),
-        "pcie_lc_perf_other_end_recovery": _validate_if_max_uint(gpu_metrics.pcie_lc_perf_other_end_recovery, MaxUIntegerTypes.UINT32_T),
-    }
+    return {field: _decode_gpu_metrics_field(gpu_metrics, field) for field in fields}
+
+
+# Counter rate key: (counter key, divisor, scale, unit)
+# The rate is delta(counter) * scale / delta(divisor); "seconds" is the time between
+# the two updates, "accumulation_counter" the number of firmware accumulation intervals.
+# Array counters give one rate per entry.
+_GPU_COUNTER_RATES = {
+    # energy_accumulator is scaled by the counter resolution of each device, in uJ
+    "power": ("energy_accumulator", "seconds", 1e-6, "W"),
+    "gfx_activity": ("gfx_activity_acc", "accumulation_counter", 1, "%"),
+    "mem_activity": ("mem_activity_acc", "accumulation_counter", 1, "%"),
+    "pcie_bandwidth": ("pcie_bandwidth_acc", "accumulation_counter", 1, "GB/s"),
+    "xgmi_read_bandwidth": ("xgmi_read_data_acc", "seconds", 1e-6, "GB/s"),
+    "xgmi_write_bandwidth": ("xgmi_write_data_acc", "seconds", 1e-6, "GB/s"),
+    "prochot_residency": ("prochot_residency_acc", "accumulation_counter", 100, "%"),
+    "ppt_residency": ("ppt_residency_acc", "accumulation_counter", 100, "%"),
+    "socket_thm_residency": ("socket_thm_residency_acc", "accumulation_counter", 100, "%"),
+    "vr_thm_residency": ("vr_thm_residency_acc", "accumulation_counter", 100, "%"),
+    "hbm_thm_residency": ("hbm_thm_residency_acc", "accumulation_counter", 100, "%"),
+}
+
+# Same as _GPU_COUNTER_RATES for the numeric amdsmi_get_hsmp_metrics_table values
+_HSMP_COUNTER_RATES = {
+    "mtbl_socket_power": ("mtbl_socket_energy_acc", "seconds", KILO, "W"),
+    "mtbl_ccd_power": ("mtbl_ccd_energy_acc", "seconds", KILO, "W"),
+    "mtbl_xcd_power": ("mtbl_xcd_energy_acc", "seconds", KILO, "W"),
+    "mtbl_aid_power": ("mtbl_aid_energy_acc", "seconds", KILO, "W"),
+    "mtbl_hbm_power": ("mtbl_hbm_energy_acc", "seconds", KILO, "W"),
+    "mtbl_cclk_frequency_avg": ("mtbl_cclk_frequency_acc", "accumulation_counter", 1, "GHz"),
+    "mtbl_gfxclk_frequency_avg": ("mtbl_gfxclk_frequency_acc", "accumulation_counter", 1, "MHz"),
+    "mtbl_xgmi_read_bandwidth": ("mtbl_xgmi_read_bandwidth_acc", "accumulation_counter", 1, "Gbps"),
+    "mtbl_xgmi_write_bandwidth": ("mtbl_xgmi_write_bandwidth_acc", "accumulation_counter", 1, "Gbps"),
+    "mtbl_pcie_bandwidth": ("mtbl_pcie_bandwidth_acc", "accumulation_counter", 1, "Gbps"),
+    "mtbl_hbm_bandwidth": ("mtbl_hbm_bandwidth_acc", "accumulation_counter", 1, "Gbps"),
+    "mtbl_socket_c0_residency_avg": ("mtbl_socket_c0_residency_acc", "accumulation_counter", 1, "%"),
+    "mtbl_socket_gfx_busy_avg": ("mtbl_socket_gfx_busy_acc", "accumulation_counter", 1, "%"),
+    "mtbl_dram_bandwidth_utilization_avg": ("mtbl_dram_bandwidth_utilization_acc", "accumulation_counter", 1, "%"),
+    "mtbl_prochot_residency": ("mtbl_prochot_residency_acc", "accumulation_counter", 100, "%"),
+    "mtbl_ppt_residency": ("mtbl_ppt_residency_acc", "accumulation_counter", 100, "%"),
+    "mtbl_socket_thm_residency": ("mtbl_socket_thm_residency_acc", "accumulation_counter", 100, "%"),
+    "mtbl_vr_thm_residency": ("mtbl_vr_thm_residency_acc", "accumulation_counter", 100, "%"),
+    "mtbl_hbm_thm_residency": ("mtbl_hbm_thm_residency_acc", "accumulation_counter", 100, "%"),
+}
+
+
+def _counter_delta(current, previous, max_value=None):
+    """
+    Difference between two reads of an accumulating counter.
+
+    Returns None if either read is unavailable or the counter went backwards
+    without wrapping; only counters narrower than 64 bits are expected to wrap,
+    a 64 bit counter going backwards was reset.
+    """
+    if not isinstance(current, (int, float)) or not isinstance(previous, (int, float)) \
+            or isinstance(current, bool) or isinstance(previous, bool):
+        return None
+    if current >= previous:
+        return current - previous
+    if max_value is not None and max_value < MaxUIntegerTypes.UINT64_T:
+        return current + max_value + 1 - previous
+    return None
+
+
+def _counter_rate(current, previous, divisor, scale, max_value=None):
+    if isinstance(current, list):
+        if not isinstance(previous, list) or len(previous) != len(current):
+            return ["N/A"] * len(current)
+        return [_counter_rate(value, previous_value, divisor, scale, max_value)
+                for value, previous_value in zip(current, previous)]
+    delta = _counter_delta(current, previous, max_value)
+    if delta is None or not divisor or scale is None:
+        return "N/A"
+    return round(delta * scale / divisor, 3)
+
+
+class CounterRateTracker:
+    """
+    Per interval rates of the accumulating gpu metrics and HSMP metrics table counters.
+
+    The last sample of every handle is kept; each update returns the rates over the
+    interval since the previous update of the same handle: watts from the energy
+    accumulators, GB/s from the pcie and xgmi accumulators, average activity and
+    the throttle residencies in %. 32 bit counters wrap around, any other counter
+    going backwards (ex. driver reload) reports "N/A" for one interval. The first
+    update of a handle has no interval and reports "N/A" for every rate, a list
+    of "N/A" for the per link xgmi rates.
+
+        tracker = CounterRateTracker()
+        while True:
+            rates = tracker.update(processor_handle)
+            print(rates["power"], CounterRateTracker.get_units()["power"])
+            time.sleep(1)
+
+    The tracker is thread safe, updates of different handles may run concurrently.
+    """
+
+    _GPU_FIELDS = ["accumulation_counter"] + [counter for counter, _, _, _ in _GPU_COUNTER_RATES.values()]
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (table, handle value) -> (timestamp, {counter key: value})
+        self._samples = {}
+        # handle value -> energy counter resolution in uJ, None if not available
+        self._energy_resolution = {}
+
+    @staticmethod
+    def get_units() -> Dict[str, str]:
+        """
+        Get the unit of every rate returned by update and update_hsmp.
+
+        Returns:
+            `dict`: Rate key to its unit, ex. {"power": "W"}.
+        """
+        units = {rate: unit for rate, (_, _, _, unit) in _GPU_COUNTER_RATES.items()}
+        units.update({rate: unit for rate, (_, _, _, unit) in _HSMP_COUNTER_RATES.items()})
+        return units
+
+    def has_sample(self, processor_handle: amdsmi_wrapper.amdsmi_processor_handle) -> bool:
+        """
+        Check if the next update of a handle returns rates.
+
+        Parameters:
+            processor_handle(`amdsmi_processor_handle`): Handle for the given device.
+
+        Returns:
+            `bool`: True if a gpu metrics sample of the handle is kept.
+        """
+        with self._lock:
+            return ("gpu", processor_handle.value) in self._samples
+
+    def reset(self, processor_handle: Union[amdsmi_wrapper.amdsmi_processor_handle, None] = None) -> None:
+        """
+        Drop the kept samples, the next update of the handles starts a new interval.
+
+        Parameters:
+            processor_handle(`amdsmi_processor_handle`, optional): Handle to reset.
+            Defaults to None, which resets every handle.
+
+        Returns:
+            `None`: This function does not return anything
+        """
+        with self._lock:
+            if processor_handle is None:
+                self._samples.clear()
+            else:
+                for key in [key for key in self._samples if key[1] == processor_handle.value]:
+                    del self._samples[key]
+
+    def _get_energy_resolution(self, processor_handle):
+        if processor_handle.value not in self._energy_resolution:
+            try:
+                resolution = amdsmi_get_energy_count(processor_handle)["counter_resolution"]
+            except AmdSmiLibraryException:
+                resolution = None
+            self._energy_resolution[processor_handle.value] = resolution
+        return self._energy_resolution[processor_handle.value]
+
+    def _update(self, key, sample, timestamp, counter_rates, accumulation_key, scales, max_values):
+        counters = [accumulation_key] + [counter for counter, _, _, _ in counter_rates.values()]
+        sample = {counter: sample.get(counter, "N/A") for counter in counters}
+        with self._lock:
+            previous = self._samples.get(key)
+            self._samples[key] = (timestamp, sample)
+        if previous is None:
+            # No interval yet, the rates of list counters keep their length
+            return {rate: _counter_rate(sample[counter], None, None, None)
+                    for rate, (counter, _, _, _) in counter_rates.items()}
+
+        previous_timestamp, previous_sample = previous
+        divisors = {
+            "seconds": timestamp - previous_timestamp if timestamp > previous_timestamp else None,
+            "accumulation_counter": _counter_delta(sample[accumulation_key], previous_sample[accumulation_key],
+                                                   max_values.get(accumulation_key)),
+        }
+        rates = {}
+        for rate, (counter, divisor, scale, _) in counter_rates.items():
+            scale = scales.get(rate, scale)
+            rates[rate] = _counter_rate(sample[counter], previous_sample[counter], divisors[divisor],
+                                        scale, max_values.get(counter))
+        return rates
+
+    def update(
+        self,
+        processor_handle: amdsmi_wrapper.amdsmi_processor_handle,
+        gpu_metrics: Union[Dict[str, Any], None] = None,
+        timestamp: Union[float, None] = None,
+    ) -> Dict[str, Any]:
+        """
+        Add a gpu metrics sample and get the rates since the previous one.
+
+        Parameters:
+            processor_handle(`amdsmi_processor_handle`): Handle for the given device.
+            gpu_metrics(`dict`, optional): amdsmi_get_gpu_metrics_info output to use
+            instead of reading the device, it must hold the accumulator keys.
+            timestamp(`float`, optional): time.monotonic() seconds of the sample.
+            Defaults to None, which uses the current time.
+
+        Returns:
+            `dict`: Rate key to its value, or "N/A"; see get_units for the units.
+        """
+        if not isinstance(processor_handle, amdsmi_wrapper.amdsmi_processor_handle):
+            raise AmdSmiParameterException(
+                processor_handle, amdsmi_wrapper.amdsmi_processor_handle
+            )
+
+        if gpu_metrics is None:
+            gpu_metrics = amdsmi_get_gpu_metrics_info(processor_handle, fields=self._GPU_FIELDS)
+        if timestamp is None:
+            timestamp = monotonic()
+
+        scales = {}
+        resolution = self._get_energy_resolution(processor_handle)
+        scales["power"] = resolution * _GPU_COUNTER_RATES["power"][2] if resolution else None
+        max_values = {counter: _GPU_METRICS_FIELDS[counter][0] for counter in self._GPU_FIELDS}
+        return self._update(("gpu", processor_handle.value), gpu_metrics, timestamp,
+                            _GPU_COUNTER_RATES, "accumulation_counter", scales, max_values)
+
+    def update_hsmp(
+        self,
+        processor_handle: amdsmi_wrapper.amdsmi_processor_handle,
+        metrics_table: Union[Dict[str, Any], None] = None,
+        timestamp: Union[float, None] = None,
+    ) -> Dict[str, Any]:
+        """
+        Add an HSMP metrics table sample of a cpu socket and get the rates since the previous one.
+
+        Parameters:
+            processor_handle(`amdsmi_processor_handle`): Handle for the given cpu socket.
+            metrics_table(`dict`, optional): amdsmi_get_hsmp_metrics_table(numeric=True)
+            output to use instead of reading the socket.
+            timestamp(`float`, optional): time.monotonic() seconds of the sample.
+            Defaults to None, which uses the current time.
+
+        Returns:
+            `dict`: Rate key to its value, or "N/A"; see get_units for the units.
+        """
+        if not isinstance(processor_handle, amdsmi_wrapper.amdsmi_processor_handle):
+            raise AmdSmiParameterException(
+                processor_handle, amdsmi_wrapper.amdsmi_processor_handle
+            )
+
+        if metrics_table is None:
+            metrics_table = amdsmi_get_hsmp_metrics_table(processor_handle, numeric=True)
+        if timestamp is None:
+            timestamp = monotonic()
+
+        return self._update(("hsmp", processor_handle.value), metrics_table, timestamp,
+                            _HSMP_COUNTER_RATES, "mtbl_accumulation_counter", {}, {})
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("numpy is required for structured gpu metrics access (pip install numpy)") from e
+    return numpy
+
+
+def _ctypes_to_numpy_dtype(ctype, numpy):
+    """
+    Build a numpy dtype with the same memory layout as a ctypes type.
+
+    Parameters:
+        ctype: ctypes simple type, array type, Structure or Union from amdsmi_wrapper.
+        numpy: The numpy module.
+
+    Returns:
+        `numpy.dtype`: Structured dtype; field offsets and itemsize match the ctypes layout.
+    """
+    if issubclass(ctype, ctypes.Array):
+        if ctype._type_ is ctypes.c_char:
+            return numpy.dtype((numpy.bytes_, ctype._length_))
+        return numpy.dtype((_ctypes_to_numpy_dtype(ctype._type_, numpy), (ctype._length_,)))
+
+    if issubclass(ctype, (ctypes.Structure, ctypes.Union)):
+        names, formats, offsets = [], [], []
+        for field in ctype._fields_:
+            name, field_type = field[0], field[1]
+            names.append(name)
+            formats.append(_ctypes_to_numpy_dtype(field_type, numpy))
+            offsets.append(getattr(ctype, name).offset)
+        return numpy.dtype({"names": names, "formats": formats,
+                            "offsets": offsets, "itemsize": ctypes.sizeof(ctype)})
+
+    return numpy.dtype(ctype)
+
+
+_gpu_metrics_dtype = None
 
-    # Create 2d array with each XCD's stats
-    for k,v in gpu_metrics_output.items():
-        if 'xcp_stats' in k:
-            if 'xcp_stats.gfx_busy_inst' in k:
-                for curr_xcp, item in enumerate(v):
-                    print_xcp_detail = []
-                    for val in item.gfx_busy_inst:
-                        print_xcp_detail.append(_validate_if_max_uint(val, MaxUIntegerTypes.UINT32_T, isActivity=True))
-                    gpu_metrics_output[k][curr_xcp] = print_xcp_detail
-            if 'xcp_stats.jpeg_busy' in k:
-                for curr_xcp, item in enumerate(v):
-                    print_xcp_detail = []
-                    for val in item.jpeg_busy:
-                        print_xcp_detail.append(_validate_if_max_uint(val, MaxUIntegerTypes.UINT16_T, isActivity=True))
-                    gpu_metrics_output[k][curr_xcp] = print_xcp_detail
-            if 'xcp_stats.vcn_busy' in k:
-                for curr_xcp, item in enumerate(v):
-                    print_xcp_detail = []
-                    for val in item.vcn_busy:
-                        print_xcp_detail.append(_validate_if_max_uint(val, MaxUIntegerTypes.UINT16_T, isActivity=True))
-                    gpu_metrics_output[k][curr_xcp] = print_xcp_detail
-            if 'xcp_stats.gfx_busy_acc' in k:
-                for curr_xcp, item in enumerate(v):
-                    print_xcp_detail = []
-                    for val in item.gfx_busy_acc:
-                        print_xcp_detail.append(_validate_if_max_uint(val, MaxUIntegerTypes.UINT64_T, isActivity=True))
-                    gpu_metrics_output[k][curr_xcp] = print_xcp_detail
-    return gpu_metrics_output
+
+def amdsmi_get_gpu_metrics_dtype():
+    """
+    Get the numpy structured dtype matching `amdsmi_gpu_metrics_t`.
+
+    The dtype is generated once from the amdsmi_wrapper ctypes fields and can be
+    used to preallocate sample arrays, ex. numpy.zeros(n, amdsmi_get_gpu_metrics_dtype()).
+
+    Returns:
+        `numpy.dtype`: Structured dtype with the raw gpu metrics layout.
+    """
+    global _gpu_metrics_dtype
+    if _gpu_metrics_dtype is None:
+        _gpu_metrics_dtype = _ctypes_to_numpy_dtype(amdsmi_wrapper.amdsmi_gpu_metrics_t, _import_numpy())
+    return _gpu_metrics_dtype
+
+
+def amdsmi_get_gpu_metrics_array(
+    processor_handle: amdsmi_wrapper.amdsmi_processor_handle,
+    out=None,
+):
+    """
+    Get the raw gpu metrics table of a device as a numpy structured array.
+
+    The library fills the returned array's memory directly; no per-field
+    conversion or copy is made. Raw values are returned as is, max uint
+    values are not converted to "N/A".
+
+    Parameters:
+        processor_handle(`amdsmi_processor_handle`): Handle for the given device.
+        out(`numpy.ndarray`, optional): Contiguous array of one element with the
+        amdsmi_get_gpu_metrics_dtype() dtype, ex. samples[i:i + 1]. It is filled in place.
+
+    Returns:
+        `numpy.ndarray`: Array of shape (1,) viewing the gpu metrics buffer.
+    """
+    if not isinstance(processor_handle, amdsmi_wrapper.amdsmi_processor_handle):
+        raise AmdSmiParameterException(
+            processor_handle, amdsmi_wrapper.amdsmi_processor_handle
+        )
+
+    numpy = _import_numpy()
+    dtype = amdsmi_get_gpu_metrics_dtype()
+    if out is None:
+        out = numpy.zeros(1, dtype=dtype)
+    elif not isinstance(out, numpy.ndarray) or out.dtype != dtype or out.shape != (1,) \
+            or not out.flags.c_contiguous:
+        raise AmdSmiParameterException(out, dtype, "out must be a contiguous (1,) array of the gpu metrics dtype")
+
+    gpu_metrics = amdsmi_wrapper.amdsmi_gpu_metrics_t.from_buffer(out)
+    _check_res(
+        amdsmi_wrapper.amdsmi_get_gpu_metrics_info(
+            processor_handle, ctypes.byref(gpu_metrics)
+        )
+    )
+
+    return out
+
+
+def _validate_processor_handles(processor_handles) -> List[amdsmi_wrapper.amdsmi_processor_handle]:
+    if not isinstance(processor_handles, Iterable):
+        raise AmdSmiParameterException(
+            processor_handles, List[amdsmi_wrapper.amdsmi_processor_handle]
+        )
+    processor_handles = list(processor_handles)
+    for processor_handle in processor_handles:
+        if not isinstance(processor_handle, amdsmi_wrapper.amdsmi_processor_handle):
+            raise AmdSmiParameterException(
+                processor_handle, amdsmi_wrapper.amdsmi_processor_handle
+            )
+    return processor_handles
+
+
+def _batch_columns(structs, status: List[int], columns: Dict[str, Any]) -> Dict[str, List]:
+    """
+    Convert a filled array of structs into columnar output.
+
+    Parameters:
+        structs: ctypes array filled by the library, one entry per device.
+        status(`list`): amdsmi_status_t returned for each device.
+        columns(`dict`): Output key to a function decoding that value from one struct.
+
+    Returns:
+        `dict`: "status" column plus one list per key; failed devices hold "N/A".
+        The status entries are the raw amdsmi_status_t ints, AMDSMI_STATUS_SUCCESS
+        on success; AmdSmiLibraryException(status) describes a failure.
+    """
+    ok = [ret == amdsmi_wrapper.AMDSMI_STATUS_SUCCESS for ret in status]
+    output = {"status": status}
+    for key, decode in columns.items():
+        output[key] = [decode(structs[index]) if ok[index] else "N/A" for index in range(len(status))]
+    return output
+
+
+def _uint16_or_na(value):
+    return "N/A" if value == 0xFFFF else value
+
+
+def amdsmi_get_gpu_metrics_info_batch(
+    processor_handles: List[amdsmi_wrapper.amdsmi_processor_handle],
+    fields: Union[List[str], None] = None,
+) -> Dict[str, List]:
+    """
+    Get the gpu metrics table of several devices in one pass.
+
+    Handles are validated once and the tables are read into one preallocated
+    array of amdsmi_gpu_metrics_t. A failing device does not stop the batch.
+
+    Parameters:
+        processor_handles(`list`): Handles for the given devices.
+        fields(`list`, optional): Output keys to decode, as in amdsmi_get_gpu_metrics_info.
+        Defaults to None, which decodes the full table.
+
+    Returns:
+        `dict`: Columnar output; "status" holds the amdsmi_status_t int of each device,
+        AMDSMI_STATUS_SUCCESS on success, and every field holds one value per device
+        in handle order ("N/A" on failure). A failed status is not raised, pass it to
+        AmdSmiLibraryException to get the same error as amdsmi_get_gpu_metrics_info.
+    """
+    processor_handles = _validate_processor_handles(processor_handles)
+    if fields is None:
+        fields = _GPU_METRICS_FIELDS
+    else:
+        if isinstance(fields, str):
+            fields = [fields]
+        if not isinstance(fields, Iterable):
+            raise AmdSmiParameterException(fields, List[str])
+        for field in fields:
+            if not isinstance(field, str) or field not in _GPU_METRICS_FIELDS:
+                raise AmdSmiKeyException(str(field))
+
+    gpu_metrics = (amdsmi_wrapper.amdsmi_gpu_metrics_t * len(processor_handles))()
+    status = [
+        amdsmi_wrapper.amdsmi_get_gpu_metrics_info(processor_handle, ctypes.byref(gpu_metrics[index]))
+        for index, processor_handle in enumerate(processor_handles)
+    ]
+
+    columns = {field: (lambda metrics, field=field: _decode_gpu_metrics_field(metrics, field))
+               for field in fields}
+    return _batch_columns(gpu_metrics, status, columns)
+
+
+def amdsmi_get_power_info_batch(
+    processor_handles: List[amdsmi_wrapper.amdsmi_processor_handle],
+) -> Dict[str, List]:
+    """
+    Get the power info of several devices in one pass.
+
+    Parameters:
+        processor_handles(`list`): Handles for the given devices.
+
+    Returns:
+        `dict`: Columnar output with the amdsmi_get_power_info keys and a "status" column,
+        as in amdsmi_get_gpu_metrics_info_batch.
+    """
+    processor_handles = _validate_processor_handles(processor_handles)
+
+    power_measures = (amdsmi_wrapper.amdsmi_power_info_t * len(processor_handles))()
+    status = [
+        amdsmi_wrapper.amdsmi_get_power_info(processor_handle, ctypes.byref(power_measures[index]))
+        for index, processor_handle in enumerate(processor_handles)
+    ]
+
+    return _batch_columns(power_measures, status, {
+        "current_socket_power": lambda power: _uint16_or_na(power.current_socket_power),
+        "average_socket_power": lambda power: _uint16_or_na(power.average_socket_power),
+        "gfx_voltage": lambda power: _uint16_or_na(power.gfx_voltage),
+        "soc_voltage": lambda power: _uint16_or_na(power.soc_voltage),
+        "mem_voltage": lambda power: _uint16_or_na(power.mem_voltage),
+        "power_limit": lambda power: _uint16_or_na(power.power_limit),
+    })
+
+
+def amdsmi_get_temp_metric_batch(
+    processor_handles: List[amdsmi_wrapper.amdsmi_processor_handle],
+    sensor_type: AmdSmiTemperatureType,
+    metric: AmdSmiTemperatureMetric,
+) -> Dict[str, List]:
+    """
+    Get one temperature metric of several devices in one pass.
+
+    Parameters:
+        processor_handles(`list`): Handles for the given devices.
+        sensor_type(`AmdSmiTemperatureType`): Temperature sensor to read.
+        metric(`AmdSmiTemperatureMetric`): Temperature metric to read.
+
+    Returns:
+        `dict`: Columnar output with "temperature" and "status" columns,
+        as in amdsmi_get_gpu_metrics_info_batch.
+    """
+    processor_handles = _validate_processor_handles(processor_handles)
+    if not isinstance(sensor_type, AmdSmiTemperatureType):
+        raise AmdSmiParameterException(sensor_type, AmdSmiTemperatureType)
+    if not isinstance(metric, AmdSmiTemperatureMetric):
+        raise AmdSmiParameterException(metric, AmdSmiTemperatureMetric)
+
+    temp_values = (ctypes.c_int64 * len(processor_handles))()
+    status = [
+        amdsmi_wrapper.amdsmi_get_temp_metric(
+            processor_handle, sensor_type, metric,
+            ctypes.byref(ctypes.c_int64.from_buffer(temp_values, index * ctypes.sizeof(ctypes.c_int64))))
+        for index, processor_handle in enumerate(processor_handles)
+    ]
+
+    return _batch_columns(temp_values, status, {
+        "temperature": lambda temp_value: temp_value,
+    })
+
+
+def amdsmi_get_clock_info_batch(
+    processor_handles: List[amdsmi_wrapper.amdsmi_processor_handle],
+    clock_type: AmdSmiClkType,
+) -> Dict[str, List]:
+    """
+    Get the clock info of several devices in one pass.
+
+    Parameters:
+        processor_handles(`list`): Handles for the given devices.
+        clock_type(`AmdSmiClkType`): Clock domain to read.
+
+    Returns:
+        `dict`: Columnar output with the amdsmi_get_clock_info keys and a "status" column,
+        as in amdsmi_get_gpu_metrics_info_batch.
+    """
+    processor_handles = _validate_processor_handles(processor_handles)
+    if not isinstance(clock_type, AmdSmiClkType):
+        raise AmdSmiParameterException(clock_type, AmdSmiClkType)
+
+    clock_measures = (amdsmi_wrapper.amdsmi_clk_info_t * len(processor_handles))()
+    status = [
+        amdsmi_wrapper.amdsmi_get_clock_info(processor_handle, clock_type, ctypes.byref(clock_measures[index]))
+        for index, processor_handle in enumerate(processor_handles)
+    ]
+
+    return _batch_columns(clock_measures, status, {
+        "clk": lambda clock: clock.clk,
+        "min_clk": lambda clock: clock.min_clk,
+        "max_clk": lambda clock: clock.max_clk,
+        "clk_locked": lambda clock: clock.clk_locked,
+        "clk_deep_sleep": lambda clock: clock.clk_deep_sleep,
+    })
+
+
+def amdsmi_get_gpu_activity_batch(
+    processor_handles: List[amdsmi_wrapper.amdsmi_processor_handle],
+) -> Dict[str, List]:
+    """
+    Get the engine activity of several devices in one pass.
+
+    Parameters:
+        processor_handles(`list`): Handles for the given devices.
+
+    Returns:
+        `dict`: Columnar output with the amdsmi_get_gpu_activity keys and a "status" column,
+        as in amdsmi_get_gpu_metrics_info_batch.
+    """
+    processor_handles = _validate_processor_handles(processor_handles)
+
+    engine_usages = (amdsmi_wrapper.amdsmi_engine_usage_t * len(processor_handles))()
+    status = [
+        amdsmi_wrapper.amdsmi_get_gpu_activity(processor_handle, ctypes.byref(engine_usages[index]))
+        for index, processor_handle in enumerate(processor_handles)
+    ]
+
+    return _batch_columns(engine_usages, status, {
+        "gfx_activity": lambda engine_usage: _uint16_or_na(engine_usage.gfx_activity),
+        "umc_activity": lambda engine_usage: _uint16_or_na(engine_usage.umc_activity),
+        "mm_activity": lambda engine_usage: _uint16_or_na(engine_usage.mm_activity),
+    })
 
 
 def amdsmi_get_gpu_od_volt_curve_regions(
@@ -4180,3 +5301,223 @@ def amdsmi_get_link_topology_nearest(
         'count': topology_nearest_list.count,
         'processor_list': device_list
     }
+
+
+class _AmdSmiCapabilityCache:
+    """
+    Per processor record of the getters that returned AMDSMI_STATUS_NOT_SUPPORTED.
+
+    Features like overdrive voltages, fans on passively cooled parts, or ECC
+    on virtual machines are reported as not supported on every call. Once a
+    getter failed that way for a processor, later calls with the same
+    arguments raise the same AmdSmiLibraryException without calling the
+    library. Calls that failed with any other status are always retried.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._unsupported = {}
+
+    @staticmethod
+    def _describe(key):
+        api_name, args = key
+        api_args = [arg.name if isinstance(arg, IntEnum) else repr(arg) for arg in args]
+        if api_args:
+            return f"{api_name}({', '.join(api_args)})"
+        return api_name
+
+    def wrap(self, api):
+        signature = inspect.signature(api)
+
+        @functools.wraps(api)
+        def _api(*args, **kwargs):
+            try:
+                # Arguments in parameter order, so keyword and positional calls get the same key
+                arguments = tuple(signature.bind(*args, **kwargs).arguments.values())
+            except TypeError: # Invalid arguments, the api reports them
+                return api(*args, **kwargs)
+            if not arguments or not isinstance(arguments[0], amdsmi_wrapper.amdsmi_processor_handle):
+                return api(*args, **kwargs)
+            processor_handle = arguments[0]
+            key = (api.__name__, arguments[1:])
+            try:
+                hash(key)
+            except TypeError: # Unhashable arguments, ex. a list of fields
+                return api(*args, **kwargs)
+            if key in self._unsupported.get(processor_handle.value, ()):
+                raise AmdSmiLibraryException(amdsmi_wrapper.AMDSMI_STATUS_NOT_SUPPORTED)
+            try:
+                return api(*args, **kwargs)
+            except AmdSmiLibraryException as e:
+                if e.get_error_code() == amdsmi_wrapper.AMDSMI_STATUS_NOT_SUPPORTED:
+                    with self._lock:
+                        self._unsupported.setdefault(processor_handle.value, {})[key] = None
+                raise
+        return _api
+
+    def get(self, processor_handle):
+        with self._lock:
+            keys = list(self._unsupported.get(processor_handle.value, ()))
+        return [self._describe(key) for key in keys]
+
+    def clear(self, processor_handle=None):
+        with self._lock:
+            if processor_handle is None:
+                self._unsupported = {}
+            else:
+                self._unsupported.pop(processor_handle.value, None)
+
+
+_capability_cache = _AmdSmiCapabilityCache()
+
+# Getters taking a processor handle as their first argument, they go through
+# the capability cache
+_CAPABILITY_CACHED_APIS = (
+    "amdsmi_get_processor_info",
+    "amdsmi_get_cpu_hsmp_proto_ver",
+    "amdsmi_get_cpu_smu_fw_version",
+    "amdsmi_get_cpu_core_energy",
+    "amdsmi_get_cpu_socket_energy",
+    "amdsmi_get_cpu_prochot_status",
+    "amdsmi_get_cpu_fclk_mclk",
+    "amdsmi_get_cpu_cclk_limit",
+    "amdsmi_get_cpu_socket_current_active_freq_limit",
+    "amdsmi_get_cpu_socket_freq_range",
+    "amdsmi_get_cpu_core_current_freq_limit",
+    "amdsmi_get_cpu_socket_power",
+    "amdsmi_get_cpu_socket_power_cap",
+    "amdsmi_get_cpu_socket_power_cap_max",
+    "amdsmi_get_cpu_pwr_svi_telemetry_all_rails",
+    "amdsmi_get_cpu_core_boostlimit",
+    "amdsmi_get_cpu_socket_c0_residency",
+    "amdsmi_get_cpu_ddr_bw",
+    "amdsmi_get_cpu_socket_temperature",
+    "amdsmi_get_cpu_dimm_temp_range_and_refresh_rate",
+    "amdsmi_get_cpu_dimm_power_consumption",
+    "amdsmi_get_cpu_dimm_thermal_sensor",
+    "amdsmi_get_cpu_socket_lclk_dpm_level",
+    "amdsmi_get_cpu_current_io_bandwidth",
+    "amdsmi_get_cpu_current_xgmi_bw",
+    "amdsmi_get_hsmp_metrics_table_version",
+    "amdsmi_get_hsmp_metrics_table",
+    "amdsmi_get_processor_type",
+    "amdsmi_get_gpu_device_bdf",
+    "amdsmi_get_gpu_asic_info",
+    "amdsmi_get_gpu_kfd_info",
+    "amdsmi_get_power_cap_info",
+    "amdsmi_get_gpu_pm_metrics_info",
+    "amdsmi_get_gpu_reg_table_info",
+    "amdsmi_get_gpu_vram_info",
+    "amdsmi_get_gpu_cache_info",
+    "amdsmi_get_gpu_vbios_info",
+    "amdsmi_get_gpu_activity",
+    "amdsmi_get_clock_info",
+    "amdsmi_get_gpu_bad_page_info",
+    "amdsmi_get_violation_status",
+    "amdsmi_get_gpu_total_ecc_count",
+    "amdsmi_get_gpu_board_info",
+    "amdsmi_get_gpu_ras_feature_info",
+    "amdsmi_get_gpu_ras_block_features_enabled",
+    "amdsmi_get_gpu_process_list",
+    "amdsmi_get_gpu_process_table",
+    "amdsmi_get_gpu_device_uuid",
+    "amdsmi_get_gpu_driver_info",
+    "amdsmi_get_power_info",
+    "amdsmi_get_fw_info",
+    "amdsmi_get_gpu_vram_usage",
+    "amdsmi_get_pcie_info",
+    "amdsmi_get_gpu_vendor_name",
+    "amdsmi_get_gpu_id",
+    "amdsmi_get_gpu_vram_vendor",
+    "amdsmi_get_gpu_subsystem_id",
+    "amdsmi_get_gpu_subsystem_name",
+    "amdsmi_get_gpu_compute_partition",
+    "amdsmi_get_gpu_memory_partition",
+    "amdsmi_get_gpu_accelerator_partition_profile",
+    "amdsmi_get_xgmi_info",
+    "amdsmi_get_gpu_available_counters",
+    "amdsmi_get_gpu_bdf_id",
+    "amdsmi_get_gpu_pci_bandwidth",
+    "amdsmi_get_gpu_pci_throughput",
+    "amdsmi_get_gpu_pci_replay_counter",
+    "amdsmi_get_gpu_topo_numa_affinity",
+    "amdsmi_get_energy_count",
+    "amdsmi_get_gpu_memory_total",
+    "amdsmi_get_gpu_memory_usage",
+    "amdsmi_get_gpu_fan_rpms",
+    "amdsmi_get_gpu_fan_speed",
+    "amdsmi_get_gpu_fan_speed_max",
+    "amdsmi_get_temp_metric",
+    "amdsmi_get_gpu_volt_metric",
+    "amdsmi_get_utilization_count",
+    "amdsmi_get_gpu_perf_level",
+    "amdsmi_get_gpu_overdrive_level",
+    "amdsmi_get_gpu_mem_overdrive_level",
+    "amdsmi_get_clk_freq",
+    "amdsmi_get_soc_pstate",
+    "amdsmi_get_xgmi_plpd",
+    "amdsmi_get_gpu_process_isolation",
+    "amdsmi_get_gpu_od_volt_info",
+    "amdsmi_get_gpu_metrics_info",
+    "amdsmi_get_gpu_metrics_array",
+    "amdsmi_get_gpu_od_volt_curve_regions",
+    "amdsmi_get_gpu_power_profile_presets",
+    "amdsmi_get_gpu_ecc_count",
+    "amdsmi_get_gpu_ecc_enabled",
+    "amdsmi_get_gpu_ecc_status",
+    "amdsmi_get_gpu_memory_reserved_pages",
+    "amdsmi_get_gpu_metrics_header_info",
+    "amdsmi_get_link_topology_nearest",
+)
+
+for _name in _CAPABILITY_CACHED_APIS:
+    globals()[_name] = _capability_cache.wrap(globals()[_name])
+
+
+def amdsmi_get_unsupported_apis(
+    processor_handle: amdsmi_wrapper.amdsmi_processor_handle,
+) -> List[str]:
+    """
+    Get the getters that returned AMDSMI_STATUS_NOT_SUPPORTED for a processor.
+
+    Those getters are not called again for the processor, they raise
+    AmdSmiLibraryException with AMDSMI_STATUS_NOT_SUPPORTED right away.
+    Getters called with arguments are listed with them,
+    ex. amdsmi_get_gpu_fan_speed(0).
+
+    Parameters:
+        processor_handle(`amdsmi_processor_handle`): Handle of the processor.
+
+    Returns:
+        `list`: Unsupported getters, in the order they failed.
+    """
+    if not isinstance(processor_handle, amdsmi_wrapper.amdsmi_processor_handle):
+        raise AmdSmiParameterException(
+            processor_handle, amdsmi_wrapper.amdsmi_processor_handle
+        )
+
+    return _capability_cache.get(processor_handle)
+
+
+def amdsmi_clear_unsupported_apis(
+    processor_handle: Union[amdsmi_wrapper.amdsmi_processor_handle, None] = None,
+) -> None:
+    """
+    Forget the unsupported getters of a processor, or of all processors, so
+    they are called again, ex. after a driver reload. The record is also
+    cleared by `amdsmi_shut_down`, `amdsmi_reset_gpu` and the partition
+    setters.
+
+    Parameters:
+        processor_handle(`amdsmi_processor_handle`, optional): Handle of the
+        processor. Defaults to all processors.
+
+    Returns:
+        `None`.
+    """
+    if processor_handle is not None and not isinstance(processor_handle, amdsmi_wrapper.amdsmi_processor_handle):
+        raise AmdSmiParameterException(
+            processor_handle, amdsmi_wrapper.amdsmi_processor_handle
+        )
+
+    _capability_cache.clear(processor_handle)
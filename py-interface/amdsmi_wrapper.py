@@ -29,6 +29,7 @@ import os
 # LONGDOUBLE_SIZE is: 16
 #
 import ctypes
+import sys
 
 
 c_int128 = ctypes.c_ubyte*16
@@ -39,46 +40,74 @@ if ctypes.sizeof(ctypes.c_longdouble) == 16:
 else:
     c_long_double_t = ctypes.c_ubyte*16
 
+# Struct class -> converter compiled from its _fields_ on first use
+_AS_DICT_CONVERTERS = {}
+_AS_TUPLE_CONVERTERS = {}
+
+
+def _pointer_contents(value):
+    try:
+        return value.contents
+    except ValueError:
+        # nullptr
+        return None
+
+
+def _compile_converter(cls, as_tuple):
+    # Generates one function per struct class reading every field with a plain
+    # attribute access, so the field kinds are only inspected once
+    import keyword
+    namespace = {'_pointer_contents': _pointer_contents}
+    items = []
+    for field_tuple in getattr(cls, '_fields_', ()):
+        field, type_ = field_tuple[0], field_tuple[1]
+        if field.startswith('PADDING_'):
+            continue
+        if field.isidentifier() and not keyword.iskeyword(field):
+            value = f'self.{field}'
+        else:
+            value = f'getattr(self, {field!r})'
+        if issubclass(type_, ctypes.Array) and type_._type_ not in (ctypes.c_char, ctypes.c_wchar):
+            # char arrays are already read as bytes or str
+            value = f'list({value})'
+        elif issubclass(type_, ctypes._Pointer):
+            value = f'_pointer_contents({value})'
+        elif issubclass(type_, AsDictMixin):
+            # other structure
+            converter = f'_convert_{len(items)}'
+            namespace[converter] = _get_converter(type_, as_tuple)
+            value = f'{converter}({value})'
+        items.append(value if as_tuple else f'{field!r}: {value}')
+
+    if as_tuple:
+        source = f"def convert(self):\n    return ({', '.join(items)}{',' if len(items) == 1 else ''})\n"
+    else:
+        source = f"def convert(self):\n    return {{{', '.join(items)}}}\n"
+    exec(compile(source, f'<{cls.__name__} converter>', 'exec'), namespace)
+    return namespace['convert']
+
+
+def _get_converter(cls, as_tuple):
+    converters = _AS_TUPLE_CONVERTERS if as_tuple else _AS_DICT_CONVERTERS
+    converter = converters.get(cls)
+    if converter is None:
+        converter = converters[cls] = _compile_converter(cls, as_tuple)
+    return converter
+
+
 class AsDictMixin:
     @classmethod
     def as_dict(cls, self):
-        result = {}
         if not isinstance(self, AsDictMixin):
             # not a structure, assume it's already a python object
             return self
-        if not hasattr(cls, "_fields_"):
-            return result
-        # sys.version_info >= (3, 5)
-        # for (field, *_) in cls._fields_:  # noqa
-        for field_tuple in cls._fields_:  # noqa
-            field = field_tuple[0]
-            if field.startswith('PADDING_'):
-                continue
-            value = getattr(self, field)
-            type_ = type(value)
-            if hasattr(value, "_length_") and hasattr(value, "_type_"):
-                # array
-                if not hasattr(type_, "as_dict"):
-                    value = [v for v in value]
-                else:
-                    type_ = type_._type_
-                    value = [type_.as_dict(v) for v in value]
-            elif hasattr(value, "contents") and hasattr(value, "_type_"):
-                # pointer
-                try:
-                    if not hasattr(type_, "as_dict"):
-                        value = value.contents
-                    else:
-                        type_ = type_._type_
-                        value = type_.as_dict(value.contents)
-                except ValueError:
-                    # nullptr
-                    value = None
-            elif isinstance(value, AsDictMixin):
-                # other structure
-                value = type_.as_dict(value)
-            result[field] = value
-        return result
+        return _get_converter(cls, False)(self)
+
+    @classmethod
+    def as_tuple(cls, self):
+        if not isinstance(self, AsDictMixin):
+            return self
+        return _get_converter(cls, True)(self)
 
 
 class Structure(ctypes.Structure, AsDictMixin):
@@ -2062,504 +2091,200 @@ struct_amdsmi_hsmp_metrics_table_t._fields_ = [
 amdsmi_hsmp_metrics_table_t = struct_amdsmi_hsmp_metrics_table_t
 amdsmi_hsmp_freqlimit_src_names = ['cHTC-Active', 'PROCHOT', 'TDC limit', 'PPT Limit', 'OPN Max', 'Reliability Limit', 'APML Agent', 'HSMP Agent'] # Variable ctypes.POINTER(ctypes.c_char) * 8
 uint64_t = ctypes.c_uint64
-amdsmi_init = _libraries['libamd_smi.so'].amdsmi_init
-amdsmi_init.restype = amdsmi_status_t
-amdsmi_init.argtypes = [uint64_t]
-amdsmi_shut_down = _libraries['libamd_smi.so'].amdsmi_shut_down
-amdsmi_shut_down.restype = amdsmi_status_t
-amdsmi_shut_down.argtypes = []
-amdsmi_get_socket_handles = _libraries['libamd_smi.so'].amdsmi_get_socket_handles
-amdsmi_get_socket_handles.restype = amdsmi_status_t
-amdsmi_get_socket_handles.argtypes = [ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.POINTER(None))]
-amdsmi_get_cpu_handles = _libraries['libamd_smi.so'].amdsmi_get_cpu_handles
-amdsmi_get_cpu_handles.restype = amdsmi_status_t
-amdsmi_get_cpu_handles.argtypes = [ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.POINTER(None))]
 size_t = ctypes.c_uint64
-amdsmi_get_socket_info = _libraries['libamd_smi.so'].amdsmi_get_socket_info
-amdsmi_get_socket_info.restype = amdsmi_status_t
-amdsmi_get_socket_info.argtypes = [amdsmi_socket_handle, size_t, ctypes.POINTER(ctypes.c_char)]
-amdsmi_get_processor_info = _libraries['libamd_smi.so'].amdsmi_get_processor_info
-amdsmi_get_processor_info.restype = amdsmi_status_t
-amdsmi_get_processor_info.argtypes = [amdsmi_processor_handle, size_t, ctypes.POINTER(ctypes.c_char)]
-amdsmi_get_processor_count_from_handles = _libraries['libamd_smi.so'].amdsmi_get_processor_count_from_handles
-amdsmi_get_processor_count_from_handles.restype = amdsmi_status_t
-amdsmi_get_processor_count_from_handles.argtypes = [ctypes.POINTER(ctypes.POINTER(None)), ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_processor_handles_by_type = _libraries['libamd_smi.so'].amdsmi_get_processor_handles_by_type
-amdsmi_get_processor_handles_by_type.restype = amdsmi_status_t
-amdsmi_get_processor_handles_by_type.argtypes = [amdsmi_socket_handle, processor_type_t, ctypes.POINTER(ctypes.POINTER(None)), ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_processor_handles = _libraries['libamd_smi.so'].amdsmi_get_processor_handles
-amdsmi_get_processor_handles.restype = amdsmi_status_t
-amdsmi_get_processor_handles.argtypes = [amdsmi_socket_handle, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.POINTER(None))]
-amdsmi_get_cpucore_handles = _libraries['libamd_smi.so'].amdsmi_get_cpucore_handles
-amdsmi_get_cpucore_handles.restype = amdsmi_status_t
-amdsmi_get_cpucore_handles.argtypes = [ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.POINTER(None))]
-amdsmi_get_processor_type = _libraries['libamd_smi.so'].amdsmi_get_processor_type
-amdsmi_get_processor_type.restype = amdsmi_status_t
-amdsmi_get_processor_type.argtypes = [amdsmi_processor_handle, ctypes.POINTER(processor_type_t)]
-amdsmi_get_processor_handle_from_bdf = _libraries['libamd_smi.so'].amdsmi_get_processor_handle_from_bdf
-amdsmi_get_processor_handle_from_bdf.restype = amdsmi_status_t
-amdsmi_get_processor_handle_from_bdf.argtypes = [amdsmi_bdf_t, ctypes.POINTER(ctypes.POINTER(None))]
-amdsmi_get_gpu_id = _libraries['libamd_smi.so'].amdsmi_get_gpu_id
-amdsmi_get_gpu_id.restype = amdsmi_status_t
-amdsmi_get_gpu_id.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint16)]
-amdsmi_get_gpu_revision = _libraries['libamd_smi.so'].amdsmi_get_gpu_revision
-amdsmi_get_gpu_revision.restype = amdsmi_status_t
-amdsmi_get_gpu_revision.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint16)]
-amdsmi_get_gpu_vendor_name = _libraries['libamd_smi.so'].amdsmi_get_gpu_vendor_name
-amdsmi_get_gpu_vendor_name.restype = amdsmi_status_t
-amdsmi_get_gpu_vendor_name.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_char), size_t]
 uint32_t = ctypes.c_uint32
-amdsmi_get_gpu_vram_vendor = _libraries['libamd_smi.so'].amdsmi_get_gpu_vram_vendor
-amdsmi_get_gpu_vram_vendor.restype = amdsmi_status_t
-amdsmi_get_gpu_vram_vendor.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_char), uint32_t]
-amdsmi_get_gpu_subsystem_id = _libraries['libamd_smi.so'].amdsmi_get_gpu_subsystem_id
-amdsmi_get_gpu_subsystem_id.restype = amdsmi_status_t
-amdsmi_get_gpu_subsystem_id.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint16)]
-amdsmi_get_gpu_subsystem_name = _libraries['libamd_smi.so'].amdsmi_get_gpu_subsystem_name
-amdsmi_get_gpu_subsystem_name.restype = amdsmi_status_t
-amdsmi_get_gpu_subsystem_name.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_char), size_t]
-amdsmi_get_gpu_pci_bandwidth = _libraries['libamd_smi.so'].amdsmi_get_gpu_pci_bandwidth
-amdsmi_get_gpu_pci_bandwidth.restype = amdsmi_status_t
-amdsmi_get_gpu_pci_bandwidth.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_pcie_bandwidth_t)]
-amdsmi_get_gpu_bdf_id = _libraries['libamd_smi.so'].amdsmi_get_gpu_bdf_id
-amdsmi_get_gpu_bdf_id.restype = amdsmi_status_t
-amdsmi_get_gpu_bdf_id.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint64)]
-amdsmi_get_gpu_topo_numa_affinity = _libraries['libamd_smi.so'].amdsmi_get_gpu_topo_numa_affinity
-amdsmi_get_gpu_topo_numa_affinity.restype = amdsmi_status_t
-amdsmi_get_gpu_topo_numa_affinity.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_int32)]
-amdsmi_get_gpu_pci_throughput = _libraries['libamd_smi.so'].amdsmi_get_gpu_pci_throughput
-amdsmi_get_gpu_pci_throughput.restype = amdsmi_status_t
-amdsmi_get_gpu_pci_throughput.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint64), ctypes.POINTER(ctypes.c_uint64), ctypes.POINTER(ctypes.c_uint64)]
-amdsmi_get_gpu_pci_replay_counter = _libraries['libamd_smi.so'].amdsmi_get_gpu_pci_replay_counter
-amdsmi_get_gpu_pci_replay_counter.restype = amdsmi_status_t
-amdsmi_get_gpu_pci_replay_counter.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint64)]
-amdsmi_set_gpu_pci_bandwidth = _libraries['libamd_smi.so'].amdsmi_set_gpu_pci_bandwidth
-amdsmi_set_gpu_pci_bandwidth.restype = amdsmi_status_t
-amdsmi_set_gpu_pci_bandwidth.argtypes = [amdsmi_processor_handle, uint64_t]
-amdsmi_get_energy_count = _libraries['libamd_smi.so'].amdsmi_get_energy_count
-amdsmi_get_energy_count.restype = amdsmi_status_t
-amdsmi_get_energy_count.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint64), ctypes.POINTER(ctypes.c_float), ctypes.POINTER(ctypes.c_uint64)]
-amdsmi_set_power_cap = _libraries['libamd_smi.so'].amdsmi_set_power_cap
-amdsmi_set_power_cap.restype = amdsmi_status_t
-amdsmi_set_power_cap.argtypes = [amdsmi_processor_handle, uint32_t, uint64_t]
-amdsmi_set_gpu_power_profile = _libraries['libamd_smi.so'].amdsmi_set_gpu_power_profile
-amdsmi_set_gpu_power_profile.restype = amdsmi_status_t
-amdsmi_set_gpu_power_profile.argtypes = [amdsmi_processor_handle, uint32_t, amdsmi_power_profile_preset_masks_t]
-amdsmi_get_gpu_memory_total = _libraries['libamd_smi.so'].amdsmi_get_gpu_memory_total
-amdsmi_get_gpu_memory_total.restype = amdsmi_status_t
-amdsmi_get_gpu_memory_total.argtypes = [amdsmi_processor_handle, amdsmi_memory_type_t, ctypes.POINTER(ctypes.c_uint64)]
-amdsmi_get_gpu_memory_usage = _libraries['libamd_smi.so'].amdsmi_get_gpu_memory_usage
-amdsmi_get_gpu_memory_usage.restype = amdsmi_status_t
-amdsmi_get_gpu_memory_usage.argtypes = [amdsmi_processor_handle, amdsmi_memory_type_t, ctypes.POINTER(ctypes.c_uint64)]
-amdsmi_get_gpu_bad_page_info = _libraries['libamd_smi.so'].amdsmi_get_gpu_bad_page_info
-amdsmi_get_gpu_bad_page_info.restype = amdsmi_status_t
-amdsmi_get_gpu_bad_page_info.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(struct_amdsmi_retired_page_record_t)]
-amdsmi_get_gpu_ras_feature_info = _libraries['libamd_smi.so'].amdsmi_get_gpu_ras_feature_info
-amdsmi_get_gpu_ras_feature_info.restype = amdsmi_status_t
-amdsmi_get_gpu_ras_feature_info.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_ras_feature_t)]
-amdsmi_get_gpu_ras_block_features_enabled = _libraries['libamd_smi.so'].amdsmi_get_gpu_ras_block_features_enabled
-amdsmi_get_gpu_ras_block_features_enabled.restype = amdsmi_status_t
-amdsmi_get_gpu_ras_block_features_enabled.argtypes = [amdsmi_processor_handle, amdsmi_gpu_block_t, ctypes.POINTER(amdsmi_ras_err_state_t)]
-amdsmi_get_gpu_memory_reserved_pages = _libraries['libamd_smi.so'].amdsmi_get_gpu_memory_reserved_pages
-amdsmi_get_gpu_memory_reserved_pages.restype = amdsmi_status_t
-amdsmi_get_gpu_memory_reserved_pages.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(struct_amdsmi_retired_page_record_t)]
-amdsmi_get_gpu_fan_rpms = _libraries['libamd_smi.so'].amdsmi_get_gpu_fan_rpms
-amdsmi_get_gpu_fan_rpms.restype = amdsmi_status_t
-amdsmi_get_gpu_fan_rpms.argtypes = [amdsmi_processor_handle, uint32_t, ctypes.POINTER(ctypes.c_int64)]
-amdsmi_get_gpu_fan_speed = _libraries['libamd_smi.so'].amdsmi_get_gpu_fan_speed
-amdsmi_get_gpu_fan_speed.restype = amdsmi_status_t
-amdsmi_get_gpu_fan_speed.argtypes = [amdsmi_processor_handle, uint32_t, ctypes.POINTER(ctypes.c_int64)]
-amdsmi_get_gpu_fan_speed_max = _libraries['libamd_smi.so'].amdsmi_get_gpu_fan_speed_max
-amdsmi_get_gpu_fan_speed_max.restype = amdsmi_status_t
-amdsmi_get_gpu_fan_speed_max.argtypes = [amdsmi_processor_handle, uint32_t, ctypes.POINTER(ctypes.c_uint64)]
-amdsmi_get_temp_metric = _libraries['libamd_smi.so'].amdsmi_get_temp_metric
-amdsmi_get_temp_metric.restype = amdsmi_status_t
-amdsmi_get_temp_metric.argtypes = [amdsmi_processor_handle, amdsmi_temperature_type_t, amdsmi_temperature_metric_t, ctypes.POINTER(ctypes.c_int64)]
-amdsmi_get_gpu_cache_info = _libraries['libamd_smi.so'].amdsmi_get_gpu_cache_info
-amdsmi_get_gpu_cache_info.restype = amdsmi_status_t
-amdsmi_get_gpu_cache_info.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_gpu_cache_info_t)]
-amdsmi_get_gpu_volt_metric = _libraries['libamd_smi.so'].amdsmi_get_gpu_volt_metric
-amdsmi_get_gpu_volt_metric.restype = amdsmi_status_t
-amdsmi_get_gpu_volt_metric.argtypes = [amdsmi_processor_handle, amdsmi_voltage_type_t, amdsmi_voltage_metric_t, ctypes.POINTER(ctypes.c_int64)]
-amdsmi_reset_gpu_fan = _libraries['libamd_smi.so'].amdsmi_reset_gpu_fan
-amdsmi_reset_gpu_fan.restype = amdsmi_status_t
-amdsmi_reset_gpu_fan.argtypes = [amdsmi_processor_handle, uint32_t]
-amdsmi_set_gpu_fan_speed = _libraries['libamd_smi.so'].amdsmi_set_gpu_fan_speed
-amdsmi_set_gpu_fan_speed.restype = amdsmi_status_t
-amdsmi_set_gpu_fan_speed.argtypes = [amdsmi_processor_handle, uint32_t, uint64_t]
-amdsmi_get_utilization_count = _libraries['libamd_smi.so'].amdsmi_get_utilization_count
-amdsmi_get_utilization_count.restype = amdsmi_status_t
-amdsmi_get_utilization_count.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_utilization_counter_t), uint32_t, ctypes.POINTER(ctypes.c_uint64)]
-amdsmi_get_gpu_perf_level = _libraries['libamd_smi.so'].amdsmi_get_gpu_perf_level
-amdsmi_get_gpu_perf_level.restype = amdsmi_status_t
-amdsmi_get_gpu_perf_level.argtypes = [amdsmi_processor_handle, ctypes.POINTER(amdsmi_dev_perf_level_t)]
-amdsmi_set_gpu_perf_determinism_mode = _libraries['libamd_smi.so'].amdsmi_set_gpu_perf_determinism_mode
-amdsmi_set_gpu_perf_determinism_mode.restype = amdsmi_status_t
-amdsmi_set_gpu_perf_determinism_mode.argtypes = [amdsmi_processor_handle, uint64_t]
-amdsmi_get_gpu_overdrive_level = _libraries['libamd_smi.so'].amdsmi_get_gpu_overdrive_level
-amdsmi_get_gpu_overdrive_level.restype = amdsmi_status_t
-amdsmi_get_gpu_overdrive_level.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_gpu_mem_overdrive_level = _libraries['libamd_smi.so'].amdsmi_get_gpu_mem_overdrive_level
-amdsmi_get_gpu_mem_overdrive_level.restype = amdsmi_status_t
-amdsmi_get_gpu_mem_overdrive_level.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_clk_freq = _libraries['libamd_smi.so'].amdsmi_get_clk_freq
-amdsmi_get_clk_freq.restype = amdsmi_status_t
-amdsmi_get_clk_freq.argtypes = [amdsmi_processor_handle, amdsmi_clk_type_t, ctypes.POINTER(struct_amdsmi_frequencies_t)]
-amdsmi_reset_gpu = _libraries['libamd_smi.so'].amdsmi_reset_gpu
-amdsmi_reset_gpu.restype = amdsmi_status_t
-amdsmi_reset_gpu.argtypes = [amdsmi_processor_handle]
-amdsmi_get_gpu_od_volt_info = _libraries['libamd_smi.so'].amdsmi_get_gpu_od_volt_info
-amdsmi_get_gpu_od_volt_info.restype = amdsmi_status_t
-amdsmi_get_gpu_od_volt_info.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_od_volt_freq_data_t)]
-amdsmi_get_gpu_metrics_header_info = _libraries['libamd_smi.so'].amdsmi_get_gpu_metrics_header_info
-amdsmi_get_gpu_metrics_header_info.restype = amdsmi_status_t
-amdsmi_get_gpu_metrics_header_info.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amd_metrics_table_header_t)]
-amdsmi_get_gpu_metrics_info = _libraries['libamd_smi.so'].amdsmi_get_gpu_metrics_info
-amdsmi_get_gpu_metrics_info.restype = amdsmi_status_t
-amdsmi_get_gpu_metrics_info.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_gpu_metrics_t)]
-amdsmi_get_gpu_pm_metrics_info = _libraries['libamd_smi.so'].amdsmi_get_gpu_pm_metrics_info
-amdsmi_get_gpu_pm_metrics_info.restype = amdsmi_status_t
-amdsmi_get_gpu_pm_metrics_info.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.POINTER(struct_amdsmi_name_value_t)), ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_gpu_reg_table_info = _libraries['libamd_smi.so'].amdsmi_get_gpu_reg_table_info
-amdsmi_get_gpu_reg_table_info.restype = amdsmi_status_t
-amdsmi_get_gpu_reg_table_info.argtypes = [amdsmi_processor_handle, amdsmi_reg_type_t, ctypes.POINTER(ctypes.POINTER(struct_amdsmi_name_value_t)), ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_set_gpu_clk_range = _libraries['libamd_smi.so'].amdsmi_set_gpu_clk_range
-amdsmi_set_gpu_clk_range.restype = amdsmi_status_t
-amdsmi_set_gpu_clk_range.argtypes = [amdsmi_processor_handle, uint64_t, uint64_t, amdsmi_clk_type_t]
-amdsmi_set_gpu_clk_limit = _libraries['libamd_smi.so'].amdsmi_set_gpu_clk_limit
-amdsmi_set_gpu_clk_limit.restype = amdsmi_status_t
-amdsmi_set_gpu_clk_limit.argtypes = [amdsmi_processor_handle, amdsmi_clk_type_t, amdsmi_clk_limit_type_t, uint64_t]
-amdsmi_free_name_value_pairs = _libraries['libamd_smi.so'].amdsmi_free_name_value_pairs
-amdsmi_free_name_value_pairs.restype = None
-amdsmi_free_name_value_pairs.argtypes = [ctypes.POINTER(None)]
-amdsmi_set_gpu_od_clk_info = _libraries['libamd_smi.so'].amdsmi_set_gpu_od_clk_info
-amdsmi_set_gpu_od_clk_info.restype = amdsmi_status_t
-amdsmi_set_gpu_od_clk_info.argtypes = [amdsmi_processor_handle, amdsmi_freq_ind_t, uint64_t, amdsmi_clk_type_t]
-amdsmi_set_gpu_od_volt_info = _libraries['libamd_smi.so'].amdsmi_set_gpu_od_volt_info
-amdsmi_set_gpu_od_volt_info.restype = amdsmi_status_t
-amdsmi_set_gpu_od_volt_info.argtypes = [amdsmi_processor_handle, uint32_t, uint64_t, uint64_t]
-amdsmi_get_gpu_od_volt_curve_regions = _libraries['libamd_smi.so'].amdsmi_get_gpu_od_volt_curve_regions
-amdsmi_get_gpu_od_volt_curve_regions.restype = amdsmi_status_t
-amdsmi_get_gpu_od_volt_curve_regions.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(struct_amdsmi_freq_volt_region_t)]
-amdsmi_get_gpu_power_profile_presets = _libraries['libamd_smi.so'].amdsmi_get_gpu_power_profile_presets
-amdsmi_get_gpu_power_profile_presets.restype = amdsmi_status_t
-amdsmi_get_gpu_power_profile_presets.argtypes = [amdsmi_processor_handle, uint32_t, ctypes.POINTER(struct_amdsmi_power_profile_status_t)]
-amdsmi_set_gpu_perf_level = _libraries['libamd_smi.so'].amdsmi_set_gpu_perf_level
-amdsmi_set_gpu_perf_level.restype = amdsmi_status_t
-amdsmi_set_gpu_perf_level.argtypes = [amdsmi_processor_handle, amdsmi_dev_perf_level_t]
-amdsmi_set_gpu_overdrive_level = _libraries['libamd_smi.so'].amdsmi_set_gpu_overdrive_level
-amdsmi_set_gpu_overdrive_level.restype = amdsmi_status_t
-amdsmi_set_gpu_overdrive_level.argtypes = [amdsmi_processor_handle, uint32_t]
-amdsmi_set_clk_freq = _libraries['libamd_smi.so'].amdsmi_set_clk_freq
-amdsmi_set_clk_freq.restype = amdsmi_status_t
-amdsmi_set_clk_freq.argtypes = [amdsmi_processor_handle, amdsmi_clk_type_t, uint64_t]
-amdsmi_get_soc_pstate = _libraries['libamd_smi.so'].amdsmi_get_soc_pstate
-amdsmi_get_soc_pstate.restype = amdsmi_status_t
-amdsmi_get_soc_pstate.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_dpm_policy_t)]
-amdsmi_set_soc_pstate = _libraries['libamd_smi.so'].amdsmi_set_soc_pstate
-amdsmi_set_soc_pstate.restype = amdsmi_status_t
-amdsmi_set_soc_pstate.argtypes = [amdsmi_processor_handle, uint32_t]
-amdsmi_get_xgmi_plpd = _libraries['libamd_smi.so'].amdsmi_get_xgmi_plpd
-amdsmi_get_xgmi_plpd.restype = amdsmi_status_t
-amdsmi_get_xgmi_plpd.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_dpm_policy_t)]
-amdsmi_set_xgmi_plpd = _libraries['libamd_smi.so'].amdsmi_set_xgmi_plpd
-amdsmi_set_xgmi_plpd.restype = amdsmi_status_t
-amdsmi_set_xgmi_plpd.argtypes = [amdsmi_processor_handle, uint32_t]
-amdsmi_get_gpu_process_isolation = _libraries['libamd_smi.so'].amdsmi_get_gpu_process_isolation
-amdsmi_get_gpu_process_isolation.restype = amdsmi_status_t
-amdsmi_get_gpu_process_isolation.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_set_gpu_process_isolation = _libraries['libamd_smi.so'].amdsmi_set_gpu_process_isolation
-amdsmi_set_gpu_process_isolation.restype = amdsmi_status_t
-amdsmi_set_gpu_process_isolation.argtypes = [amdsmi_processor_handle, uint32_t]
-amdsmi_clean_gpu_local_data = _libraries['libamd_smi.so'].amdsmi_clean_gpu_local_data
-amdsmi_clean_gpu_local_data.restype = amdsmi_status_t
-amdsmi_clean_gpu_local_data.argtypes = [amdsmi_processor_handle]
-amdsmi_get_lib_version = _libraries['libamd_smi.so'].amdsmi_get_lib_version
-amdsmi_get_lib_version.restype = amdsmi_status_t
-amdsmi_get_lib_version.argtypes = [ctypes.POINTER(struct_amdsmi_version_t)]
-amdsmi_get_gpu_ecc_count = _libraries['libamd_smi.so'].amdsmi_get_gpu_ecc_count
-amdsmi_get_gpu_ecc_count.restype = amdsmi_status_t
-amdsmi_get_gpu_ecc_count.argtypes = [amdsmi_processor_handle, amdsmi_gpu_block_t, ctypes.POINTER(struct_amdsmi_error_count_t)]
-amdsmi_get_gpu_ecc_enabled = _libraries['libamd_smi.so'].amdsmi_get_gpu_ecc_enabled
-amdsmi_get_gpu_ecc_enabled.restype = amdsmi_status_t
-amdsmi_get_gpu_ecc_enabled.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint64)]
-amdsmi_get_gpu_ecc_status = _libraries['libamd_smi.so'].amdsmi_get_gpu_ecc_status
-amdsmi_get_gpu_ecc_status.restype = amdsmi_status_t
-amdsmi_get_gpu_ecc_status.argtypes = [amdsmi_processor_handle, amdsmi_gpu_block_t, ctypes.POINTER(amdsmi_ras_err_state_t)]
-amdsmi_status_code_to_string = _libraries['libamd_smi.so'].amdsmi_status_code_to_string
-amdsmi_status_code_to_string.restype = amdsmi_status_t
-amdsmi_status_code_to_string.argtypes = [amdsmi_status_t, ctypes.POINTER(ctypes.POINTER(ctypes.c_char))]
-amdsmi_gpu_counter_group_supported = _libraries['libamd_smi.so'].amdsmi_gpu_counter_group_supported
-amdsmi_gpu_counter_group_supported.restype = amdsmi_status_t
-amdsmi_gpu_counter_group_supported.argtypes = [amdsmi_processor_handle, amdsmi_event_group_t]
-amdsmi_gpu_create_counter = _libraries['libamd_smi.so'].amdsmi_gpu_create_counter
-amdsmi_gpu_create_counter.restype = amdsmi_status_t
-amdsmi_gpu_create_counter.argtypes = [amdsmi_processor_handle, amdsmi_event_type_t, ctypes.POINTER(ctypes.c_uint64)]
-amdsmi_gpu_destroy_counter = _libraries['libamd_smi.so'].amdsmi_gpu_destroy_counter
-amdsmi_gpu_destroy_counter.restype = amdsmi_status_t
-amdsmi_gpu_destroy_counter.argtypes = [amdsmi_event_handle_t]
-amdsmi_gpu_control_counter = _libraries['libamd_smi.so'].amdsmi_gpu_control_counter
-amdsmi_gpu_control_counter.restype = amdsmi_status_t
-amdsmi_gpu_control_counter.argtypes = [amdsmi_event_handle_t, amdsmi_counter_command_t, ctypes.POINTER(None)]
-amdsmi_gpu_read_counter = _libraries['libamd_smi.so'].amdsmi_gpu_read_counter
-amdsmi_gpu_read_counter.restype = amdsmi_status_t
-amdsmi_gpu_read_counter.argtypes = [amdsmi_event_handle_t, ctypes.POINTER(struct_amdsmi_counter_value_t)]
-amdsmi_get_gpu_available_counters = _libraries['libamd_smi.so'].amdsmi_get_gpu_available_counters
-amdsmi_get_gpu_available_counters.restype = amdsmi_status_t
-amdsmi_get_gpu_available_counters.argtypes = [amdsmi_processor_handle, amdsmi_event_group_t, ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_gpu_compute_process_info = _libraries['libamd_smi.so'].amdsmi_get_gpu_compute_process_info
-amdsmi_get_gpu_compute_process_info.restype = amdsmi_status_t
-amdsmi_get_gpu_compute_process_info.argtypes = [ctypes.POINTER(struct_amdsmi_process_info_t), ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_gpu_compute_process_info_by_pid = _libraries['libamd_smi.so'].amdsmi_get_gpu_compute_process_info_by_pid
-amdsmi_get_gpu_compute_process_info_by_pid.restype = amdsmi_status_t
-amdsmi_get_gpu_compute_process_info_by_pid.argtypes = [uint32_t, ctypes.POINTER(struct_amdsmi_process_info_t)]
-amdsmi_get_gpu_compute_process_gpus = _libraries['libamd_smi.so'].amdsmi_get_gpu_compute_process_gpus
-amdsmi_get_gpu_compute_process_gpus.restype = amdsmi_status_t
-amdsmi_get_gpu_compute_process_gpus.argtypes = [uint32_t, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_gpu_xgmi_error_status = _libraries['libamd_smi.so'].amdsmi_gpu_xgmi_error_status
-amdsmi_gpu_xgmi_error_status.restype = amdsmi_status_t
-amdsmi_gpu_xgmi_error_status.argtypes = [amdsmi_processor_handle, ctypes.POINTER(amdsmi_xgmi_status_t)]
-amdsmi_reset_gpu_xgmi_error = _libraries['libamd_smi.so'].amdsmi_reset_gpu_xgmi_error
-amdsmi_reset_gpu_xgmi_error.restype = amdsmi_status_t
-amdsmi_reset_gpu_xgmi_error.argtypes = [amdsmi_processor_handle]
-amdsmi_get_link_metrics = _libraries['libamd_smi.so'].amdsmi_get_link_metrics
-amdsmi_get_link_metrics.restype = amdsmi_status_t
-amdsmi_get_link_metrics.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_link_metrics_t)]
-amdsmi_topo_get_numa_node_number = _libraries['libamd_smi.so'].amdsmi_topo_get_numa_node_number
-amdsmi_topo_get_numa_node_number.restype = amdsmi_status_t
-amdsmi_topo_get_numa_node_number.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_topo_get_link_weight = _libraries['libamd_smi.so'].amdsmi_topo_get_link_weight
-amdsmi_topo_get_link_weight.restype = amdsmi_status_t
-amdsmi_topo_get_link_weight.argtypes = [amdsmi_processor_handle, amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint64)]
-amdsmi_get_minmax_bandwidth_between_processors = _libraries['libamd_smi.so'].amdsmi_get_minmax_bandwidth_between_processors
-amdsmi_get_minmax_bandwidth_between_processors.restype = amdsmi_status_t
-amdsmi_get_minmax_bandwidth_between_processors.argtypes = [amdsmi_processor_handle, amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint64), ctypes.POINTER(ctypes.c_uint64)]
-amdsmi_topo_get_link_type = _libraries['libamd_smi.so'].amdsmi_topo_get_link_type
-amdsmi_topo_get_link_type.restype = amdsmi_status_t
-amdsmi_topo_get_link_type.argtypes = [amdsmi_processor_handle, amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint64), ctypes.POINTER(amdsmi_io_link_type_t)]
-amdsmi_is_P2P_accessible = _libraries['libamd_smi.so'].amdsmi_is_P2P_accessible
-amdsmi_is_P2P_accessible.restype = amdsmi_status_t
-amdsmi_is_P2P_accessible.argtypes = [amdsmi_processor_handle, amdsmi_processor_handle, ctypes.POINTER(ctypes.c_bool)]
-amdsmi_topo_get_p2p_status = _libraries['libamd_smi.so'].amdsmi_topo_get_p2p_status
-amdsmi_topo_get_p2p_status.restype = amdsmi_status_t
-amdsmi_topo_get_p2p_status.argtypes = [amdsmi_processor_handle, amdsmi_processor_handle, ctypes.POINTER(amdsmi_io_link_type_t), ctypes.POINTER(struct_amdsmi_p2p_capability_t)]
-amdsmi_get_gpu_compute_partition = _libraries['libamd_smi.so'].amdsmi_get_gpu_compute_partition
-amdsmi_get_gpu_compute_partition.restype = amdsmi_status_t
-amdsmi_get_gpu_compute_partition.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_char), uint32_t]
-amdsmi_set_gpu_compute_partition = _libraries['libamd_smi.so'].amdsmi_set_gpu_compute_partition
-amdsmi_set_gpu_compute_partition.restype = amdsmi_status_t
-amdsmi_set_gpu_compute_partition.argtypes = [amdsmi_processor_handle, amdsmi_compute_partition_type_t]
-amdsmi_get_gpu_memory_partition = _libraries['libamd_smi.so'].amdsmi_get_gpu_memory_partition
-amdsmi_get_gpu_memory_partition.restype = amdsmi_status_t
-amdsmi_get_gpu_memory_partition.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_char), uint32_t]
-amdsmi_set_gpu_memory_partition = _libraries['libamd_smi.so'].amdsmi_set_gpu_memory_partition
-amdsmi_set_gpu_memory_partition.restype = amdsmi_status_t
-amdsmi_set_gpu_memory_partition.argtypes = [amdsmi_processor_handle, amdsmi_memory_partition_type_t]
-amdsmi_get_gpu_accelerator_partition_profile = _libraries['libamd_smi.so'].amdsmi_get_gpu_accelerator_partition_profile
-amdsmi_get_gpu_accelerator_partition_profile.restype = amdsmi_status_t
-amdsmi_get_gpu_accelerator_partition_profile.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_accelerator_partition_profile_t), ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_init_gpu_event_notification = _libraries['libamd_smi.so'].amdsmi_init_gpu_event_notification
-amdsmi_init_gpu_event_notification.restype = amdsmi_status_t
-amdsmi_init_gpu_event_notification.argtypes = [amdsmi_processor_handle]
-amdsmi_set_gpu_event_notification_mask = _libraries['libamd_smi.so'].amdsmi_set_gpu_event_notification_mask
-amdsmi_set_gpu_event_notification_mask.restype = amdsmi_status_t
-amdsmi_set_gpu_event_notification_mask.argtypes = [amdsmi_processor_handle, uint64_t]
-amdsmi_get_gpu_event_notification = _libraries['libamd_smi.so'].amdsmi_get_gpu_event_notification
-amdsmi_get_gpu_event_notification.restype = amdsmi_status_t
-amdsmi_get_gpu_event_notification.argtypes = [ctypes.c_int32, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(struct_amdsmi_evt_notification_data_t)]
-amdsmi_stop_gpu_event_notification = _libraries['libamd_smi.so'].amdsmi_stop_gpu_event_notification
-amdsmi_stop_gpu_event_notification.restype = amdsmi_status_t
-amdsmi_stop_gpu_event_notification.argtypes = [amdsmi_processor_handle]
-amdsmi_get_gpu_device_bdf = _libraries['libamd_smi.so'].amdsmi_get_gpu_device_bdf
-amdsmi_get_gpu_device_bdf.restype = amdsmi_status_t
-amdsmi_get_gpu_device_bdf.argtypes = [amdsmi_processor_handle, ctypes.POINTER(union_amdsmi_bdf_t)]
-amdsmi_get_gpu_device_uuid = _libraries['libamd_smi.so'].amdsmi_get_gpu_device_uuid
-amdsmi_get_gpu_device_uuid.restype = amdsmi_status_t
-amdsmi_get_gpu_device_uuid.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_char)]
-amdsmi_get_gpu_driver_info = _libraries['libamd_smi.so'].amdsmi_get_gpu_driver_info
-amdsmi_get_gpu_driver_info.restype = amdsmi_status_t
-amdsmi_get_gpu_driver_info.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_driver_info_t)]
-amdsmi_get_gpu_asic_info = _libraries['libamd_smi.so'].amdsmi_get_gpu_asic_info
-amdsmi_get_gpu_asic_info.restype = amdsmi_status_t
-amdsmi_get_gpu_asic_info.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_asic_info_t)]
-amdsmi_get_gpu_kfd_info = _libraries['libamd_smi.so'].amdsmi_get_gpu_kfd_info
-amdsmi_get_gpu_kfd_info.restype = amdsmi_status_t
-amdsmi_get_gpu_kfd_info.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_kfd_info_t)]
-amdsmi_get_gpu_vram_info = _libraries['libamd_smi.so'].amdsmi_get_gpu_vram_info
-amdsmi_get_gpu_vram_info.restype = amdsmi_status_t
-amdsmi_get_gpu_vram_info.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_vram_info_t)]
-amdsmi_get_gpu_board_info = _libraries['libamd_smi.so'].amdsmi_get_gpu_board_info
-amdsmi_get_gpu_board_info.restype = amdsmi_status_t
-amdsmi_get_gpu_board_info.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_board_info_t)]
-amdsmi_get_power_cap_info = _libraries['libamd_smi.so'].amdsmi_get_power_cap_info
-amdsmi_get_power_cap_info.restype = amdsmi_status_t
-amdsmi_get_power_cap_info.argtypes = [amdsmi_processor_handle, uint32_t, ctypes.POINTER(struct_amdsmi_power_cap_info_t)]
-amdsmi_get_pcie_info = _libraries['libamd_smi.so'].amdsmi_get_pcie_info
-amdsmi_get_pcie_info.restype = amdsmi_status_t
-amdsmi_get_pcie_info.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_pcie_info_t)]
-amdsmi_get_xgmi_info = _libraries['libamd_smi.so'].amdsmi_get_xgmi_info
-amdsmi_get_xgmi_info.restype = amdsmi_status_t
-amdsmi_get_xgmi_info.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_xgmi_info_t)]
-amdsmi_get_fw_info = _libraries['libamd_smi.so'].amdsmi_get_fw_info
-amdsmi_get_fw_info.restype = amdsmi_status_t
-amdsmi_get_fw_info.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_fw_info_t)]
-amdsmi_get_gpu_vbios_info = _libraries['libamd_smi.so'].amdsmi_get_gpu_vbios_info
-amdsmi_get_gpu_vbios_info.restype = amdsmi_status_t
-amdsmi_get_gpu_vbios_info.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_vbios_info_t)]
-amdsmi_get_gpu_activity = _libraries['libamd_smi.so'].amdsmi_get_gpu_activity
-amdsmi_get_gpu_activity.restype = amdsmi_status_t
-amdsmi_get_gpu_activity.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_engine_usage_t)]
-amdsmi_get_power_info = _libraries['libamd_smi.so'].amdsmi_get_power_info
-amdsmi_get_power_info.restype = amdsmi_status_t
-amdsmi_get_power_info.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_power_info_t)]
-amdsmi_is_gpu_power_management_enabled = _libraries['libamd_smi.so'].amdsmi_is_gpu_power_management_enabled
-amdsmi_is_gpu_power_management_enabled.restype = amdsmi_status_t
-amdsmi_is_gpu_power_management_enabled.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_bool)]
-amdsmi_get_clock_info = _libraries['libamd_smi.so'].amdsmi_get_clock_info
-amdsmi_get_clock_info.restype = amdsmi_status_t
-amdsmi_get_clock_info.argtypes = [amdsmi_processor_handle, amdsmi_clk_type_t, ctypes.POINTER(struct_amdsmi_clk_info_t)]
-amdsmi_get_gpu_vram_usage = _libraries['libamd_smi.so'].amdsmi_get_gpu_vram_usage
-amdsmi_get_gpu_vram_usage.restype = amdsmi_status_t
-amdsmi_get_gpu_vram_usage.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_vram_usage_t)]
-amdsmi_get_violation_status = _libraries['libamd_smi.so'].amdsmi_get_violation_status
-amdsmi_get_violation_status.restype = amdsmi_status_t
-amdsmi_get_violation_status.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_violation_status_t)]
-amdsmi_get_gpu_process_list = _libraries['libamd_smi.so'].amdsmi_get_gpu_process_list
-amdsmi_get_gpu_process_list.restype = amdsmi_status_t
-amdsmi_get_gpu_process_list.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(struct_amdsmi_proc_info_t)]
-amdsmi_get_gpu_total_ecc_count = _libraries['libamd_smi.so'].amdsmi_get_gpu_total_ecc_count
-amdsmi_get_gpu_total_ecc_count.restype = amdsmi_status_t
-amdsmi_get_gpu_total_ecc_count.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_error_count_t)]
-amdsmi_get_link_topology_nearest = _libraries['libamd_smi.so'].amdsmi_get_link_topology_nearest
-amdsmi_get_link_topology_nearest.restype = amdsmi_status_t
-amdsmi_get_link_topology_nearest.argtypes = [amdsmi_processor_handle, amdsmi_link_type_t, ctypes.POINTER(struct_amdsmi_topology_nearest_t)]
-amdsmi_get_cpu_core_energy = _libraries['libamd_smi.so'].amdsmi_get_cpu_core_energy
-amdsmi_get_cpu_core_energy.restype = amdsmi_status_t
-amdsmi_get_cpu_core_energy.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint64)]
-amdsmi_get_cpu_socket_energy = _libraries['libamd_smi.so'].amdsmi_get_cpu_socket_energy
-amdsmi_get_cpu_socket_energy.restype = amdsmi_status_t
-amdsmi_get_cpu_socket_energy.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint64)]
-amdsmi_get_threads_per_core = _libraries['libamd_smi.so'].amdsmi_get_threads_per_core
-amdsmi_get_threads_per_core.restype = amdsmi_status_t
-amdsmi_get_threads_per_core.argtypes = [ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_cpu_smu_fw_version = _libraries['libamd_smi.so'].amdsmi_get_cpu_smu_fw_version
-amdsmi_get_cpu_smu_fw_version.restype = amdsmi_status_t
-amdsmi_get_cpu_smu_fw_version.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_smu_fw_version_t)]
-amdsmi_get_cpu_hsmp_proto_ver = _libraries['libamd_smi.so'].amdsmi_get_cpu_hsmp_proto_ver
-amdsmi_get_cpu_hsmp_proto_ver.restype = amdsmi_status_t
-amdsmi_get_cpu_hsmp_proto_ver.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_cpu_prochot_status = _libraries['libamd_smi.so'].amdsmi_get_cpu_prochot_status
-amdsmi_get_cpu_prochot_status.restype = amdsmi_status_t
-amdsmi_get_cpu_prochot_status.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_cpu_fclk_mclk = _libraries['libamd_smi.so'].amdsmi_get_cpu_fclk_mclk
-amdsmi_get_cpu_fclk_mclk.restype = amdsmi_status_t
-amdsmi_get_cpu_fclk_mclk.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_cpu_cclk_limit = _libraries['libamd_smi.so'].amdsmi_get_cpu_cclk_limit
-amdsmi_get_cpu_cclk_limit.restype = amdsmi_status_t
-amdsmi_get_cpu_cclk_limit.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_cpu_socket_current_active_freq_limit = _libraries['libamd_smi.so'].amdsmi_get_cpu_socket_current_active_freq_limit
-amdsmi_get_cpu_socket_current_active_freq_limit.restype = amdsmi_status_t
-amdsmi_get_cpu_socket_current_active_freq_limit.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint16), ctypes.POINTER(ctypes.POINTER(ctypes.c_char))]
-amdsmi_get_cpu_socket_freq_range = _libraries['libamd_smi.so'].amdsmi_get_cpu_socket_freq_range
-amdsmi_get_cpu_socket_freq_range.restype = amdsmi_status_t
-amdsmi_get_cpu_socket_freq_range.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint16), ctypes.POINTER(ctypes.c_uint16)]
-amdsmi_get_cpu_core_current_freq_limit = _libraries['libamd_smi.so'].amdsmi_get_cpu_core_current_freq_limit
-amdsmi_get_cpu_core_current_freq_limit.restype = amdsmi_status_t
-amdsmi_get_cpu_core_current_freq_limit.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_cpu_socket_power = _libraries['libamd_smi.so'].amdsmi_get_cpu_socket_power
-amdsmi_get_cpu_socket_power.restype = amdsmi_status_t
-amdsmi_get_cpu_socket_power.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_cpu_socket_power_cap = _libraries['libamd_smi.so'].amdsmi_get_cpu_socket_power_cap
-amdsmi_get_cpu_socket_power_cap.restype = amdsmi_status_t
-amdsmi_get_cpu_socket_power_cap.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_cpu_socket_power_cap_max = _libraries['libamd_smi.so'].amdsmi_get_cpu_socket_power_cap_max
-amdsmi_get_cpu_socket_power_cap_max.restype = amdsmi_status_t
-amdsmi_get_cpu_socket_power_cap_max.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_cpu_pwr_svi_telemetry_all_rails = _libraries['libamd_smi.so'].amdsmi_get_cpu_pwr_svi_telemetry_all_rails
-amdsmi_get_cpu_pwr_svi_telemetry_all_rails.restype = amdsmi_status_t
-amdsmi_get_cpu_pwr_svi_telemetry_all_rails.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_set_cpu_socket_power_cap = _libraries['libamd_smi.so'].amdsmi_set_cpu_socket_power_cap
-amdsmi_set_cpu_socket_power_cap.restype = amdsmi_status_t
-amdsmi_set_cpu_socket_power_cap.argtypes = [amdsmi_processor_handle, uint32_t]
 uint8_t = ctypes.c_uint8
-amdsmi_set_cpu_pwr_efficiency_mode = _libraries['libamd_smi.so'].amdsmi_set_cpu_pwr_efficiency_mode
-amdsmi_set_cpu_pwr_efficiency_mode.restype = amdsmi_status_t
-amdsmi_set_cpu_pwr_efficiency_mode.argtypes = [amdsmi_processor_handle, uint8_t]
-amdsmi_get_cpu_core_boostlimit = _libraries['libamd_smi.so'].amdsmi_get_cpu_core_boostlimit
-amdsmi_get_cpu_core_boostlimit.restype = amdsmi_status_t
-amdsmi_get_cpu_core_boostlimit.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_cpu_socket_c0_residency = _libraries['libamd_smi.so'].amdsmi_get_cpu_socket_c0_residency
-amdsmi_get_cpu_socket_c0_residency.restype = amdsmi_status_t
-amdsmi_get_cpu_socket_c0_residency.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_set_cpu_core_boostlimit = _libraries['libamd_smi.so'].amdsmi_set_cpu_core_boostlimit
-amdsmi_set_cpu_core_boostlimit.restype = amdsmi_status_t
-amdsmi_set_cpu_core_boostlimit.argtypes = [amdsmi_processor_handle, uint32_t]
-amdsmi_set_cpu_socket_boostlimit = _libraries['libamd_smi.so'].amdsmi_set_cpu_socket_boostlimit
-amdsmi_set_cpu_socket_boostlimit.restype = amdsmi_status_t
-amdsmi_set_cpu_socket_boostlimit.argtypes = [amdsmi_processor_handle, uint32_t]
-amdsmi_get_cpu_ddr_bw = _libraries['libamd_smi.so'].amdsmi_get_cpu_ddr_bw
-amdsmi_get_cpu_ddr_bw.restype = amdsmi_status_t
-amdsmi_get_cpu_ddr_bw.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_ddr_bw_metrics_t)]
-amdsmi_get_cpu_socket_temperature = _libraries['libamd_smi.so'].amdsmi_get_cpu_socket_temperature
-amdsmi_get_cpu_socket_temperature.restype = amdsmi_status_t
-amdsmi_get_cpu_socket_temperature.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_cpu_dimm_temp_range_and_refresh_rate = _libraries['libamd_smi.so'].amdsmi_get_cpu_dimm_temp_range_and_refresh_rate
-amdsmi_get_cpu_dimm_temp_range_and_refresh_rate.restype = amdsmi_status_t
-amdsmi_get_cpu_dimm_temp_range_and_refresh_rate.argtypes = [amdsmi_processor_handle, uint8_t, ctypes.POINTER(struct_amdsmi_temp_range_refresh_rate_t)]
-amdsmi_get_cpu_dimm_power_consumption = _libraries['libamd_smi.so'].amdsmi_get_cpu_dimm_power_consumption
-amdsmi_get_cpu_dimm_power_consumption.restype = amdsmi_status_t
-amdsmi_get_cpu_dimm_power_consumption.argtypes = [amdsmi_processor_handle, uint8_t, ctypes.POINTER(struct_amdsmi_dimm_power_t)]
-amdsmi_get_cpu_dimm_thermal_sensor = _libraries['libamd_smi.so'].amdsmi_get_cpu_dimm_thermal_sensor
-amdsmi_get_cpu_dimm_thermal_sensor.restype = amdsmi_status_t
-amdsmi_get_cpu_dimm_thermal_sensor.argtypes = [amdsmi_processor_handle, uint8_t, ctypes.POINTER(struct_amdsmi_dimm_thermal_t)]
-amdsmi_set_cpu_xgmi_width = _libraries['libamd_smi.so'].amdsmi_set_cpu_xgmi_width
-amdsmi_set_cpu_xgmi_width.restype = amdsmi_status_t
-amdsmi_set_cpu_xgmi_width.argtypes = [amdsmi_processor_handle, uint8_t, uint8_t]
-amdsmi_set_cpu_gmi3_link_width_range = _libraries['libamd_smi.so'].amdsmi_set_cpu_gmi3_link_width_range
-amdsmi_set_cpu_gmi3_link_width_range.restype = amdsmi_status_t
-amdsmi_set_cpu_gmi3_link_width_range.argtypes = [amdsmi_processor_handle, uint8_t, uint8_t]
-amdsmi_cpu_apb_enable = _libraries['libamd_smi.so'].amdsmi_cpu_apb_enable
-amdsmi_cpu_apb_enable.restype = amdsmi_status_t
-amdsmi_cpu_apb_enable.argtypes = [amdsmi_processor_handle]
-amdsmi_cpu_apb_disable = _libraries['libamd_smi.so'].amdsmi_cpu_apb_disable
-amdsmi_cpu_apb_disable.restype = amdsmi_status_t
-amdsmi_cpu_apb_disable.argtypes = [amdsmi_processor_handle, uint8_t]
-amdsmi_set_cpu_socket_lclk_dpm_level = _libraries['libamd_smi.so'].amdsmi_set_cpu_socket_lclk_dpm_level
-amdsmi_set_cpu_socket_lclk_dpm_level.restype = amdsmi_status_t
-amdsmi_set_cpu_socket_lclk_dpm_level.argtypes = [amdsmi_processor_handle, uint8_t, uint8_t, uint8_t]
-amdsmi_get_cpu_socket_lclk_dpm_level = _libraries['libamd_smi.so'].amdsmi_get_cpu_socket_lclk_dpm_level
-amdsmi_get_cpu_socket_lclk_dpm_level.restype = amdsmi_status_t
-amdsmi_get_cpu_socket_lclk_dpm_level.argtypes = [amdsmi_processor_handle, uint8_t, ctypes.POINTER(struct_amdsmi_dpm_level_t)]
-amdsmi_set_cpu_pcie_link_rate = _libraries['libamd_smi.so'].amdsmi_set_cpu_pcie_link_rate
-amdsmi_set_cpu_pcie_link_rate.restype = amdsmi_status_t
-amdsmi_set_cpu_pcie_link_rate.argtypes = [amdsmi_processor_handle, uint8_t, ctypes.POINTER(ctypes.c_ubyte)]
-amdsmi_set_cpu_df_pstate_range = _libraries['libamd_smi.so'].amdsmi_set_cpu_df_pstate_range
-amdsmi_set_cpu_df_pstate_range.restype = amdsmi_status_t
-amdsmi_set_cpu_df_pstate_range.argtypes = [amdsmi_processor_handle, uint8_t, uint8_t]
-amdsmi_get_cpu_current_io_bandwidth = _libraries['libamd_smi.so'].amdsmi_get_cpu_current_io_bandwidth
-amdsmi_get_cpu_current_io_bandwidth.restype = amdsmi_status_t
-amdsmi_get_cpu_current_io_bandwidth.argtypes = [amdsmi_processor_handle, amdsmi_link_id_bw_type_t, ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_cpu_current_xgmi_bw = _libraries['libamd_smi.so'].amdsmi_get_cpu_current_xgmi_bw
-amdsmi_get_cpu_current_xgmi_bw.restype = amdsmi_status_t
-amdsmi_get_cpu_current_xgmi_bw.argtypes = [amdsmi_processor_handle, amdsmi_link_id_bw_type_t, ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_hsmp_metrics_table_version = _libraries['libamd_smi.so'].amdsmi_get_hsmp_metrics_table_version
-amdsmi_get_hsmp_metrics_table_version.restype = amdsmi_status_t
-amdsmi_get_hsmp_metrics_table_version.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_hsmp_metrics_table = _libraries['libamd_smi.so'].amdsmi_get_hsmp_metrics_table
-amdsmi_get_hsmp_metrics_table.restype = amdsmi_status_t
-amdsmi_get_hsmp_metrics_table.argtypes = [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_hsmp_metrics_table_t)]
-amdsmi_first_online_core_on_cpu_socket = _libraries['libamd_smi.so'].amdsmi_first_online_core_on_cpu_socket
-amdsmi_first_online_core_on_cpu_socket.restype = amdsmi_status_t
-amdsmi_first_online_core_on_cpu_socket.argtypes = [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_cpu_family = _libraries['libamd_smi.so'].amdsmi_get_cpu_family
-amdsmi_get_cpu_family.restype = amdsmi_status_t
-amdsmi_get_cpu_family.argtypes = [ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_cpu_model = _libraries['libamd_smi.so'].amdsmi_get_cpu_model
-amdsmi_get_cpu_model.restype = amdsmi_status_t
-amdsmi_get_cpu_model.argtypes = [ctypes.POINTER(ctypes.c_uint32)]
-amdsmi_get_esmi_err_msg = _libraries['libamd_smi.so'].amdsmi_get_esmi_err_msg
-amdsmi_get_esmi_err_msg.restype = amdsmi_status_t
-amdsmi_get_esmi_err_msg.argtypes = [amdsmi_status_t, ctypes.POINTER(ctypes.POINTER(ctypes.c_char))]
+# Library functions are bound on first use by __getattr__: name -> (restype, argtypes)
+_FUNCTION_SIGNATURES = {
+    'amdsmi_init': lambda: (amdsmi_status_t, [uint64_t]),
+    'amdsmi_shut_down': lambda: (amdsmi_status_t, []),
+    'amdsmi_get_socket_handles': lambda: (amdsmi_status_t, [ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.POINTER(None))]),
+    'amdsmi_get_cpu_handles': lambda: (amdsmi_status_t, [ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.POINTER(None))]),
+    'amdsmi_get_socket_info': lambda: (amdsmi_status_t, [amdsmi_socket_handle, size_t, ctypes.POINTER(ctypes.c_char)]),
+    'amdsmi_get_processor_info': lambda: (amdsmi_status_t, [amdsmi_processor_handle, size_t, ctypes.POINTER(ctypes.c_char)]),
+    'amdsmi_get_processor_count_from_handles': lambda: (amdsmi_status_t, [ctypes.POINTER(ctypes.POINTER(None)), ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_processor_handles_by_type': lambda: (amdsmi_status_t, [amdsmi_socket_handle, processor_type_t, ctypes.POINTER(ctypes.POINTER(None)), ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_processor_handles': lambda: (amdsmi_status_t, [amdsmi_socket_handle, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.POINTER(None))]),
+    'amdsmi_get_cpucore_handles': lambda: (amdsmi_status_t, [ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.POINTER(None))]),
+    'amdsmi_get_processor_type': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(processor_type_t)]),
+    'amdsmi_get_processor_handle_from_bdf': lambda: (amdsmi_status_t, [amdsmi_bdf_t, ctypes.POINTER(ctypes.POINTER(None))]),
+    'amdsmi_get_gpu_id': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint16)]),
+    'amdsmi_get_gpu_revision': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint16)]),
+    'amdsmi_get_gpu_vendor_name': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_char), size_t]),
+    'amdsmi_get_gpu_vram_vendor': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_char), uint32_t]),
+    'amdsmi_get_gpu_subsystem_id': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint16)]),
+    'amdsmi_get_gpu_subsystem_name': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_char), size_t]),
+    'amdsmi_get_gpu_pci_bandwidth': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_pcie_bandwidth_t)]),
+    'amdsmi_get_gpu_bdf_id': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint64)]),
+    'amdsmi_get_gpu_topo_numa_affinity': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_int32)]),
+    'amdsmi_get_gpu_pci_throughput': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint64), ctypes.POINTER(ctypes.c_uint64), ctypes.POINTER(ctypes.c_uint64)]),
+    'amdsmi_get_gpu_pci_replay_counter': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint64)]),
+    'amdsmi_set_gpu_pci_bandwidth': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint64_t]),
+    'amdsmi_get_energy_count': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint64), ctypes.POINTER(ctypes.c_float), ctypes.POINTER(ctypes.c_uint64)]),
+    'amdsmi_set_power_cap': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint32_t, uint64_t]),
+    'amdsmi_set_gpu_power_profile': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint32_t, amdsmi_power_profile_preset_masks_t]),
+    'amdsmi_get_gpu_memory_total': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_memory_type_t, ctypes.POINTER(ctypes.c_uint64)]),
+    'amdsmi_get_gpu_memory_usage': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_memory_type_t, ctypes.POINTER(ctypes.c_uint64)]),
+    'amdsmi_get_gpu_bad_page_info': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(struct_amdsmi_retired_page_record_t)]),
+    'amdsmi_get_gpu_ras_feature_info': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_ras_feature_t)]),
+    'amdsmi_get_gpu_ras_block_features_enabled': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_gpu_block_t, ctypes.POINTER(amdsmi_ras_err_state_t)]),
+    'amdsmi_get_gpu_memory_reserved_pages': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(struct_amdsmi_retired_page_record_t)]),
+    'amdsmi_get_gpu_fan_rpms': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint32_t, ctypes.POINTER(ctypes.c_int64)]),
+    'amdsmi_get_gpu_fan_speed': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint32_t, ctypes.POINTER(ctypes.c_int64)]),
+    'amdsmi_get_gpu_fan_speed_max': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint32_t, ctypes.POINTER(ctypes.c_uint64)]),
+    'amdsmi_get_temp_metric': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_temperature_type_t, amdsmi_temperature_metric_t, ctypes.POINTER(ctypes.c_int64)]),
+    'amdsmi_get_gpu_cache_info': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_gpu_cache_info_t)]),
+    'amdsmi_get_gpu_volt_metric': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_voltage_type_t, amdsmi_voltage_metric_t, ctypes.POINTER(ctypes.c_int64)]),
+    'amdsmi_reset_gpu_fan': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint32_t]),
+    'amdsmi_set_gpu_fan_speed': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint32_t, uint64_t]),
+    'amdsmi_get_utilization_count': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_utilization_counter_t), uint32_t, ctypes.POINTER(ctypes.c_uint64)]),
+    'amdsmi_get_gpu_perf_level': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(amdsmi_dev_perf_level_t)]),
+    'amdsmi_set_gpu_perf_determinism_mode': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint64_t]),
+    'amdsmi_get_gpu_overdrive_level': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_gpu_mem_overdrive_level': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_clk_freq': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_clk_type_t, ctypes.POINTER(struct_amdsmi_frequencies_t)]),
+    'amdsmi_reset_gpu': lambda: (amdsmi_status_t, [amdsmi_processor_handle]),
+    'amdsmi_get_gpu_od_volt_info': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_od_volt_freq_data_t)]),
+    'amdsmi_get_gpu_metrics_header_info': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amd_metrics_table_header_t)]),
+    'amdsmi_get_gpu_metrics_info': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_gpu_metrics_t)]),
+    'amdsmi_get_gpu_pm_metrics_info': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.POINTER(struct_amdsmi_name_value_t)), ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_gpu_reg_table_info': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_reg_type_t, ctypes.POINTER(ctypes.POINTER(struct_amdsmi_name_value_t)), ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_set_gpu_clk_range': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint64_t, uint64_t, amdsmi_clk_type_t]),
+    'amdsmi_set_gpu_clk_limit': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_clk_type_t, amdsmi_clk_limit_type_t, uint64_t]),
+    'amdsmi_free_name_value_pairs': lambda: (None, [ctypes.POINTER(None)]),
+    'amdsmi_set_gpu_od_clk_info': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_freq_ind_t, uint64_t, amdsmi_clk_type_t]),
+    'amdsmi_set_gpu_od_volt_info': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint32_t, uint64_t, uint64_t]),
+    'amdsmi_get_gpu_od_volt_curve_regions': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(struct_amdsmi_freq_volt_region_t)]),
+    'amdsmi_get_gpu_power_profile_presets': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint32_t, ctypes.POINTER(struct_amdsmi_power_profile_status_t)]),
+    'amdsmi_set_gpu_perf_level': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_dev_perf_level_t]),
+    'amdsmi_set_gpu_overdrive_level': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint32_t]),
+    'amdsmi_set_clk_freq': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_clk_type_t, uint64_t]),
+    'amdsmi_get_soc_pstate': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_dpm_policy_t)]),
+    'amdsmi_set_soc_pstate': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint32_t]),
+    'amdsmi_get_xgmi_plpd': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_dpm_policy_t)]),
+    'amdsmi_set_xgmi_plpd': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint32_t]),
+    'amdsmi_get_gpu_process_isolation': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_set_gpu_process_isolation': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint32_t]),
+    'amdsmi_clean_gpu_local_data': lambda: (amdsmi_status_t, [amdsmi_processor_handle]),
+    'amdsmi_get_lib_version': lambda: (amdsmi_status_t, [ctypes.POINTER(struct_amdsmi_version_t)]),
+    'amdsmi_get_gpu_ecc_count': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_gpu_block_t, ctypes.POINTER(struct_amdsmi_error_count_t)]),
+    'amdsmi_get_gpu_ecc_enabled': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint64)]),
+    'amdsmi_get_gpu_ecc_status': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_gpu_block_t, ctypes.POINTER(amdsmi_ras_err_state_t)]),
+    'amdsmi_status_code_to_string': lambda: (amdsmi_status_t, [amdsmi_status_t, ctypes.POINTER(ctypes.POINTER(ctypes.c_char))]),
+    'amdsmi_gpu_counter_group_supported': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_event_group_t]),
+    'amdsmi_gpu_create_counter': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_event_type_t, ctypes.POINTER(ctypes.c_uint64)]),
+    'amdsmi_gpu_destroy_counter': lambda: (amdsmi_status_t, [amdsmi_event_handle_t]),
+    'amdsmi_gpu_control_counter': lambda: (amdsmi_status_t, [amdsmi_event_handle_t, amdsmi_counter_command_t, ctypes.POINTER(None)]),
+    'amdsmi_gpu_read_counter': lambda: (amdsmi_status_t, [amdsmi_event_handle_t, ctypes.POINTER(struct_amdsmi_counter_value_t)]),
+    'amdsmi_get_gpu_available_counters': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_event_group_t, ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_gpu_compute_process_info': lambda: (amdsmi_status_t, [ctypes.POINTER(struct_amdsmi_process_info_t), ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_gpu_compute_process_info_by_pid': lambda: (amdsmi_status_t, [uint32_t, ctypes.POINTER(struct_amdsmi_process_info_t)]),
+    'amdsmi_get_gpu_compute_process_gpus': lambda: (amdsmi_status_t, [uint32_t, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_gpu_xgmi_error_status': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(amdsmi_xgmi_status_t)]),
+    'amdsmi_reset_gpu_xgmi_error': lambda: (amdsmi_status_t, [amdsmi_processor_handle]),
+    'amdsmi_get_link_metrics': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_link_metrics_t)]),
+    'amdsmi_topo_get_numa_node_number': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_topo_get_link_weight': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint64)]),
+    'amdsmi_get_minmax_bandwidth_between_processors': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint64), ctypes.POINTER(ctypes.c_uint64)]),
+    'amdsmi_topo_get_link_type': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint64), ctypes.POINTER(amdsmi_io_link_type_t)]),
+    'amdsmi_is_P2P_accessible': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_processor_handle, ctypes.POINTER(ctypes.c_bool)]),
+    'amdsmi_topo_get_p2p_status': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_processor_handle, ctypes.POINTER(amdsmi_io_link_type_t), ctypes.POINTER(struct_amdsmi_p2p_capability_t)]),
+    'amdsmi_get_gpu_compute_partition': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_char), uint32_t]),
+    'amdsmi_set_gpu_compute_partition': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_compute_partition_type_t]),
+    'amdsmi_get_gpu_memory_partition': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_char), uint32_t]),
+    'amdsmi_set_gpu_memory_partition': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_memory_partition_type_t]),
+    'amdsmi_get_gpu_accelerator_partition_profile': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_accelerator_partition_profile_t), ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_init_gpu_event_notification': lambda: (amdsmi_status_t, [amdsmi_processor_handle]),
+    'amdsmi_set_gpu_event_notification_mask': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint64_t]),
+    'amdsmi_get_gpu_event_notification': lambda: (amdsmi_status_t, [ctypes.c_int32, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(struct_amdsmi_evt_notification_data_t)]),
+    'amdsmi_stop_gpu_event_notification': lambda: (amdsmi_status_t, [amdsmi_processor_handle]),
+    'amdsmi_get_gpu_device_bdf': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(union_amdsmi_bdf_t)]),
+    'amdsmi_get_gpu_device_uuid': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_char)]),
+    'amdsmi_get_gpu_driver_info': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_driver_info_t)]),
+    'amdsmi_get_gpu_asic_info': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_asic_info_t)]),
+    'amdsmi_get_gpu_kfd_info': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_kfd_info_t)]),
+    'amdsmi_get_gpu_vram_info': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_vram_info_t)]),
+    'amdsmi_get_gpu_board_info': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_board_info_t)]),
+    'amdsmi_get_power_cap_info': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint32_t, ctypes.POINTER(struct_amdsmi_power_cap_info_t)]),
+    'amdsmi_get_pcie_info': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_pcie_info_t)]),
+    'amdsmi_get_xgmi_info': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_xgmi_info_t)]),
+    'amdsmi_get_fw_info': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_fw_info_t)]),
+    'amdsmi_get_gpu_vbios_info': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_vbios_info_t)]),
+    'amdsmi_get_gpu_activity': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_engine_usage_t)]),
+    'amdsmi_get_power_info': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_power_info_t)]),
+    'amdsmi_is_gpu_power_management_enabled': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_bool)]),
+    'amdsmi_get_clock_info': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_clk_type_t, ctypes.POINTER(struct_amdsmi_clk_info_t)]),
+    'amdsmi_get_gpu_vram_usage': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_vram_usage_t)]),
+    'amdsmi_get_violation_status': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_violation_status_t)]),
+    'amdsmi_get_gpu_process_list': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(struct_amdsmi_proc_info_t)]),
+    'amdsmi_get_gpu_total_ecc_count': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_error_count_t)]),
+    'amdsmi_get_link_topology_nearest': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_link_type_t, ctypes.POINTER(struct_amdsmi_topology_nearest_t)]),
+    'amdsmi_get_cpu_core_energy': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint64)]),
+    'amdsmi_get_cpu_socket_energy': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint64)]),
+    'amdsmi_get_threads_per_core': lambda: (amdsmi_status_t, [ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_cpu_smu_fw_version': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_smu_fw_version_t)]),
+    'amdsmi_get_cpu_hsmp_proto_ver': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_cpu_prochot_status': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_cpu_fclk_mclk': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_cpu_cclk_limit': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_cpu_socket_current_active_freq_limit': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint16), ctypes.POINTER(ctypes.POINTER(ctypes.c_char))]),
+    'amdsmi_get_cpu_socket_freq_range': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint16), ctypes.POINTER(ctypes.c_uint16)]),
+    'amdsmi_get_cpu_core_current_freq_limit': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_cpu_socket_power': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_cpu_socket_power_cap': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_cpu_socket_power_cap_max': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_cpu_pwr_svi_telemetry_all_rails': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_set_cpu_socket_power_cap': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint32_t]),
+    'amdsmi_set_cpu_pwr_efficiency_mode': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint8_t]),
+    'amdsmi_get_cpu_core_boostlimit': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_cpu_socket_c0_residency': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_set_cpu_core_boostlimit': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint32_t]),
+    'amdsmi_set_cpu_socket_boostlimit': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint32_t]),
+    'amdsmi_get_cpu_ddr_bw': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_ddr_bw_metrics_t)]),
+    'amdsmi_get_cpu_socket_temperature': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_cpu_dimm_temp_range_and_refresh_rate': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint8_t, ctypes.POINTER(struct_amdsmi_temp_range_refresh_rate_t)]),
+    'amdsmi_get_cpu_dimm_power_consumption': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint8_t, ctypes.POINTER(struct_amdsmi_dimm_power_t)]),
+    'amdsmi_get_cpu_dimm_thermal_sensor': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint8_t, ctypes.POINTER(struct_amdsmi_dimm_thermal_t)]),
+    'amdsmi_set_cpu_xgmi_width': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint8_t, uint8_t]),
+    'amdsmi_set_cpu_gmi3_link_width_range': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint8_t, uint8_t]),
+    'amdsmi_cpu_apb_enable': lambda: (amdsmi_status_t, [amdsmi_processor_handle]),
+    'amdsmi_cpu_apb_disable': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint8_t]),
+    'amdsmi_set_cpu_socket_lclk_dpm_level': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint8_t, uint8_t, uint8_t]),
+    'amdsmi_get_cpu_socket_lclk_dpm_level': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint8_t, ctypes.POINTER(struct_amdsmi_dpm_level_t)]),
+    'amdsmi_set_cpu_pcie_link_rate': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint8_t, ctypes.POINTER(ctypes.c_ubyte)]),
+    'amdsmi_set_cpu_df_pstate_range': lambda: (amdsmi_status_t, [amdsmi_processor_handle, uint8_t, uint8_t]),
+    'amdsmi_get_cpu_current_io_bandwidth': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_link_id_bw_type_t, ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_cpu_current_xgmi_bw': lambda: (amdsmi_status_t, [amdsmi_processor_handle, amdsmi_link_id_bw_type_t, ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_hsmp_metrics_table_version': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_hsmp_metrics_table': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(struct_amdsmi_hsmp_metrics_table_t)]),
+    'amdsmi_first_online_core_on_cpu_socket': lambda: (amdsmi_status_t, [amdsmi_processor_handle, ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_cpu_family': lambda: (amdsmi_status_t, [ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_cpu_model': lambda: (amdsmi_status_t, [ctypes.POINTER(ctypes.c_uint32)]),
+    'amdsmi_get_esmi_err_msg': lambda: (amdsmi_status_t, [amdsmi_status_t, ctypes.POINTER(ctypes.POINTER(ctypes.c_char))]),
+}
+
+
+def _bind_function(name):
+    if 'libamd_smi.so' not in _libraries:
+        raise AttributeError(f"{name}: Unable to find amdsmi library try installing amd-smi-lib from your package manager")
+    function = getattr(_libraries['libamd_smi.so'], name)
+    function.restype, function.argtypes = _FUNCTION_SIGNATURES[name]()
+    globals()[name] = function
+    return function
+
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name in _FUNCTION_SIGNATURES:
+            return _bind_function(name)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+else:
+    # Module __getattr__ needs python 3.7, bind every function at import
+    if 'libamd_smi.so' in _libraries:
+        for _name in _FUNCTION_SIGNATURES:
+            _bind_function(_name)
+
+
 __all__ = \
     ['AGG_BW0', 'AMDSMI_ACCELERATOR_PARTITION_CPX',
     'AMDSMI_ACCELERATOR_PARTITION_DPX',
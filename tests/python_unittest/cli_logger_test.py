@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2024 Advanced Micro Devices, Inc. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import sys
+sys.path.append("/opt/rocm/libexec/amdsmi_cli/")
+
+try:
+    import amdsmi_logger
+except ImportError:
+    raise ImportError("Could not import /opt/rocm/libexec/amdsmi_cli/amdsmi_logger.py")
+
+import glob
+import json
+import os
+import pathlib
+import tempfile
+import unittest
+
+# golden/<name>.json holds a device output and golden/<name>.txt its human readable output,
+# as rendered by the previous yaml.dump based implementation
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+
+
+class TestAmdSmiLoggerHumanReadable(unittest.TestCase):
+    def setUp(self):
+        self.logger = amdsmi_logger.AMDSMILogger()
+
+    def test_golden_outputs(self):
+        golden_inputs = sorted(glob.glob(os.path.join(GOLDEN_DIR, "*.json")))
+        self.assertTrue(golden_inputs)
+        for golden_input in golden_inputs:
+            with self.subTest(golden=os.path.basename(golden_input)):
+                with open(golden_input, encoding="utf-8") as input_file:
+                    device_output = json.load(input_file)
+                with open(golden_input[:-len(".json")] + ".txt", encoding="utf-8") as expected_file:
+                    expected = expected_file.read()
+                self.assertEqual(self.logger._convert_json_to_human_readable(device_output), expected)
+
+    def test_python_values(self):
+        # Values json.dumps converts: tuples, and numeric, boolean, and None keys
+        device_output = {"gpu": 0, "limits": (1, 2.5, None), 3: "three", True: "yes", None: [("a", "b"), ()],
+                         "ratio": float("inf"), "usage": {"gfx": 1e-07, "long": "word " * 30 + "end"}}
+        expected = ("GPU: 0\n"
+                    "    LIMITS:\n"
+                    "        1\n"
+                    "        2.5\n"
+                    "        null\n"
+                    "    3: three\n"
+                    "    true: yes\n"
+                    "    null:\n"
+                    "        - a\n"
+                    "            b\n"
+                    "        []\n"
+                    "    RATIO: Infinity\n"
+                    "    USAGE:\n"
+                    "        GFX: 1e-07\n"
+                    "        LONG: word word word word word word word word word word word word word word word\n"
+                    "            word word word word word word word word word word word word word word word end\n")
+        self.assertEqual(self.logger._convert_json_to_human_readable(device_output), expected)
+
+    def test_unserializable_value(self):
+        with self.assertRaises(TypeError):
+            self.logger._convert_json_to_human_readable({"gpu": 0, "handle": object()})
+
+
+class TestAmdSmiLoggerWatchFile(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self):
+        temporary_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_dir.cleanup)
+        self.path = pathlib.Path(temporary_dir.name) / "watch.out"
+
+    def watch(self, output_format, iterations, tabular=False, titles=None):
+        """Stream each iteration's device outputs as a watch with --file would"""
+        logger = amdsmi_logger.AMDSMILogger(format=output_format, destination=self.path)
+        for table_title, table_header, secondary_table_title, secondary_table_header in titles or []:
+            logger.table_title = table_title
+            logger.table_header = table_header
+            logger.secondary_table_title = secondary_table_title
+            logger.secondary_table_header = secondary_table_header
+        for device_outputs in iterations:
+            logger.multiple_device_output = [dict(output) for output in device_outputs]
+            logger.store_watch_output(multiple_device_enabled=True, tabular=tabular)
+            self.assertEqual(logger.multiple_device_output, [])
+        return logger
+
+    def read(self, path=None):
+        with open(path or self.path, newline="", encoding="utf-8") as watch_file:
+            return watch_file.read()
+
+    def test_json_lines(self):
+        self.path.write_text("previous watch\n", encoding="utf-8")
+        self.watch("json", [[{"timestamp": 1, "gpu": 0, "power": {"value": 100, "unit": "W"}},
+                             {"timestamp": 1, "gpu": 1, "power": "N/A"}],
+                            [{"timestamp": 2, "gpu": 0, "power": {"value": 110, "unit": "W"}}]])
+        # the file is truncated by the first iteration, then one object per line
+        self.assertEqual(self.read(),
+                         '{"timestamp": 1, "gpu": 0, "power": {"value": 100, "unit": "W"}}\n'
+                         '{"timestamp": 1, "gpu": 1, "power": "N/A"}\n'
+                         '{"timestamp": 2, "gpu": 0, "power": {"value": 110, "unit": "W"}}\n')
+
+    def test_csv_new_column(self):
+        self.watch("csv", [[{"timestamp": 1, "gpu": 0, "power": 100},
+                            {"timestamp": 1, "gpu": 1, "power": 90}],
+                           [{"timestamp": 2, "gpu": 0, "power": 110}],
+                           [{"timestamp": 3, "gpu": 0, "power": 120, "temperature": 50},
+                            {"timestamp": 3, "gpu": 1, "power": 95}]])
+        # the header is written once, a new column starts a new header block
+        self.assertEqual(self.read(),
+                         "timestamp,gpu,power\r\n"
+                         "1,0,100\r\n"
+                         "1,1,90\r\n"
+                         "2,0,110\r\n"
+                         "\n"
+                         "timestamp,gpu,power,temperature\r\n"
+                         "3,0,120,50\r\n"
+                         "3,1,95,N/A\r\n")
+
+    def test_csv_process_file(self):
+        process_list = [{"process_info": {"name": "python", "pid": 100,
+                                          "memory_usage": {"gtt_mem": 0, "cpu_mem": 1, "vram_mem": 2},
+                                          "mem_usage": 3, "usage": {"gfx": 4, "enc": 5}}}]
+        self.watch("csv", [[{"timestamp": 1, "gpu": 0, "power": 100, "process_list": process_list}],
+                           [{"timestamp": 2, "gpu": 0, "power": 110,
+                             "process_list": [{"process_info": "No running processes detected"}]}]])
+        self.assertEqual(self.read(),
+                         "timestamp,gpu,power\r\n"
+                         "1,0,100\r\n"
+                         "2,0,110\r\n")
+        self.assertEqual(self.read(self.path.with_name("watch_process.out")),
+                         "timestamp,gpu,name,pid,gtt_mem,cpu_mem,vram_mem,mem_usage,gfx,enc\r\n"
+                         "1,0,python,100,0,1,2,3,4,5\r\n"
+                         "\n"
+                         "timestamp,gpu,name,pid,gtt_mem,cpu_mem,vram_mem,mem_usage,gfx,enc,process_info\r\n"
+                         "2,0,N/A,N/A,N/A,N/A,N/A,N/A,N/A,N/A,No running processes detected\r\n")
+
+    def test_tabular_header_once(self):
+        process_list = [{"process_info": {"name": "python", "pid": 100,
+                                          "memory_usage": {"gtt_mem": 0, "cpu_mem": 1, "vram_mem": 2},
+                                          "mem_usage": 3, "usage": {"gfx": 4, "enc": 5}}}]
+        self.watch("human_readable",
+                   [[{"timestamp": 1, "gpu": 0, "power_usage": 100, "process_list": process_list},
+                     {"timestamp": 1, "gpu": 1, "power_usage": 90, "process_list": process_list}],
+                    [{"timestamp": 2, "gpu": 0, "power_usage": 110, "process_list": process_list}]],
+                   tabular=True, titles=[("", "TIMESTAMP  GPU  POWER", "PROCESS INFO", "TIMESTAMP  GPU  NAME")])
+        self.assertEqual(self.read(),
+                         "TIMESTAMP  GPU  POWER\n"
+                         "         1    0    100\n"
+                         "         1    1     90\n"
+                         "         2    0    110\n")
+        # two spaces after the gpu, then the name column is 20 wide
+        process_row = "  " + "python".rjust(20) + "      100         0         1         2          3       4       5"
+        self.assertEqual(self.read(self.path.with_name("watch_process.out")),
+                         "PROCESS INFO:\n"
+                         "TIMESTAMP  GPU  NAME\n"
+                         "         1    0" + process_row + "\n"
+                         "         1    1" + process_row + "\n"
+                         "         2    0" + process_row + "\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
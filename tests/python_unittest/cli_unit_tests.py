@@ -0,0 +1,649 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2024 Advanced Micro Devices, Inc. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import sys
+sys.path.append("/opt/rocm/libexec/amdsmi_cli/")
+
+try:
+    import amdsmi_boot_cache
+except ImportError:
+    raise ImportError("Could not import /opt/rocm/libexec/amdsmi_cli/amdsmi_boot_cache.py")
+
+import json
+import os
+import stat
+import tempfile
+import unittest
+from unittest import mock
+
+
+class TestAmdSmiBootCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        boot_id = mock.patch.object(amdsmi_boot_cache, "get_boot_id", return_value="boot-1")
+        self.boot_id = boot_id.start()
+        self.addCleanup(boot_id.stop)
+        runtime_dir = mock.patch.dict(os.environ, {"XDG_RUNTIME_DIR": self.directory.name})
+        runtime_dir.start()
+        self.addCleanup(runtime_dir.stop)
+
+    def test_default_path(self):
+        cache = amdsmi_boot_cache.AMDSMIBootCache("test.json", "AMDSMI_TEST_CACHE")
+        cache_dir = os.path.join(self.directory.name, "amdsmi")
+        self.assertEqual(cache.get_path(), os.path.join(cache_dir, "test.json"))
+        cache.save({"value": 1})
+        self.assertEqual(stat.S_IMODE(os.stat(cache_dir).st_mode), 0o700)
+        self.assertEqual(os.listdir(cache_dir), ["test.json"])
+        self.assertEqual(cache.load(), {"value": 1})
+        # files from another boot are ignored
+        self.boot_id.return_value = "boot-2"
+        self.assertIsNone(cache.load())
+        cache.remove()
+        self.assertEqual(os.listdir(cache_dir), [])
+
+    def test_disabled(self):
+        with mock.patch.dict(os.environ, {"AMDSMI_TEST_CACHE": ""}):
+            self.assertIsNone(amdsmi_boot_cache.AMDSMIBootCache("test.json", "AMDSMI_TEST_CACHE").get_path())
+        # persisted by default only in the private runtime directory
+        del os.environ["XDG_RUNTIME_DIR"]
+        cache = amdsmi_boot_cache.AMDSMIBootCache("test.json", "AMDSMI_TEST_CACHE")
+        self.assertIsNone(cache.get_path())
+        cache.save({"value": 1})
+        self.assertIsNone(cache.load())
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_untrusted_files(self):
+        cache_path = os.path.join(self.directory.name, "test.json")
+        cache = amdsmi_boot_cache.AMDSMIBootCache("test.json", "AMDSMI_TEST_CACHE", cache_path)
+        target_path = os.path.join(self.directory.name, "target.json")
+        with open(target_path, 'w', encoding="utf-8") as target_file:
+            json.dump({"boot_id": "boot-1", "data": {"value": 1}}, target_file)
+        # symlinks are not followed
+        os.symlink(target_path, cache_path)
+        self.assertIsNone(cache.load())
+        os.unlink(cache_path)
+        # files other users can write are ignored
+        os.rename(target_path, cache_path)
+        os.chmod(cache_path, 0o666)
+        self.assertIsNone(cache.load())
+        os.chmod(cache_path, 0o600)
+        self.assertEqual(cache.load(), {"value": 1})
+        # a shared default directory is not written to
+        cache_dir = os.path.join(self.directory.name, "amdsmi")
+        os.mkdir(cache_dir, 0o777)
+        os.chmod(cache_dir, 0o777)
+        amdsmi_boot_cache.AMDSMIBootCache("test.json", "AMDSMI_TEST_CACHE").save({"value": 2})
+        self.assertEqual(os.listdir(cache_dir), [])
+
+
+class TestAmdSmiTopologyCache(unittest.TestCase):
+    def test_transient_errors(self):
+        import amdsmi_topology
+        interface = amdsmi_topology.amdsmi_interface
+        wrapper = interface.amdsmi_wrapper
+        handles = [wrapper.amdsmi_processor_handle(value) for value in (0x10, 0x20, 0x30)]
+        helpers = mock.Mock()
+        helpers.handle_registry.get_gpu_bdf.side_effect = lambda handle: f"0000:{handle.value:02x}:00.0"
+        calls = []
+        def get_link_type(src_gpu, dest_gpu):
+            calls.append((src_gpu.value, dest_gpu.value))
+            if dest_gpu.value == 0x30:
+                # busy once, the next run reads it again
+                raise amdsmi_topology.amdsmi_exception.AmdSmiLibraryException(wrapper.AMDSMI_STATUS_BUSY)
+            return {"type": wrapper.AMDSMI_IOLINK_TYPE_XGMI, "hops": 1}
+        def not_supported(*args):
+            raise amdsmi_topology.amdsmi_exception.AmdSmiLibraryException(wrapper.AMDSMI_STATUS_NOT_SUPPORTED)
+
+        with tempfile.TemporaryDirectory() as directory, \
+             mock.patch.object(amdsmi_boot_cache, "get_boot_id", return_value="boot-1"), \
+             mock.patch.object(interface, "amdsmi_is_P2P_accessible", return_value=True), \
+             mock.patch.object(interface, "amdsmi_topo_get_link_type", side_effect=get_link_type), \
+             mock.patch.object(interface, "amdsmi_topo_get_link_weight", return_value=15), \
+             mock.patch.object(interface, "amdsmi_get_minmax_bandwidth_between_processors", side_effect=not_supported), \
+             mock.patch.object(interface, "amdsmi_topo_get_p2p_status", side_effect=not_supported):
+            cache_path = os.path.join(directory, "topology.json")
+            links = amdsmi_topology.AMDSMITopology(helpers, cache_path).get_links(handles)
+            self.assertTrue(links["0000:10:00.0"]["0000:30:00.0"]["transient"])
+            self.assertNotIn("transient", links["0000:10:00.0"]["0000:20:00.0"])
+            # a later run only reads the links with transient errors
+            calls.clear()
+            amdsmi_topology.AMDSMITopology(helpers, cache_path).get_links(handles)
+            self.assertEqual(sorted(calls), [(0x10, 0x30), (0x20, 0x30)])
+            # not supported reads are kept
+            self.assertEqual(interface.amdsmi_topo_get_p2p_status.call_count, 3 * 2 + 2)
+
+class TestAmdSmiPlatformProfile(unittest.TestCase):
+    def test_detect(self):
+        import amdsmi_helpers
+        profile_type = amdsmi_helpers.AMDSMIPlatformProfile
+        cases = [("flags : fpu vme", set(), {"is_baremetal": True}),
+                 ("flags : fpu hypervisor", {"0x1002"}, {"is_virtual_os": True}),
+                 ("flags : fpu hypervisor", {"0x74a1"}, {"is_baremetal": True, "is_passthrough": True})]
+        for cpuinfo, device_ids, expected in cases:
+            with self.subTest(cpuinfo=cpuinfo, device_ids=device_ids), \
+                 mock.patch("builtins.open", mock.mock_open(read_data=cpuinfo)), \
+                 mock.patch.object(profile_type, "get_pci_device_ids", return_value=device_ids) as get_pci_device_ids:
+                profile = profile_type.detect("Linux")
+                self.assertEqual({key for key, value in profile.items() if value is True}, {"is_linux"} | set(expected))
+                # only guests scan the PCI functions
+                self.assertEqual(get_pci_device_ids.called, "hypervisor" in cpuinfo)
+        self.assertFalse(any(value is True for value in profile_type.detect("Windows").values()))
+
+    def test_cache(self):
+        import amdsmi_helpers
+        profile_type = amdsmi_helpers.AMDSMIPlatformProfile
+        with tempfile.TemporaryDirectory() as directory, \
+             mock.patch.object(amdsmi_boot_cache, "get_boot_id", return_value="boot-1"), \
+             mock.patch.object(amdsmi_helpers.platform, "system", return_value="Linux"), \
+             mock.patch.object(profile_type, "detect", wraps=profile_type.detect) as detect:
+            cache_path = os.path.join(directory, "platform.json")
+            profile = profile_type(cache_path).get()
+            self.assertEqual(detect.call_count, 1)
+            self.assertTrue(os.path.exists(cache_path))
+            # later runs in the same boot load the saved profile
+            platform_profile = profile_type(cache_path)
+            self.assertEqual(platform_profile.get(), profile)
+            self.assertEqual(detect.call_count, 1)
+            platform_profile.invalidate()
+            self.assertFalse(os.path.exists(cache_path))
+            self.assertEqual(platform_profile.get(), profile)
+            self.assertEqual(detect.call_count, 2)
+            # a profile saved for another operating system is detected again
+            with mock.patch.object(amdsmi_helpers.platform, "system", return_value="Linux-other"):
+                profile_type(cache_path).get()
+            self.assertEqual(detect.call_count, 3)
+
+
+class TestAmdSmiExporter(unittest.TestCase):
+    def setUp(self):
+        import amdsmi_exporter
+        helpers = mock.Mock()
+        helpers.get_gpu_id_from_device_handle.side_effect = lambda handle: handle.value - 1
+        helpers.handle_registry.get_gpu_bdf.side_effect = lambda handle: f"0000:0{handle.value}:00.0"
+        handles = [amdsmi_exporter.amdsmi_interface.amdsmi_wrapper.amdsmi_processor_handle(1)]
+        self.exporter = amdsmi_exporter.AMDSMIExporter(helpers, handles)
+        self.values = {metric_name: [] for metric_name in amdsmi_exporter.EXPORTER_METRICS}
+
+    def test_render(self):
+        self.values['amdsmi_power_watts'] = [('gpu="0",bdf="0000:01:00.0"', 150)]
+        self.values['amdsmi_temperature_celsius'] = [('gpu="0",bdf="0000:01:00.0",sensor="hotspot"', 55),
+                                                     ('gpu="0",bdf="0000:01:00.0",sensor="memory"', 60.5)]
+        self.exporter.samples_total = 3
+        metrics = self.exporter.render({"timestamp": 100.25, "duration": 0.0125, "values": self.values})
+        self.assertEqual(metrics.decode("utf-8").splitlines(), [
+            '# HELP amdsmi_power_watts Socket power in W',
+            '# TYPE amdsmi_power_watts gauge',
+            'amdsmi_power_watts{gpu="0",bdf="0000:01:00.0"} 150',
+            '# HELP amdsmi_temperature_celsius Temperature in C',
+            '# TYPE amdsmi_temperature_celsius gauge',
+            'amdsmi_temperature_celsius{gpu="0",bdf="0000:01:00.0",sensor="hotspot"} 55',
+            'amdsmi_temperature_celsius{gpu="0",bdf="0000:01:00.0",sensor="memory"} 60.5',
+            '# HELP amdsmi_exporter_sample_timestamp_seconds Time of the last sample',
+            '# TYPE amdsmi_exporter_sample_timestamp_seconds gauge',
+            'amdsmi_exporter_sample_timestamp_seconds 100.250',
+            '# HELP amdsmi_exporter_sample_duration_seconds Time spent reading the last sample',
+            '# TYPE amdsmi_exporter_sample_duration_seconds gauge',
+            'amdsmi_exporter_sample_duration_seconds 0.012500',
+            '# HELP amdsmi_exporter_samples_total Samples taken since the exporter started',
+            '# TYPE amdsmi_exporter_samples_total counter',
+            'amdsmi_exporter_samples_total 3'])
+
+    def test_scrape_staleness(self):
+        samples = [{"timestamp": 100.0, "duration": 0.01, "values": self.values}]
+        def sample():
+            if not samples:
+                raise RuntimeError("sampling failed")
+            return samples.pop()
+        self.exporter.sample = sample
+        self.exporter._take_sample()
+        metrics = self.exporter.scrape(now=100.5)
+        self.assertIn(b"amdsmi_exporter_sample_age_seconds 0.500\n", metrics)
+        self.assertIn(b"amdsmi_exporter_sample_errors_total 0\n", metrics)
+        # a failed sample keeps the previous text, its age keeps growing
+        with self.assertRaises(RuntimeError):
+            self.exporter._take_sample()
+        metrics = self.exporter.scrape(now=103.0)
+        self.assertIn(b"amdsmi_exporter_samples_total 1\n", metrics)
+        self.assertIn(b"amdsmi_exporter_sample_age_seconds 3.000\n", metrics)
+        self.assertIn(b"amdsmi_exporter_sample_errors_total 1\n", metrics)
+
+
+class TestAmdSmiSampler(unittest.TestCase):
+    def test_sample_ring(self):
+        import amdsmi_sampler
+        ring = amdsmi_sampler.SampleRing(3)
+        self.assertEqual(list(ring.values()), [])
+        for value in (1, 2):
+            ring.append(value)
+        self.assertEqual(list(ring.values()), [1, 2])
+        # once full the oldest samples are overwritten, oldest first
+        for value in (3, 4, 5):
+            ring.append(value)
+        self.assertEqual(list(ring.values()), [3, 4, 5])
+        self.assertEqual(ring.count, 3)
+        ring.clear()
+        self.assertEqual(list(ring.values()), [])
+
+    def test_aggregate(self):
+        import amdsmi_sampler
+        ring = amdsmi_sampler.SampleRing(200)
+        self.assertEqual(ring.aggregate(), {"min": "N/A", "avg": "N/A", "max": "N/A", "p99": "N/A", "samples": 0})
+        for value in range(100, 0, -1):
+            ring.append(value)
+        aggregates = ring.aggregate()
+        # nearest rank: the 99th of 100 sorted samples
+        self.assertEqual(aggregates, {"min": 1, "avg": 50.5, "max": 100, "p99": 99, "samples": 100})
+        # integer samples come back as int, fractions stay float
+        self.assertIsInstance(aggregates["min"], int)
+        self.assertIsInstance(aggregates["avg"], float)
+        ring.clear()
+        for value in (0.5, 2.0, 3.25):
+            ring.append(value)
+        aggregates = ring.aggregate()
+        self.assertEqual(aggregates["p99"], 3.25)
+        self.assertEqual(aggregates["avg"], 1.917)
+        self.assertIsInstance(aggregates["max"], float)
+        self.assertIsInstance(aggregates["avg"], float)
+        # p99 of a single sample is that sample
+        ring.clear()
+        ring.append(7)
+        self.assertEqual(ring.aggregate()["p99"], 7)
+
+    def test_sampler_loop_errors(self):
+        import threading
+        import amdsmi_sampler
+        stop = threading.Event()
+        calls = []
+        def sample():
+            calls.append(len(calls))
+            if len(calls) == 3:
+                stop.set()
+            if len(calls) == 1:
+                raise amdsmi_sampler.amdsmi_exception.AmdSmiLibraryException(
+                    amdsmi_sampler.amdsmi_interface.amdsmi_wrapper.AMDSMI_STATUS_BUSY)
+            if len(calls) == 2:
+                raise ValueError("unexpected")
+        with self.assertLogs(level="ERROR"):
+            amdsmi_sampler.run_sampler_loop(sample, 0.001, stop)
+        self.assertEqual(calls, [0, 1, 2])
+
+
+class TestAmdSmiWatch(unittest.TestCase):
+    def run_watch(self, durations, watch, watch_time=None, iterations=None):
+        """Return the start time of every iteration, each taking the next of durations"""
+        import argparse
+        import amdsmi_helpers
+        clock = [0.0]
+        starts = []
+        def subcommand(args, watching_output=False):
+            self.assertTrue(watching_output)
+            self.assertIsNone(args.watch)
+            starts.append(clock[0])
+            clock[0] += durations[len(starts) - 1]
+        def sleep(seconds):
+            self.assertGreaterEqual(seconds, 0)
+            clock[0] += seconds
+        helpers = amdsmi_helpers.AMDSMIHelpers.__new__(amdsmi_helpers.AMDSMIHelpers)
+        args = argparse.Namespace(watch=watch, watch_time=watch_time, iterations=iterations)
+        with mock.patch.object(amdsmi_helpers.time, "monotonic", side_effect=lambda: clock[0]), \
+             mock.patch.object(amdsmi_helpers.time, "sleep", side_effect=sleep), \
+             mock.patch("builtins.print"):
+            helpers.handle_watch(args, subcommand, None)
+        return starts
+
+    def test_fixed_grid(self):
+        # the collection time doesn't push the next iterations back
+        self.assertEqual(self.run_watch([0.25] * 4, watch=1, iterations=4), [0, 1, 2, 3])
+
+    def test_skip_missed_iterations(self):
+        # a 2.5 second collection started at 1 misses 2 and 3, the next one starts at 4
+        self.assertEqual(self.run_watch([0.25, 2.5, 0.25, 0.25], watch=1, iterations=4), [0, 1, 4, 5])
+        # ending exactly on the grid runs the next iteration right away
+        self.assertEqual(self.run_watch([0.25, 1, 0.25], watch=1, iterations=3), [0, 1, 2])
+
+    def test_watch_time(self):
+        self.assertEqual(self.run_watch([0.25] * 10, watch=1, watch_time=3), [0, 1, 2, 3])
+        # iterations that would start after the watch time are not run
+        self.assertEqual(self.run_watch([2.5] * 10, watch=1, watch_time=3), [0, 3])
+
+
+class TestAmdSmiDaemon(unittest.TestCase):
+    def setUp(self):
+        import amdsmi_daemon
+        self.amdsmi_daemon = amdsmi_daemon
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.socket_path = os.path.join(directory.name, "daemon.sock")
+
+    def make_daemon(self):
+        import argparse
+        commands = mock.Mock()
+        commands.metric.side_effect = lambda args: print(f"metric gpu {args.gpu}")
+        parser = mock.Mock()
+        parser.parse_args.side_effect = lambda args: argparse.Namespace(
+            func=commands.metric if args[0] == "metric" else commands.process,
+            gpu=args[-1], watch=None, json=False, csv=False, file=None)
+        return self.amdsmi_daemon.AMDSMIDaemon(commands, parser, self.socket_path)
+
+    def test_round_trip(self):
+        import threading
+        daemon = self.make_daemon()
+        server = daemon._bind()
+        self.assertEqual(stat.S_IMODE(os.stat(self.socket_path).st_mode), 0o600)
+        daemon._bind = lambda: server
+        thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        with mock.patch("builtins.print"):
+            thread.start()
+        self.assertEqual(self.amdsmi_daemon.query(["metric", "--gpu", "0"], self.socket_path, timeout=5),
+                         {"status": 0, "output": "metric gpu 0\n"})
+        reply = self.amdsmi_daemon.query(["process", "--gpu", "0"], self.socket_path, timeout=5)
+        self.assertEqual(reply["status"], 1)
+        self.assertIn("only serves metric, monitor and static queries", reply["error"])
+        self.assertEqual(daemon.requests_served, 2)
+
+    def test_bind_refuses_foreign_files(self):
+        with open(self.socket_path, 'w', encoding="utf-8") as socket_file:
+            socket_file.write("not a socket")
+        with self.assertRaises(RuntimeError):
+            self.make_daemon()._bind()
+        # the file is left alone
+        with open(self.socket_path, encoding="utf-8") as socket_file:
+            self.assertEqual(socket_file.read(), "not a socket")
+
+    def test_bind_replaces_stale_socket(self):
+        daemon = self.make_daemon()
+        daemon._bind().close()
+        # nobody listens on the socket left behind, it is replaced
+        daemon._bind().close()
+        # the socket of a running daemon is not
+        server = daemon._bind()
+        with self.assertRaises(RuntimeError):
+            self.make_daemon()._bind()
+        server.close()
+        daemon._unlink_socket()
+        self.assertFalse(os.path.exists(self.socket_path))
+
+
+class TestAmdSmiHandleRegistry(unittest.TestCase):
+    def setUp(self):
+        import amdsmi_helpers
+        interface = amdsmi_helpers.amdsmi_interface
+        self.handles = [interface.amdsmi_wrapper.amdsmi_processor_handle(value) for value in (0x10, 0x20)]
+        bdfs = {0x10: "0000:03:00.0", 0x20: "0000:83:00.0"}
+        uuids = {0x10: "AB000000-0000-1000-8000-000000000010", 0x20: "ab000000-0000-1000-8000-000000000020"}
+        self.enumerate = mock.Mock(side_effect=lambda: list(self.handles))
+        self.get_bdf = mock.Mock(side_effect=lambda handle: bdfs[handle.value])
+        self.get_uuid = mock.Mock(side_effect=lambda handle: uuids[handle.value])
+        for name, api in (("amdsmi_get_processor_handles", self.enumerate),
+                          ("amdsmi_get_gpu_device_bdf", self.get_bdf),
+                          ("amdsmi_get_gpu_device_uuid", self.get_uuid)):
+            patcher = mock.patch.object(interface, name, api)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.registry = amdsmi_helpers.AMDSMIHandleRegistry()
+
+    def test_enumerated_once(self):
+        for _ in range(3):
+            self.assertEqual(self.registry.get_gpu_handles(), self.handles)
+            self.assertEqual(self.registry.get_gpu_index(self.handles[1]), 1)
+            self.assertEqual(self.registry.get_gpu_bdf(self.handles[1]), "0000:83:00.0")
+        self.assertEqual(self.enumerate.call_count, 1)
+        # BDF and UUID are read once per GPU
+        self.assertEqual(self.get_bdf.call_count, 2)
+        self.assertEqual(self.get_uuid.call_count, 2)
+
+    def test_lookups(self):
+        from BDF import BDF
+        import amdsmi_helpers
+        unknown = amdsmi_helpers.amdsmi_interface.amdsmi_wrapper.amdsmi_processor_handle(0x30)
+        self.assertEqual(self.registry.get_gpu_index(self.handles[0]), 0)
+        self.assertIsNone(self.registry.get_gpu_index(unknown))
+        self.assertEqual(self.registry.get_gpu_uuid(self.handles[1]), "ab000000-0000-1000-8000-000000000020")
+        self.assertIsNone(self.registry.get_gpu_bdf(unknown))
+        # BDF strings and objects find the same handle
+        self.assertIs(self.registry.get_gpu_handle_from_bdf("0000:83:00.0"), self.handles[1])
+        self.assertIs(self.registry.get_gpu_handle_from_bdf("83:00.0"), self.handles[1])
+        self.assertIs(self.registry.get_gpu_handle_from_bdf(BDF("0000:03:00.0")), self.handles[0])
+        self.assertIsNone(self.registry.get_gpu_handle_from_bdf("0000:04:00.0"))
+        # UUIDs are case insensitive
+        self.assertIs(self.registry.get_gpu_handle_from_uuid("ab000000-0000-1000-8000-000000000010"), self.handles[0])
+        self.assertIs(self.registry.get_gpu_handle_from_uuid("AB000000-0000-1000-8000-000000000020"), self.handles[1])
+        self.assertIsNone(self.registry.get_gpu_handle_from_uuid("ab000000-0000-1000-8000-000000000030"))
+
+    def test_invalidate(self):
+        import amdsmi_helpers
+        self.assertIsNone(self.registry.get_gpu_handle_from_uuid("ab000000-0000-1000-8000-000000000030"))
+        # a reset brings back a third GPU, the registry doesn't see it until invalidated
+        self.handles.append(amdsmi_helpers.amdsmi_interface.amdsmi_wrapper.amdsmi_processor_handle(0x30))
+        self.get_uuid.side_effect = lambda handle: "ab000000-0000-1000-8000-0000000000%x" % handle.value
+        self.get_bdf.side_effect = lambda handle: "0000:%02x:00.0" % handle.value
+        self.assertEqual(len(self.registry.get_gpu_handles()), 2)
+        self.registry.invalidate()
+        self.assertEqual(self.registry.get_gpu_index(self.handles[2]), 2)
+        self.assertIs(self.registry.get_gpu_handle_from_uuid("ab000000-0000-1000-8000-000000000030"), self.handles[2])
+        self.assertIs(self.registry.get_gpu_handle_from_bdf("0000:30:00.0"), self.handles[2])
+        self.assertEqual(self.enumerate.call_count, 2)
+        self.assertEqual(self.get_uuid.call_count, 5)
+
+
+class TestAmdSmiCollectDeviceOutputs(unittest.TestCase):
+    def setUp(self):
+        import amdsmi_helpers
+        import amdsmi_logger
+        wrapper = amdsmi_helpers.amdsmi_interface.amdsmi_wrapper
+        self.handles = [wrapper.amdsmi_processor_handle(value) for value in (0x10, 0x20, 0x30)]
+        gpu_ids = {handle.value: index for index, handle in enumerate(self.handles)}
+        self.helpers = amdsmi_helpers.AMDSMIHelpers.__new__(amdsmi_helpers.AMDSMIHelpers)
+        self.helpers.get_gpu_id_from_device_handle = lambda handle: gpu_ids[handle.value]
+        with mock.patch.object(amdsmi_logger, "AMDSMIHelpers", return_value=self.helpers):
+            self.logger = amdsmi_logger.AMDSMILogger()
+        # Every test gets its own threads
+        self.helpers.device_pool = amdsmi_helpers.AMDSMIDevicePool()
+        self.collected = []
+
+    def collect(self, delays, parallel, device_timeout=None):
+        import argparse
+        import threading
+        import time
+        release = threading.Event()
+        self.addCleanup(release.set)
+        def subcommand(args, multiple_devices=False, gpu=None):
+            self.assertTrue(multiple_devices)
+            self.collected.append(gpu.value)
+            delay = delays[gpu.value]
+            if delay is None:
+                release.wait()
+            else:
+                time.sleep(delay)
+            self.logger.store_output(gpu, 'values', {"power": {"value": gpu.value, "unit": "W"},
+                                                     "usage": {"gfx": 10, "mem": 20}})
+            self.logger.store_multiple_device_output()
+        args = argparse.Namespace(gpu=self.handles, parallel=parallel, device_timeout=device_timeout)
+        self.helpers.collect_device_outputs(args, self.logger, subcommand)
+        return self.logger.multiple_device_output
+
+    def test_order(self):
+        # later devices finish first, the output keeps the order of args.gpu
+        outputs = self.collect({0x10: 0.06, 0x20: 0.03, 0x30: 0}, parallel=3)
+        self.assertEqual([output["gpu"] for output in outputs], [0, 1, 2])
+        self.assertEqual([output["power"]["value"] for output in outputs], [0x10, 0x20, 0x30])
+
+    def test_timeout(self):
+        outputs = self.collect({0x10: 0, 0x20: None, 0x30: 0}, parallel=3, device_timeout=0.1)
+        self.assertEqual([output["gpu"] for output in outputs], [0, 1, 2])
+        # the hung device has the columns of the others
+        self.assertEqual(outputs[1], {"gpu": 1, "power": "N/A", "usage": {"gfx": "N/A", "mem": "N/A"}})
+        self.assertEqual(outputs[2]["usage"], {"gfx": 10, "mem": 20})
+
+    def test_hung_device_is_not_queued_again(self):
+        for _ in range(3):
+            self.logger.clear_multiple_devices_ouput()
+            outputs = self.collect({0x10: 0, 0x20: None, 0x30: 0}, parallel=2, device_timeout=0.05)
+            self.assertEqual(outputs[1]["power"], "N/A")
+            self.assertEqual(outputs[2]["power"]["value"], 0x30)
+        # the hung device was collected once and holds one of the two threads
+        self.assertEqual(self.collected.count(0x20), 1)
+        self.assertEqual(self.collected.count(0x30), 3)
+        self.assertEqual(self.helpers.device_pool._workers, 2)
+
+
+class TestAmdSmiSnapshot(unittest.TestCase):
+    def test_late_reads_are_dropped(self):
+        import amdsmi_helpers
+        handle = amdsmi_helpers.amdsmi_interface.amdsmi_wrapper.amdsmi_processor_handle(0x10)
+        snapshot = amdsmi_helpers.AMDSMISnapshot()
+        reads = []
+        def amdsmi_get_value(device_handle):
+            reads.append(device_handle.value)
+            # the tick ends while this read is still running
+            snapshot.end_tick()
+            return len(reads)
+        snapshot.start_tick()
+        self.assertEqual(snapshot.get(amdsmi_get_value, handle), 1)
+        snapshot.start_tick()
+        self.assertEqual(snapshot.get(amdsmi_get_value, handle), 2)
+        self.assertEqual(reads, [0x10, 0x10])
+
+    def test_hits_and_cached_failures(self):
+        import amdsmi_helpers
+        wrapper = amdsmi_helpers.amdsmi_interface.amdsmi_wrapper
+        handles = [wrapper.amdsmi_processor_handle(value) for value in (0x10, 0x20)]
+        reads = []
+        def amdsmi_get_value(device_handle, index=0):
+            reads.append((device_handle.value, index))
+            if device_handle.value == 0x20:
+                raise amdsmi_helpers.amdsmi_exception.AmdSmiLibraryException(wrapper.AMDSMI_STATUS_NOT_SUPPORTED)
+            return device_handle.value + index
+        snapshot = amdsmi_helpers.AMDSMISnapshot()
+        snapshot.start_tick()
+        for _ in range(3):
+            self.assertEqual(snapshot.get(amdsmi_get_value, handles[0]), 0x10)
+            self.assertEqual(snapshot.get(amdsmi_get_value, handles[0], 1), 0x11)
+        errors = []
+        for _ in range(2):
+            with self.assertRaises(amdsmi_helpers.amdsmi_exception.AmdSmiLibraryException) as error:
+                snapshot.get(amdsmi_get_value, handles[1])
+            self.assertEqual(error.exception.get_error_code(), wrapper.AMDSMI_STATUS_NOT_SUPPORTED)
+            errors.append(error.exception)
+        # each lookup raises a new exception, the cached one doesn't grow its traceback
+        self.assertIsNot(errors[0], errors[1])
+        self.assertEqual(snapshot.lookup(amdsmi_get_value, handles[0], 1), 0x11)
+        with self.assertRaises(KeyError):
+            snapshot.lookup(amdsmi_get_value, handles[0], 2)
+        self.assertEqual(reads, [(0x10, 0), (0x10, 1), (0x20, 0)])
+        self.assertEqual((snapshot.calls, snapshot.hits), (3, 6))
+        self.assertEqual(snapshot.end_tick(), 6)
+
+        # the next tick reads the library again
+        snapshot.start_tick()
+        self.assertEqual((snapshot.calls, snapshot.hits), (0, 0))
+        self.assertEqual(snapshot.get(amdsmi_get_value, handles[0]), 0x10)
+        self.assertEqual(len(reads), 4)
+        self.assertEqual(snapshot.end_tick(), 0)
+        self.assertEqual(snapshot.total_saved, 6)
+
+    def test_cached_failure_class(self):
+        import amdsmi_helpers
+        amdsmi_exception = amdsmi_helpers.amdsmi_exception
+        handle = amdsmi_helpers.amdsmi_interface.amdsmi_wrapper.amdsmi_processor_handle(0x10)
+        snapshot = amdsmi_helpers.AMDSMISnapshot()
+        snapshot.start_tick()
+        for exception in (amdsmi_exception.AmdSmiRetryException(), amdsmi_exception.AmdSmiTimeoutException(),
+                          amdsmi_exception.AmdSmiLibraryException(2)):
+            def amdsmi_get_value(device_handle, exception_name, exception=exception):
+                raise exception
+            for _ in range(2):
+                with self.assertRaises(amdsmi_exception.AmdSmiLibraryException) as error:
+                    snapshot.get(amdsmi_get_value, handle, type(exception).__name__)
+                # a cache hit raises the same class as the library read
+                self.assertIs(type(error.exception), type(exception))
+                self.assertEqual(error.exception.get_error_code(), exception.get_error_code())
+
+
+class TestAmdSmiFields(unittest.TestCase):
+    def test_parse_fields(self):
+        import amdsmi_fields
+        self.assertEqual(amdsmi_fields.parse_fields("power.socket,clock.gfx, TEMP.hotspot,power.socket"),
+                         ["power.socket", "clock.gfx.cur", "clock.gfx.min", "clock.gfx.max", "temp.hotspot"])
+        self.assertEqual(amdsmi_fields.parse_fields("ecc"),
+                         ["ecc.correctable", "ecc.uncorrectable", "ecc.deferred"])
+        for fields_str in ("power.bogus", "clock.gf", "", "power,,temp"):
+            with self.assertRaises(ValueError):
+                amdsmi_fields.parse_fields(fields_str)
+
+    def test_nest_fields(self):
+        import amdsmi_fields
+        self.assertEqual(amdsmi_fields.nest_fields({"clock.gfx.cur": 2100, "clock.gfx.max": 2200,
+                                                    "power.socket": 350, "perf_level": "AUTO"}),
+                         {"clock": {"gfx": {"cur": 2100, "max": 2200}},
+                          "power": {"socket": 350}, "perf_level": "AUTO"})
+
+    def test_plan_reads_each_source_once(self):
+        import amdsmi_fields
+        handle = amdsmi_fields.amdsmi_interface.amdsmi_wrapper.amdsmi_processor_handle(0x10)
+        gpu_metrics = {"current_socket_power": "N/A", "average_socket_power": 300,
+                       "temperature_hotspot": 61, "current_gfxclk": "N/A", "current_gfxclks": [2100, 2000]}
+        plan = amdsmi_fields.AMDSMIFieldPlan(["power.socket", "temp.hotspot", "clock.gfx.cur",
+                                              "clock.gfx.min", "clock.gfx.max", "pcie.width"])
+        self.assertEqual(plan.sources, ["gpu_metrics", "gfx_clock_info", "pcie_info"])
+        self.assertEqual(plan.gpu_metrics_keys, ("current_socket_power", "average_socket_power",
+                                                 "temperature_hotspot", "current_gfxclk", "current_gfxclks"))
+
+        def amdsmi_get_pcie_info(device_handle):
+            raise amdsmi_fields.amdsmi_exception.AmdSmiLibraryException(2)
+        metrics_mock = mock.Mock(return_value=gpu_metrics)
+        clock_mock = mock.Mock(return_value={"min_clk": 500, "max_clk": 2200})
+        clock_type = amdsmi_fields.amdsmi_interface.AmdSmiClkType.GFX
+        with mock.patch.dict(amdsmi_fields.FIELD_SOURCES, {"gpu_metrics": (metrics_mock, ()),
+                                                           "gfx_clock_info": (clock_mock, (clock_type,)),
+                                                           "pcie_info": (amdsmi_get_pcie_info, ())}):
+            field_values = plan.read(handle)
+        self.assertEqual(field_values, {"power.socket": 300, "temp.hotspot": 61, "clock.gfx.cur": 2100,
+                                        "clock.gfx.min": 500, "clock.gfx.max": 2200, "pcie.width": "N/A"})
+        metrics_mock.assert_called_once_with(handle, fields=plan.gpu_metrics_keys)
+        clock_mock.assert_called_once_with(handle, clock_type)
+
+    def test_plan_shares_snapshot_gpu_metrics(self):
+        import amdsmi_fields
+        import amdsmi_helpers
+        handle = amdsmi_fields.amdsmi_interface.amdsmi_wrapper.amdsmi_processor_handle(0x10)
+        reads = []
+        def amdsmi_get_gpu_metrics_info(device_handle, fields=None):
+            reads.append(fields)
+            return {"temperature_edge": 40, "temperature_hotspot": 61}
+        plan = amdsmi_fields.AMDSMIFieldPlan(["temp.hotspot"])
+        snapshot = amdsmi_helpers.AMDSMISnapshot()
+        with mock.patch.dict(amdsmi_fields.FIELD_SOURCES, {"gpu_metrics": (amdsmi_get_gpu_metrics_info, ())}):
+            # Only the keys of the plan are read
+            snapshot.start_tick()
+            self.assertEqual(plan.read(handle, snapshot=snapshot), {"temp.hotspot": 61})
+            self.assertEqual(plan.read(handle, snapshot=snapshot), {"temp.hotspot": 61})
+            self.assertEqual(reads, [("temperature_hotspot",)])
+            # The full table read by another column is reused
+            snapshot.start_tick()
+            snapshot.get(amdsmi_get_gpu_metrics_info, handle)
+            self.assertEqual(plan.read(handle, snapshot=snapshot), {"temp.hotspot": 61})
+            self.assertEqual(reads, [("temperature_hotspot",), None])
+
+
+if __name__ == '__main__':
+    unittest.main()
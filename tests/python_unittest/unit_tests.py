@@ -159,5 +159,586 @@ class TestAmdSmiPythonBDF(unittest.TestCase):
         result = amdsmi.amdsmi_interface._check_res(
             (lambda: amdsmi.amdsmi_interface.amdsmi_wrapper.AMDSMI_STATUS_SUCCESS)())
         self.assertEqual(None, result)
+
+class TestAmdSmiPythonGpuMetrics(unittest.TestCase):
+    def test_decode_gpu_metrics_field(self):
+        gpu_metrics = amdsmi.amdsmi_interface.amdsmi_wrapper.amdsmi_gpu_metrics_t()
+        gpu_metrics.current_socket_power = 250
+        gpu_metrics.temperature_edge = 0xFFFF
+        gpu_metrics.average_gfx_activity = 101
+        gpu_metrics.throttle_status = 1
+        gpu_metrics.vcn_activity[0] = 42
+        gpu_metrics.vcn_activity[1] = 0xFFFF
+        gpu_metrics.xcp_stats[0].jpeg_busy[0] = 7
+        gpu_metrics.xcp_stats[0].jpeg_busy[1] = 0xFFFF
+        decode = amdsmi.amdsmi_interface._decode_gpu_metrics_field
+        self.assertEqual(decode(gpu_metrics, "current_socket_power"), 250)
+        self.assertEqual(decode(gpu_metrics, "temperature_edge"), "N/A")
+        self.assertEqual(decode(gpu_metrics, "average_gfx_activity"), "N/A")
+        self.assertEqual(decode(gpu_metrics, "throttle_status"), True)
+        self.assertEqual(decode(gpu_metrics, "vcn_activity")[:2], [42, "N/A"])
+        xcp_jpeg_busy = decode(gpu_metrics, "xcp_stats.jpeg_busy")
+        self.assertEqual(len(xcp_jpeg_busy), len(gpu_metrics.xcp_stats))
+        self.assertEqual(xcp_jpeg_busy[0][:2], [7, "N/A"])
+        # every output key must be decodable
+        for key in amdsmi.amdsmi_interface._GPU_METRICS_FIELDS:
+            decode(gpu_metrics, key)
+
+    def test_gpu_metrics_dtype(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        import ctypes
+        from unittest import mock
+        wrapper = amdsmi.amdsmi_interface.amdsmi_wrapper
+
+        def check_layout(dtype, ctype):
+            self.assertEqual(dtype.itemsize, ctypes.sizeof(ctype))
+            if issubclass(ctype, ctypes.Array):
+                self.assertEqual(dtype.shape, (ctype._length_,))
+                if ctype._type_ is not ctypes.c_char:
+                    check_layout(dtype.base, ctype._type_)
+            elif issubclass(ctype, (ctypes.Structure, ctypes.Union)):
+                self.assertEqual(list(dtype.names), [field[0] for field in ctype._fields_])
+                for field in ctype._fields_:
+                    field_dtype, offset = dtype.fields[field[0]][:2]
+                    self.assertEqual(offset, getattr(ctype, field[0]).offset, field[0])
+                    check_layout(field_dtype, field[1])
+
+        dtype = amdsmi.amdsmi_get_gpu_metrics_dtype()
+        check_layout(dtype, wrapper.amdsmi_gpu_metrics_t)
+        self.assertIs(amdsmi.amdsmi_get_gpu_metrics_dtype(), dtype)
+
+        def get_gpu_metrics_info(processor_handle, gpu_metrics):
+            gpu_metrics._obj.current_socket_power = 250
+            gpu_metrics._obj.xcp_stats[1].gfx_busy_inst[2] = 42
+            return wrapper.AMDSMI_STATUS_SUCCESS
+        samples = numpy.zeros(3, dtype=dtype)
+        handle = wrapper.amdsmi_processor_handle(0x10)
+        with mock.patch.object(wrapper, "amdsmi_get_gpu_metrics_info", side_effect=get_gpu_metrics_info, create=True):
+            amdsmi.amdsmi_get_gpu_metrics_array(handle, out=samples[1:2])
+        self.assertEqual(list(samples["current_socket_power"]), [0, 250, 0])
+        self.assertEqual(samples["xcp_stats"]["gfx_busy_inst"][1][1][2], 42)
+
+    def test_unknown_gpu_metrics_fields(self):
+        handle = amdsmi.amdsmi_interface.amdsmi_wrapper.amdsmi_processor_handle(0x10)
+        for field in ("temperature_bogus", 5, None, ["temperature_edge"]):
+            with self.assertRaises(amdsmi.AmdSmiKeyException) as error:
+                amdsmi.amdsmi_get_gpu_metrics_info(handle, fields=["temperature_edge", field])
+            self.assertIn(str(field), str(error.exception))
+            with self.assertRaises(amdsmi.AmdSmiKeyException):
+                amdsmi.amdsmi_get_gpu_metrics_info_batch([handle], fields=["temperature_edge", field])
+
+class TestAmdSmiPythonHsmpMetricsTable(unittest.TestCase):
+    def test_decode_hsmp_metrics_table(self):
+        mtbl = amdsmi.amdsmi_interface.amdsmi_wrapper.amdsmi_hsmp_metrics_table_t()
+        mtbl.socket_power = 250 << 10
+        mtbl.max_socket_temperature = 45 << 10
+        mtbl.fclk_frequency_table[1] = 1600 << 10
+        mtbl.timestamp = 123456789
+        decode = amdsmi.amdsmi_interface._decode_hsmp_metrics_table
+        numeric = decode(mtbl, True, 0)
+        self.assertEqual(numeric["mtbl_socket_power"], 250.0)
+        self.assertEqual(numeric["mtbl_max_socket_temperature"], 45.0)
+        self.assertEqual(numeric["mtbl_fclk_frequency_table"][:2], [0.0, 1600.0])
+        # the hardware timestamp is kept
+        self.assertEqual(numeric["mtbl_timestamp_raw"], 123456789)
+        self.assertNotIn("mtbl_timestamp_readable", numeric)
+        # the string output is the numeric output with its unit
+        formatted = decode(mtbl, False, 0)
+        units = amdsmi.amdsmi_interface.amdsmi_get_hsmp_metrics_table_units()
+        self.assertEqual(formatted["mtbl_socket_power"], "250.0 W")
+        self.assertEqual(units["mtbl_socket_power"], "W")
+        for key, value in numeric.items():
+            self.assertEqual(formatted[key], f"{value} {units[key]}" if units[key] else value)
+        self.assertIn("mtbl_timestamp_readable", formatted)
+
+class TestAmdSmiPythonCounterRates(unittest.TestCase):
+    def test_counter_rate_tracker(self):
+        handle = amdsmi.amdsmi_interface.amdsmi_wrapper.amdsmi_processor_handle(0x10)
+        tracker = amdsmi.amdsmi_interface.CounterRateTracker()
+        # 15.3 uJ energy counter resolution
+        tracker._energy_resolution[handle.value] = 15.3
+        gpu_metrics = {"accumulation_counter": 1000, "energy_accumulator": 0,
+                       "gfx_activity_acc": 0xFFFFFFFF - 99, "pcie_bandwidth_acc": 500,
+                       "xgmi_read_data_acc": [0, "N/A"], "ppt_residency_acc": 10}
+        rates = tracker.update(handle, gpu_metrics, timestamp=10.0)
+        self.assertEqual(rates["xgmi_read_bandwidth"], ["N/A", "N/A"])
+        self.assertFalse(any(value != "N/A" for rate, value in rates.items() if rate != "xgmi_read_bandwidth"))
+        self.assertTrue(tracker.has_sample(handle))
+
+        gpu_metrics = {"accumulation_counter": 1100, "energy_accumulator": 2000000,
+                       "gfx_activity_acc": 4900, "pcie_bandwidth_acc": 1700,
+                       "xgmi_read_data_acc": [4000000, "N/A"], "ppt_residency_acc": 35}
+        rates = tracker.update(handle, gpu_metrics, timestamp=12.0)
+        self.assertEqual(rates["power"], 15.3)
+        # the 32 bit activity accumulator wrapped around
+        self.assertEqual(rates["gfx_activity"], 50.0)
+        self.assertEqual(rates["pcie_bandwidth"], 12.0)
+        self.assertEqual(rates["xgmi_read_bandwidth"], [2.0, "N/A"])
+        self.assertEqual(rates["ppt_residency"], 25.0)
+        self.assertEqual(rates["hbm_thm_residency"], "N/A")
+        self.assertEqual(amdsmi.amdsmi_interface.CounterRateTracker.get_units()["power"], "W")
+
+        # a 64 bit counter going backwards was reset
+        gpu_metrics = dict(gpu_metrics, energy_accumulator=5)
+        rates = tracker.update(handle, gpu_metrics, timestamp=13.0)
+        self.assertEqual(rates["power"], "N/A")
+        tracker.reset(handle)
+        self.assertFalse(tracker.has_sample(handle))
+
+class TestAmdSmiPythonEventDispatcher(unittest.TestCase):
+    def test_event_routing(self):
+        from unittest import mock
+        wrapper = amdsmi.amdsmi_interface.amdsmi_wrapper
+        handles = [wrapper.amdsmi_processor_handle(value) for value in (0x10, 0x20)]
+        def read(timeout, num_elem, event_info):
+            # one event per device, then nothing
+            if read.calls:
+                return wrapper.AMDSMI_STATUS_NO_DATA
+            read.calls += 1
+            for index, handle in enumerate(handles):
+                event_info[index].processor_handle = handle.value
+                event_info[index].event = wrapper.AMDSMI_EVT_NOTIF_GPU_PRE_RESET
+                event_info[index].message = b"reset"
+            num_elem._obj.value = len(handles)
+            return wrapper.AMDSMI_STATUS_SUCCESS
+        read.calls = 0
+
+        stopped = []
+        with mock.patch.object(wrapper, "amdsmi_init_gpu_event_notification", return_value=0, create=True), \
+             mock.patch.object(wrapper, "amdsmi_set_gpu_event_notification_mask", return_value=0, create=True), \
+             mock.patch.object(wrapper, "amdsmi_stop_gpu_event_notification", side_effect=lambda handle: stopped.append(handle) or 0, create=True), \
+             mock.patch.object(wrapper, "amdsmi_get_gpu_event_notification", side_effect=read, create=True):
+            all_events = []
+            device_events = []
+            with amdsmi.AmdSmiEventDispatcher(handles, amdsmi.AmdSmiEvtNotificationType) as dispatcher:
+                dispatcher.subscribe(all_events.append)
+                token = dispatcher.subscribe(device_events.append, handles[1])
+                self.assertEqual(len(dispatcher.poll(0)), 2)
+                self.assertEqual(dispatcher.poll(0), [])
+                dispatcher.unsubscribe(token)
+            self.assertEqual([event["event"] for event in all_events], ["GPU_PRE_RESET"] * 2)
+            self.assertEqual(device_events, [{"processor_handle": 0x20, "event": "GPU_PRE_RESET", "message": "reset"}])
+            self.assertEqual(len(stopped), 2)
+
+    def test_stop_every_device(self):
+        from unittest import mock
+        wrapper = amdsmi.amdsmi_interface.amdsmi_wrapper
+        handles = [wrapper.amdsmi_processor_handle(value) for value in (0x10, 0x20, 0x30)]
+        stopped = []
+        def stop_notification(handle):
+            stopped.append(handle)
+            return wrapper.AMDSMI_STATUS_BUSY if len(stopped) == 1 else wrapper.AMDSMI_STATUS_SUCCESS
+        def init_notification(handle):
+            # the last device fails the setup
+            return wrapper.AMDSMI_STATUS_NOT_SUPPORTED if handle.value == 0x30 else wrapper.AMDSMI_STATUS_SUCCESS
+
+        with mock.patch.object(wrapper, "amdsmi_init_gpu_event_notification", side_effect=init_notification, create=True), \
+             mock.patch.object(wrapper, "amdsmi_set_gpu_event_notification_mask", return_value=0, create=True), \
+             mock.patch.object(wrapper, "amdsmi_stop_gpu_event_notification", side_effect=stop_notification, create=True):
+            # the setup error is raised, not the one stopping the first device
+            with self.assertRaises(amdsmi.AmdSmiLibraryException) as error:
+                amdsmi.AmdSmiEventDispatcher(handles, amdsmi.AmdSmiEvtNotificationType)
+            self.assertEqual(error.exception.get_error_code(), wrapper.AMDSMI_STATUS_NOT_SUPPORTED)
+            self.assertEqual(len(stopped), 2)
+
+            stopped.clear()
+            dispatcher = amdsmi.AmdSmiEventDispatcher(handles[:2], amdsmi.AmdSmiEvtNotificationType)
+            # a failing device doesn't keep the others enabled
+            with self.assertRaises(amdsmi.AmdSmiLibraryException) as error:
+                dispatcher.stop()
+            self.assertEqual(error.exception.get_error_code(), wrapper.AMDSMI_STATUS_BUSY)
+            self.assertEqual([handle.value for handle in stopped], [0x10, 0x20])
+
+    def test_error_backoff(self):
+        import threading
+        from unittest import mock
+        wrapper = amdsmi.amdsmi_interface.amdsmi_wrapper
+        handle = wrapper.amdsmi_processor_handle(0x10)
+        errors = []
+        with mock.patch.object(wrapper, "amdsmi_init_gpu_event_notification", return_value=0, create=True), \
+             mock.patch.object(wrapper, "amdsmi_set_gpu_event_notification_mask", return_value=0, create=True), \
+             mock.patch.object(wrapper, "amdsmi_stop_gpu_event_notification", return_value=0, create=True), \
+             mock.patch.object(wrapper, "amdsmi_get_gpu_event_notification", return_value=wrapper.AMDSMI_STATUS_IO, create=True):
+            with amdsmi.AmdSmiEventDispatcher([handle], amdsmi.AmdSmiEvtNotificationType) as dispatcher:
+                waits = []
+                dispatcher._stop_event = mock.Mock(wraps=threading.Event())
+                def wait(seconds):
+                    waits.append(seconds)
+                    if len(waits) == 8:
+                        dispatcher._stop_event.set()
+                dispatcher._stop_event.wait.side_effect = wait
+                dispatcher._dispatch_loop(0, errors.append)
+        self.assertEqual(len(errors), 8)
+        # a persistent error doubles the wait up to the maximum
+        self.assertEqual(waits, [0.1, 0.2, 0.4, 0.8, 1.6, 3.2, 5.0, 5.0])
+
+class TestAmdSmiPythonEventReader(unittest.TestCase):
+    def test_reused_event_buffer(self):
+        from unittest import mock
+        wrapper = amdsmi.amdsmi_interface.amdsmi_wrapper
+        handle = wrapper.amdsmi_processor_handle(0x10)
+        def read(timeout, num_elem, event_info):
+            # three events the first time, one after
+            count = 3 if not read.calls else 1
+            read.calls += 1
+            for index in range(count):
+                event_info[index].processor_handle = handle.value
+                event_info[index].event = wrapper.AMDSMI_EVT_NOTIF_THERMAL_THROTTLE
+                event_info[index].message = f"throttle {read.calls}".encode()
+            num_elem._obj.value = count
+            return wrapper.AMDSMI_STATUS_SUCCESS
+        read.calls = 0
+
+        with mock.patch.object(wrapper, "amdsmi_init_gpu_event_notification", return_value=0, create=True), \
+             mock.patch.object(wrapper, "amdsmi_set_gpu_event_notification_mask", return_value=0, create=True), \
+             mock.patch.object(wrapper, "amdsmi_stop_gpu_event_notification", return_value=0, create=True), \
+             mock.patch.object(wrapper, "amdsmi_get_gpu_event_notification", side_effect=read, create=True):
+            with amdsmi.AmdSmiEventReader(handle, amdsmi.AmdSmiEvtNotificationType) as reader:
+                self.assertEqual(len(reader.read(0, 4)), 3)
+                event_info = reader.event_info
+                # the stale events past the ones read aren't returned again
+                events = reader.read_batch(0, 2)
+                self.assertIs(reader.event_info, event_info)
+                self.assertEqual(len(events), 1)
+                self.assertEqual(events[0].processor_handle, handle.value)
+                self.assertEqual(events[0].event, "THERMAL_THROTTLE")
+                self.assertEqual(events[0].message, "throttle 2")
+
+class TestAmdSmiPythonProcessTable(unittest.TestCase):
+    def test_process_table(self):
+        from unittest import mock
+        wrapper = amdsmi.amdsmi_interface.amdsmi_wrapper
+        handle = wrapper.amdsmi_processor_handle(0x10)
+        running = {"count": 3, "sizes": []}
+        def get_process_list(processor_handle, max_processes, process_list):
+            size = max_processes._obj.value
+            running["sizes"].append(size)
+            if size:
+                for index in range(min(size, running["count"])):
+                    process_list[index].name = b"python" if index else b""
+                    process_list[index].pid = 100 + index
+                    process_list[index].memory_usage.vram_mem = 4096 * index
+                    process_list[index].engine_usage.gfx = 10 * index
+            max_processes._obj.value = running["count"]
+            if size and size < running["count"]:
+                return wrapper.AMDSMI_STATUS_OUT_OF_RESOURCES
+            # a process starts between the count and the first fill
+            running["count"] = 4
+            return wrapper.AMDSMI_STATUS_SUCCESS
+
+        with mock.patch.object(wrapper, "amdsmi_get_gpu_process_list", side_effect=get_process_list, create=True):
+            table = amdsmi.amdsmi_get_gpu_process_table(handle)
+            # count, fill too small, fill again with the new count
+            self.assertEqual(running["sizes"], [0, 3, 4])
+            self.assertEqual(table["pid"], [100, 101, 102, 103])
+            self.assertEqual(table["name"], ["N/A", "python", "python", "python"])
+            self.assertEqual(table["vram_mem"], [0, 4096, 8192, 12288])
+            table = amdsmi.amdsmi_get_gpu_process_table(handle, pids=[102])
+            self.assertEqual(table["pid"], [102])
+            self.assertEqual(table["gfx"], [20])
+            process_list = amdsmi.amdsmi_get_gpu_process_list(handle)
+            self.assertEqual(process_list[2]["memory_usage"]["vram_mem"], 8192)
+            self.assertEqual(process_list[2]["engine_usage"]["gfx"], 20)
+
+    def test_process_list_keeps_growing(self):
+        from unittest import mock
+        wrapper = amdsmi.amdsmi_interface.amdsmi_wrapper
+        handle = wrapper.amdsmi_processor_handle(0x10)
+        sizes = []
+        def get_process_list(processor_handle, max_processes, process_list):
+            size = max_processes._obj.value
+            sizes.append(size)
+            # a process starts before every read
+            count = len(sizes) + 1
+            for index in range(min(size, count)):
+                process_list[index].pid = 100 + index
+            max_processes._obj.value = count
+            if size and size < count:
+                return wrapper.AMDSMI_STATUS_OUT_OF_RESOURCES
+            return wrapper.AMDSMI_STATUS_SUCCESS
+
+        with mock.patch.object(wrapper, "amdsmi_get_gpu_process_list", side_effect=get_process_list, create=True):
+            table = amdsmi.amdsmi_get_gpu_process_table(handle)
+        # the last attempt returns the processes it could fill
+        self.assertEqual(sizes, [0, 2, 3, 4])
+        self.assertEqual(table["pid"], [100, 101, 102, 103])
+
+class TestAmdSmiPythonHandleTopology(unittest.TestCase):
+    def test_handle_topology_cache(self):
+        handle_type = amdsmi.amdsmi_interface.amdsmi_wrapper.amdsmi_processor_handle
+        enumerated = {"calls": 0, "values": [0x10, 0x20]}
+        def enumerate_handles():
+            enumerated["calls"] += 1
+            return [handle_type(value) for value in enumerated["values"]]
+
+        topology = amdsmi.amdsmi_interface._AmdSmiHandleTopology()
+        handles = topology.get(enumerate_handles)
+        self.assertEqual([handle.value for handle in handles], [0x10, 0x20])
+        # repeat lookups are served from the cache
+        topology.get(enumerate_handles)
+        self.assertEqual(enumerated["calls"], 1)
+        self.assertEqual(topology.generation, 0)
+        # refresh without a change keeps the generation
+        self.assertFalse(topology.refresh())
+        self.assertEqual(topology.generation, 0)
+        # a changed enumeration bumps the generation
+        enumerated["values"] = [0x10, 0x20, 0x30]
+        topology.invalidate()
+        self.assertEqual(len(topology.get(enumerate_handles)), 3)
+        self.assertEqual(topology.generation, 1)
+        enumerated["values"] = [0x10]
+        self.assertTrue(topology.refresh())
+        self.assertEqual(topology.generation, 2)
+        self.assertEqual(enumerated["calls"], 4)
+
+class TestAmdSmiPythonLazyBinding(unittest.TestCase):
+    def test_lazy_binding(self):
+        wrapper = amdsmi.amdsmi_interface.amdsmi_wrapper
+        name = "amdsmi_get_gpu_device_bdf"
+        self.assertIn(name, wrapper._FUNCTION_SIGNATURES)
+        # drop the binding if an earlier test already used it
+        vars(wrapper).pop(name, None)
+        if "libamd_smi.so" not in wrapper._libraries:
+            # without the library the lookup fails like any missing attribute
+            with self.assertRaises(AttributeError):
+                getattr(wrapper, name)
+            self.assertNotIn(name, vars(wrapper))
+            return
+        function = getattr(wrapper, name)
+        # bound once, later lookups are plain module attributes
+        self.assertIs(vars(wrapper)[name], function)
+        self.assertIs(getattr(wrapper, name), function)
+        self.assertEqual(function.restype, wrapper.amdsmi_status_t)
+        with self.assertRaises(AttributeError):
+            getattr(wrapper, "amdsmi_not_a_library_function")
+
+class TestAmdSmiPythonAsDict(unittest.TestCase):
+    def test_as_dict(self):
+        wrapper = amdsmi.amdsmi_interface.amdsmi_wrapper
+        process = wrapper.amdsmi_proc_info_t()
+        process.name = b"python3"
+        process.pid = 42
+        process.engine_usage.gfx = 7
+        process.memory_usage.vram_mem = 4096
+        result = wrapper.amdsmi_proc_info_t.as_dict(process)
+        self.assertEqual(list(result), list(wrapper.amdsmi_proc_info_t._field_names_()))
+        self.assertEqual(result["name"], b"python3")
+        self.assertEqual(result["pid"], 42)
+        self.assertEqual(result["engine_usage"]["gfx"], 7)
+        self.assertEqual(result["memory_usage"]["vram_mem"], 4096)
+        self.assertEqual(wrapper.amdsmi_proc_info_t.as_tuple(process),
+                         tuple(value if not isinstance(value, dict) else tuple(value.values())
+                               for value in result.values()))
+
+        gpu_metrics = wrapper.amdsmi_gpu_metrics_t()
+        gpu_metrics.vcn_activity[1] = 12
+        result = wrapper.amdsmi_gpu_metrics_t.as_dict(gpu_metrics)
+        self.assertEqual(result["vcn_activity"][:2], [0, 12])
+        self.assertEqual(result["common_header"], {"structure_size": 0, "format_revision": 0,
+                                                   "content_revision": 0})
+        # not a structure, returned as is
+        self.assertEqual(wrapper.amdsmi_gpu_metrics_t.as_dict(5), 5)
+
+class TestAmdSmiPythonAio(unittest.TestCase):
+    def test_per_device_serialization(self):
+        import asyncio
+        import threading
+        import time
+        from amdsmi import aio
+        handle_type = amdsmi.amdsmi_interface.amdsmi_wrapper.amdsmi_processor_handle
+        handles = [handle_type(value) for value in (0x10, 0x20, 0x30)]
+        lock = threading.Lock()
+        running = {}
+        max_running = {"device": 0, "total": 0}
+        def read(handle):
+            with lock:
+                running[handle.value] = running.get(handle.value, 0) + 1
+                max_running["device"] = max(max_running["device"], running[handle.value])
+                max_running["total"] = max(max_running["total"], sum(running.values()))
+            time.sleep(0.01)
+            with lock:
+                running[handle.value] -= 1
+            return handle.value
+
+        async def poll():
+            return await asyncio.gather(*[aio.amdsmi_aio_run(read, handle) for handle in handles * 3])
+
+        loop = asyncio.new_event_loop()
+        try:
+            asyncio.set_event_loop(loop)
+            result = loop.run_until_complete(poll())
+        finally:
+            loop.close()
+            asyncio.set_event_loop(None)
+            aio.amdsmi_aio_shut_down()
+        # results keep the submission order
+        self.assertEqual(result, [handle.value for handle in handles * 3])
+        # one call at a time per device, devices in parallel
+        self.assertEqual(max_running["device"], 1)
+        self.assertGreater(max_running["total"], 1)
+        self.assertTrue(asyncio.iscoroutinefunction(aio.amdsmi_get_gpu_activity))
+
+    def test_cancelled_call_keeps_device_lock(self):
+        import asyncio
+        import threading
+        from amdsmi import aio
+        handle = amdsmi.amdsmi_interface.amdsmi_wrapper.amdsmi_processor_handle(0x10)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        def slow_read(handle):
+            calls.append("slow")
+            started.set()
+            release.wait(5)
+            calls.append("slow done")
+        def read(handle):
+            calls.append("read")
+            return handle.value
+
+        async def poll():
+            loop = asyncio.get_running_loop()
+            slow = asyncio.ensure_future(aio.amdsmi_aio_run(slow_read, handle))
+            await loop.run_in_executor(None, started.wait, 5)
+            slow.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await slow
+            # the library call is still running, the next call on the handle waits for it
+            pending = asyncio.ensure_future(aio.amdsmi_aio_run(read, handle))
+            await asyncio.sleep(0.05)
+            self.assertFalse(pending.done())
+            release.set()
+            return await pending
+
+        try:
+            self.assertEqual(asyncio.run(poll()), handle.value)
+        finally:
+            release.set()
+            aio.amdsmi_aio_shut_down()
+        self.assertEqual(calls, ["slow", "slow done", "read"])
+
+class TestAmdSmiPythonCapabilityCache(unittest.TestCase):
+    def test_capability_cache(self):
+        interface = amdsmi.amdsmi_interface
+        wrapper = interface.amdsmi_wrapper
+        handle = wrapper.amdsmi_processor_handle(0x10)
+        calls = []
+        def amdsmi_get_fake(processor_handle, sensor_idx, fields=None):
+            calls.append((sensor_idx, fields))
+            raise amdsmi.AmdSmiLibraryException(wrapper.AMDSMI_STATUS_NOT_SUPPORTED)
+
+        cache = interface._AmdSmiCapabilityCache()
+        api = cache.wrap(amdsmi_get_fake)
+        for _ in range(3):
+            with self.assertRaises(amdsmi.AmdSmiLibraryException) as error:
+                api(handle, 1)
+            self.assertEqual(error.exception.get_error_code(), wrapper.AMDSMI_STATUS_NOT_SUPPORTED)
+        # only the first call reaches the library
+        self.assertEqual(calls, [(1, None)])
+        self.assertEqual(cache.get(handle), ["amdsmi_get_fake(1)"])
+        # unhashable arguments bypass the cache and keep the library exception
+        for _ in range(2):
+            with self.assertRaises(amdsmi.AmdSmiLibraryException):
+                api(wrapper.amdsmi_processor_handle(0x20), 0, fields=["temperature_edge"])
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(cache.get(wrapper.amdsmi_processor_handle(0x20)), [])
+        # keyword arguments are recorded as the same call
+        with self.assertRaises(amdsmi.AmdSmiLibraryException):
+            api(handle, sensor_idx=1)
+        with self.assertRaises(amdsmi.AmdSmiLibraryException):
+            api(processor_handle=handle, sensor_idx=1)
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(cache.get(handle), ["amdsmi_get_fake(1)"])
+        cache.clear(handle)
+        self.assertEqual(cache.get(handle), [])
+
+    def test_reset_clears_capabilities(self):
+        from unittest import mock
+        interface = amdsmi.amdsmi_interface
+        wrapper = interface.amdsmi_wrapper
+        handle = wrapper.amdsmi_processor_handle(0x30)
+        def get_fan_speed(processor_handle, sensor_idx, speed):
+            return wrapper.AMDSMI_STATUS_NOT_SUPPORTED
+
+        with mock.patch.object(wrapper, "amdsmi_get_gpu_fan_speed", side_effect=get_fan_speed, create=True) as fan_speed, \
+             mock.patch.object(wrapper, "amdsmi_reset_gpu", return_value=wrapper.AMDSMI_STATUS_SUCCESS, create=True):
+            for _ in range(2):
+                with self.assertRaises(amdsmi.AmdSmiLibraryException):
+                    amdsmi.amdsmi_get_gpu_fan_speed(handle, 0)
+            self.assertEqual(fan_speed.call_count, 1)
+            self.assertEqual(amdsmi.amdsmi_get_unsupported_apis(handle), ["amdsmi_get_gpu_fan_speed(0)"])
+            # a reset can change what the device supports
+            amdsmi.amdsmi_reset_gpu(handle)
+            self.assertEqual(amdsmi.amdsmi_get_unsupported_apis(handle), [])
+            with self.assertRaises(amdsmi.AmdSmiLibraryException):
+                amdsmi.amdsmi_get_gpu_fan_speed(handle, 0)
+            self.assertEqual(fan_speed.call_count, 2)
+        amdsmi.amdsmi_clear_unsupported_apis(handle)
+
+class TestAmdSmiPythonBatch(unittest.TestCase):
+    def test_batch_matches_single_device(self):
+        from unittest import mock
+        interface = amdsmi.amdsmi_interface
+        wrapper = interface.amdsmi_wrapper
+        handles = [wrapper.amdsmi_processor_handle(value) for value in (0x40, 0x50, 0x60)]
+        # the last device is busy
+        def status(processor_handle):
+            if processor_handle.value == 0x60:
+                return wrapper.AMDSMI_STATUS_BUSY
+            return wrapper.AMDSMI_STATUS_SUCCESS
+        def get_gpu_metrics_info(processor_handle, gpu_metrics):
+            gpu_metrics._obj.current_socket_power = processor_handle.value
+            gpu_metrics._obj.temperature_edge = 0xFFFF
+            gpu_metrics._obj.current_gfxclks[0] = processor_handle.value * 10
+            return status(processor_handle)
+        def get_power_info(processor_handle, power_info):
+            power_info._obj.current_socket_power = processor_handle.value
+            power_info._obj.gfx_voltage = 0xFFFF
+            return status(processor_handle)
+        def get_temp_metric(processor_handle, sensor_type, metric, temp_value):
+            temp_value._obj.value = processor_handle.value + sensor_type
+            return status(processor_handle)
+        def get_clock_info(processor_handle, clock_type, clock_info):
+            clock_info._obj.clk = processor_handle.value + clock_type
+            clock_info._obj.max_clk = 2100
+            return status(processor_handle)
+        def get_gpu_activity(processor_handle, engine_usage):
+            engine_usage._obj.gfx_activity = processor_handle.value % 100
+            engine_usage._obj.mm_activity = 0xFFFF
+            return status(processor_handle)
+
+        with mock.patch.object(wrapper, "amdsmi_get_gpu_metrics_info", side_effect=get_gpu_metrics_info, create=True), \
+             mock.patch.object(wrapper, "amdsmi_get_power_info", side_effect=get_power_info, create=True), \
+             mock.patch.object(wrapper, "amdsmi_get_temp_metric", side_effect=get_temp_metric, create=True), \
+             mock.patch.object(wrapper, "amdsmi_get_clock_info", side_effect=get_clock_info, create=True), \
+             mock.patch.object(wrapper, "amdsmi_get_gpu_activity", side_effect=get_gpu_activity, create=True):
+            fields = ["current_socket_power", "temperature_edge", "current_gfxclks"]
+            getters = [
+                (lambda handles: amdsmi.amdsmi_get_gpu_metrics_info_batch(handles, fields),
+                 lambda handle: amdsmi.amdsmi_get_gpu_metrics_info(handle, fields)),
+                (amdsmi.amdsmi_get_power_info_batch, amdsmi.amdsmi_get_power_info),
+                (lambda handles: amdsmi.amdsmi_get_temp_metric_batch(
+                    handles, interface.AmdSmiTemperatureType.HOTSPOT, interface.AmdSmiTemperatureMetric.CURRENT),
+                 lambda handle: {"temperature": amdsmi.amdsmi_get_temp_metric(
+                    handle, interface.AmdSmiTemperatureType.HOTSPOT, interface.AmdSmiTemperatureMetric.CURRENT)}),
+                (lambda handles: amdsmi.amdsmi_get_clock_info_batch(handles, interface.AmdSmiClkType.MEM),
+                 lambda handle: amdsmi.amdsmi_get_clock_info(handle, interface.AmdSmiClkType.MEM)),
+                (amdsmi.amdsmi_get_gpu_activity_batch, amdsmi.amdsmi_get_gpu_activity),
+            ]
+            for get_batch, get_single in getters:
+                batch = get_batch(handles)
+                self.assertEqual(batch["status"], [wrapper.AMDSMI_STATUS_SUCCESS, wrapper.AMDSMI_STATUS_SUCCESS,
+                                                   wrapper.AMDSMI_STATUS_BUSY])
+                for index, handle in enumerate(handles[:2]):
+                    single = get_single(handle)
+                    self.assertEqual(set(batch), set(single) | {"status"})
+                    self.assertEqual({key: batch[key][index] for key in single}, single)
+                with self.assertRaises(amdsmi.AmdSmiLibraryException) as error:
+                    get_single(handles[2])
+                self.assertEqual(error.exception.get_error_code(), batch["status"][2])
+                self.assertTrue(all(values[2] == "N/A" for key, values in batch.items() if key != "status"))
+
 if __name__ == '__main__':
     unittest.main()
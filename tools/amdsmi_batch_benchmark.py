@@ -0,0 +1,68 @@
+#
+# Copyright (C) 2024 Advanced Micro Devices. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+
+# Compare per-device overhead of single-device calls against the batch APIs.
+# Handle lists of 1, 8 and 64 entries are built by repeating the detected GPUs.
+# Run this post install with python3 amdsmi_batch_benchmark.py [iterations]
+
+import sys
+import timeit
+
+from amdsmi import *
+
+HANDLE_COUNTS = [1, 8, 64]
+
+
+def single_calls(handles):
+    for handle in handles:
+        try:
+            amdsmi_get_gpu_metrics_info(handle)
+        except AmdSmiLibraryException:
+            pass
+
+
+def batch_call(handles):
+    amdsmi_get_gpu_metrics_info_batch(handles)
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    amdsmi_init()
+    try:
+        gpus = amdsmi_get_processor_handles()
+        if not gpus:
+            print("No GPUs on machine")
+            return
+
+        print(f"{'HANDLES':>8}{'SINGLE (us/dev)':>18}{'BATCH (us/dev)':>17}{'SPEEDUP':>10}")
+        for count in HANDLE_COUNTS:
+            handles = [gpus[index % len(gpus)] for index in range(count)]
+            single = timeit.timeit(lambda: single_calls(handles), number=iterations)
+            batch = timeit.timeit(lambda: batch_call(handles), number=iterations)
+            single_us = single / iterations / count * 1e6
+            batch_us = batch / iterations / count * 1e6
+            print(f"{count:>8}{single_us:>18.1f}{batch_us:>17.1f}{single / batch:>9.2f}x")
+    finally:
+        amdsmi_shut_down()
+
+
+if __name__ == "__main__":
+    main()
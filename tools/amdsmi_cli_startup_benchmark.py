@@ -0,0 +1,88 @@
+#
+# Copyright (C) 2024 Advanced Micro Devices. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+
+# Measure the time to first output and the total run time of common amd-smi
+# subcommands. Each subcommand is started in a new process, so the numbers
+# include the interpreter startup, the imports, the library init, and the
+# parser setup. Exits with 1 if a subcommand fails, or if the best time to
+# first output of any subcommand is above the budget.
+# Run this post install with python3 amdsmi_cli_startup_benchmark.py [runs] [budget ms] [amd-smi path]
+
+import shutil
+import subprocess
+import sys
+import time
+
+SUBCOMMANDS = [
+    ["version"],
+    ["list"],
+    ["static", "-g", "0"],
+    ["metric", "-g", "0"],
+    ["monitor"],
+]
+
+
+def run_subcommand(amd_smi, subcommand):
+    """Return (seconds to the first byte of output, total seconds, return code)"""
+    start_time = time.perf_counter()
+    process = subprocess.Popen([amd_smi] + subcommand, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    first_byte = process.stdout.read(1)
+    first_output_time = time.perf_counter() - start_time
+    process.stdout.read()
+    return_code = process.wait()
+    total_time = time.perf_counter() - start_time
+    if not first_byte:
+        first_output_time = total_time
+    return first_output_time, total_time, return_code
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    budget_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 1000.0
+    amd_smi = sys.argv[3] if len(sys.argv) > 3 else shutil.which("amd-smi")
+    if amd_smi is None:
+        print("FAIL: amd-smi not found in PATH")
+        return 1
+
+    failed = False
+    print(f"{'SUBCOMMAND':<20}{'BEST FIRST OUTPUT (ms)':>24}{'BEST TOTAL (ms)':>18}")
+    for subcommand in SUBCOMMANDS:
+        name = " ".join(subcommand)
+        best_first_output = best_total = float("inf")
+        for _ in range(runs):
+            first_output_time, total_time, return_code = run_subcommand(amd_smi, subcommand)
+            if return_code:
+                print(f"FAIL: amd-smi {name} exited with {return_code}")
+                failed = True
+                break
+            best_first_output = min(best_first_output, first_output_time)
+            best_total = min(best_total, total_time)
+        else:
+            print(f"{name:<20}{best_first_output * 1000:>24.2f}{best_total * 1000:>18.2f}")
+            if best_first_output * 1000 > budget_ms:
+                print(f"FAIL: amd-smi {name} took {best_first_output * 1000:.2f} ms to first output,"
+                      f" budget is {budget_ms:.2f} ms")
+                failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
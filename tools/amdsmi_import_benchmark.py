@@ -0,0 +1,80 @@
+#
+# Copyright (C) 2024 Advanced Micro Devices. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+
+# Measure the import time of the amdsmi package with python -X importtime and
+# guard it: exits with 1 if importing amdsmi binds any library function, or if
+# the best cumulative import time of amdsmi is above the budget.
+# Run this post install with python3 amdsmi_import_benchmark.py [runs] [budget ms]
+
+import subprocess
+import sys
+
+IMPORT_SCRIPT = """
+import amdsmi
+from amdsmi import amdsmi_wrapper
+bound = [name for name in getattr(amdsmi_wrapper, '_FUNCTION_SIGNATURES', {}) if name in vars(amdsmi_wrapper)]
+print(len(bound))
+"""
+
+
+def import_times():
+    """Return ({module: cumulative us}, number of functions bound by the import)"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", IMPORT_SCRIPT],
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, encoding="utf-8", check=True)
+    times = {}
+    # import time: self [us] | cumulative | imported package
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        times[module.strip()] = int(cumulative)
+    return times, int(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    budget_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 100.0
+
+    best = {}
+    bound_functions = 0
+    for _ in range(runs):
+        times, bound_functions = import_times()
+        for module, cumulative in times.items():
+            if module.startswith("amdsmi"):
+                best[module] = min(best.get(module, cumulative), cumulative)
+
+    print(f"{'MODULE':<32}{'BEST CUMULATIVE (ms)':>22}")
+    for module, cumulative in sorted(best.items(), key=lambda item: item[1], reverse=True):
+        print(f"{module:<32}{cumulative / 1000:>22.2f}")
+
+    failed = False
+    if bound_functions:
+        print(f"FAIL: import amdsmi bound {bound_functions} library functions, expected 0")
+        failed = True
+    amdsmi_ms = best.get("amdsmi", 0) / 1000
+    if amdsmi_ms > budget_ms:
+        print(f"FAIL: import amdsmi took {amdsmi_ms:.2f} ms, budget is {budget_ms:.2f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+#
+# Copyright (C) 2024 Advanced Micro Devices. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+
+# Compare amd-smi multi-GPU reports collected sequentially against --parallel.
+# Each subcommand is run for all GPUs with --parallel 1 (sequential) and with
+# --parallel set to the number of detected GPUs, the best wall time of each wins.
+# Run this post install with python3 amdsmi_parallel_benchmark.py [repeats] [amd-smi path]
+
+import json
+import subprocess
+import sys
+import time
+
+SUBCOMMANDS = [["metric"], ["monitor"], ["static"], ["process"], ["firmware"]]
+
+
+def best_time(command, repeats):
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    amd_smi = sys.argv[2] if len(sys.argv) > 2 else "/opt/rocm/bin/amd-smi"
+
+    gpu_list = subprocess.run([amd_smi, "list", "--json"], stdout=subprocess.PIPE, check=True).stdout
+    gpu_count = len(json.loads(gpu_list))
+    if gpu_count < 2:
+        print("Parallel collection needs at least 2 GPUs")
+        return
+
+    print(f"{'SUBCOMMAND':>12}{'SEQUENTIAL (s)':>17}{f'PARALLEL {gpu_count} (s)':>17}{'SPEEDUP':>10}")
+    for subcommand in SUBCOMMANDS:
+        command = [amd_smi] + subcommand + ["--json"]
+        sequential = best_time(command + ["--parallel", "1"], repeats)
+        parallel = best_time(command + ["--parallel", str(gpu_count)], repeats)
+        print(f"{subcommand[0]:>12}{sequential:>17.3f}{parallel:>17.3f}{sequential / parallel:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,7 @@
 
 
 import os
+import re
 import argparse
 import tempfile
 import shutil
@@ -65,9 +66,12 @@ def parseArgument():
                         help='Loading dynamic link libraries')
     parser.add_argument('-e', '--extra-args', type=str, required=False,
                         help='Parse extra arguments to clang')
+    parser.add_argument('-b', '--binding', type=str, required=False, default='lazy',
+                        choices=['lazy', 'eager'],
+                        help='Bind library functions on first use (lazy) or at import (eager)')
     args = vars(parser.parse_args())
 
-    return args['output'], args['input'], args['library'], args['extra_args']
+    return args['output'], args['input'], args['library'], args['extra_args'], args['binding']
 
 
 def replace_line(full_path_file_name, string_to_replace, new_string):
@@ -148,8 +152,190 @@ def find_line_num(search_str, line):
     return (line_num)
 
 
+AS_DICT_MIXIN = \
+"""
+# Struct class -> converter compiled from its _fields_ on first use
+_AS_DICT_CONVERTERS = {}
+_AS_TUPLE_CONVERTERS = {}
+
+
+def _pointer_contents(value):
+    try:
+        return value.contents
+    except ValueError:
+        # nullptr
+        return None
+
+
+def _compile_converter(cls, as_tuple):
+    # Generates one function per struct class reading every field with a plain
+    # attribute access, so the field kinds are only inspected once
+    import keyword
+    namespace = {'_pointer_contents': _pointer_contents}
+    items = []
+    for field_tuple in getattr(cls, '_fields_', ()):
+        field, type_ = field_tuple[0], field_tuple[1]
+        if field.startswith('PADDING_'):
+            continue
+        if field.isidentifier() and not keyword.iskeyword(field):
+            value = f'self.{field}'
+        else:
+            value = f'getattr(self, {field!r})'
+        if issubclass(type_, ctypes.Array) and type_._type_ not in (ctypes.c_char, ctypes.c_wchar):
+            # char arrays are already read as bytes or str
+            value = f'list({value})'
+        elif issubclass(type_, ctypes._Pointer):
+            value = f'_pointer_contents({value})'
+        elif issubclass(type_, AsDictMixin):
+            # other structure
+            converter = f'_convert_{len(items)}'
+            namespace[converter] = _get_converter(type_, as_tuple)
+            value = f'{converter}({value})'
+        items.append(value if as_tuple else f'{field!r}: {value}')
+
+    if as_tuple:
+        source = f"def convert(self):\\n    return ({', '.join(items)}{',' if len(items) == 1 else ''})\\n"
+    else:
+        source = f"def convert(self):\\n    return {{{', '.join(items)}}}\\n"
+    exec(compile(source, f'<{cls.__name__} converter>', 'exec'), namespace)
+    return namespace['convert']
+
+
+def _get_converter(cls, as_tuple):
+    converters = _AS_TUPLE_CONVERTERS if as_tuple else _AS_DICT_CONVERTERS
+    converter = converters.get(cls)
+    if converter is None:
+        converter = converters[cls] = _compile_converter(cls, as_tuple)
+    return converter
+
+
+class AsDictMixin:
+    @classmethod
+    def as_dict(cls, self):
+        if not isinstance(self, AsDictMixin):
+            # not a structure, assume it's already a python object
+            return self
+        return _get_converter(cls, False)(self)
+
+    @classmethod
+    def as_tuple(cls, self):
+        if not isinstance(self, AsDictMixin):
+            return self
+        return _get_converter(cls, True)(self)
+"""
+
+
+def make_compiled_as_dict(output_file_array):
+    """
+    Replaces the AsDictMixin generated by clang2py with one using compiled converters.
+
+    The clang2py as_dict checks the kind of every field on each call. The converter
+    of each struct class is instead generated once from its _fields_, and as_tuple
+    returns the same values without the field names.
+
+    Args:
+        output_file_array (list): Lines of the generated wrapper
+
+    Returns:
+        list: Lines of the wrapper with the compiled AsDictMixin
+    """
+    try:
+        start_index = output_file_array.index('class AsDictMixin:')
+        end_index = output_file_array.index('class Structure(ctypes.Structure, AsDictMixin):')
+    except ValueError:
+        print('Error: Could not find AsDictMixin in the output file, skipping replacement')
+        return output_file_array
+
+    new_file_array = output_file_array[:start_index]
+    new_file_array += AS_DICT_MIXIN.strip('\n').split('\n')
+    new_file_array += ['', '']
+    new_file_array += output_file_array[end_index:]
+    return new_file_array
+
+
+LAZY_BINDING_FOOTER = \
+"""
+
+def _bind_function(name):
+    if '{library_name}' not in _libraries:
+        raise AttributeError(f"{{name}}: Unable to find amdsmi library try installing amd-smi-lib from your package manager")
+    function = getattr(_libraries['{library_name}'], name)
+    function.restype, function.argtypes = _FUNCTION_SIGNATURES[name]()
+    globals()[name] = function
+    return function
+
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name in _FUNCTION_SIGNATURES:
+            return _bind_function(name)
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+else:
+    # Module __getattr__ needs python 3.7, bind every function at import
+    if '{library_name}' in _libraries:
+        for _name in _FUNCTION_SIGNATURES:
+            _bind_function(_name)
+"""
+
+
+def make_lazy_bindings(output_file_array, library_name):
+    """
+    Replaces the import time binding of every library function with a binding on first use.
+
+    Each function is generated by clang2py as:
+        amdsmi_init = _libraries['libamd_smi.so'].amdsmi_init
+        amdsmi_init.restype = amdsmi_status_t
+        amdsmi_init.argtypes = [uint64_t]
+    These lines are moved to the _FUNCTION_SIGNATURES table, placed after every type
+    definition, and the module __getattr__ resolves the symbol the first time it is used.
+
+    Args:
+        output_file_array (list): Lines of the generated wrapper
+        library_name (str): The name of the library in _libraries
+
+    Returns:
+        list: Lines of the wrapper with lazy bindings
+    """
+    symbol_pattern = re.compile(r"^(\w+) = _libraries\['" + re.escape(library_name) + r"'\]\.(\w+)$")
+    signatures = []
+    new_file_array = []
+    index = 0
+    while index < len(output_file_array):
+        match = symbol_pattern.match(output_file_array[index])
+        if match and match.group(1) == match.group(2) and index + 2 < len(output_file_array):
+            name = match.group(1)
+            restype_line = output_file_array[index + 1]
+            argtypes_line = output_file_array[index + 2]
+            if restype_line.startswith(f'{name}.restype = ') and argtypes_line.startswith(f'{name}.argtypes = '):
+                restype = restype_line[len(f'{name}.restype = '):]
+                argtypes = argtypes_line[len(f'{name}.argtypes = '):]
+                signatures.append(f"    '{name}': lambda: ({restype}, {argtypes}),")
+                index += 3
+                continue
+        new_file_array.append(output_file_array[index])
+        index += 1
+
+    if not signatures:
+        return output_file_array
+
+    # The table goes right before __all__ so every type it references is already defined
+    all_index = new_file_array.index('__all__ = \\')
+    table = ['# Library functions are bound on first use by __getattr__: name -> (restype, argtypes)',
+             '_FUNCTION_SIGNATURES = {']
+    table += signatures
+    table += ['}']
+    table += LAZY_BINDING_FOOTER.format(library_name=library_name).split('\n')
+    table += ['']
+    new_file_array[all_index:all_index] = table
+
+    # sys is needed for the version check
+    ctypes_index = new_file_array.index('import ctypes')
+    new_file_array.insert(ctypes_index + 1, 'import sys')
+    return new_file_array
+
+
 def main():
-    output_file, input_file, library, clang_extra_args =  parseArgument()
+    output_file, input_file, library, clang_extra_args, binding =  parseArgument()
 
     # make args string easy to append
     if clang_extra_args is None:
@@ -344,5 +530,12 @@ except OSError as error:
 
         write_file(output_file, output_file_array)
 
+    with open(output_file, 'r') as fin:
+        output_file_array = fin.read().splitlines()
+    output_file_array = make_compiled_as_dict(output_file_array)
+    if binding == 'lazy':
+        output_file_array = make_lazy_bindings(output_file_array, library_name)
+    write_file(output_file, output_file_array)
+
 if __name__ == "__main__":
     main()